@@ -6,10 +6,11 @@ Analyzes the provided HTML file to extract comprehensive review data
 
 import re
 import json
-from bs4 import BeautifulSoup
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from html_source import load_soup
+
 class AdvancedCapterraHTMLAnalyzer:
     def __init__(self, html_file: str):
         self.html_file = html_file
@@ -19,9 +20,7 @@ class AdvancedCapterraHTMLAnalyzer:
     def load_html(self) -> bool:
         """Load and parse the HTML file"""
         try:
-            with open(self.html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            self.soup = BeautifulSoup(content, 'html.parser')
+            self.soup = load_soup(self.html_file)
             print(f"✅ Loaded HTML file: {self.html_file}")
             return True
         except Exception as e:
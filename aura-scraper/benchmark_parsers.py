@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+"""
+Offline Parser Benchmark Suite
+Runs every parser over the captured Capterra pages in capterraHTML/ and reports
+pages/sec, peak RSS and per-stage time. Results are compared with a JSON
+baseline and the run fails when a case raises, produces different output than
+the baseline, or regresses beyond the threshold.
+Timings are machine-specific: record the baseline on the machine that runs
+the check, and tighten --threshold on quiet hardware.
+
+    python benchmark_parsers.py                     # compare with the baseline
+    python benchmark_parsers.py --update-baseline   # record a new baseline
+    python benchmark_parsers.py --case capterra_parser --repeat 5
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import multiprocessing
+import platform
+import statistics
+import sys
+import time
+import warnings
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ROOT = Path(__file__).parent
+FIXTURE_DIR = ROOT / "capterraHTML"
+DEFAULT_BASELINE = ROOT / "benchmarks" / "parser_baseline.json"
+
+# Fixture roles -> file names
+FIXTURES = {
+    "reviews": "Looker Reviews 2025. Verified Reviews, Pros & Cons _ Capterra.html",
+    "features": "Looker Features, Alternatives & More 2025 _ Capterra.html",
+    "head_to_head": "Looker vs Microsoft Power BI _ Which Software is Best For You in 2025_ _ Capterra.html",
+    "three_way": "Looker vs Microsoft Power BI vs Tableau 2025 _ Capterra.html",
+}
+ALL_PAGES = list(FIXTURES)
+
+Stage = Tuple[str, Callable[[Dict[str, Any]], None]]
+
+
+def _read(state: Dict[str, Any]):
+    with open(state["path"], "r", encoding="utf-8") as f:
+        state["html"] = f.read()
+
+
+def _chimera():
+    """Make chimera-scraper importable and keep its logging out of the timings."""
+    from chimera_bridge import add_chimera_to_path
+    add_chimera_to_path()
+    warnings.filterwarnings("ignore", module="pydantic")
+    from loguru import logger
+    logger.disable("chimera")
+
+
+def _capterra_parser_stages() -> List[Stage]:
+    _chimera()
+    from chimera.parsers.capterra import CapterraParser
+
+    def extract(state):
+        state["result"] = asyncio.run(CapterraParser().extract_reviews(state["html"], state["url"]))
+
+    return [("read", _read), ("extract_reviews", extract)]
+
+
+def _chunker_pattern_stages() -> List[Stage]:
+    from html_chunker import HTMLChunker
+    from pattern_extractor import CapterraPatternExtractor
+
+    def chunk(state):
+        state["chunks"] = HTMLChunker().create_chunks(str(state["path"]))
+
+    def extract(state):
+        state["result"] = CapterraPatternExtractor().process_chunks(state["chunks"])
+
+    return [("chunk", chunk), ("extract_patterns", extract)]
+
+
+def _html_analyzer_stages() -> List[Stage]:
+    from html_analyzer import CapterraHTMLAnalyzer
+
+    def load(state):
+        state["analyzer"] = CapterraHTMLAnalyzer(str(state["path"]))
+        state["analyzer"].load_html()
+
+    def analyze(state):
+        state["result"] = state["analyzer"].analyze_review_structure()
+
+    return [("load_html", load), ("analyze", analyze)]
+
+
+def _final_extractor_stages() -> List[Stage]:
+    from final_comprehensive_extractor import FinalComprehensiveExtractor
+
+    def load(state):
+        state["extractor"] = FinalComprehensiveExtractor(str(state["path"]))
+        state["extractor"].load_html()
+
+    def extract(state):
+        state["result"] = state["extractor"].extract_all_reviews()
+
+    return [("load_html", load), ("extract_reviews", extract)]
+
+
+def _final_extractor_stream_stages() -> List[Stage]:
+    from final_comprehensive_extractor import FinalComprehensiveExtractor
+
+    def stream(state):
+        state["result"] = list(FinalComprehensiveExtractor(str(state["path"]), stream=True).stream_reviews())
+
+    return [("stream_reviews", stream)]
+
+
+def _head_to_head_stages() -> List[Stage]:
+    _chimera()
+    from chimera.parsers.head_to_head_comparison import G2HeadToHeadComparisonParser
+
+    def parse(state):
+        state["result"] = asyncio.run(
+            G2HeadToHeadComparisonParser().parse_head_to_head_comparison(state["html"], state["url"])
+        )
+
+    return [("read", _read), ("parse_comparison", parse)]
+
+
+def _four_way_stages() -> List[Stage]:
+    _chimera()
+    from chimera.parsers.four_way_comparison import G2FourWayComparisonParser
+
+    def parse(state):
+        state["result"] = asyncio.run(
+            G2FourWayComparisonParser().parse_four_way_comparison(state["html"], state["url"])
+        )
+
+    return [("read", _read), ("parse_comparison", parse)]
+
+
+# Case name -> (stage factory, fixture roles)
+CASES: Dict[str, Tuple[Callable[[], List[Stage]], List[str]]] = {
+    "capterra_parser": (_capterra_parser_stages, ALL_PAGES),
+    "chunker_pattern_extractor": (_chunker_pattern_stages, ALL_PAGES),
+    "html_analyzer": (_html_analyzer_stages, ALL_PAGES),
+    "final_comprehensive_extractor": (_final_extractor_stages, ALL_PAGES),
+    "final_comprehensive_extractor_stream": (_final_extractor_stream_stages, ALL_PAGES),
+    "head_to_head_comparison_parser": (_head_to_head_stages, ["head_to_head"]),
+    "four_way_comparison_parser": (_four_way_stages, ["head_to_head", "three_way"]),
+}
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _outcome(result: Any) -> str:
+    """Short description of what a run produced, to compare like with like."""
+    if isinstance(result, dict):
+        for key in ("total_reviews", "unique_reviews"):
+            if key in result:
+                return f"{result[key]} reviews"
+        if "reviews" in result and isinstance(result["reviews"], list):
+            return f"{len(result['reviews'])} reviews"
+        return "dict"
+    if isinstance(result, list):
+        return f"{len(result)} items"
+    if hasattr(result, "data_quality_score"):
+        # Comparison dataclasses
+        products = getattr(result, "total_products", 2)
+        return f"{products} products, quality {result.data_quality_score:.1f}"
+    return type(result).__name__
+
+
+def _errors(results: Dict[str, Any]) -> List[str]:
+    """Cases whose parse raised on some fixture."""
+    return [
+        f"{name}: {role} {outcome}"
+        for name, result in results.items()
+        for role, outcome in result["outcomes"].items()
+        if outcome.startswith("error:")
+    ]
+
+
+def run_case(name: str, repeat: int) -> Dict[str, Any]:
+    """Run one benchmark case in the current process and return its measurements."""
+    stage_factory, roles = CASES[name]
+    stages = stage_factory()
+    rss_before = _peak_rss_mb()
+
+    stage_times: Dict[str, List[float]] = {stage: [] for stage, _ in stages}
+    page_times: List[float] = []
+    best_times: List[float] = []
+    outcomes: Dict[str, str] = {}
+
+    for role in roles:
+        path = FIXTURE_DIR / FIXTURES[role]
+        fixture_times = []
+        for _ in range(repeat):
+            state = {"path": path, "url": f"https://www.capterra.com/benchmark/{role}"}
+            page_time = 0.0
+            try:
+                # Extractors print progress; keep it out of the report
+                with contextlib.redirect_stdout(io.StringIO()):
+                    for stage, stage_fn in stages:
+                        started = time.perf_counter()
+                        stage_fn(state)
+                        elapsed = time.perf_counter() - started
+                        stage_times[stage].append(elapsed)
+                        page_time += elapsed
+                outcomes[role] = _outcome(state.get("result"))
+            except Exception as e:
+                outcomes[role] = f"error: {type(e).__name__}"
+            fixture_times.append(page_time)
+        page_times.extend(fixture_times)
+        best_times.append(min(fixture_times))
+
+    total_time = sum(page_times)
+    return {
+        "pages": len(page_times),
+        "pages_per_sec": len(page_times) / total_time if total_time else 0.0,
+        "median_seconds_per_page": statistics.median(page_times) if page_times else 0.0,
+        # Mean over fixtures of the fastest run; least sensitive to machine noise
+        "best_seconds_per_page": statistics.mean(best_times) if best_times else 0.0,
+        "stage_seconds": {stage: statistics.median(times) if times else 0.0 for stage, times in stage_times.items()},
+        "peak_rss_mb": _peak_rss_mb(),
+        "import_rss_mb": rss_before,
+        "outcomes": outcomes,
+    }
+
+
+def run_isolated(name: str, repeat: int) -> Dict[str, Any]:
+    """Run a case in a fresh process so its peak RSS is its own."""
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1) as pool:
+        return pool.apply(run_case, (name, repeat))
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float, min_delta_ms: float) -> List[str]:
+    """Return regression messages for cases that broke, changed output, or got slower or larger.
+
+    A case regresses when any fixture raised or produced a different outcome
+    than in the baseline. Time is compared on best-of-repeats per page; a
+    slowdown must also exceed ``min_delta_ms`` so millisecond-scale cases do
+    not fail on jitter.
+    """
+    regressions = _errors(results)
+    for name, current in results.items():
+        previous = baseline.get("cases", {}).get(name)
+        if not previous:
+            continue
+        if previous.get("outcomes") != current["outcomes"]:
+            regressions.append(f"{name}: outcomes changed {previous.get('outcomes')} -> {current['outcomes']}")
+            continue
+
+        current_time = current["best_seconds_per_page"]
+        previous_time = previous["best_seconds_per_page"]
+        if current_time > previous_time * (1 + threshold) and (current_time - previous_time) * 1000 > min_delta_ms:
+            regressions.append(
+                f"{name}: {current_time * 1000:.1f} ms/page vs baseline {previous_time * 1000:.1f} ms/page"
+            )
+        if previous.get("peak_rss_mb") and current.get("peak_rss_mb"):
+            if current["peak_rss_mb"] > previous["peak_rss_mb"] * (1 + threshold):
+                regressions.append(
+                    f"{name}: peak RSS {current['peak_rss_mb']:.0f} MB vs baseline {previous['peak_rss_mb']:.0f} MB"
+                )
+    return regressions
+
+
+def print_report(results: Dict[str, Any]):
+    print(f"\n{'case':<40} {'pages/s':>8} {'ms/page':>9} {'best ms':>8} {'peak MB':>8}  stages (median ms)")
+    for name, result in results.items():
+        stages = ", ".join(f"{stage}={seconds * 1000:.0f}" for stage, seconds in result["stage_seconds"].items())
+        rss = f"{result['peak_rss_mb']:.0f}" if result["peak_rss_mb"] is not None else "n/a"
+        print(f"{name:<40} {result['pages_per_sec']:>8.2f} {result['median_seconds_per_page'] * 1000:>9.1f} "
+              f"{result['best_seconds_per_page'] * 1000:>8.1f} {rss:>8}  {stages}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the parsers against the captured Capterra pages")
+    parser.add_argument("--case", action="append", choices=list(CASES), help="Run only these cases (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per fixture (default: 3)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=0.5,
+                        help="Allowed slowdown/growth over the baseline, as a fraction (default: 0.5)")
+    parser.add_argument("--min-delta-ms", type=float, default=5.0,
+                        help="Ignore slowdowns smaller than this many ms/page (default: 5)")
+    parser.add_argument("--update-baseline", action="store_true", help="Write these results as the new baseline")
+    parser.add_argument("--output", type=Path, help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.case or CASES:
+        print(f"⏱️ {name}...")
+        results[name] = run_isolated(name, args.repeat)
+    print_report(results)
+
+    report = {
+        "created": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "cases": results,
+    }
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+    errors = _errors(results)
+    if args.update_baseline:
+        if errors:
+            print("\n❌ Not recording a baseline with failing cases:")
+            for message in errors:
+                print(f"  - {message}")
+            return 1
+        baseline = {}
+        if args.baseline.exists():
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        report["cases"] = {**baseline.get("cases", {}), **results}
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n📁 Baseline written to: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\n⚠️ No baseline at {args.baseline}; run with --update-baseline to record one")
+        for message in errors:
+            print(f"  ❌ {message}")
+        return 1 if errors else 0
+
+    with open(args.baseline, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+
+    regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+    if regressions:
+        print(f"\n❌ {len(regressions)} regression(s):")
+        for message in regressions:
+            print(f"  - {message}")
+        return 1
+
+    print(f"\n✅ No regressions beyond {args.threshold:.0%} of the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
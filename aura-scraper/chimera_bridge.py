@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Chimera Bridge
+The one place aura reaches into chimera-scraper: puts its src/ directory on
+the import path and re-exports the chimera pieces the aura extractors share
+"""
+
+import sys
+from pathlib import Path
+
+CHIMERA_SRC = Path(__file__).resolve().parent.parent / "chimera-scraper" / "src"
+
+
+def add_chimera_to_path():
+    """Make the ``chimera`` package importable; safe to call more than once"""
+    if str(CHIMERA_SRC) not in sys.path:
+        sys.path.insert(0, str(CHIMERA_SRC))
+
+
+add_chimera_to_path()
+
+from chimera.analysis.dedup import NearDuplicateIndex, deduplicate
+from chimera.utils.patterns import BudgetedPattern, register_pattern
+
+__all__ = [
+    'CHIMERA_SRC',
+    'add_chimera_to_path',
+    'NearDuplicateIndex',
+    'deduplicate',
+    'BudgetedPattern',
+    'register_pattern'
+]
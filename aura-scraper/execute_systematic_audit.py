@@ -12,17 +12,20 @@ from pathlib import Path
 from typing import Dict, List, Any
 
 from html_chunker import HTMLChunker
+from html_source import map_files
 from pattern_extractor import CapterraPatternExtractor
 
 class SystematicAuditExecutor:
-    def __init__(self, output_dir: str = "output/audit_results"):
+    def __init__(self, output_dir: str = "output/audit_results", max_workers: int = None):
         """
         Initialize systematic audit executor
         
         Args:
             output_dir: Directory to save audit results
+            max_workers: Files processed concurrently (default: one per CPU, 1 for in-process)
         """
         self.output_dir = output_dir
+        self.max_workers = max_workers
         self.chunker = HTMLChunker(chunk_size=50000, overlap_size=5000)
         self.extractor = CapterraPatternExtractor()
         self.audit_results = {
@@ -64,11 +67,10 @@ class SystematicAuditExecutor:
         
         print(f"📁 Found {len(html_files)} HTML files to process")
         
-        # Process each file
-        for i, html_file in enumerate(html_files, 1):
-            print(f"\n📄 Processing file {i}/{len(html_files)}: {html_file}")
-            file_result = self._process_single_file(html_file)
-            self.audit_results['file_results'].append(file_result)
+        # Process the files in worker processes, each mapping its own file
+        self.audit_results['file_results'].extend(
+            map_files(self._process_single_file, html_files, self.max_workers)
+        )
         
         # Calculate final statistics
         end_time = time.time()
@@ -115,6 +117,7 @@ class SystematicAuditExecutor:
         file_start_time = time.time()
         file_name = os.path.basename(file_path)
         
+        print(f"\n📄 Processing file: {file_name}")
         print(f"  🔍 Creating chunks...")
         
         # Step 1: Create chunks
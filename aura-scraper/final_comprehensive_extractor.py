@@ -6,21 +6,35 @@ Uses the specialized pattern matching approach for comprehensive review data ext
 
 import re
 import json
-from bs4 import BeautifulSoup
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
 from datetime import datetime
 
+from chimera_bridge import NearDuplicateIndex, deduplicate
+from html_source import HTMLSource, load_soup
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# Elements whose strings BeautifulSoup's get_text() leaves out
+NON_TEXT_TAGS = {'script', 'style', 'template'}
+REVIEW_CONTAINER_TAGS = {'div', 'article', 'section'}
+
+# Review fields compared when dropping near-duplicates of the same reviewer's review
+DEDUP_FIELDS = ('title', 'review_date', 'review_text', 'pros', 'cons')
+
 class FinalComprehensiveExtractor:
-    def __init__(self, html_file: str):
+    def __init__(self, html_file: str, stream: bool = False, chunk_size: int = 64 * 1024):
         self.html_file = html_file
         self.soup = None
+        self.stream = stream
+        self.chunk_size = chunk_size
         
     def load_html(self) -> bool:
         """Load and parse the HTML file"""
         try:
-            with open(self.html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            self.soup = BeautifulSoup(content, 'html.parser')
+            self.soup = load_soup(self.html_file)
             print(f"✅ Loaded HTML file: {self.html_file}")
             return True
         except Exception as e:
@@ -49,6 +63,9 @@ class FinalComprehensiveExtractor:
                 if review_data:
                     potential_reviews.append(review_data)
         
+        # Nested containers repeat the same review
+        potential_reviews = deduplicate(potential_reviews, self._dedup_text, self._dedup_scope)
+        
         return {
             "total_reviews": len(potential_reviews),
             "reviews": potential_reviews,
@@ -59,6 +76,55 @@ class FinalComprehensiveExtractor:
             }
         }
     
+    def stream_reviews(self) -> Iterator[Dict[str, Any]]:
+        """Yield reviews as their containers close, reading mapped byte chunks
+        
+        Same containers and fields as extract_all_reviews, but nested matches
+        come out innermost first. Each closed element keeps only its stripped
+        text pieces and its subtree is dropped, so the page is never held as
+        a full tree.
+        """
+        if etree is None:
+            raise ImportError("Streaming extraction requires lxml")
+        
+        parser = etree.HTMLPullParser(events=('end',), encoding='utf-8')
+        text_pieces = {}
+        seen = NearDuplicateIndex()
+        
+        # lxml decodes the raw bytes itself, including characters split across chunks
+        with HTMLSource(self.html_file) as source:
+            for chunk in source.iter_chunks(self.chunk_size):
+                with chunk:
+                    parser.feed(chunk.tobytes())
+                yield from self._reviews_from_events(parser, text_pieces, seen)
+        
+        parser.close()
+        yield from self._reviews_from_events(parser, text_pieces, seen)
+    
+    def _reviews_from_events(self, parser, text_pieces: Dict[Any, List[str]],
+                             seen: NearDuplicateIndex) -> Iterator[Dict[str, Any]]:
+        """Fold closed elements into text pieces and yield first-seen review containers"""
+        for _, element in parser.read_events():
+            pieces = []
+            if element.tag not in NON_TEXT_TAGS and element.text and element.text.strip():
+                pieces.append(element.text.strip())
+            
+            for child in element:
+                pieces.extend(text_pieces.pop(child, []))
+                if child.tail and child.tail.strip():
+                    pieces.append(child.tail.strip())
+            
+            if element.tag in REVIEW_CONTAINER_TAGS:
+                text = ''.join(pieces)
+                if self._is_review_element(text):
+                    review_data = self._extract_review_from_text(text)
+                    if review_data and seen.add(len(seen), self._dedup_text(review_data),
+                                                self._dedup_scope(review_data)) is None:
+                        yield review_data
+            
+            text_pieces[element] = pieces
+            element.clear(keep_tail=True)
+    
     def _find_all_review_containers(self) -> List[Any]:
         """Find all review containers using multiple strategies"""
         containers = []
@@ -71,7 +137,7 @@ class FinalComprehensiveExtractor:
         title_elements = self.soup.find_all('h4', string=re.compile(r'".*"'))
         for title in title_elements:
             parent = title.find_parent()
-            if parent and parent not in containers:
+            if parent:
                 containers.append(parent)
         
         # Strategy 3: Look for elements with star ratings
@@ -79,16 +145,11 @@ class FinalComprehensiveExtractor:
         for star in star_elements:
             if star.find('svg', class_=re.compile(r'star')):
                 parent = star.find_parent()
-                if parent and parent not in containers:
+                if parent:
                     containers.append(parent)
         
-        # Remove duplicates and return
-        unique_containers = []
-        for container in containers:
-            if container not in unique_containers:
-                unique_containers.append(container)
-        
-        return unique_containers
+        # Remove duplicates by element identity; Tag equality compares whole subtrees
+        return list({id(container): container for container in containers}.values())
     
     def _extract_comprehensive_review(self, container, index: int) -> Optional[Dict[str, Any]]:
         """Extract comprehensive data from a single review container"""
@@ -241,6 +302,14 @@ class FinalComprehensiveExtractor:
         
         return source_info
     
+    @staticmethod
+    def _dedup_text(review: Dict[str, Any]) -> str:
+        return ' '.join(review.get(field, '') for field in DEDUP_FIELDS)
+    
+    @staticmethod
+    def _dedup_scope(review: Dict[str, Any]) -> str:
+        return review.get('reviewer_name', '').strip().lower()
+    
     def _is_review_element(self, text: str) -> bool:
         """Check if an element contains review-like content"""
         # Look for patterns that indicate a review
@@ -263,9 +332,11 @@ class FinalComprehensiveExtractor:
     
     def _extract_review_from_element(self, element) -> Optional[Dict[str, Any]]:
         """Extract review data from a single element"""
+        return self._extract_review_from_text(element.get_text(strip=True))
+    
+    def _extract_review_from_text(self, text: str) -> Optional[Dict[str, Any]]:
+        """Extract review data from an element's stripped text"""
         try:
-            text = element.get_text(strip=True)
-            
             review_data = {
                 "title": "",
                 "reviewer_name": "",
@@ -348,13 +419,30 @@ class FinalComprehensiveExtractor:
     
     def run_extraction(self) -> Dict[str, Any]:
         """Run the complete extraction process"""
-        if not self.load_html():
-            return {"error": "Failed to load HTML"}
-        
-        print("🚀 Starting final comprehensive review extraction...")
-        
-        # Extract all reviews
-        results = self.extract_all_reviews()
+        if self.stream:
+            print("🚀 Starting streaming review extraction...")
+            try:
+                reviews = list(self.stream_reviews())
+            except Exception as e:
+                print(f"❌ Error streaming HTML file: {e}")
+                return {"error": "Failed to load HTML"}
+            results = {
+                "total_reviews": len(reviews),
+                "reviews": reviews,
+                "extraction_metadata": {
+                    "timestamp": datetime.now().isoformat(),
+                    "html_file": self.html_file,
+                    "method": "final_comprehensive_extraction_streaming"
+                }
+            }
+        else:
+            if not self.load_html():
+                return {"error": "Failed to load HTML"}
+            
+            print("🚀 Starting final comprehensive review extraction...")
+            
+            # Extract all reviews
+            results = self.extract_all_reviews()
         
         # Add summary statistics
         if "reviews" in results:
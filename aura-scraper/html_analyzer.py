@@ -7,9 +7,12 @@ Analyzes the provided HTML file to extract precise selectors for comprehensive r
 import re
 import json
 from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
 from pathlib import Path
 
+from advanced_html_analyzer import AdvancedCapterraHTMLAnalyzer
+from html_source import HTMLSource, load_soup
+from template_profiles import TemplateProfileStore, template_fingerprint
+
 class CapterraHTMLAnalyzer:
     def __init__(self, html_file_path: str):
         self.html_file_path = html_file_path
@@ -19,9 +22,7 @@ class CapterraHTMLAnalyzer:
     def load_html(self) -> bool:
         """Load and parse the HTML file"""
         try:
-            with open(self.html_file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            self.soup = BeautifulSoup(content, 'html.parser')
+            self.soup = load_soup(self.html_file_path)
             return True
         except Exception as e:
             print(f"Error loading HTML: {e}")
@@ -306,6 +307,25 @@ class CapterraHTMLAnalyzer:
         else:
             return tag
     
+    def template_fingerprint(self) -> str:
+        """Fingerprint of the page's template, read from the mapped file without parsing it"""
+        with HTMLSource(self.html_file_path) as source:
+            return template_fingerprint(source.buffer)
+    
+    def learned_selectors(self, profile_store: TemplateProfileStore) -> Dict[str, Any]:
+        """Selectors for the page's template, analyzing the page only when the template is new"""
+        return profile_store.selectors_for(
+            self.template_fingerprint(), self.discover_selectors, source=self.html_file_path
+        )
+    
+    def discover_selectors(self) -> Dict[str, Any]:
+        """Full selector discovery: the structure analysis plus the analyzer's improved selectors"""
+        if not self.soup and not self.load_html():
+            return {}
+        analysis = self.analyze_review_structure()
+        analysis['improved_selectors'] = AdvancedCapterraHTMLAnalyzer(self.html_file_path).generate_improved_selectors()
+        return analysis
+    
     def save_analysis(self, output_file: str) -> bool:
         """Save the analysis to a JSON file"""
         try:
@@ -6,30 +6,160 @@ Intelligently splits large HTML files into manageable chunks while preserving st
 
 import re
 import os
-from typing import List, Dict, Any, Tuple
+from collections.abc import Mapping
+from typing import List, Dict, Any, Optional, Tuple, Iterator
 from pathlib import Path
 
+from html_source import HTMLSource
+
+REVIEW_INDICATORS = [
+    r'class="[^"]*review[^"]*"',
+    r'Pros</span>',
+    r'Cons</span>',
+    r'Review Source',
+    r'<svg[^>]*class="[^"]*star[^"]*"',
+    r'([A-Z][a-z]+ [A-Z]\.)',
+    r'([A-Z][a-z]+ \d{1,2}, \d{4})'
+]
+
+COMPARISON_INDICATORS = [
+    r'vs\.',
+    r'comparison',
+    r'compare',
+    r'versus',
+    r'alternative',
+    r'better than',
+    r'worse than'
+]
+
+PRICING_INDICATORS = [
+    r'\$\d+',
+    r'price',
+    r'cost',
+    r'pricing',
+    r'plan',
+    r'subscription',
+    r'free trial',
+    r'per month',
+    r'per user'
+]
+
+STRUCTURE_MARKERS = [
+    r'<div[^>]*class="[^"]*review[^"]*"[^>]*>',
+    r'<section[^>]*>',
+    r'<article[^>]*>',
+    r'<main[^>]*>',
+    r'<header[^>]*>',
+    r'<footer[^>]*>',
+    r'<nav[^>]*>',
+    r'<aside[^>]*>'
+]
+
+
+def _any_of(patterns: List[str]) -> "re.Pattern[bytes]":
+    """One bytes regex that matches wherever any of ``patterns`` would"""
+    return re.compile('|'.join(f'(?:{pattern})' for pattern in patterns).encode('ascii'), re.IGNORECASE)
+
+
+# Chunk flags for balanced chunks, searched directly in the mapped bytes
+CHUNK_FLAGS = {
+    'has_reviews': _any_of(REVIEW_INDICATORS),
+    'has_comparison': _any_of(COMPARISON_INDICATORS),
+    'has_pricing': _any_of(PRICING_INDICATORS)
+}
+STRUCTURE_PATTERN = _any_of(STRUCTURE_MARKERS)
+
+# Markup tokens for the tag-depth scanner: comments, declarations, end tags and
+# start tags (quoted attribute values may contain '>')
+TAG_TOKEN = re.compile(
+    rb'<!--.*?-->|<[!?][^>]*>|<(/?)([a-zA-Z][^\s/>]*)((?:"[^"]*"|\'[^\']*\'|[^\'">])*)>',
+    re.DOTALL
+)
+VOID_TAGS = {
+    b'area', b'base', b'br', b'col', b'embed', b'hr', b'img', b'input',
+    b'link', b'meta', b'param', b'source', b'track', b'wbr'
+}
+RAW_TEXT_TAGS = {b'script', b'style', b'textarea', b'title'}
+
+
+class ChunkView(Mapping):
+    """Chunk of a mapped file held as offsets into the shared buffer
+    
+    Reads like the chunk dicts (``chunk['content']``...); content is decoded
+    only when asked for, and ``size`` is in bytes.
+    """
+    __slots__ = ('source', 'index', 'start_pos', 'end_pos', 'has_reviews', 'has_comparison', 'has_pricing')
+    KEYS = ('index', 'file_path', 'start_pos', 'end_pos', 'size', 'content',
+            'has_reviews', 'has_comparison', 'has_pricing', 'structure_elements')
+    
+    def __init__(self, source: HTMLSource, index: int, start_pos: int, end_pos: int,
+                 flags: Optional[Tuple[bool, ...]] = None):
+        self.source = source
+        self.index = index
+        self.start_pos = start_pos
+        self.end_pos = end_pos
+        if flags is None:
+            buffer = source.buffer
+            flags = tuple(pattern.search(buffer, start_pos, end_pos) is not None for pattern in CHUNK_FLAGS.values())
+        for flag, value in zip(CHUNK_FLAGS, flags):
+            setattr(self, flag, value)
+    
+    def __reduce__(self):
+        # Pickled as offsets; the receiving process maps the file again
+        flags = tuple(getattr(self, flag) for flag in CHUNK_FLAGS)
+        return ChunkView, (self.source, self.index, self.start_pos, self.end_pos, flags)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+    
+    def __len__(self) -> int:
+        return len(self.KEYS)
+    
+    def __repr__(self) -> str:
+        return f"ChunkView(index={self.index}, start_pos={self.start_pos}, end_pos={self.end_pos})"
+    
+    @property
+    def file_path(self) -> str:
+        return self.source.path
+    
+    @property
+    def size(self) -> int:
+        return self.end_pos - self.start_pos
+    
+    @property
+    def content(self) -> str:
+        return self.source.text(self.start_pos, self.end_pos)
+    
+    @property
+    def structure_elements(self) -> List[str]:
+        matches = STRUCTURE_PATTERN.finditer(self.source.buffer, self.start_pos, self.end_pos)
+        return list({match.group().decode(self.source.encoding, 'replace') for match in matches})
+    
+    def view(self) -> memoryview:
+        """Zero-copy bytes of the chunk"""
+        return self.source.view(self.start_pos, self.end_pos)
+
+
 class HTMLChunker:
-    def __init__(self, chunk_size: int = 50000, overlap_size: int = 5000):
+    def __init__(self, chunk_size: int = 50000, overlap_size: int = 5000, balanced: bool = False):
         """
         Initialize HTML chunker
         
         Args:
-            chunk_size: Maximum characters per chunk
-            overlap_size: Characters to overlap between chunks
+            chunk_size: Maximum bytes per chunk
+            overlap_size: Bytes to overlap between chunks
+            balanced: Return ChunkViews over the mapped file, cut only between
+                whole subtrees and without overlap
         """
         self.chunk_size = chunk_size
         self.overlap_size = overlap_size
-        self.html_structure_markers = [
-            r'<div[^>]*class="[^"]*review[^"]*"[^>]*>',
-            r'<section[^>]*>',
-            r'<article[^>]*>',
-            r'<main[^>]*>',
-            r'<header[^>]*>',
-            r'<footer[^>]*>',
-            r'<nav[^>]*>',
-            r'<aside[^>]*>'
-        ]
+        self.balanced = balanced
+        self.html_structure_markers = STRUCTURE_MARKERS
     
     def create_chunks(self, file_path: str) -> List[Dict[str, Any]]:
         """
@@ -43,25 +173,33 @@ class HTMLChunker:
         """
         print(f"📁 Processing file: {file_path}")
         
-        # Read file content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        file_size = len(content)
-        print(f"📊 File size: {file_size:,} characters")
+        if self.balanced:
+            # The views share the mapping, which stays open as long as they do
+            source = HTMLSource(file_path)
+            print(f"📊 File size: {source.size:,} bytes")
+            chunks = [
+                ChunkView(source, index, start_pos, end_pos)
+                for index, (start_pos, end_pos) in enumerate(self.balanced_breaks(source))
+            ]
+            print(f"✅ Created {len(chunks)} balanced chunks")
+            return chunks
         
-        # Create chunks
-        chunks = self._split_into_chunks(content, file_path)
+        # Map the file; only each chunk's own bytes are decoded
+        with HTMLSource(file_path) as source:
+            print(f"📊 File size: {source.size:,} bytes")
+            
+            # Create chunks
+            chunks = self._split_into_chunks(source, file_path)
         
         print(f"✅ Created {len(chunks)} chunks")
         return chunks
     
-    def _split_into_chunks(self, content: str, file_path: str) -> List[Dict[str, Any]]:
+    def _split_into_chunks(self, source: HTMLSource, file_path: str) -> List[Dict[str, Any]]:
         """
         Split content into intelligent chunks
         
         Args:
-            content: HTML content
+            source: Mapped HTML file; chunk positions are byte offsets into it
             file_path: Original file path
             
         Returns:
@@ -71,16 +209,16 @@ class HTMLChunker:
         start_pos = 0
         chunk_index = 0
         
-        while start_pos < len(content):
+        while start_pos < source.size:
             # Calculate end position
-            end_pos = min(start_pos + self.chunk_size, len(content))
+            end_pos = min(start_pos + self.chunk_size, source.size)
             
             # Try to find a good break point
-            if end_pos < len(content):
-                end_pos = self._find_break_point(content, start_pos, end_pos)
+            if end_pos < source.size:
+                end_pos = self._find_break_point(source, start_pos, end_pos)
             
             # Extract chunk content
-            chunk_content = content[start_pos:end_pos]
+            chunk_content = source.text(start_pos, end_pos)
             
             # Create chunk metadata
             chunk = {
@@ -97,19 +235,77 @@ class HTMLChunker:
             }
             
             chunks.append(chunk)
+            if end_pos >= source.size:
+                break
             
             # Move to next chunk with overlap
-            start_pos = max(end_pos - self.overlap_size, start_pos + 1)
+            start_pos = max(source.align(end_pos - self.overlap_size), start_pos + 1)
             chunk_index += 1
         
         return chunks
     
-    def _find_break_point(self, content: str, start_pos: int, end_pos: int) -> int:
+    def balanced_breaks(self, source: HTMLSource) -> Iterator[Tuple[int, int]]:
+        """
+        Yield chunk ranges that only end between complete subtrees
+        
+        One pass over the tags tracks nesting depth. Every tag end at least
+        half a chunk into the current chunk is a candidate break, and when the
+        next tag would overflow the chunk, the chunk ends at the shallowest
+        candidate (the latest one on ties). Siblings such as review cards are
+        therefore kept whole, and a single subtree larger than a chunk is cut
+        between its children. A chunk only runs over ``chunk_size`` when more
+        than half a chunk passes without a tag ending (long text, a huge tag).
+        
+        Args:
+            source: Mapped HTML file
+            
+        Yields:
+            (start_pos, end_pos) byte offsets
+        """
+        buffer = source.buffer
+        min_size = self.chunk_size // 2
+        chunk_start = 0
+        best_pos = best_depth = None
+        depth = 0
+        pos = 0
+        
+        while True:
+            match = TAG_TOKEN.search(buffer, pos)
+            if not match:
+                break
+            pos = match.end()
+            closing, name, attributes = match.groups()
+            if name:
+                name = name.lower()
+                if closing:
+                    depth = max(depth - 1, 0)
+                elif name in RAW_TEXT_TAGS:
+                    # Raw text is never cut; resume after the end tag
+                    end_tag = source.find_closing(name, pos, source.size)
+                    pos = buffer.find(b'>', end_tag) + 1 or source.size
+                elif name not in VOID_TAGS and not attributes.endswith(b'/'):
+                    depth += 1
+            
+            while pos - chunk_start > self.chunk_size:
+                cut = best_pos if best_pos is not None else pos
+                yield chunk_start, cut
+                chunk_start = cut
+                best_pos = best_depth = None
+                if cut == pos:
+                    break
+            
+            if pos - chunk_start >= min_size and (best_depth is None or depth <= best_depth):
+                best_pos, best_depth = pos, depth
+        
+        if chunk_start < source.size:
+            yield chunk_start, source.size
+    
+    def _find_break_point(self, source: HTMLSource, start_pos: int, end_pos: int) -> int:
         """
         Find a good break point within the chunk size limit
         
         Args:
-            content: HTML content
+            source: Mapped HTML file
             start_pos: Start position of current chunk
             end_pos: Maximum end position
             
@@ -121,67 +317,35 @@ class HTMLChunker:
         search_end = end_pos
         
         # Find the last complete HTML tag
-        last_tag_end = content.rfind('>', search_start, search_end)
+        last_tag_end = source.rfind(b'>', search_start, search_end)
         if last_tag_end > start_pos:
             return last_tag_end + 1
         
         # Find the last complete word
-        last_space = content.rfind(' ', search_start, search_end)
+        last_space = source.rfind(b' ', search_start, search_end)
         if last_space > start_pos:
             return last_space
         
-        # Fall back to original end position
-        return end_pos
+        # Fall back to original end position, kept off the middle of a character
+        return max(source.align(end_pos), start_pos + 1)
     
     def _contains_reviews(self, content: str) -> bool:
         """Check if chunk contains review-related content"""
-        review_indicators = [
-            r'class="[^"]*review[^"]*"',
-            r'Pros</span>',
-            r'Cons</span>',
-            r'Review Source',
-            r'<svg[^>]*class="[^"]*star[^"]*"',
-            r'([A-Z][a-z]+ [A-Z]\.)',
-            r'([A-Z][a-z]+ \d{1,2}, \d{4})'
-        ]
-        
-        for pattern in review_indicators:
+        for pattern in REVIEW_INDICATORS:
             if re.search(pattern, content, re.IGNORECASE):
                 return True
         return False
     
     def _contains_comparison(self, content: str) -> bool:
         """Check if chunk contains comparison-related content"""
-        comparison_indicators = [
-            r'vs\.',
-            r'comparison',
-            r'compare',
-            r'versus',
-            r'alternative',
-            r'better than',
-            r'worse than'
-        ]
-        
-        for pattern in comparison_indicators:
+        for pattern in COMPARISON_INDICATORS:
             if re.search(pattern, content, re.IGNORECASE):
                 return True
         return False
     
     def _contains_pricing(self, content: str) -> bool:
         """Check if chunk contains pricing-related content"""
-        pricing_indicators = [
-            r'\$\d+',
-            r'price',
-            r'cost',
-            r'pricing',
-            r'plan',
-            r'subscription',
-            r'free trial',
-            r'per month',
-            r'per user'
-        ]
-        
-        for pattern in pricing_indicators:
+        for pattern in PRICING_INDICATORS:
             if re.search(pattern, content, re.IGNORECASE):
                 return True
         return False
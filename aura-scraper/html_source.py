@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped HTML input for the offline extractors
+Maps a saved page once and hands out byte-range views, so tools can search and
+decode only the regions they use instead of reading the whole file into a str
+"""
+
+import mmap
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup
+
+# Raw-text elements whose bodies the extractors never read (get_text() skips them);
+# on Capterra pages these are around half of the file
+ELIDED_TAGS = ('script', 'style')
+
+
+def _open_tag_pattern(tags: Iterable[str]) -> "re.Pattern[bytes]":
+    names = b'|'.join(re.escape(tag.encode('ascii')) for tag in tags)
+    return re.compile(rb'<(' + names + rb')\b[^>]*>', re.I)
+
+
+ELIDED_TAG_PATTERN = _open_tag_pattern(ELIDED_TAGS)
+
+
+class HTMLSource:
+    """Read-only memory map of an HTML file
+
+    The mapping is shared with the OS page cache, so many processes working on
+    the same dumps do not each hold a private copy. Offsets are byte offsets.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], encoding: str = 'utf-8'):
+        self.path = os.fspath(path)
+        self.encoding = encoding
+        self._file = open(self.path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            self._map = b''
+        self.size = len(self._map)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __reduce__(self):
+        # Pickled by path, so worker processes map the file themselves
+        return HTMLSource, (self.path, self.encoding)
+
+    def __enter__(self) -> "HTMLSource":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Unmap the file; views handed out earlier must be released first"""
+        if isinstance(self._map, mmap.mmap) and not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    @property
+    def buffer(self) -> Union[mmap.mmap, bytes]:
+        """The mapped bytes, usable with bytes regexes and ``find``"""
+        return self._map
+
+    def view(self, start: int = 0, end: Optional[int] = None) -> memoryview:
+        """Zero-copy view of ``[start, end)``"""
+        return memoryview(self._map)[start:self.size if end is None else end]
+
+    def align(self, pos: int) -> int:
+        """Move ``pos`` back to the start of the UTF-8 character it falls in"""
+        pos = max(0, min(pos, self.size))
+        while 0 < pos < self.size and self._map[pos] & 0xC0 == 0x80:
+            pos -= 1
+        return pos
+
+    def text(self, start: int = 0, end: Optional[int] = None) -> str:
+        """Decode only ``[start, end)``, widened to whole characters"""
+        end = self.size if end is None else end
+        with self.view(self.align(start), self.align(end)) as region:
+            return str(region, self.encoding, 'replace')
+
+    def find(self, needle: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        return self._map.find(needle, start, self.size if end is None else end)
+
+    def rfind(self, needle: bytes, start: int = 0, end: Optional[int] = None) -> int:
+        return self._map.rfind(needle, start, self.size if end is None else end)
+
+    def finditer(self, pattern: Union[bytes, "re.Pattern[bytes]"], start: int = 0,
+                 end: Optional[int] = None) -> Iterator["re.Match[bytes]"]:
+        """Run a bytes regex over the mapping without copying it"""
+        if isinstance(pattern, bytes):
+            pattern = re.compile(pattern)
+        return pattern.finditer(self._map, start, self.size if end is None else end)
+
+    def iter_chunks(self, chunk_size: int = 64 * 1024, start: int = 0,
+                    end: Optional[int] = None) -> Iterator[memoryview]:
+        """Consecutive views of at most ``chunk_size`` bytes, e.g. for a pull parser"""
+        end = self.size if end is None else end
+        for pos in range(start, end, chunk_size):
+            yield self.view(pos, min(pos + chunk_size, end))
+
+    def regions(self, start: int = 0, end: Optional[int] = None,
+                elide: Iterable[str] = ELIDED_TAGS) -> List[Tuple[int, int]]:
+        """Byte ranges of ``[start, end)`` with the bodies of ``elide`` elements cut out
+
+        The elided elements keep their tags, only their raw text goes, so the
+        resulting document has the same elements as the original.
+        """
+        end = self.size if end is None else end
+        pattern = ELIDED_TAG_PATTERN if tuple(elide) == ELIDED_TAGS else _open_tag_pattern(elide)
+        ranges = []
+        pos = start
+        while pos < end:
+            match = pattern.search(self._map, pos, end)
+            if not match:
+                break
+            closing = self.find_closing(match.group(1).lower(), match.end(), end)
+            ranges.append((pos, match.end()))
+            pos = closing
+        ranges.append((pos, end))
+        return [(low, high) for low, high in ranges if high > low]
+
+    def find_closing(self, tag: bytes, start: int, end: int) -> int:
+        """Offset of the ``</tag`` ending a raw-text body, or ``end`` if it is unclosed"""
+        closing = re.compile(rb'</' + re.escape(tag) + rb'\s*>', re.I)
+        match = closing.search(self._map, start, end)
+        return match.start() if match else end
+
+    def markup(self, start: int = 0, end: Optional[int] = None,
+               elide: Iterable[str] = ELIDED_TAGS) -> str:
+        """Decoded markup of a region, copying only the kept byte ranges"""
+        return b''.join(self.view(low, high) for low, high in self.regions(start, end, elide)).decode(
+            self.encoding, 'replace'
+        )
+
+    def soup(self, parser: str = 'html.parser', start: int = 0, end: Optional[int] = None,
+             elide: Iterable[str] = ELIDED_TAGS) -> BeautifulSoup:
+        """BeautifulSoup of a region, built without script and style bodies"""
+        return BeautifulSoup(self.markup(start, end, elide), parser)
+
+
+def load_soup(path: Union[str, os.PathLike], parser: str = 'html.parser') -> BeautifulSoup:
+    """Parse a saved page through a memory map, skipping script and style bodies"""
+    with HTMLSource(path) as source:
+        return source.soup(parser)
+
+
+def map_files(func: Callable[[str], Any], paths: Iterable[str],
+              max_workers: Optional[int] = None) -> List[Any]:
+    """Run ``func(path)`` for each file in worker processes, results in input order
+
+    Each worker maps its own file, and the mapped pages are shared through the
+    page cache. ``max_workers=1`` runs in this process.
+    """
+    paths = list(paths)
+    max_workers = min(max_workers or os.cpu_count() or 1, len(paths) or 1)
+    if max_workers == 1:
+        return [func(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(func, paths))
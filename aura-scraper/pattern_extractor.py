@@ -4,16 +4,98 @@ Pattern Extractor for Capterra HTML Content
 Extracts structured data from HTML chunks using comprehensive pattern matching
 """
 
+import os
 import re
 import json
-from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
 from bs4 import BeautifulSoup
 
+from chimera_bridge import BudgetedPattern, NearDuplicateIndex, deduplicate, register_pattern
+
+# Per-process extractor used by process_chunks workers
+_worker_extractor = None
+
+
+def _init_worker(extractor_class: type):
+    global _worker_extractor
+    _worker_extractor = extractor_class()
+
+
+def _extract_in_worker(chunk: Dict[str, Any]) -> Dict[str, Any]:
+    return _worker_extractor.extract_from_chunk(chunk)
+
+
+class ExtractionReducer:
+    """Merges per-chunk extraction results in chunk order
+    
+    Product info, pricing and metadata keep the first value found for each
+    key, comparisons are concatenated, and reviews are deduplicated as they
+    arrive, so the merged result does not depend on how chunks were scheduled.
+    """
+    
+    def __init__(self, dedup: Callable[[List[Dict[str, Any]]], List[Dict[str, Any]]]):
+        self.dedup = dedup
+        self.chunks = 0
+        self.partial_chunks = 0
+        self.reviews_found = 0
+        self.reviews = []
+        self.product_info = {}
+        self.comparisons = []
+        self.pricing = {}
+        self.metadata = {}
+    
+    def add(self, extracted: Dict[str, Any]):
+        """Fold in the result of the next chunk"""
+        self.chunks += 1
+        self.partial_chunks += bool(extracted['chunk_metadata'].get('partial_scans'))
+        self.reviews_found += len(extracted['reviews'])
+        self.reviews.extend(self.dedup(extracted['reviews']))
+        self.comparisons.extend(extracted['comparisons'])
+        for merged, values in ((self.product_info, extracted['product_info']),
+                               (self.pricing, extracted['pricing']),
+                               (self.metadata, extracted['metadata'])):
+            for key, value in values.items():
+                merged.setdefault(key, value)
+
+# Flags of the patterns in _initialize_patterns that need any
+PATTERN_FLAGS = {
+    ('reviews', 'container'): re.DOTALL | re.IGNORECASE,
+    ('reviews', 'review_text'): re.DOTALL,
+    ('reviews', 'pros'): re.DOTALL | re.IGNORECASE,
+    ('reviews', 'cons'): re.DOTALL | re.IGNORECASE,
+    ('reviews', 'source'): re.IGNORECASE,
+    ('reviews', 'continue_reading'): re.IGNORECASE,
+    ('pricing', 'price_period'): re.IGNORECASE,
+    ('pricing', 'free_trial'): re.IGNORECASE,
+    ('pricing', 'free_version'): re.IGNORECASE
+}
+
+REVIEW_CONTAINER_STRATEGIES = [
+    register_pattern(f'capterra.review_containers.{name}', source, re.DOTALL | re.IGNORECASE)
+    for name, source in (
+        ('review_class', r'<div[^>]*class="[^"]*review[^"]*"[^>]*>.*?</div>'),
+        ('pros_cons', r'<div[^>]*>.*?Pros.*?Cons.*?</div>'),
+        ('star_rating', r'<div[^>]*>.*?<svg[^>]*class="[^"]*star[^"]*"[^>]*>.*?</div>'),
+        ('reviewer_name', r'<div[^>]*>.*?([A-Z][a-z]+ [A-Z]\.).*?</div>')
+    )
+]
+
 class CapterraPatternExtractor:
-    def __init__(self):
-        """Initialize pattern extractor with comprehensive regex patterns"""
+    def __init__(self, review_index: Optional[NearDuplicateIndex] = None, max_workers: int = 1):
+        """Initialize pattern extractor with comprehensive regex patterns
+        
+        Args:
+            review_index: Near-duplicate index shared across process_chunks
+                calls, so a review seen on one page is dropped on the next;
+                by default each call deduplicates on its own
+            max_workers: Worker processes process_chunks spreads chunks over
+                (None for one per CPU, 1 to extract in this process)
+        """
         self.patterns = self._initialize_patterns()
+        self.review_index = review_index
+        self.max_workers = max_workers
         self.extracted_data = {
             'reviews': [],
             'product_info': {},
@@ -22,9 +104,13 @@ class CapterraPatternExtractor:
             'metadata': {}
         }
     
-    def _initialize_patterns(self) -> Dict[str, Dict[str, str]]:
-        """Initialize comprehensive regex patterns for data extraction"""
-        return {
+    def _initialize_patterns(self) -> Dict[str, Dict[str, BudgetedPattern]]:
+        """Initialize comprehensive regex patterns for data extraction
+        
+        Patterns are compiled once per process in the shared registry, which
+        bounds and budgets the ones that can backtrack on large chunks.
+        """
+        sources = {
             'reviews': {
                 'container': r'<div[^>]*class="[^"]*review[^"]*"[^>]*>.*?</div>',
                 'title': r'<h[1-6][^>]*>([^<]+)</h[1-6]>',
@@ -69,6 +155,13 @@ class CapterraPatternExtractor:
                 'canonical_url': r'<link rel="canonical" href="([^"]+)"'
             }
         }
+        return {
+            group: {
+                name: register_pattern(f'capterra.{group}.{name}', source, PATTERN_FLAGS.get((group, name), 0))
+                for name, source in patterns.items()
+            }
+            for group, patterns in sources.items()
+        }
     
     def extract_from_chunk(self, chunk: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -87,7 +180,8 @@ class CapterraPatternExtractor:
             'chunk_size': chunk['size'],
             'has_reviews': chunk['has_reviews'],
             'has_comparison': chunk['has_comparison'],
-            'has_pricing': chunk['has_pricing']
+            'has_pricing': chunk['has_pricing'],
+            'partial_scans': []
         }
         
         extracted = {
@@ -101,7 +195,7 @@ class CapterraPatternExtractor:
         
         # Extract reviews if chunk contains review content
         if chunk['has_reviews']:
-            extracted['reviews'] = self._extract_reviews(content)
+            extracted['reviews'], chunk_metadata['partial_scans'] = self._extract_reviews(content)
         
         # Extract product information
         extracted['product_info'] = self._extract_product_info(content)
@@ -119,59 +213,39 @@ class CapterraPatternExtractor:
         
         return extracted
     
-    def _extract_reviews(self, content: str) -> List[Dict[str, Any]]:
-        """Extract review data from content"""
+    def _extract_reviews(self, content: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """Extract review data from content, with the container patterns that scanned it only partially"""
         reviews = []
         
         # Find review containers using multiple strategies
-        review_containers = self._find_review_containers(content)
+        review_containers, partial_scans = self._find_review_containers(content)
         
         for i, container in enumerate(review_containers):
             review_data = self._extract_single_review(container, i)
             if review_data:
                 reviews.append(review_data)
         
-        return reviews
+        return reviews, partial_scans
     
-    def _find_review_containers(self, content: str) -> List[str]:
-        """Find review containers using multiple strategies"""
-        containers = []
+    def _find_review_containers(self, content: str) -> Tuple[List[str], List[str]]:
+        """Find review containers using multiple strategies
         
-        # Strategy 1: Look for divs with review class
-        review_divs = re.findall(
-            r'<div[^>]*class="[^"]*review[^"]*"[^>]*>.*?</div>',
-            content, re.DOTALL | re.IGNORECASE
-        )
-        containers.extend(review_divs)
-        
-        # Strategy 2: Look for elements with pros/cons
-        pros_cons_elements = re.findall(
-            r'<div[^>]*>.*?Pros.*?Cons.*?</div>',
-            content, re.DOTALL | re.IGNORECASE
-        )
-        containers.extend(pros_cons_elements)
-        
-        # Strategy 3: Look for elements with star ratings
-        star_elements = re.findall(
-            r'<div[^>]*>.*?<svg[^>]*class="[^"]*star[^"]*"[^>]*>.*?</div>',
-            content, re.DOTALL | re.IGNORECASE
-        )
-        containers.extend(star_elements)
-        
-        # Strategy 4: Look for elements with reviewer names
-        reviewer_elements = re.findall(
-            r'<div[^>]*>.*?([A-Z][a-z]+ [A-Z]\.).*?</div>',
-            content, re.DOTALL | re.IGNORECASE
-        )
-        containers.extend(reviewer_elements)
+        Returns:
+            The containers, and the names of the strategies whose scan was cut
+            short by their budgets, so may have missed some
+        """
+        containers = []
+        partial_scans = []
         
-        # Remove duplicates and return
-        unique_containers = []
-        for container in containers:
-            if container not in unique_containers:
-                unique_containers.append(container)
+        # Strategies: review class, pros/cons, star ratings, reviewer names
+        for pattern in REVIEW_CONTAINER_STRATEGIES:
+            scan = pattern.scan(content)
+            containers.extend(scan.findall())
+            if not scan.complete:
+                partial_scans.append(pattern.name)
         
-        return unique_containers
+        # Remove duplicates, keeping first-seen order
+        return list(dict.fromkeys(containers)), partial_scans
     
     def _extract_single_review(self, container: str, index: int) -> Optional[Dict[str, Any]]:
         """Extract data from a single review container"""
@@ -192,56 +266,56 @@ class CapterraPatternExtractor:
             }
             
             # Extract title (quoted text)
-            title_match = re.search(self.patterns['reviews']['quoted_title'], container)
+            title_match = self.patterns['reviews']['quoted_title'].search(container)
             if title_match:
                 review_data['title'] = title_match.group(1)
             
             # Extract rating
-            rating_matches = re.findall(self.patterns['reviews']['rating'], container)
+            rating_matches = self.patterns['reviews']['rating'].findall(container)
             if rating_matches:
                 review_data['rating'] = f"{len(rating_matches)}.0"
             
             # Extract reviewer information
-            name_match = re.search(self.patterns['reviews']['reviewer_name'], container)
+            name_match = self.patterns['reviews']['reviewer_name'].search(container)
             if name_match:
                 review_data['reviewer_name'] = name_match.group(1)
             
-            role_match = re.search(self.patterns['reviews']['reviewer_role'], container)
+            role_match = self.patterns['reviews']['reviewer_role'].search(container)
             if role_match:
                 review_data['reviewer_role'] = role_match.group(1)
             
-            company_match = re.search(self.patterns['reviews']['reviewer_company'], container)
+            company_match = self.patterns['reviews']['reviewer_company'].search(container)
             if company_match:
                 potential_company = company_match.group(1)
                 if len(potential_company.split()) >= 3:
                     review_data['reviewer_company'] = potential_company
             
             # Extract date
-            date_match = re.search(self.patterns['reviews']['review_date'], container)
+            date_match = self.patterns['reviews']['review_date'].search(container)
             if date_match:
                 review_data['review_date'] = date_match.group(1)
             
             # Extract review text
-            text_match = re.search(self.patterns['reviews']['review_text'], container, re.DOTALL)
+            text_match = self.patterns['reviews']['review_text'].search(container)
             if text_match:
                 review_data['review_text'] = text_match.group(1).strip()
             
             # Extract pros
-            pros_match = re.search(self.patterns['reviews']['pros'], container, re.DOTALL | re.IGNORECASE)
+            pros_match = self.patterns['reviews']['pros'].search(container)
             if pros_match:
                 review_data['pros'] = pros_match.group(1).strip()
             
             # Extract cons
-            cons_match = re.search(self.patterns['reviews']['cons'], container, re.DOTALL | re.IGNORECASE)
+            cons_match = self.patterns['reviews']['cons'].search(container)
             if cons_match:
                 review_data['cons'] = cons_match.group(1).strip()
             
             # Check for review source
-            if re.search(self.patterns['reviews']['source'], container, re.IGNORECASE):
+            if self.patterns['reviews']['source'].search(container):
                 review_data['source'] = 'Capterra'
             
             # Check for continue reading
-            if re.search(self.patterns['reviews']['continue_reading'], container, re.IGNORECASE):
+            if self.patterns['reviews']['continue_reading'].search(container):
                 review_data['continue_reading'] = True
             
             # Only return if we have meaningful data
@@ -258,28 +332,28 @@ class CapterraPatternExtractor:
         product_info = {}
         
         # Extract title
-        title_match = re.search(self.patterns['product_info']['name'], content)
+        title_match = self.patterns['product_info']['name'].search(content)
         if title_match:
             product_info['title'] = title_match.group(1)
         
         # Extract description
-        desc_match = re.search(self.patterns['product_info']['description'], content)
+        desc_match = self.patterns['product_info']['description'].search(content)
         if desc_match:
             product_info['description'] = desc_match.group(1)
         
         # Extract overall rating
-        rating_match = re.search(self.patterns['product_info']['overall_rating'], content)
+        rating_match = self.patterns['product_info']['overall_rating'].search(content)
         if rating_match:
             product_info['overall_rating'] = rating_match.group(1)
             product_info['review_count'] = rating_match.group(2)
         
         # Extract categories
-        categories = re.findall(self.patterns['product_info']['category'], content)
+        categories = self.patterns['product_info']['category'].findall(content)
         if categories:
             product_info['categories'] = [cat[1] for cat in categories]
         
         # Extract features
-        features = re.findall(self.patterns['product_info']['features'], content)
+        features = self.patterns['product_info']['features'].findall(content)
         if features:
             product_info['features'] = features[:10]  # Limit to first 10 features
         
@@ -290,7 +364,7 @@ class CapterraPatternExtractor:
         comparisons = []
         
         # Extract vs patterns
-        vs_matches = re.findall(self.patterns['comparisons']['vs_pattern'], content)
+        vs_matches = self.patterns['comparisons']['vs_pattern'].findall(content)
         for match in vs_matches:
             comparisons.append({
                 'type': 'vs_comparison',
@@ -299,7 +373,7 @@ class CapterraPatternExtractor:
             })
         
         # Extract rating comparisons
-        rating_matches = re.findall(self.patterns['comparisons']['rating_comparison'], content)
+        rating_matches = self.patterns['comparisons']['rating_comparison'].findall(content)
         for match in rating_matches:
             comparisons.append({
                 'type': 'rating_comparison',
@@ -314,21 +388,21 @@ class CapterraPatternExtractor:
         pricing = {}
         
         # Extract prices
-        prices = re.findall(self.patterns['pricing']['price'], content)
+        prices = self.patterns['pricing']['price'].findall(content)
         if prices:
             pricing['prices'] = prices
         
         # Extract price periods
-        periods = re.findall(self.patterns['pricing']['price_period'], content, re.IGNORECASE)
+        periods = self.patterns['pricing']['price_period'].findall(content)
         if periods:
             pricing['periods'] = list(set(periods))
         
         # Check for free trial
-        if re.search(self.patterns['pricing']['free_trial'], content, re.IGNORECASE):
+        if self.patterns['pricing']['free_trial'].search(content):
             pricing['free_trial'] = True
         
         # Check for free version
-        if re.search(self.patterns['pricing']['free_version'], content, re.IGNORECASE):
+        if self.patterns['pricing']['free_version'].search(content):
             pricing['free_version'] = True
         
         return pricing
@@ -338,93 +412,97 @@ class CapterraPatternExtractor:
         metadata = {}
         
         # Extract last updated date
-        updated_match = re.search(self.patterns['metadata']['last_updated'], content)
+        updated_match = self.patterns['metadata']['last_updated'].search(content)
         if updated_match:
             metadata['last_updated'] = updated_match.group(1)
         
         # Extract page type
-        page_type_match = re.search(self.patterns['metadata']['page_type'], content)
+        page_type_match = self.patterns['metadata']['page_type'].search(content)
         if page_type_match:
             metadata['page_type'] = page_type_match.group(1)
         
         # Extract canonical URL
-        url_match = re.search(self.patterns['metadata']['canonical_url'], content)
+        url_match = self.patterns['metadata']['canonical_url'].search(content)
         if url_match:
             metadata['canonical_url'] = url_match.group(1)
         
         return metadata
     
-    def process_chunks(self, chunks: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def process_chunks(self, chunks: List[Dict[str, Any]], max_workers: Optional[int] = None) -> Dict[str, Any]:
         """
         Process multiple chunks and combine results
         
+        Chunks are extracted in worker processes when more than one worker is
+        configured (map), and the partial results are merged in chunk order
+        as they come back (reduce), so the output matches a serial run.
+        
         Args:
-            chunks: List of chunk dictionaries
+            chunks: List of chunk dictionaries or ChunkViews; views are sent
+                to workers as offsets and decoded there
+            max_workers: Overrides the extractor's max_workers for this call
             
         Returns:
             Combined extracted data
         """
         print(f"🔍 Processing {len(chunks)} chunks...")
         
-        all_reviews = []
-        all_product_info = {}
-        all_comparisons = []
-        all_pricing = {}
-        all_metadata = {}
+        # A shared index spans calls; otherwise this call deduplicates on its own
+        review_index = self.review_index if self.review_index is not None else NearDuplicateIndex()
+        reducer = ExtractionReducer(lambda reviews: self._deduplicate_reviews(reviews, review_index))
         
-        for chunk in chunks:
-            extracted = self.extract_from_chunk(chunk)
-            
-            # Combine reviews
-            all_reviews.extend(extracted['reviews'])
-            
-            # Merge product info
-            all_product_info.update(extracted['product_info'])
-            
-            # Combine comparisons
-            all_comparisons.extend(extracted['comparisons'])
-            
-            # Merge pricing
-            all_pricing.update(extracted['pricing'])
-            
-            # Merge metadata
-            all_metadata.update(extracted['metadata'])
-        
-        # Deduplicate reviews
-        unique_reviews = self._deduplicate_reviews(all_reviews)
+        for extracted in self._map_chunks(chunks, self.max_workers if max_workers is None else max_workers):
+            reducer.add(extracted)
         
         result = {
             'extraction_metadata': {
                 'timestamp': datetime.now().isoformat(),
-                'total_chunks_processed': len(chunks),
-                'total_reviews_found': len(all_reviews),
-                'unique_reviews': len(unique_reviews),
+                'total_chunks_processed': reducer.chunks,
+                'chunks_scanned_partially': reducer.partial_chunks,
+                'total_reviews_found': reducer.reviews_found,
+                'unique_reviews': len(reducer.reviews),
                 'extraction_method': 'pattern_based_extraction'
             },
-            'reviews': unique_reviews,
-            'product_info': all_product_info,
-            'comparisons': all_comparisons,
-            'pricing': all_pricing,
-            'metadata': all_metadata
+            'reviews': reducer.reviews,
+            'product_info': reducer.product_info,
+            'comparisons': reducer.comparisons,
+            'pricing': reducer.pricing,
+            'metadata': reducer.metadata
         }
         
-        print(f"✅ Extraction complete: {len(unique_reviews)} unique reviews found")
+        print(f"✅ Extraction complete: {len(reducer.reviews)} unique reviews found")
         return result
     
-    def _deduplicate_reviews(self, reviews: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate reviews based on title and reviewer"""
-        unique_reviews = []
-        seen = set()
-        
-        for review in reviews:
-            # Create a unique identifier
-            identifier = f"{review.get('title', '')}_{review.get('reviewer_name', '')}_{review.get('review_date', '')}"
-            
-            if identifier not in seen and identifier.strip():
-                seen.add(identifier)
-                unique_reviews.append(review)
-        
-        return unique_reviews
+    def _map_chunks(self, chunks: List[Dict[str, Any]], max_workers: Optional[int]) -> Iterator[Dict[str, Any]]:
+        """Yield extract_from_chunk results in chunk order, in a process pool if asked to"""
+        max_workers = min(max_workers or os.cpu_count() or 1, len(chunks) or 1)
+        if max_workers == 1:
+            yield from map(self.extract_from_chunk, chunks)
+            return
+        
+        # Batches amortize the pickling round trips; several per worker keep the load even
+        batch_size = max(1, len(chunks) // (max_workers * 4))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(type(self),)) as pool:
+            yield from pool.map(_extract_in_worker, chunks, chunksize=batch_size)
+    
+    def _deduplicate_reviews(self, reviews: List[Dict[str, Any]],
+                             index: Optional[NearDuplicateIndex] = None) -> List[Dict[str, Any]]:
+        """Remove near-duplicate reviews by the same reviewer
+        
+        Overlapping chunks and nested containers yield the same review with
+        slightly different surrounding text, so reviews are compared by a
+        SimHash fingerprint of their text rather than exact field matches.
+        Reviews already in ``index`` (default: the shared review_index) are
+        dropped too.
+        """
+        return deduplicate(
+            reviews,
+            lambda review: ' '.join(
+                review.get(field, '') for field in ('title', 'review_date', 'review_text', 'pros', 'cons')
+            ),
+            lambda review: review.get('reviewer_name', '').strip().lower(),
+            index if index is not None else self.review_index
+        )
 
 def main():
     """Main function to demonstrate pattern extraction"""
@@ -432,7 +510,7 @@ def main():
     
     # Initialize chunker and extractor
     chunker = HTMLChunker(chunk_size=50000, overlap_size=5000)
-    extractor = CapterraPatternExtractor()
+    extractor = CapterraPatternExtractor(max_workers=None)
     
     # Process a sample file
     sample_file = "capterraHTML/Looker Features, Alternatives & More 2025 _ Capterra.html"
@@ -10,13 +10,16 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from playwright.async_api import Page
 
+from template_profiles import TemplateProfileStore, template_fingerprint
+
 logger = logging.getLogger(__name__)
 
 class CapterraSelectorExtractor:
     """Extract precise selectors from Capterra pages using developer tools analysis"""
     
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, profile_store: Optional[TemplateProfileStore] = None):
         self.page = page
+        self.profile_store = profile_store
         self.extracted_selectors = {}
         self.page_structure = {}
     
@@ -29,6 +32,16 @@ class CapterraSelectorExtractor:
             await self.page.goto(url, wait_until='domcontentloaded')
             await asyncio.sleep(3)
             
+            # Pages from a template seen before reuse its learned selectors
+            fingerprint = None
+            if self.profile_store is not None:
+                fingerprint = template_fingerprint((await self.page.content()).encode('utf-8'))
+                profile = self.profile_store.get(fingerprint)
+                if profile is not None:
+                    print(f"   ♻️ Known page template {fingerprint}, reusing its selectors")
+                    self.extracted_selectors = profile['selectors']
+                    return profile['selectors']
+            
             # Extract different types of selectors
             selectors = {
                 'company_info': await self._extract_company_selectors(),
@@ -41,7 +54,7 @@ class CapterraSelectorExtractor:
             
             # Save extracted selectors
             self.extracted_selectors = selectors
-            await self._save_selectors(selectors, url)
+            await self._save_selectors(selectors, url, fingerprint)
             
             return selectors
             
@@ -356,8 +369,8 @@ class CapterraSelectorExtractor:
         
         return structure
     
-    async def _save_selectors(self, selectors: Dict[str, Any], url: str):
-        """Save extracted selectors to file"""
+    async def _save_selectors(self, selectors: Dict[str, Any], url: str, fingerprint: Optional[str] = None):
+        """Save extracted selectors to file, and as the profile of the page's template"""
         output_dir = Path("output/selectors")
         output_dir.mkdir(parents=True, exist_ok=True)
         
@@ -369,6 +382,7 @@ class CapterraSelectorExtractor:
         selector_data = {
             'url': url,
             'extraction_timestamp': asyncio.get_event_loop().time(),
+            'template_fingerprint': fingerprint,
             'selectors': selectors
         }
         
@@ -377,6 +391,10 @@ class CapterraSelectorExtractor:
             json.dump(selector_data, f, indent=2)
         
         print(f"   💾 Selectors saved to: {output_file}")
+        
+        if self.profile_store is not None and fingerprint:
+            self.profile_store.put(fingerprint, selectors, url=url)
+            print(f"   🧬 Learned selector profile for page template {fingerprint}")
     
     async def generate_playwright_selectors(self) -> Dict[str, str]:
         """Generate Playwright-compatible selectors from extracted data"""
@@ -440,8 +458,9 @@ async def extract_selectors_from_capterra():
         # Get targets
         targets = aura_lite.target_manager.get_targets_by_priority("high")
         
-        # Extract selectors from each target
+        # Extract selectors from each target, discovering them once per page template
         all_selectors = {}
+        profile_store = TemplateProfileStore()
         
         for i, target in enumerate(targets[:3]):  # Test with first 3 targets
             company_name = target['data']['name']
@@ -451,7 +470,7 @@ async def extract_selectors_from_capterra():
             print(f"   URL: {reviews_url}")
             
             # Create extractor
-            extractor = CapterraSelectorExtractor(aura_lite.page)
+            extractor = CapterraSelectorExtractor(aura_lite.page, profile_store)
             
             # Extract selectors
             selectors = await extractor.extract_all_selectors(reviews_url)
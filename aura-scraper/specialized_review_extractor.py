@@ -6,10 +6,11 @@ Uses targeted pattern matching to extract review data from minified HTML
 
 import re
 import json
-from bs4 import BeautifulSoup
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from html_source import load_soup
+
 class SpecializedReviewExtractor:
     def __init__(self, html_file: str):
         self.html_file = html_file
@@ -18,9 +19,7 @@ class SpecializedReviewExtractor:
     def load_html(self) -> bool:
         """Load and parse the HTML file"""
         try:
-            with open(self.html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            self.soup = BeautifulSoup(content, 'html.parser')
+            self.soup = load_soup(self.html_file)
             print(f"✅ Loaded HTML file: {self.html_file}")
             return True
         except Exception as e:
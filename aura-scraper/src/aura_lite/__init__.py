@@ -3,12 +3,22 @@ AURA-LITE - Specialized Capterra Scraper
 Adapted from Chimera-Ultimate for targeted review platform scraping
 """
 
+import sys
+from pathlib import Path
+
+# The offline modules the package builds on (html_source, template_profiles,
+# chimera_bridge) live in the aura-scraper root next to the scripts
+AURA_ROOT = Path(__file__).resolve().parents[2]
+if str(AURA_ROOT) not in sys.path:
+    sys.path.insert(0, str(AURA_ROOT))
+
 from .aura_lite import AuraLite
 from .core.cloudflare_bypass import CloudflareBypassManager
 from .core.human_behavior import HumanBehaviorSimulator
 from .managers.target_manager import CapterraTargetManager
 from .managers.session_manager import SessionManager
 from .extractors.data_extractor import CapterraDataExtractor
+from .extractors.review_engine import ReviewExtractionEngine
 
 __version__ = "1.0.0"
 __author__ = "AURA-LITE Team"
@@ -19,5 +29,6 @@ __all__ = [
     'HumanBehaviorSimulator',
     'CapterraTargetManager',
     'SessionManager',
-    'CapterraDataExtractor'
+    'CapterraDataExtractor',
+    'ReviewExtractionEngine'
 ]
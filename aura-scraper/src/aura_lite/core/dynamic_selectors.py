@@ -9,15 +9,19 @@ from pathlib import Path
 from typing import Dict, List, Any, Optional
 from playwright.async_api import Page
 
+from template_profiles import TemplateProfileStore, template_fingerprint
+
 logger = logging.getLogger(__name__)
 
 class DynamicSelectorManager:
     """Manages dynamic selectors extracted from real page analysis"""
     
-    def __init__(self, selectors_file: Optional[str] = None):
+    def __init__(self, selectors_file: Optional[str] = None, profile_store: Optional[TemplateProfileStore] = None):
         self.selectors_file = selectors_file or "output/selectors/combined_capterra_selectors.json"
         self.selectors = self._load_selectors()
         self.fallback_selectors = self._get_fallback_selectors()
+        # Selector profiles learned per page template
+        self.profile_store = profile_store if profile_store is not None else TemplateProfileStore()
     
     def _load_selectors(self) -> Dict[str, Any]:
         """Load extracted selectors from file"""
@@ -92,7 +96,18 @@ class DynamicSelectorManager:
         if company not in self.selectors:
             return self.fallback_selectors
         
-        company_data = self.selectors[company]
+        return self._flatten_selectors(self.selectors[company])
+    
+    def get_template_selectors(self, fingerprint: str, company: str = None) -> Dict[str, str]:
+        """Get all selectors learned for a page template, else the company's selectors"""
+        profile = self.profile_store.get(fingerprint) if fingerprint else None
+        if profile is None:
+            return self.get_company_selectors(company) if company else self.fallback_selectors
+        
+        return self._flatten_selectors(profile['selectors'])
+    
+    def _flatten_selectors(self, company_data: Dict[str, Any]) -> Dict[str, str]:
+        """Map extracted selector sections to element types, filling gaps with fallbacks"""
         selectors = {}
         
         # Extract company info selectors
@@ -148,17 +163,28 @@ class PreciseDataExtractor:
     def __init__(self, page: Page, selector_manager: DynamicSelectorManager):
         self.page = page
         self.selector_manager = selector_manager
+        self.template = None
         self.extraction_stats = {
             'elements_found': 0,
             'elements_missing': 0,
             'extraction_errors': 0
         }
     
+    async def identify_template(self) -> str:
+        """Fingerprint the loaded page, so its template's learned selectors are used"""
+        self.template = template_fingerprint((await self.page.content()).encode('utf-8'))
+        return self.template
+    
+    def _get_selectors(self, company: str) -> Dict[str, str]:
+        if self.template:
+            return self.selector_manager.get_template_selectors(self.template, company)
+        return self.selector_manager.get_company_selectors(company)
+    
     async def extract_company_data(self, company: str) -> Dict[str, Any]:
         """Extract company data using precise selectors"""
         print(f"🔍 Extracting data for: {company}")
         
-        selectors = self.selector_manager.get_company_selectors(company)
+        selectors = self._get_selectors(company)
         data = {}
         
         try:
@@ -209,7 +235,7 @@ class PreciseDataExtractor:
         """Extract individual reviews using precise selectors"""
         print(f"📝 Extracting reviews for: {company}")
         
-        selectors = self.selector_manager.get_company_selectors(company)
+        selectors = self._get_selectors(company)
         reviews = []
         
         try:
@@ -280,7 +306,7 @@ class PreciseDataExtractor:
         """Extract alternative products using precise selectors"""
         print(f"🔄 Extracting alternatives for: {company}")
         
-        selectors = self.selector_manager.get_company_selectors(company)
+        selectors = self._get_selectors(company)
         alternatives = []
         
         try:
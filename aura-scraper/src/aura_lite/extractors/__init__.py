@@ -3,5 +3,6 @@ AURA-LITE Extractors
 """
 
 from .data_extractor import CapterraDataExtractor
+from .review_engine import PageIndex, ReviewExtractionEngine, ReviewStrategy
 
-__all__ = ['CapterraDataExtractor']
+__all__ = ['CapterraDataExtractor', 'PageIndex', 'ReviewExtractionEngine', 'ReviewStrategy']
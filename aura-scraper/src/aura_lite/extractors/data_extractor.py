@@ -13,6 +13,83 @@ from playwright.async_api import Page
 
 logger = logging.getLogger(__name__)
 
+# Review-like phrases for the pattern matching fallback
+REVIEW_TRIGGER_PHRASES = [
+    'what do you like best about',
+    'what do you dislike about',
+    'powerful tool that empowers',
+    'blended data feature',
+    'experience of working',
+    'recommend this product'
+]
+
+# Finds elements whose textContent is longer than minLength and contains a
+# phrase, in one walk of the text nodes: every element's text is a span of the
+# page text, and an element matches when a phrase occurrence lies inside it.
+PHRASE_CONTAINERS_SCRIPT = """
+([tags, phrases, minLength, limit]) => {
+    const wanted = new Set(tags);
+    const pieces = [];
+    const spans = [];
+    let length = 0;
+
+    const walk = (node) => {
+        for (let child = node.firstChild; child; child = child.nextSibling) {
+            if (child.nodeType === Node.TEXT_NODE || child.nodeType === Node.CDATA_SECTION_NODE) {
+                pieces.push(child.data);
+                length += child.data.length;
+            } else if (child.nodeType === Node.ELEMENT_NODE) {
+                const span = wanted.has(child.localName) ? [child, length, length] : null;
+                if (span) spans.push(span);
+                walk(child);
+                if (span) span[2] = length;
+            }
+        }
+    };
+    walk(document);
+
+    const text = pieces.join('');
+    const lowered = text.toLowerCase();
+    const matches = [];
+
+    if (lowered.length !== text.length) {
+        // Lower-casing shifted offsets; check each candidate directly
+        for (const [element, start, end] of spans) {
+            const content = element.textContent.toLowerCase();
+            if (end - start > minLength && phrases.some((phrase) => content.includes(phrase))) {
+                matches.push(element);
+            }
+        }
+    } else {
+        const occurrences = [];
+        for (const phrase of phrases) {
+            for (let at = lowered.indexOf(phrase); at !== -1; at = lowered.indexOf(phrase, at + 1)) {
+                occurrences.push([at, at + phrase.length]);
+            }
+        }
+        occurrences.sort((a, b) => a[0] - b[0]);
+
+        // Smallest occurrence end at or after each index
+        const minEnds = occurrences.map((occurrence) => occurrence[1]);
+        for (let i = minEnds.length - 2; i >= 0; i--) {
+            minEnds[i] = Math.min(minEnds[i], minEnds[i + 1]);
+        }
+
+        for (const [element, start, end] of spans) {
+            if (end - start <= minLength) continue;
+            let low = 0, high = occurrences.length;
+            while (low < high) {
+                const mid = (low + high) >> 1;
+                if (occurrences[mid][0] < start) low = mid + 1; else high = mid;
+            }
+            if (low < occurrences.length && minEnds[low] <= end) matches.push(element);
+        }
+    }
+
+    return {total: matches.length, elements: matches.slice(0, limit)};
+}
+"""
+
 class CapterraDataExtractor:
     """Data extraction system adapted from Chimera-Ultimate's precision extraction"""
     
@@ -204,28 +281,11 @@ class CapterraDataExtractor:
             if not review_elements:
                 # Pattern matching fallback
                 logger.debug("No review elements found with standard selectors, trying pattern matching")
-                all_elements = await self.page.query_selector_all('div, p, span')
-                potential_reviews = []
-                
-                for element in all_elements:
-                    try:
-                        text = await element.text_content()
-                        if text and len(text) > 30:
-                            if any(phrase in text.lower() for phrase in [
-                                'what do you like best about',
-                                'what do you dislike about',
-                                'powerful tool that empowers',
-                                'blended data feature',
-                                'experience of working',
-                                'recommend this product'
-                            ]):
-                                potential_reviews.append(element)
-                    except:
-                        continue
+                total, potential_reviews = await self._find_phrase_containers(['div', 'p', 'span'], REVIEW_TRIGGER_PHRASES, limit=20)
                 
                 if potential_reviews:
-                    review_elements = potential_reviews[:20]
-                    logger.debug(f"Found {len(potential_reviews)} potential review elements using pattern matching")
+                    review_elements = potential_reviews
+                    logger.debug(f"Found {total} potential review elements using pattern matching")
             
             # Extract review data
             max_reviews = 25  # Limit to avoid detection
@@ -247,6 +307,22 @@ class CapterraDataExtractor:
             logger.error(f"Error extracting individual reviews: {str(e)}")
             return []
     
+    async def _find_phrase_containers(self, tags: List[str], phrases: List[str], min_length: int = 30, limit: int = 20):
+        """Find phrase-matching elements in one in-page pass instead of a round trip per element"""
+        try:
+            result = await self.page.evaluate_handle(PHRASE_CONTAINERS_SCRIPT, [tags, phrases, min_length, limit])
+            total = await (await result.get_property('total')).json_value()
+            properties = await (await result.get_property('elements')).get_properties()
+            elements = [
+                handle.as_element()
+                for _, handle in sorted(properties.items(), key=lambda item: int(item[0]))
+                if handle.as_element() is not None
+            ]
+            return total, elements
+        except Exception as e:
+            logger.debug(f"Pattern matching scan failed: {str(e)}")
+            return 0, []
+    
     async def _extract_single_review(self, element) -> Optional[Dict[str, Any]]:
         """Extract data from a single review element"""
         try:
@@ -0,0 +1,518 @@
+"""
+ReviewExtractionEngine - Unified offline review extraction
+Parses a saved page once and runs the container, layout, structure and text
+pattern strategies of the offline extractors as plugins over a shared index,
+merging their reviews with per-strategy confidence scores
+"""
+
+import logging
+import re
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+
+from chimera_bridge import NearDuplicateIndex, register_pattern
+from html_source import HTMLSource
+
+logger = logging.getLogger(__name__)
+
+# Fields of a merged review, in output order
+REVIEW_FIELDS = (
+    'title', 'reviewer_name', 'reviewer_role', 'reviewer_company', 'review_date',
+    'star_rating', 'review_text', 'pros', 'cons', 'review_source'
+)
+
+# Review fields compared when grouping untitled reviews of the same reviewer
+DEDUP_FIELDS = ('review_date', 'review_text', 'pros', 'cons')
+
+STRUCTURE_TAGS = ['div', 'article', 'section']
+
+# Industry words that make a capitalised phrase a reviewer company
+COMPANY_KEYWORDS = [
+    'technology', 'services', 'software', 'marketing', 'advertising', 'health',
+    'wellness', 'fitness', 'financial', 'hospitality', 'machinery'
+]
+TEXT_SKIP_KEYWORDS = ['pros', 'cons', 'review source', 'continue reading', 'view less']
+
+NAME_PATTERN = re.compile(r'([A-Z][a-z]+ [A-Z]\.)')
+ROLE_PATTERN = re.compile(r'([A-Z][a-z]+ [A-Z][a-z]+)')
+COMPANY_PATTERN = re.compile(r'([A-Z][a-z]+(?: [A-Z][a-z]+)*(?: and [A-Z][a-z]+)*)')
+DATE_PATTERN = re.compile(r'([A-Z][a-z]+ \d{1,2}, \d{4})')
+QUOTED_TITLE_PATTERN = re.compile(r'"([^"]+)"')
+PROS_PATTERN = re.compile(r'Pros\s*(.*?)(?=Cons|Review source|Continue reading|$)', re.DOTALL | re.IGNORECASE)
+CONS_PATTERN = re.compile(r'Cons\s*(.*?)(?=Review source|Continue reading|$)', re.DOTALL | re.IGNORECASE)
+
+# At least REVIEW_INDICATOR_THRESHOLD of these in an element's text mark it as a review
+REVIEW_INDICATORS = [
+    re.compile(pattern) for pattern in (
+        r'"[^"]+"', r'[A-Z][a-z]+ [A-Z]\.', r'[A-Z][a-z]+ [A-Z][a-z]+', r'[A-Z][a-z]+ \d{1,2}, \d{4}',
+        r'Pros\s+', r'Cons\s+', r'Review source', r'Continue reading'
+    )
+]
+REVIEW_INDICATOR_THRESHOLD = 3
+
+# Quoted title, reviewer name, role, company and date, then the text up to the next title
+REVIEW_BLOCK_PATTERN = register_pattern(
+    'aura.review_blocks',
+    r'"([^"]+)"\s*([A-Z][a-z]+ [A-Z]\.)\s*([A-Z][a-z]+ [A-Z][a-z]+)\s*'
+    r'([A-Z][a-z]+(?: [A-Z][a-z]+)*(?: and [A-Z][a-z]+)*)\s*([A-Z][a-z]+ \d{1,2}, \d{4})\s*(.*?)(?="[^"]+"|$)',
+    re.DOTALL
+)
+
+
+class PageIndex:
+    """One parse of a saved page with the lookups the strategies share
+
+    Text strings are collected once in document order and every element keeps
+    the range of strings below it, so an element's ``get_text()`` is a join of
+    a slice instead of another walk of its subtree. Class searches and element
+    lists are cached, so strategies looking for the same containers share them.
+    """
+
+    def __init__(self, soup: BeautifulSoup):
+        self.soup = soup
+        self._strings: List[str] = []
+        self._stripped: List[str] = []
+        self._spans: Dict[int, Tuple[int, int]] = {}
+        self._closing_order: List[Tag] = []
+        self._text_cache: Dict[Tuple[int, bool], str] = {}
+        self._find_cache: Dict[Tuple[str, str, int], List[Tag]] = {}
+        self._build()
+
+    @classmethod
+    def from_file(cls, html_file: str) -> "PageIndex":
+        """Parse a saved page through a memory map, without script and style bodies"""
+        with HTMLSource(html_file) as source:
+            return cls(source.soup())
+
+    def _build(self):
+        """Record each element's string range in one iterative walk"""
+        string_types = tuple(getattr(Tag, 'MAIN_CONTENT_STRING_TYPES', None) or (NavigableString, CData))
+        stack: List[Tuple[Any, int]] = [(self.soup, -1)]
+        while stack:
+            node, start = stack.pop()
+            if start >= 0:
+                # Every descendant has been visited
+                self._spans[id(node)] = (start, len(self._strings))
+                self._closing_order.append(node)
+            elif isinstance(node, Tag):
+                stack.append((node, len(self._strings)))
+                stack.extend((child, -1) for child in reversed(node.contents))
+            elif type(node) in string_types:
+                self._strings.append(node)
+                self._stripped.append(node.strip())
+
+    def text(self, element: Tag, strip: bool = False) -> str:
+        """``element.get_text()`` (or ``get_text(strip=True)``) from the shared strings"""
+        key = (id(element), strip)
+        cached = self._text_cache.get(key)
+        if cached is None:
+            start, end = self._spans[id(element)]
+            pieces = self._stripped if strip else self._strings
+            cached = self._text_cache[key] = ''.join(pieces[start:end])
+        return cached
+
+    @property
+    def page_text(self) -> str:
+        return self.text(self.soup)
+
+    def find_all(self, name: str, class_pattern: str, flags: int = 0) -> List[Tag]:
+        """``soup.find_all(name, class_=re.compile(class_pattern, flags))``, cached"""
+        key = (name, class_pattern, flags)
+        if key not in self._find_cache:
+            self._find_cache[key] = self.soup.find_all(name, class_=re.compile(class_pattern, flags))
+        return self._find_cache[key]
+
+    def elements(self, names: Iterable[str], innermost_first: bool = False) -> List[Tag]:
+        """Elements with these tag names, in document order or in closing order"""
+        names = set(names)
+        if innermost_first:
+            return [element for element in self._closing_order if element.name in names]
+        return self.soup.find_all(list(names))
+
+    def title_containers(self) -> List[Tag]:
+        """Parents of the quoted ``h4`` review titles"""
+        key = ('h4', '"title"', 0)
+        if key not in self._find_cache:
+            parents = (title.find_parent() for title in self.soup.find_all('h4', string=re.compile(r'".*"')))
+            self._find_cache[key] = [parent for parent in parents if parent]
+        return self._find_cache[key]
+
+    def star_containers(self) -> List[Tag]:
+        """Parents of the star-rating rows"""
+        return [
+            star.find_parent() for star in self.find_all('div', r'flex.*items-center.*gap-1')
+            if star.find('svg', class_=re.compile(r'star')) and star.find_parent()
+        ]
+
+
+def is_review_text(text: str) -> bool:
+    """Check if an element's text has enough review indicators"""
+    return sum(1 for pattern in REVIEW_INDICATORS if pattern.search(text)) >= REVIEW_INDICATOR_THRESHOLD
+
+
+def reviewer_from_text(text: str, company_keywords: Optional[List[str]] = COMPANY_KEYWORDS) -> Dict[str, str]:
+    """Reviewer name, role, company and date found anywhere in a container's text
+
+    A company is a capitalised phrase of three or more words, containing one
+    of ``company_keywords`` unless that is None.
+    """
+    info = {"reviewer_name": "", "reviewer_role": "", "reviewer_company": "", "review_date": ""}
+
+    name_match = NAME_PATTERN.search(text)
+    if name_match:
+        info["reviewer_name"] = name_match.group(1)
+
+    role_match = ROLE_PATTERN.search(text)
+    if role_match:
+        info["reviewer_role"] = role_match.group(1)
+
+    company_match = COMPANY_PATTERN.search(text)
+    if company_match:
+        potential_company = company_match.group(1)
+        if len(potential_company.split()) >= 3 and (
+                company_keywords is None or any(word in potential_company.lower() for word in company_keywords)):
+            info["reviewer_company"] = potential_company
+
+    date_match = DATE_PATTERN.search(text)
+    if date_match:
+        info["review_date"] = date_match.group(1)
+
+    return info
+
+
+def pros_cons_from_text(text: str) -> Dict[str, str]:
+    """Pros and cons sections of a container's text, when longer than a few words"""
+    pros_cons = {"pros": "", "cons": ""}
+
+    pros_match = PROS_PATTERN.search(text)
+    if pros_match and len(pros_match.group(1).strip()) > 10:
+        pros_cons["pros"] = pros_match.group(1).strip()
+
+    cons_match = CONS_PATTERN.search(text)
+    if cons_match and len(cons_match.group(1).strip()) > 10:
+        pros_cons["cons"] = cons_match.group(1).strip()
+
+    return pros_cons
+
+
+def source_from_text(text: str) -> Dict[str, Any]:
+    """Review source and continue-reading flags of a container's text"""
+    return {
+        "review_source": "Capterra" if "Review source" in text else "",
+        "continue_reading": "Continue reading" in text
+    }
+
+
+def empty_review() -> Dict[str, Any]:
+    review = {field: "" for field in REVIEW_FIELDS}
+    review["continue_reading"] = False
+    return review
+
+
+class ReviewStrategy:
+    """A way of finding reviews on an indexed page
+
+    Plugins set ``name`` and ``confidence``, the weight their reviews carry
+    when strategies are merged, and implement ``extract``.
+    """
+    name = "base"
+    confidence = 0.5
+
+    def extract(self, index: PageIndex) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+
+class ContainerStrategy(ReviewStrategy):
+    """Review cards found by layout class, title and star row (UltimateReviewExtractor)"""
+    name = "container"
+    confidence = 0.9
+
+    def extract(self, index: PageIndex) -> List[Dict[str, Any]]:
+        containers = index.find_all('div', r'flex.*md:flex-row.*md:items-start.*gap-3.*mb-2')
+        containers = containers + index.title_containers() + index.star_containers()
+        # Deduplicate by element identity; Tag equality compares whole subtrees
+        containers = list({id(container): container for container in containers}.values())
+        return [self._extract_review(index, container) for container in containers]
+
+    def _extract_review(self, index: PageIndex, container: Tag) -> Dict[str, Any]:
+        review = empty_review()
+
+        title_elem = container.find('h4', class_=re.compile(r'text-typo-20.*font-semibold.*text-neutral-99.*flex-1'))
+        if title_elem:
+            review["title"] = index.text(title_elem, strip=True)
+
+        star_elem = container.find('div', class_=re.compile(r'flex.*items-center.*gap-1.*mr-1'))
+        if star_elem:
+            stars = star_elem.find_all('svg', class_=re.compile(r'star'))
+            if stars:
+                review["star_rating"] = f"{len(stars)}.0"
+
+        all_text = index.text(container)
+        review.update(reviewer_from_text(all_text))
+        review["review_text"] = self._review_text(index, container)
+        review.update(pros_cons_from_text(all_text))
+        review.update(source_from_text(all_text))
+        return review
+
+    @staticmethod
+    def _review_text(index: PageIndex, container: Tag) -> str:
+        """First paragraph, else first div, with substantial text that is not a pros/cons label"""
+        for name in ('p', 'div'):
+            for element in container.find_all(name):
+                text = index.text(element, strip=True)
+                if len(text) > 100 and not any(keyword in text.lower() for keyword in TEXT_SKIP_KEYWORDS):
+                    return text
+        return ""
+
+
+class LayoutStrategy(ReviewStrategy):
+    """Reviewer spans and text paragraphs of the current card layout (AdvancedCapterraHTMLAnalyzer)"""
+    name = "layout"
+    confidence = 0.8
+
+    CLASS_PATTERNS = [
+        r'flex.*md:flex-row.*md:items-start.*gap-3.*mb-2',
+        r'flex.*gap-3.*mb-2',
+        r'.*review.*',
+        r'.*user.*review.*'
+    ]
+
+    def extract(self, index: PageIndex) -> List[Dict[str, Any]]:
+        containers = [element for pattern in self.CLASS_PATTERNS for element in index.find_all('div', pattern, re.I)]
+        containers += index.title_containers() + index.star_containers()
+        containers = list({id(container): container for container in containers}.values())
+        return [self._extract_review(index, container) for container in containers]
+
+    def _extract_review(self, index: PageIndex, container: Tag) -> Dict[str, Any]:
+        review = empty_review()
+
+        title_elem = container.find('h4', class_=re.compile(r'text-typo-20.*font-semibold.*text-neutral-99.*flex-1'))
+        if title_elem:
+            review["title"] = index.text(title_elem, strip=True)
+
+        star_elem = container.find('div', class_=re.compile(r'flex.*items-center.*gap-1.*mr-1'))
+        if star_elem:
+            stars = star_elem.find_all('svg', class_=re.compile(r'star'))
+            if stars:
+                review["star_rating"] = f"{len(stars)}.0"
+
+        for span in container.find_all('span', class_=re.compile(r'text-typo-0.*text-neutral-90')):
+            text = index.text(span, strip=True)
+            if re.match(r'^[A-Z][a-z]+ [A-Z]\.$', text):
+                review["reviewer_name"] = text
+            elif re.match(r'^[A-Z][a-z]+ [A-Z][a-z]+$', text):
+                review["reviewer_role"] = text
+            elif len(text.split()) >= 3 and any(word in text.lower() for word in COMPANY_KEYWORDS[:5]):
+                review["reviewer_company"] = text
+            elif re.match(r'^[A-Z][a-z]+ \d{1,2}, \d{4}$', text):
+                review["review_date"] = text
+
+        for paragraph in container.find_all('p', class_=re.compile(r'text-typo-20.*text-neutral-90')):
+            text = index.text(paragraph, strip=True)
+            if len(text) > 50 and not any(keyword in text.lower() for keyword in TEXT_SKIP_KEYWORDS[:4]):
+                review["review_text"] = text
+                break
+
+        # The analyzer's pros and cons both read the first labelled row
+        labelled = container.find('div', class_=re.compile(r'flex.*items-center.*gap-2.*mb-2'))
+        if labelled:
+            paragraph = labelled.find('p', class_=re.compile(r'text-typo-20.*text-neutral-90'))
+            if paragraph:
+                review["pros"] = review["cons"] = index.text(paragraph, strip=True)
+
+        return review
+
+
+class StructureStrategy(ReviewStrategy):
+    """Any element whose text reads like a review (Final and Specialized extractors)
+
+    Elements are visited innermost first, so a review's own card is seen
+    before the wrappers that repeat it.
+    """
+    name = "structure"
+    confidence = 0.7
+
+    def extract(self, index: PageIndex) -> List[Dict[str, Any]]:
+        reviews = []
+        for element in index.elements(STRUCTURE_TAGS, innermost_first=True):
+            text = index.text(element, strip=True)
+            if is_review_text(text):
+                reviews.append(self.review_from_text(text))
+        return reviews
+
+    @staticmethod
+    def review_from_text(text: str) -> Dict[str, Any]:
+        """Review fields from an element's stripped text"""
+        review = empty_review()
+
+        title_match = QUOTED_TITLE_PATTERN.search(text)
+        if title_match:
+            review["title"] = title_match.group(1)
+
+        review.update(reviewer_from_text(text, company_keywords=None))
+
+        # Review text runs from the title to the first of Pros/Cons
+        if review["title"]:
+            text_start = text.find(review["title"]) + len(review["title"])
+            ends = [pos for pos in (text.find("Pros", text_start), text.find("Cons", text_start)) if pos > 0]
+            if ends:
+                review_text = text[text_start:min(ends)].strip()
+                if len(review_text) > 50:
+                    review["review_text"] = review_text
+
+        review.update(pros_cons_from_text(text))
+        review.update(source_from_text(text))
+        return review
+
+
+class TextPatternStrategy(ReviewStrategy):
+    """Title, reviewer and date runs in the page text (SpecializedReviewExtractor)"""
+    name = "text_pattern"
+    confidence = 0.6
+
+    def extract(self, index: PageIndex) -> List[Dict[str, Any]]:
+        reviews = []
+        for match in REVIEW_BLOCK_PATTERN.finditer(index.page_text):
+            review = empty_review()
+            review_text = match.group(6).strip()
+            review.update({
+                "title": match.group(1),
+                "reviewer_name": match.group(2),
+                "reviewer_role": match.group(3),
+                "reviewer_company": match.group(4),
+                "review_date": match.group(5),
+                "review_text": review_text[:500] + "..." if len(review_text) > 500 else review_text
+            })
+            reviews.append(review)
+        return reviews
+
+
+def default_strategies() -> List[ReviewStrategy]:
+    return [ContainerStrategy(), LayoutStrategy(), StructureStrategy(), TextPatternStrategy()]
+
+
+class ReviewMerger:
+    """Groups the reviews of several strategies and merges each group
+
+    Reviews with the same title (quotes and case aside) and no conflicting
+    reviewer name are one review; untitled ones are matched by near-duplicate
+    text within the same reviewer. A merged field comes from the most
+    confident strategy that found it, and a review's confidence is
+    ``1 - prod(1 - confidence)`` over the distinct strategies that found it.
+    """
+
+    def __init__(self):
+        self.groups: List[List[Tuple[ReviewStrategy, Dict[str, Any]]]] = []
+        self._by_title: Dict[str, List[int]] = {}
+        self._untitled = NearDuplicateIndex()
+
+    @staticmethod
+    def _title_key(review: Dict[str, Any]) -> str:
+        return review.get("title", "").strip().strip('"“”').strip().lower()
+
+    @staticmethod
+    def _reviewer(review: Dict[str, Any]) -> str:
+        return review.get("reviewer_name", "").strip().lower()
+
+    def add(self, strategy: ReviewStrategy, review: Dict[str, Any]):
+        if not any(review.get(field) for field in REVIEW_FIELDS):
+            return
+        title = self._title_key(review)
+        reviewer = self._reviewer(review)
+        group_id = None
+        if title:
+            for candidate in self._by_title.get(title, []):
+                names = {self._reviewer(member) for _, member in self.groups[candidate]} - {""}
+                if not reviewer or not names or reviewer in names:
+                    group_id = candidate
+                    break
+        else:
+            text = ' '.join(review.get(field, '') for field in DEDUP_FIELDS)
+            group_id = self._untitled.add(len(self.groups), text, reviewer)
+
+        if group_id is None:
+            group_id = len(self.groups)
+            self.groups.append([])
+            if title:
+                self._by_title.setdefault(title, []).append(group_id)
+        self.groups[group_id].append((strategy, review))
+
+    def merged(self) -> List[Dict[str, Any]]:
+        reviews = []
+        for group in self.groups:
+            # Most confident strategy first; a strategy's own order is kept
+            members = sorted(group, key=lambda member: -member[0].confidence)
+            review = empty_review()
+            field_sources = {}
+            for field in REVIEW_FIELDS:
+                for strategy, candidate in members:
+                    if candidate.get(field):
+                        review[field] = candidate[field]
+                        field_sources[field] = strategy.name
+                        break
+            review["continue_reading"] = any(candidate.get("continue_reading") for _, candidate in members)
+
+            strategies = {strategy.name: strategy.confidence for strategy, _ in members}
+            missed = 1.0
+            for confidence in strategies.values():
+                missed *= 1.0 - confidence
+            review["confidence"] = round(1.0 - missed, 4)
+            review["sources"] = list(strategies)
+            review["field_sources"] = field_sources
+            reviews.append(review)
+        return reviews
+
+
+class ReviewExtractionEngine:
+    """Runs every registered strategy over one parse of a page and merges the reviews"""
+
+    def __init__(self, strategies: Optional[Iterable[ReviewStrategy]] = None):
+        self.strategies = list(strategies) if strategies is not None else default_strategies()
+
+    def register(self, strategy: ReviewStrategy):
+        """Add a strategy plugin"""
+        self.strategies.append(strategy)
+
+    def extract_file(self, html_file: str) -> Dict[str, Any]:
+        """Parse a saved page once and extract its reviews with every strategy"""
+        started = time.perf_counter()
+        index = PageIndex.from_file(html_file)
+        parse_seconds = time.perf_counter() - started
+        results = self.extract(index)
+        metadata = results["extraction_metadata"]
+        metadata["html_file"] = html_file
+        metadata["parse_seconds"] = round(parse_seconds, 4)
+        return results
+
+    def extract(self, index: PageIndex) -> Dict[str, Any]:
+        """Extract reviews from an indexed page with every strategy"""
+        merger = ReviewMerger()
+        strategy_stats = {}
+        for strategy in self.strategies:
+            started = time.perf_counter()
+            try:
+                reviews = strategy.extract(index)
+            except Exception as e:
+                logger.warning(f"Review strategy {strategy.name} failed: {e}")
+                reviews = []
+            for review in reviews:
+                merger.add(strategy, review)
+            strategy_stats[strategy.name] = {
+                "reviews": len(reviews),
+                "confidence": strategy.confidence,
+                "seconds": round(time.perf_counter() - started, 4)
+            }
+
+        reviews = merger.merged()
+        return {
+            "total_reviews": len(reviews),
+            "reviews": reviews,
+            "strategies": strategy_stats,
+            "extraction_metadata": {
+                "timestamp": datetime.now().isoformat(),
+                "method": "unified_review_engine"
+            }
+        }
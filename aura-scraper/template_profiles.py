@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Page-template fingerprints and the learned selector profiles stored under them
+A fingerprint hashes the tag/class skeleton of a page's top levels, so pages
+rendered from the same template share one selector profile and only pages
+from a new template go through the expensive selector discovery
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from html_chunker import RAW_TEXT_TAGS, TAG_TOKEN, VOID_TAGS
+
+# Levels below <body> that make up the skeleton; review lists and cards sit deeper
+SKELETON_DEPTH = 6
+
+# Elements left out of the skeleton with everything inside them
+SKIPPED_TAGS = {b'svg', b'noscript', b'template', b'iframe'}
+
+CLASS_ATTRIBUTE = re.compile(rb'''\bclass\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))''', re.I)
+
+DEFAULT_PROFILES_FILE = "output/selectors/template_profiles.json"
+
+
+def _label(name: bytes, attributes: bytes) -> bytes:
+    """``tag.class1.class2`` with the classes sorted"""
+    match = CLASS_ATTRIBUTE.search(attributes)
+    classes = sorted(set(next(group for group in match.groups() if group is not None).split())) if match else []
+    return b'.'.join([name] + classes)
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _close(stack: List[list], root_children: List[str]):
+    """Pop the innermost open element and add its signature to its parent's children"""
+    _, label, children = stack.pop()
+    if label is None:
+        return
+    siblings = stack[-1][2] if stack else root_children
+    signature = _digest(label + b'(' + ','.join(children).encode('ascii') + b')')
+    # Runs of identical siblings count once
+    if not siblings or siblings[-1] != signature:
+        siblings.append(signature)
+
+
+def template_fingerprint(markup: Union[bytes, memoryview, mmap.mmap], depth: int = SKELETON_DEPTH) -> str:
+    """Hash of the tag/class skeleton of the top ``depth`` levels of ``<body>``
+
+    One pass over the tags, without building a tree. Each element's signature
+    covers its label and its children's signatures, with runs of identical
+    siblings collapsed to one, so pages that differ only in how many reviews
+    or list items they show get the same fingerprint. Text, attributes other
+    than ``class`` and the contents of SKIPPED_TAGS do not count.
+
+    Args:
+        markup: Raw page bytes, e.g. ``HTMLSource.buffer`` or encoded ``page.content()``
+        depth: Levels below ``<body>`` to include
+
+    Returns:
+        16-character hex fingerprint
+    """
+    # Open elements inside <body>: [name, label or None below depth, child signatures]
+    stack: List[list] = []
+    root_children: List[str] = []
+    in_body = False
+    skipped = 0
+    pos = 0
+
+    while True:
+        match = TAG_TOKEN.search(markup, pos)
+        if not match:
+            break
+        pos = match.end()
+        closing, name, attributes = match.groups()
+        if not name:
+            continue
+        name = name.lower()
+
+        if not in_body:
+            in_body = name == b'body' and not closing
+            continue
+
+        if closing:
+            if skipped:
+                skipped -= name in SKIPPED_TAGS
+                continue
+            if name == b'body':
+                break
+            # Close the innermost open element of this name and any left open inside it
+            if not any(frame[0] == name for frame in stack):
+                continue
+            while stack:
+                frame_name = stack[-1][0]
+                _close(stack, root_children)
+                if frame_name == name:
+                    break
+        elif skipped or name in SKIPPED_TAGS:
+            skipped += name in SKIPPED_TAGS and not attributes.endswith(b'/')
+        elif name in RAW_TEXT_TAGS:
+            # Raw text may contain tag-like text; resume after the end tag
+            end_tag = re.compile(rb'</' + name + rb'\s*>', re.I).search(markup, pos)
+            pos = end_tag.end() if end_tag else len(markup)
+        elif name not in VOID_TAGS and not attributes.endswith(b'/'):
+            # Deeper elements are only tracked to keep the nesting right
+            label = _label(name, attributes) if len(stack) < depth else None
+            stack.append([name, label, []])
+
+    # Whatever is still open at the end closes here
+    while stack:
+        _close(stack, root_children)
+
+    return _digest(','.join(root_children).encode('ascii'))
+
+
+class TemplateProfileStore:
+    """Selector profiles keyed by template fingerprint, persisted as one JSON file
+
+    Lookups are dict lookups; the file is read once and rewritten only when a
+    new profile is learned.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike] = DEFAULT_PROFILES_FILE):
+        self.path = Path(path)
+        self.profiles: Dict[str, Dict[str, Any]] = self._load()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if not self.path.exists():
+            return {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('profiles', {})
+
+    def __len__(self) -> int:
+        return len(self.profiles)
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self.profiles
+
+    def get(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """The profile learned for a template, or None for a new template"""
+        profile = self.profiles.get(fingerprint)
+        if profile is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return profile
+
+    def put(self, fingerprint: str, selectors: Dict[str, Any], **metadata) -> Dict[str, Any]:
+        """Store the selectors learned for a template and save the file"""
+        profile = {
+            'fingerprint': fingerprint,
+            'learned_at': datetime.now().isoformat(),
+            **metadata,
+            'selectors': selectors
+        }
+        self.profiles[fingerprint] = profile
+        self.save()
+        return profile
+
+    def selectors_for(self, fingerprint: str, discover: Callable[[], Dict[str, Any]],
+                      **metadata) -> Dict[str, Any]:
+        """Stored selectors of a known template, else ``discover()`` them and store the result
+
+        Empty discovery results are returned but not stored, so a failed
+        analysis is retried the next time the template is seen.
+        """
+        profile = self.get(fingerprint)
+        if profile is not None:
+            return profile['selectors']
+        selectors = discover()
+        if selectors:
+            self.put(fingerprint, selectors, **metadata)
+        return selectors
+
+    def save(self):
+        """Write the profiles to a temporary file and swap it in"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(self.path.name + '.tmp')
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump({'profiles': self.profiles}, f, indent=2, ensure_ascii=False)
+        os.replace(temporary, self.path)
+
+    def stats(self) -> Dict[str, int]:
+        return {'profiles': len(self.profiles), 'hits': self.hits, 'misses': self.misses}
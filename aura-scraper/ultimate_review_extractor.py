@@ -6,10 +6,12 @@ Uses advanced pattern matching and structural analysis to extract comprehensive
 
 import re
 import json
-from bs4 import BeautifulSoup
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from chimera_bridge import deduplicate
+from html_source import load_soup
+
 class UltimateReviewExtractor:
     def __init__(self, html_file: str):
         self.html_file = html_file
@@ -18,9 +20,7 @@ class UltimateReviewExtractor:
     def load_html(self) -> bool:
         """Load and parse the HTML file"""
         try:
-            with open(self.html_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            self.soup = BeautifulSoup(content, 'html.parser')
+            self.soup = load_soup(self.html_file)
             print(f"✅ Loaded HTML file: {self.html_file}")
             return True
         except Exception as e:
@@ -48,6 +48,13 @@ class UltimateReviewExtractor:
             if review_data:
                 extracted_reviews.append(review_data)
         
+        # Nested and overlapping containers repeat the same review
+        extracted_reviews = deduplicate(
+            extracted_reviews,
+            lambda review: ' '.join(review.get(field) or '' for field in ('title', 'review_date', 'review_text', 'pros', 'cons')),
+            lambda review: (review.get('reviewer_name') or '').strip().lower()
+        )
+        
         return {
             "total_reviews": len(extracted_reviews),
             "reviews": extracted_reviews,
@@ -70,7 +77,7 @@ class UltimateReviewExtractor:
         title_elements = self.soup.find_all('h4', string=re.compile(r'".*"'))
         for title in title_elements:
             parent = title.find_parent()
-            if parent and parent not in containers:
+            if parent:
                 containers.append(parent)
         
         # Strategy 3: Look for elements with star ratings
@@ -78,16 +85,11 @@ class UltimateReviewExtractor:
         for star in star_elements:
             if star.find('svg', class_=re.compile(r'star')):
                 parent = star.find_parent()
-                if parent and parent not in containers:
+                if parent:
                     containers.append(parent)
         
-        # Remove duplicates and return
-        unique_containers = []
-        for container in containers:
-            if container not in unique_containers:
-                unique_containers.append(container)
-        
-        return unique_containers
+        # Remove duplicates by element identity; Tag equality compares whole subtrees
+        return list({id(container): container for container in containers}.values())
     
     def _extract_comprehensive_review(self, container, index: int) -> Optional[Dict[str, Any]]:
         """Extract comprehensive data from a single review container"""
@@ -9,6 +9,8 @@ from datetime import datetime
 from typing import Dict, List, Optional, Any
 from standalone_parser import StandaloneHeadToHeadParser, HeadToHeadComparisonData
 
+from chimera_results import save_results
+
 class BreakthroughIframeBypass:
     """Breakthrough iframe CAPTCHA bypass for DataDome challenges."""
     
@@ -1128,17 +1130,11 @@ class BreakthroughIframeBypass:
         
     def export_breakthrough_test_results(self, output_dir: str = "output") -> str:
         """Export breakthrough iframe bypass test results."""
-        Path(output_dir).mkdir(exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"breakthrough_iframe_bypass_results_{timestamp}.json"
-        filepath = Path(output_dir) / filename
-        
-        with open(filepath, 'w') as f:
-            json.dump(self.test_results, f, indent=2, default=str)
+        run_id = save_results("breakthrough_iframe_bypass_results", self.test_results,
+                              path=str(Path(output_dir) / "results"))
             
-        print(f"📁 Results exported to: {filepath}")
-        return str(filepath)
+        print(f"📁 Results exported as run: {run_id}")
+        return run_id
         
     def get_breakthrough_test_summary(self) -> Dict[str, Any]:
         """Get summary of breakthrough iframe bypass testing."""
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Chimera Results
+The one place the standalone scripts and testing harnesses reach into
+chimera's src/ directory: puts it on the import path and re-exports the
+results store writer they share
+"""
+
+import sys
+from pathlib import Path
+
+CHIMERA_SRC = Path(__file__).resolve().parent / "src"
+
+
+def add_chimera_to_path():
+    """Make the ``chimera`` package importable; safe to call more than once"""
+    if str(CHIMERA_SRC) not in sys.path:
+        sys.path.insert(0, str(CHIMERA_SRC))
+
+
+add_chimera_to_path()
+
+from chimera.utils.results_store import save_results
+
+__all__ = [
+    'CHIMERA_SRC',
+    'add_chimera_to_path',
+    'save_results'
+]
@@ -19,6 +19,8 @@ from dataclasses import dataclass
 from playwright.async_api import async_playwright, Page, Frame, ElementHandle
 from loguru import logger
 
+from chimera_results import save_results
+
 @dataclass
 class FinalWorkingStrategy:
     """Final working strategy combining proven success with new insights."""
@@ -809,13 +811,6 @@ class FinalWorkingScraper:
 
     def export_results(self, output_dir: str = "output") -> str:
         """Export comprehensive test results."""
-        output_path = Path(output_dir)
-        output_path.mkdir(exist_ok=True)
-        
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"final_working_scraper_results_{timestamp}.json"
-        filepath = output_path / filename
-        
         export_data = {
             "test_summary": self.get_test_summary(),
             "scraping_stats": self.scraping_stats,
@@ -828,11 +823,11 @@ class FinalWorkingScraper:
             }
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
+        run_id = save_results("final_working_scraper_results", export_data,
+                              path=str(Path(output_dir) / "results"))
         
-        logger.info(f"✅ Results exported to: {filepath}")
-        return str(filepath)
+        logger.info(f"✅ Results exported as run: {run_id}")
+        return run_id
 
     def get_test_summary(self) -> Dict[str, Any]:
         """Get comprehensive test summary."""
@@ -0,0 +1,131 @@
+"""Near-duplicate review detection shared by the parsers and the aura extractors."""
+
+import hashlib
+import re
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+FINGERPRINT_BITS = 64
+SHINGLE_SIZE = 3
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WORD_RE = re.compile(r"\w+")
+
+
+def normalize_text(text: str) -> List[str]:
+    """Lower-cased word tokens with markup and punctuation removed."""
+    return _WORD_RE.findall(_TAG_RE.sub(" ", text or "").lower())
+
+
+def _feature_hash(feature: str) -> int:
+    return int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(text: str) -> Optional[int]:
+    """64-bit SimHash over word shingles, or None when the text has no words.
+
+    Texts that share most of their shingles get fingerprints a few bits
+    apart, so markup, whitespace and small edits between two copies of a
+    review barely move the fingerprint.
+    """
+    words = normalize_text(text)
+    if not words:
+        return None
+    if len(words) < SHINGLE_SIZE:
+        shingles = [" ".join(words)]
+    else:
+        shingles = [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+
+    hashes = [_feature_hash(shingle) for shingle in shingles]
+    threshold = len(hashes) / 2
+    fingerprint = 0
+    for bit in range(FINGERPRINT_BITS):
+        mask = 1 << bit
+        if sum(1 for value in hashes if value & mask) > threshold:
+            fingerprint |= mask
+    return fingerprint
+
+
+class NearDuplicateIndex:
+    """SimHash index answering "have we seen (nearly) this text?" in sub-linear time.
+
+    Fingerprints within ``max_distance`` bits count as the same review. The
+    64 bits are cut into ``max_distance + 1`` bands and each band value is a
+    bucket key; two fingerprints that close must agree exactly on at least
+    one band, so a lookup only compares against the entries sharing a bucket
+    instead of every review seen so far.
+
+    An optional ``scope`` (for example the normalized author) keeps
+    lookalike texts from different scopes apart: two short "Great tool,
+    easy dashboards" reviews by different people are not duplicates.
+    """
+
+    def __init__(self, max_distance: int = 6):
+        if not 0 <= max_distance < FINGERPRINT_BITS:
+            raise ValueError(f"max_distance must be between 0 and {FINGERPRINT_BITS - 1}")
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        width, extra = divmod(FINGERPRINT_BITS, bands)
+        self._bands: List[Tuple[int, int]] = []
+        shift = 0
+        for band in range(bands):
+            size = width + (1 if band < extra else 0)
+            self._bands.append((shift, (1 << size) - 1))
+            shift += size
+        self._buckets: Dict[Tuple[Hashable, int, int], List[Tuple[int, Hashable]]] = {}
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _bucket_keys(self, fingerprint: int, scope: Hashable) -> List[Tuple[Hashable, int, int]]:
+        return [(scope, band, (fingerprint >> shift) & mask) for band, (shift, mask) in enumerate(self._bands)]
+
+    def find(self, text: str, scope: Hashable = None) -> Optional[Hashable]:
+        """Key of a stored near-duplicate of ``text``, or None."""
+        fingerprint = simhash(text)
+        if fingerprint is None:
+            return None
+        return self._find(fingerprint, scope)
+
+    def _find(self, fingerprint: int, scope: Hashable) -> Optional[Hashable]:
+        for bucket_key in self._bucket_keys(fingerprint, scope):
+            for candidate, key in self._buckets.get(bucket_key, ()):
+                if (candidate ^ fingerprint).bit_count() <= self.max_distance:
+                    return key
+        return None
+
+    def add(self, key: Hashable, text: str, scope: Hashable = None) -> Optional[Hashable]:
+        """Index ``text`` under ``key`` unless it is a near-duplicate.
+
+        Returns the key of the earlier near-duplicate, or None when the text
+        was new and has been added. Texts without any words are never
+        considered duplicates and are not indexed.
+        """
+        fingerprint = simhash(text)
+        if fingerprint is None:
+            return None
+        existing = self._find(fingerprint, scope)
+        if existing is not None:
+            return existing
+        for bucket_key in self._bucket_keys(fingerprint, scope):
+            self._buckets.setdefault(bucket_key, []).append((fingerprint, key))
+        self._size += 1
+        return None
+
+
+def deduplicate(items: Iterable[T], text_of: Callable[[T], str],
+                scope_of: Optional[Callable[[T], Hashable]] = None,
+                index: Optional[NearDuplicateIndex] = None) -> List[T]:
+    """Keep the first of each group of near-duplicate items, in order.
+
+    Pass a shared ``index`` to also drop items already seen in earlier calls.
+    """
+    index = index if index is not None else NearDuplicateIndex()
+    unique = []
+    for item in items:
+        scope = scope_of(item) if scope_of else None
+        if index.add(len(index), text_of(item), scope) is None:
+            unique.append(item)
+    return unique
@@ -0,0 +1,370 @@
+"""Array-backed review container for analytics over large review sets."""
+
+import sys
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from chimera.models.review import EnhancedReview, ReviewSentiment
+from chimera.utils import serialization
+
+
+# EnhancedReview fields by storage kind; keys are model field names
+TEXT_FIELDS = ("id", "title", "content", "author", "url")
+JSON_FIELDS = ("raw_data",)
+CATEGORICAL_FIELDS = (
+    "source", "author_role", "sentiment_label", "use_case", "industry", "extraction_method", "selector_used"
+)
+FLOAT_FIELDS = ("rating", "sentiment_score", "review_quality_score", "extraction_confidence")
+INT_FIELDS = ("word_count",)
+DATETIME_FIELDS = ("date", "extraction_timestamp")
+LIST_FIELDS = ("competitor_mentions", "feature_mentions", "pain_points", "pros", "cons")
+
+# Frame-level label, not a review field (the batch's target company)
+LABEL_FIELDS = ("target_company",)
+
+AGGREGATES = ("count", "sum", "mean", "min", "max")
+
+# Stands in for None in integer columns; review counts are never negative
+_MISSING_INT = -1
+
+
+class TextColumn:
+    """Strings stored back to back in one buffer, addressed by int64 offsets.
+
+    One ``str`` plus an offsets array replaces a Python object per value;
+    ``valid`` marks None entries and is omitted when there are none.
+    """
+
+    __slots__ = ("buffer", "offsets", "valid")
+
+    def __init__(self, buffer: str, offsets: np.ndarray, valid: Optional[np.ndarray] = None):
+        self.buffer = buffer
+        self.offsets = offsets
+        self.valid = valid
+
+    @classmethod
+    def from_values(cls, values: Sequence[Optional[str]]) -> "TextColumn":
+        parts = [value or "" for value in values]
+        offsets = np.zeros(len(parts) + 1, dtype=np.int64)
+        np.cumsum([len(part) for part in parts], out=offsets[1:])
+        valid = np.fromiter((value is not None for value in values), dtype=bool, count=len(parts))
+        return cls("".join(parts), offsets, None if valid.all() else valid)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        if self.valid is not None and not self.valid[index]:
+            return None
+        return self.buffer[self.offsets[index]:self.offsets[index + 1]]
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return (self[index] for index in range(len(self)))
+
+    def lengths(self) -> np.ndarray:
+        """Character count of every value."""
+        return np.diff(self.offsets)
+
+    def take(self, indices: np.ndarray) -> "TextColumn":
+        return TextColumn.from_values([self[int(index)] for index in indices])
+
+    @classmethod
+    def concat(cls, columns: Sequence["TextColumn"]) -> "TextColumn":
+        offsets = [np.zeros(1, dtype=np.int64)]
+        shift = 0
+        for column in columns:
+            offsets.append(column.offsets[1:] + shift)
+            shift += len(column.buffer)
+        valids = [column.valid if column.valid is not None else np.ones(len(column), dtype=bool) for column in columns]
+        valid = np.concatenate(valids) if valids else np.ones(0, dtype=bool)
+        return cls("".join(column.buffer for column in columns), np.concatenate(offsets),
+                   None if valid.all() else valid)
+
+    @property
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.buffer) + self.offsets.nbytes + (self.valid.nbytes if self.valid is not None else 0)
+
+
+class CategoricalColumn:
+    """Interned values as int32 codes into a category list; -1 is None."""
+
+    __slots__ = ("codes", "categories")
+
+    def __init__(self, codes: np.ndarray, categories: List[str]):
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def from_values(cls, values: Sequence[Optional[str]]) -> "CategoricalColumn":
+        lookup: Dict[str, int] = {}
+        codes = np.fromiter(
+            (-1 if value is None else lookup.setdefault(value, len(lookup)) for value in values),
+            dtype=np.int32, count=len(values)
+        )
+        return cls(codes, list(lookup))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        code = self.codes[index]
+        return None if code < 0 else self.categories[code]
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        return (self[index] for index in range(len(self)))
+
+    def take(self, indices: np.ndarray) -> "CategoricalColumn":
+        return CategoricalColumn(self.codes[indices], self.categories)
+
+    @classmethod
+    def concat(cls, columns: Sequence["CategoricalColumn"]) -> "CategoricalColumn":
+        lookup: Dict[str, int] = {}
+        remapped = []
+        for column in columns:
+            # Last slot maps -1 to -1
+            mapping = np.array([lookup.setdefault(value, len(lookup)) for value in column.categories] + [-1],
+                               dtype=np.int32)
+            remapped.append(mapping[column.codes])
+        codes = np.concatenate(remapped) if remapped else np.zeros(0, dtype=np.int32)
+        return cls(codes, list(lookup))
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + sum(sys.getsizeof(value) for value in self.categories)
+
+
+class ListColumn:
+    """Lists of strings: every item in one TextColumn, rows delimited by offsets."""
+
+    __slots__ = ("items", "offsets")
+
+    def __init__(self, items: TextColumn, offsets: np.ndarray):
+        self.items = items
+        self.offsets = offsets
+
+    @classmethod
+    def from_values(cls, values: Sequence[Sequence[str]]) -> "ListColumn":
+        offsets = np.zeros(len(values) + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in values], out=offsets[1:])
+        return cls(TextColumn.from_values([item for value in values for item in value]), offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> List[str]:
+        return [self.items[item] for item in range(self.offsets[index], self.offsets[index + 1])]
+
+    def __iter__(self) -> Iterator[List[str]]:
+        return (self[index] for index in range(len(self)))
+
+    def take(self, indices: np.ndarray) -> "ListColumn":
+        return ListColumn.from_values([self[int(index)] for index in indices])
+
+    @classmethod
+    def concat(cls, columns: Sequence["ListColumn"]) -> "ListColumn":
+        offsets = [np.zeros(1, dtype=np.int64)]
+        shift = 0
+        for column in columns:
+            offsets.append(column.offsets[1:] + shift)
+            shift += len(column.items)
+        return cls(TextColumn.concat([column.items for column in columns]), np.concatenate(offsets))
+
+    @property
+    def nbytes(self) -> int:
+        return self.items.nbytes + self.offsets.nbytes
+
+
+Column = Union[TextColumn, CategoricalColumn, ListColumn, np.ndarray]
+
+
+def _to_datetime64(values: Sequence[Optional[datetime]]) -> np.ndarray:
+    return np.array([np.datetime64(value, "us") if value is not None else np.datetime64("NaT") for value in values],
+                    dtype="datetime64[us]")
+
+
+class ReviewFrame:
+    """Column store for reviews with vectorized aggregates.
+
+    Ratings and scores are float64 arrays (NaN for None), dates
+    ``datetime64[us]`` (NaT for None), low-cardinality strings interned
+    categorical codes, and free text offset-encoded, so 100k reviews cost a
+    few arrays instead of 100k pydantic objects with their dicts and lists.
+    ``to_reviews`` rebuilds equal ``EnhancedReview`` objects; dates are kept
+    as naive datetimes.
+
+    An optional ``target_company`` label column records which company each
+    review was collected for, for grouping across batches.
+    """
+
+    def __init__(self, columns: Dict[str, Column]):
+        self.columns = columns
+        self._length = len(columns["id"])
+
+    @classmethod
+    def from_reviews(cls, reviews: Iterable[EnhancedReview], target_company: Optional[str] = None) -> "ReviewFrame":
+        reviews = list(reviews)
+        columns: Dict[str, Column] = {}
+        for name in TEXT_FIELDS:
+            columns[name] = TextColumn.from_values([getattr(review, name) for review in reviews])
+        for name in JSON_FIELDS:
+            columns[name] = TextColumn.from_values([
+                None if getattr(review, name) is None else serialization.dumps(getattr(review, name))
+                for review in reviews
+            ])
+        for name in CATEGORICAL_FIELDS:
+            values = [getattr(review, name) for review in reviews]
+            columns[name] = CategoricalColumn.from_values([
+                value.value if isinstance(value, ReviewSentiment) else value for value in values
+            ])
+        for name in FLOAT_FIELDS:
+            columns[name] = np.array([
+                np.nan if getattr(review, name) is None else getattr(review, name) for review in reviews
+            ], dtype=np.float64)
+        for name in INT_FIELDS:
+            columns[name] = np.array([
+                _MISSING_INT if getattr(review, name) is None else getattr(review, name) for review in reviews
+            ], dtype=np.int64)
+        for name in DATETIME_FIELDS:
+            columns[name] = _to_datetime64([getattr(review, name) for review in reviews])
+        for name in LIST_FIELDS:
+            columns[name] = ListColumn.from_values([getattr(review, name) for review in reviews])
+        columns["target_company"] = CategoricalColumn.from_values([target_company] * len(reviews))
+        return cls(columns)
+
+    @classmethod
+    def concat(cls, frames: Sequence["ReviewFrame"]) -> "ReviewFrame":
+        """One frame holding every row of ``frames``, in order."""
+        if not frames:
+            return cls.from_reviews([])
+        columns: Dict[str, Column] = {}
+        for name, first in frames[0].columns.items():
+            parts = [frame.columns[name] for frame in frames]
+            columns[name] = np.concatenate(parts) if isinstance(first, np.ndarray) else type(first).concat(parts)
+        return cls(columns)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def review(self, index: int) -> EnhancedReview:
+        """Rebuild the review at a row."""
+        data: Dict[str, Any] = {}
+        for name in TEXT_FIELDS + CATEGORICAL_FIELDS:
+            data[name] = self.columns[name][index]
+        for name in JSON_FIELDS:
+            value = self.columns[name][index]
+            data[name] = None if value is None else serialization.loads(value)
+        for name in FLOAT_FIELDS:
+            value = self.columns[name][index]
+            data[name] = None if np.isnan(value) else float(value)
+        for name in INT_FIELDS:
+            value = self.columns[name][index]
+            data[name] = None if value == _MISSING_INT else int(value)
+        for name in DATETIME_FIELDS:
+            value = self.columns[name][index]
+            data[name] = None if np.isnat(value) else value.astype(datetime)
+        for name in LIST_FIELDS:
+            data[name] = self.columns[name][index]
+        return EnhancedReview(**data)
+
+    def to_reviews(self) -> List[EnhancedReview]:
+        return [self.review(index) for index in range(len(self))]
+
+    def __iter__(self) -> Iterator[EnhancedReview]:
+        return (self.review(index) for index in range(len(self)))
+
+    def numeric(self, name: str) -> np.ndarray:
+        """A float, integer or text-length column as float64, NaN for None.
+
+        Text columns give their character counts (``numeric("content")``).
+        """
+        column = self.columns[name]
+        if isinstance(column, TextColumn):
+            return column.lengths().astype(np.float64)
+        if name in INT_FIELDS:
+            return np.where(column == _MISSING_INT, np.nan, column.astype(np.float64))
+        if name in FLOAT_FIELDS:
+            return column
+        raise ValueError(f"Column '{name}' is not numeric")
+
+    def take(self, indices: Union[Sequence[int], np.ndarray]) -> "ReviewFrame":
+        """Rows at ``indices`` as a new frame."""
+        indices = np.asarray(indices, dtype=np.int64)
+        return ReviewFrame({
+            name: column[indices] if isinstance(column, np.ndarray) else column.take(indices)
+            for name, column in self.columns.items()
+        })
+
+    def filter(self, mask: np.ndarray) -> "ReviewFrame":
+        """Rows where a boolean mask (e.g. ``frame.numeric("rating") < 3``) is true."""
+        return self.take(np.flatnonzero(mask))
+
+    def value_counts(self, name: str) -> Dict[Optional[str], int]:
+        """Occurrences of each value of a categorical or list column, most common first."""
+        column = self.columns[name]
+        if isinstance(column, ListColumn):
+            return dict(Counter(column.items).most_common())
+        if not isinstance(column, CategoricalColumn):
+            raise ValueError(f"Column '{name}' is not categorical")
+        counts = np.bincount(column.codes + 1, minlength=len(column.categories) + 1)
+        labels: List[Optional[str]] = [None] + column.categories
+        return {labels[slot]: int(counts[slot]) for slot in np.argsort(-counts, kind="stable") if counts[slot]}
+
+    def sentiment_distribution(self) -> Dict[str, int]:
+        """Review count per sentiment label, shaped like ``ReviewBatch.sentiment_distribution``."""
+        counts = self.value_counts("sentiment_label")
+        return {sentiment.value: counts.get(sentiment.value, 0) for sentiment in ReviewSentiment}
+
+    def group_by(self, key: str, **aggregates: str) -> Dict[Optional[str], Dict[str, float]]:
+        """Vectorized aggregates of numeric columns per value of a categorical column.
+
+        ``frame.group_by("source", rating="mean", sentiment_score="max")``
+        returns ``{"G2": {"count": 120, "rating_mean": 4.2, ...}, ...}``.
+        NaN values are skipped; a group without any value gets NaN.
+        """
+        column = self.columns[key]
+        if not isinstance(column, CategoricalColumn):
+            raise ValueError(f"Column '{key}' is not categorical")
+        for name, how in aggregates.items():
+            if how not in AGGREGATES:
+                raise ValueError(f"Unknown aggregate '{how}' for {name}. Available: {', '.join(AGGREGATES)}")
+
+        # Slot 0 collects rows without a value
+        groups = column.codes + 1
+        size = len(column.categories) + 1
+        results = {"count": np.bincount(groups, minlength=size).astype(np.float64)}
+
+        for name, how in aggregates.items():
+            values = self.numeric(name)
+            present = ~np.isnan(values)
+            members, values = groups[present], values[present]
+            counts = np.bincount(members, minlength=size).astype(np.float64)
+            with np.errstate(invalid="ignore", divide="ignore"):
+                if how == "count":
+                    result = counts
+                elif how in ("sum", "mean"):
+                    result = np.bincount(members, weights=values, minlength=size)
+                    if how == "mean":
+                        result = np.where(counts > 0, result / counts, np.nan)
+                else:
+                    reduce = np.minimum if how == "min" else np.maximum
+                    result = np.full(size, np.inf if how == "min" else -np.inf)
+                    reduce.at(result, members, values)
+                    result = np.where(counts > 0, result, np.nan)
+            results[f"{name}_{how}"] = result
+
+        labels: List[Optional[str]] = [None] + column.categories
+        return {
+            labels[slot]: {
+                name: int(values[slot]) if name == "count" else float(values[slot])
+                for name, values in results.items()
+            }
+            for slot in range(size) if results["count"][slot]
+        }
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns."""
+        return sum(column.nbytes for column in self.columns.values())
@@ -0,0 +1,99 @@
+"""Multi-pattern keyword matching shared by review enrichment."""
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Sequence, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """Multi-keyword search over a fixed vocabulary.
+
+    Keywords are lower-cased once; results follow ``keyword in text``
+    substring semantics, overlapping occurrences included.
+
+    When ``pyahocorasick`` is installed its C automaton reports every hit in
+    a single pass whose cost does not grow with the vocabulary. Without it,
+    each keyword is looked up with ``in`` / ``str.find``, which run in C and
+    beat a Python-level automaton walk for vocabularies of this size.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(k.lower() for k in keywords if k))
+        self._automaton = None
+
+        if ahocorasick is not None and self.keywords:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+
+    def find_all(self, text_lower: str) -> List[Tuple[int, int, str]]:
+        """Return (start, end, keyword) for every occurrence in lower-cased text."""
+        if self._automaton is not None:
+            return [(end + 1 - len(keyword), end + 1, keyword) for end, keyword in self._automaton.iter(text_lower)]
+
+        hits = []
+        for keyword in self.keywords:
+            start = text_lower.find(keyword)
+            while start != -1:
+                hits.append((start, start + len(keyword), keyword))
+                start = text_lower.find(keyword, start + 1)
+
+        return hits
+
+    def matched(self, text_lower: str) -> Set[str]:
+        """Return the distinct keywords occurring in lower-cased text."""
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(text_lower)}
+
+        return {keyword for keyword in self.keywords if keyword in text_lower}
+
+
+class KeywordIndex:
+    """One matcher over several named vocabularies.
+
+    A text is searched once for the combined vocabulary and the hits are
+    split back out per vocabulary, so sentiment words, features, pain points
+    and competitors are found together.
+    """
+
+    def __init__(self, vocabularies: Dict[str, Iterable[str]]):
+        self.vocabularies: Dict[str, FrozenSet[str]] = {
+            name: frozenset(k.lower() for k in keywords if k) for name, keywords in vocabularies.items()
+        }
+        self.matcher = KeywordMatcher(k for keywords in self.vocabularies.values() for k in sorted(keywords))
+
+    def matched(self, text_lower: str) -> Dict[str, Set[str]]:
+        """Return the distinct keywords found in the text, per vocabulary."""
+        if self.matcher._automaton is None:
+            return {name: {k for k in keywords if k in text_lower} for name, keywords in self.vocabularies.items()}
+        found = self.matcher.matched(text_lower)
+        return {name: found & keywords for name, keywords in self.vocabularies.items()}
+
+    def find_all(self, text_lower: str) -> List[Tuple[int, int, str]]:
+        """Return every (start, end, keyword) occurrence across all vocabularies."""
+        return self.matcher.find_all(text_lower)
+
+
+@lru_cache(maxsize=128)
+def _cached_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+@lru_cache(maxsize=128)
+def _cached_index(vocabularies: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> KeywordIndex:
+    return KeywordIndex(dict(vocabularies))
+
+
+def get_matcher(keywords: Sequence[str]) -> KeywordMatcher:
+    """Return a shared matcher for a keyword list, building it on first use."""
+    return _cached_matcher(tuple(keywords))
+
+
+def get_index(vocabularies: Dict[str, Sequence[str]]) -> KeywordIndex:
+    """Return a shared index for named vocabularies, building it on first use."""
+    return _cached_index(tuple((name, tuple(keywords)) for name, keywords in vocabularies.items()))
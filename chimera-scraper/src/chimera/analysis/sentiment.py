@@ -7,7 +7,17 @@ from datetime import datetime
 from loguru import logger
 import asyncio
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
 from chimera.models.review import ReviewSentiment
+from chimera.analysis.keywords import get_matcher
+
+
+# Characters stripped from a token before lexicon lookup
+_NON_WORD = re.compile(r'[^\w\s]')
 
 
 class AdvancedSentimentAnalyzer:
@@ -212,14 +222,20 @@ class AdvancedSentimentAnalyzer:
     
     def _apply_competitor_context(self, text: str, sentiment: float) -> float:
         """Apply competitor-specific sentiment adjustments."""
-        text_lower = text.lower()
         adjusted_sentiment = sentiment
         
+        # Competitor names and all their patterns are found in a single pass
+        found = get_matcher([
+            keyword
+            for competitor, patterns in self.competitor_sentiment_patterns.items()
+            for keyword in [competitor, *patterns["positive"], *patterns["negative"]]
+        ]).matched(text.lower())
+        
         for competitor, patterns in self.competitor_sentiment_patterns.items():
-            if competitor.lower() in text_lower:
+            if competitor.lower() in found:
                 # Check for positive patterns
-                positive_matches = sum(1 for pattern in patterns["positive"] if pattern in text_lower)
-                negative_matches = sum(1 for pattern in patterns["negative"] if pattern in text_lower)
+                positive_matches = sum(1 for pattern in patterns["positive"] if pattern in found)
+                negative_matches = sum(1 for pattern in patterns["negative"] if pattern in found)
                 
                 # Adjust sentiment based on pattern matches
                 if positive_matches > negative_matches:
@@ -231,7 +247,6 @@ class AdvancedSentimentAnalyzer:
     
     def _apply_industry_context(self, text: str, sentiment: float, context: Optional[Dict[str, Any]] = None) -> float:
         """Apply industry-specific sentiment adjustments."""
-        text_lower = text.lower()
         adjusted_sentiment = sentiment
         
         # Determine industry context
@@ -239,7 +254,8 @@ class AdvancedSentimentAnalyzer:
         
         if industry in self.industry_specific_terms:
             industry_terms = self.industry_specific_terms[industry]
-            term_matches = sum(1 for term in industry_terms if term in text_lower)
+            found = get_matcher(industry_terms).matched(text.lower())
+            term_matches = sum(1 for term in industry_terms if term in found)
             
             # Adjust sentiment based on industry term usage
             if term_matches > 0:
@@ -271,13 +287,20 @@ class AdvancedSentimentAnalyzer:
         has_capitalization = any(word[0].isupper() for word in words if word)
         has_numbers = any(char.isdigit() for char in text)
         
+        return self._build_confidence_metrics(
+            len(text), sentiment_words, sentiment_density, has_punctuation, has_capitalization, has_numbers
+        )
+    
+    def _build_confidence_metrics(self, text_length: int, sentiment_words: int, sentiment_density: float,
+                                  has_punctuation: bool, has_capitalization: bool, has_numbers: bool) -> Dict[str, Any]:
+        """Assemble confidence metrics from precomputed text statistics."""
         # Overall confidence score
         confidence_score = min(1.0, (
             sentiment_density * 0.4 +
             (0.2 if has_punctuation else 0) +
             (0.2 if has_capitalization else 0) +
             (0.1 if has_numbers else 0) +
-            (0.1 if len(text) > 50 else 0)
+            (0.1 if text_length > 50 else 0)
         ))
         
         return {
@@ -287,7 +310,7 @@ class AdvancedSentimentAnalyzer:
                 "has_punctuation": has_punctuation,
                 "has_capitalization": has_capitalization,
                 "has_numbers": has_numbers,
-                "length_adequate": len(text) > 50
+                "length_adequate": text_length > 50
             },
             "confidence_score": confidence_score,
             "reliability": "high" if confidence_score > 0.7 else "medium" if confidence_score > 0.4 else "low"
@@ -303,7 +326,18 @@ class AdvancedSentimentAnalyzer:
             return ReviewSentiment.NEUTRAL
     
     async def analyze_batch_sentiment(self, texts: List[str], context: Optional[Dict[str, Any]] = None) -> List[Tuple[float, ReviewSentiment, Dict[str, Any]]]:
-        """Analyze sentiment for a batch of texts."""
+        """Analyze sentiment for a batch of texts.
+        
+        The corpus is tokenized once and scored with array operations; results
+        match ``analyze_sentiment_advanced`` text for text. Without NumPy, or if
+        the batch path fails, texts are analyzed one at a time.
+        """
+        if np is not None and texts and all(isinstance(text, str) for text in texts):
+            try:
+                return self._analyze_corpus(texts, context)
+            except Exception as e:
+                logger.warning(f"Vectorized sentiment failed, analyzing texts one by one: {e}")
+        
         results = []
         
         for text in texts:
@@ -312,6 +346,127 @@ class AdvancedSentimentAnalyzer:
         
         return results
     
+    def _tokenize_corpus(self, texts: List[str]) -> Dict[str, Any]:
+        """Tokenize all texts once and map every token to a vocabulary ID.
+        
+        Lexicon lookups, punctuation stripping and modifier checks run once per
+        distinct token and are stored as per-ID arrays.
+        """
+        vocabulary: Dict[str, int] = {}
+        token_ids: List[int] = []
+        lengths: List[int] = []
+        
+        for text in texts:
+            words = text.lower().split()
+            lengths.append(len(words))
+            token_ids.extend([vocabulary.setdefault(word, len(vocabulary)) for word in words])
+        
+        positive = self.sentiment_lexicons["positive"]
+        negative = self.sentiment_lexicons["negative"]
+        neutral = self.sentiment_lexicons["neutral"]
+        
+        size = len(vocabulary)
+        weights = np.zeros(size)
+        in_lexicon = np.zeros(size)
+        modifiers = np.full(size, np.nan)
+        capitalized = np.zeros(size, dtype=bool)
+        punctuated = np.zeros(size, dtype=bool)
+        numeric = np.zeros(size, dtype=bool)
+        
+        for word, index in vocabulary.items():
+            word_clean = _NON_WORD.sub('', word)
+            if word_clean in positive:
+                weights[index] = positive[word_clean]
+                in_lexicon[index] = 1.0
+            elif word_clean in negative:
+                weights[index] = negative[word_clean]
+                in_lexicon[index] = 1.0
+            elif word_clean in neutral:
+                in_lexicon[index] = 1.0
+            if word in self.context_modifiers:
+                modifiers[index] = self.context_modifiers[word]
+            capitalized[index] = word[0].isupper()
+            punctuated[index] = any(char in word for char in "!?.,;:")
+            numeric[index] = any(char.isdigit() for char in word)
+        
+        lengths_array = np.array(lengths, dtype=np.int64)
+        return {
+            "tokens": np.array(token_ids, dtype=np.int64),
+            "docs": np.repeat(np.arange(len(texts)), lengths_array),
+            "lengths": lengths_array,
+            "weights": weights,
+            "in_lexicon": in_lexicon,
+            "modifiers": modifiers,
+            "capitalized": capitalized,
+            "punctuated": punctuated,
+            "numeric": numeric
+        }
+    
+    def _analyze_corpus(self, texts: List[str], context: Optional[Dict[str, Any]] = None) -> List[Tuple[float, ReviewSentiment, Dict[str, Any]]]:
+        """Vectorized equivalent of ``analyze_sentiment_advanced`` over many texts."""
+        corpus = self._tokenize_corpus(texts)
+        tokens, docs, lengths = corpus["tokens"], corpus["docs"], corpus["lengths"]
+        text_count = len(texts)
+        
+        # Base sentiment: sparse document-token counts times the weight vector
+        totals = np.bincount(docs, weights=corpus["weights"][tokens], minlength=text_count)
+        lexicon_counts = np.bincount(docs, weights=corpus["in_lexicon"][tokens], minlength=text_count)
+        base = np.divide(totals, lexicon_counts, out=np.zeros(text_count), where=lexicon_counts > 0)
+        
+        # Context modifiers: a modifier followed, within the same text, by a
+        # sentiment word; the last such pair in a text sets its score
+        context_adjusted = base.copy()
+        if len(tokens) > 1:
+            modifier = corpus["modifiers"][tokens[:-1]]
+            following = corpus["weights"][tokens[1:]]
+            window = ~np.isnan(modifier) & (following != 0.0) & (docs[:-1] == docs[1:])
+            positions = np.flatnonzero(window)
+            if len(positions):
+                values = np.where(modifier[positions] == -1.0, -following[positions], following[positions] * modifier[positions])
+                window_docs = docs[positions][::-1]
+                hit_docs, first = np.unique(window_docs, return_index=True)
+                context_adjusted[hit_docs] = values[::-1][first]
+        
+        # Text quality flags; whitespace carries none, so tokens decide them
+        capitalized, punctuated, numeric = (
+            np.bincount(docs, weights=corpus[flag][tokens], minlength=text_count) > 0
+            for flag in ("capitalized", "punctuated", "numeric")
+        )
+        density = np.divide(lexicon_counts, lengths, out=np.zeros(text_count), where=lengths > 0)
+        
+        timestamp = datetime.now().isoformat()
+        results = []
+        
+        for index, text in enumerate(texts):
+            base_sentiment = float(base[index])
+            context_adjusted_sentiment = float(context_adjusted[index])
+            competitor_adjusted_sentiment = self._apply_competitor_context(text, context_adjusted_sentiment)
+            industry_adjusted_sentiment = self._apply_industry_context(text, competitor_adjusted_sentiment, context)
+            
+            confidence_metrics = self._build_confidence_metrics(
+                len(text),
+                int(lexicon_counts[index]),
+                float(density[index]) if lengths[index] else 0,
+                bool(punctuated[index]),
+                bool(capitalized[index]),
+                bool(numeric[index])
+            )
+            
+            analysis_details = {
+                "base_sentiment": base_sentiment,
+                "context_adjusted": context_adjusted_sentiment,
+                "competitor_adjusted": competitor_adjusted_sentiment,
+                "industry_adjusted": industry_adjusted_sentiment,
+                "confidence_metrics": confidence_metrics,
+                "text_length": len(text),
+                "word_count": int(lengths[index]),
+                "analysis_timestamp": timestamp
+            }
+            
+            results.append((industry_adjusted_sentiment, self._determine_sentiment_label(industry_adjusted_sentiment), analysis_details))
+        
+        return results
+    
     async def get_sentiment_summary(self, texts: List[str], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get sentiment summary for a collection of texts."""
         if not texts:
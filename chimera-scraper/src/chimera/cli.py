@@ -3,13 +3,20 @@
 import asyncio
 import argparse
 import os
-from typing import List
+from collections import deque
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
 from dotenv import load_dotenv
 
 from chimera.core.scraper import AsyncScraper, ChimeraRequestException
 from chimera.providers.proxies import StaticProxyProvider
 from chimera.parsers.g2 import G2Parser
+from chimera.parsers.executor import PARSERS, ParseExecutor
+from chimera.utils.page_store import DEFAULT_PAGE_STORE_DIR, PageRecord, PageStore
+from chimera.utils.results_store import DEFAULT_RESULTS_STORE_PATH, get_results_store
+from chimera.utils import serialization
 from chimera.utils.storage import save_to_json, save_to_csv
+from chimera.utils.columnar import write_reviews_parquet
 from chimera.utils.logging import configure_logging
 
 configure_logging()
@@ -22,17 +29,73 @@ USER_AGENTS = [
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/16.5 Safari/605.1.15"
 ]
 
-async def scrape_g2_reviews(url: str, proxy_provider: StaticProxyProvider) -> List[dict]:
-    """Scrape reviews from a G2 product page."""
+async def scrape_g2_reviews(url: str, proxy_provider: StaticProxyProvider,
+                            page_store: Optional[PageStore] = None) -> List[dict]:
+    """Scrape reviews from a G2 product page, keeping the raw page if a store is given."""
     async with AsyncScraper(proxy_provider, USER_AGENTS) as scraper:
         try:
             html = await scraper.get(url)
+            if page_store:
+                await page_store.save(url, html, "g2")
             reviews = G2Parser.extract_reviews(html, url)
             return reviews
         except ChimeraRequestException as e:
             print(f"Failed to scrape {url}: {e}")
             return []
 
+def guess_parser(url: str) -> str:
+    """Pick a review parser from the URL for pages stored without a parser tag."""
+    return "capterra" if "capterra.com" in url else "g2"
+
+async def replay_stored_pages(page_store: PageStore, records: List[PageRecord], parser_name: Optional[str] = None,
+                              max_workers: Optional[int] = None) -> Tuple[List[Any], List[Any]]:
+    """Re-run parsers over stored pages in a process pool, without touching the network.
+    
+    Returns (reviews, comparisons) in store order. Only a few pages per worker
+    are decompressed at a time, so memory stays flat however large the store is.
+    """
+    executor = ParseExecutor("process", max_workers)
+    window = executor.max_workers * 2
+    pending = deque()
+    reviews, comparisons = [], []
+    
+    async def parse(record: PageRecord, html: str):
+        name = parser_name or (record.parser if record.parser in PARSERS else guess_parser(record.url))
+        try:
+            return await executor.parse(name, html, record.url)
+        except Exception as e:
+            print(f"Failed to parse {record.url}: {e}")
+            return None
+    
+    def collect(result):
+        if isinstance(result, list):
+            reviews.extend(result)
+        elif result is not None:
+            comparisons.append(result)
+    
+    try:
+        for record, html in page_store.iter_pages(records):
+            if len(pending) >= window:
+                collect(await pending.popleft())
+            pending.append(asyncio.create_task(parse(record, html)))
+        while pending:
+            collect(await pending.popleft())
+    finally:
+        executor.shutdown()
+    
+    metrics = executor.get_metrics()
+    print(f"Re-parsed {metrics['completed']} stored pages "
+          f"(avg {metrics['parse_time']['avg_ms']:.0f} ms/page, {metrics['failed']} failed)")
+    return reviews, comparisons
+
+def export_parquet(reviews: List[Any], root_dir: str):
+    """Write reviews to the Parquet dataset, reporting rather than failing if pyarrow is missing."""
+    try:
+        files = write_reviews_parquet(reviews, root_dir)
+        print(f"Parquet: {len(files)} file(s) under {root_dir}")
+    except ImportError as e:
+        print(f"Parquet export skipped: {e}")
+
 async def main():
     """Main function to run the scraper with CLI arguments."""
     load_dotenv()
@@ -43,9 +106,58 @@ async def main():
     parser.add_argument("--output", default="reviews", help="Output filename prefix (without extension)")
     parser.add_argument("--proxy", help="Proxy server (e.g., http://proxy:port)")
     parser.add_argument("--delay", type=float, default=2.0, help="Delay between requests in seconds")
+    parser.add_argument("--store-dir", default=DEFAULT_PAGE_STORE_DIR, help="Directory of the raw page store")
+    parser.add_argument("--no-store", action="store_true", help="Do not keep fetched pages in the page store")
+    parser.add_argument("--replay", action="store_true",
+                        help="Re-parse pages from the page store instead of fetching (--url/--urls filter them)")
+    parser.add_argument("--parser", choices=list(PARSERS),
+                        help="Parser to run on replayed pages (default: the one each page was fetched for)")
+    parser.add_argument("--all-fetches", action="store_true",
+                        help="Replay every stored fetch of a URL, not only the latest")
+    parser.add_argument("--workers", type=int, help="Parser processes for --replay")
+    parser.add_argument("--parquet", help="Also write reviews as a partitioned Parquet dataset under this directory")
+    parser.add_argument("--import-results", nargs="+", metavar="FILE",
+                        help="Load timestamped *_results_*.json files into the results store and exit")
+    parser.add_argument("--results-dir", default=DEFAULT_RESULTS_STORE_PATH, help="Directory of the results store")
     
     args = parser.parse_args()
     
+    if args.import_results:
+        results_store = get_results_store(args.results_dir)
+        imported = results_store.import_files(args.import_results)
+        print(f"Imported {imported} of {len(args.import_results)} result files into {args.results_dir}")
+        print(", ".join(f"{kind}: {count}" for kind, count in results_store.kinds().items()))
+        return
+    page_store = PageStore(args.store_dir)
+    
+    if args.replay:
+        urls = [args.url] if args.url else args.urls
+        records = page_store.records(urls=urls, latest_only=not args.all_fetches)
+        if not records:
+            print(f"No stored pages found in {args.store_dir}")
+            return
+        
+        print(f"Replaying {len(records)} stored pages from {args.store_dir}...")
+        reviews, comparisons = await replay_stored_pages(page_store, records, args.parser, args.workers)
+        
+        if reviews:
+            json_path = await save_to_json(reviews, f"{args.output}.json")
+            csv_path = await save_to_csv(reviews, f"{args.output}.csv")
+            print(f"\nSaved {len(reviews)} reviews to:")
+            print(f"JSON: {json_path}")
+            print(f"CSV: {csv_path}")
+            if args.parquet:
+                export_parquet(reviews, args.parquet)
+        if comparisons:
+            Path("output").mkdir(exist_ok=True)
+            comparisons_path = f"output/{args.output}_comparisons.json"
+            with open(comparisons_path, "w", encoding="utf-8") as f:
+                serialization.dump(comparisons, f, indent=2)
+            print(f"Saved {len(comparisons)} comparisons to: {comparisons_path}")
+        if not reviews and not comparisons:
+            print("No reviews were parsed from the stored pages.")
+        return
+    
     # Initialize proxy provider
     proxy_provider = StaticProxyProvider()
     if args.proxy:
@@ -68,7 +180,7 @@ async def main():
     
     for url in urls:
         print(f"Scraping {url}...")
-        reviews = await scrape_g2_reviews(url, proxy_provider)
+        reviews = await scrape_g2_reviews(url, proxy_provider, None if args.no_store else page_store)
         all_reviews.extend(reviews)
         print(f"Found {len(reviews)} reviews")
         
@@ -84,6 +196,8 @@ async def main():
         print(f"\nSaved {len(all_reviews)} reviews to:")
         print(f"JSON: {json_path}")
         print(f"CSV: {csv_path}")
+        if args.parquet:
+            export_parquet(all_reviews, args.parquet)
     else:
         print("No reviews were scraped.")
 
@@ -9,7 +9,8 @@ from loguru import logger
 class CloudflareBypass:
     """Advanced Cloudflare bypass with multiple detection methods."""
     
-    def __init__(self, page: Page):
+    def __init__(self, page: Optional[Page] = None):
+        # Scrapers that create their page later bind it before the first wait
         self.page = page
         self.indicators = self._load_cloudflare_indicators()
         self.bypass_attempts = 0
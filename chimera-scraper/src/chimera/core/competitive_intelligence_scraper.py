@@ -8,7 +8,7 @@ from datetime import datetime
 from pathlib import Path
 import json
 import yaml
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from collections import defaultdict
 
 from playwright.async_api import async_playwright, BrowserContext, Page, Browser
@@ -22,10 +22,25 @@ from .retry import AdvancedRetryManager, RetryConfig, CircuitBreakerConfig
 from ..targets.manager import TargetManager
 from ..parsers.g2 import G2Parser
 from ..parsers.capterra import CapterraParser
+from ..parsers.executor import ParseExecutor
 from ..analysis.sentiment import AdvancedSentimentAnalyzer
+from ..analysis.keywords import get_matcher
+from ..analysis.frame import ReviewFrame
 from ..monitoring.performance import PerformanceMonitor
 from ..models.review import EnhancedReview, ReviewBatch
-from ..utils.storage import DataStorage
+from ..utils.review_store import DEFAULT_REVIEW_STORE_PATH, ReviewStore
+from ..utils.review_ids import get_seen_reviews
+from ..utils.page_store import PageStore
+from ..utils.results_store import DEFAULT_RESULTS_STORE_PATH, save_results
+from ..utils import serialization
+from ..targets.watermarks import WatermarkStore, collect_new_reviews
+
+
+# Market leaders checked in every review alongside the target's own competitors
+MAJOR_COMPETITORS = [
+    "tableau", "power bi", "qlik", "looker", "snowflake", "databricks",
+    "thoughtspot", "sigma", "hex", "omni", "domo", "sisense"
+]
 
 
 @dataclass
@@ -69,7 +84,13 @@ class CompetitiveIntelligenceScraper:
         self.session_manager = ScrapingSession()
         self.target_manager = TargetManager()
         self.sentiment_analyzer = AdvancedSentimentAnalyzer()
-        self.storage = DataStorage()
+        self.storage = ReviewStore(self.config.get("review_store_path", DEFAULT_REVIEW_STORE_PATH))
+        self.parse_executor = ParseExecutor.from_config(self.config)
+        self.page_store = PageStore(self.config["page_store_dir"]) if self.config.get("page_store_dir") else None
+        # Incremental mode: per-target high-water marks; None re-reads every page
+        self.watermarks = WatermarkStore(self.config["watermark_path"]) if self.config.get("watermark_path") else None
+        # Reviews stored by earlier runs, which the parsers skip; None disables
+        self.seen_reviews = get_seen_reviews(self.config["seen_reviews_path"]) if self.config.get("seen_reviews_path") else None
         
         # Advanced components
         self.retry_manager = AdvancedRetryManager(
@@ -84,6 +105,7 @@ class CompetitiveIntelligenceScraper:
         # Competitive intelligence state
         self.competitive_targets: List[CompetitiveTarget] = []
         self.competitive_insights: List[CompetitiveInsight] = []
+        self.review_frames: List[ReviewFrame] = []
         self.market_analysis: Dict[str, Any] = {}
         
         # Browser management
@@ -130,7 +152,16 @@ class CompetitiveIntelligenceScraper:
             "cloudflare_bypass": True,
             "performance_monitoring": True,
             "competitive_analysis": True,
-            "market_intelligence": True
+            "market_intelligence": True,
+            "parser_engines": {},  # platform -> DOM engine, e.g. {"g2": "selectolax"}
+            "selector_plan_dir": "output/selector_plans",
+            "seen_reviews_path": "output/seen_reviews.db",  # reviews stored by earlier runs are skipped; None disables
+            "parse_executor": {"mode": "process", "max_workers": 2},  # mode: process, thread or inline
+            "page_store_dir": "output/pages",  # raw HTML kept for offline replay; None disables
+            "review_store_path": "output/reviews.db",
+            "max_review_pages": 5,  # review pages read per target; incremental runs stop at known reviews
+            "watermark_path": "output/watermarks.json",  # None disables incremental mode
+            "results_store_path": "output/results"
         }
     
     async def initialize(self):
@@ -173,6 +204,7 @@ class CompetitiveIntelligenceScraper:
             )
             
             self.page = await self.context.new_page()
+            self.cloudflare_bypass = CloudflareBypass(self.page)
             
             await self._apply_maximum_stealth_measures()
             await self._setup_competitive_monitoring()
@@ -537,28 +569,50 @@ class CompetitiveIntelligenceScraper:
             
             # Handle Cloudflare if needed
             if self.config.get("cloudflare_bypass", True):
-                await self.cloudflare_bypass.wait_for_bypass(self.page, target.platform)
+                await self.cloudflare_bypass.wait_for_bypass()
             
             # Simulate human behavior
             if self.config.get("human_behavior", True):
                 await self._simulate_competitive_research_behavior()
             
-            # Extract content
-            html_content = await self._extract_content_robustly()
-            
-            # Parse reviews based on platform
-            if target.platform == "g2":
-                parser = G2Parser()
-                reviews = await parser.extract_reviews(html_content, url)
-            else:
-                parser = CapterraParser()
-                reviews = await parser.extract_reviews(html_content, url)
+            # Read review pages newest-first, stopping at reviews collected by earlier runs
+            started = datetime.now()
+            target_key = f"{target.platform}:{target.competitor_id}"
+            reviews = await collect_new_reviews(
+                lambda page: self._scrape_review_page(page, target, navigate=page != url),
+                url,
+                target_key,
+                self.watermarks,
+                self.config.get("max_review_pages", 1)
+            )
             
             # Convert to competitive insights
             insights = []
             for review in reviews:
-                insight = await self._create_review_insight(target, review, url, "product_review")
+                insight = await self._create_review_insight(target, review, review.url, "product_review")
                 insights.append(insight)
+            self.review_frames.append(ReviewFrame.from_reviews(reviews, target.name))
+            
+            # Store batch
+            if reviews:
+                batch = ReviewBatch(
+                    batch_id=f"batch_{int(time.time())}_{random.randint(1000, 9999)}",
+                    source_platform=target.platform,
+                    target_company=target.name,
+                    extraction_date=datetime.now(),
+                    reviews=reviews
+                )
+                batch.update_statistics()
+                await self.storage.save_reviews_batch(batch)
+                
+                # Only stored reviews are skipped by later runs
+                if self.seen_reviews is not None:
+                    await asyncio.to_thread(self.seen_reviews.add_many, [review.id for review in reviews])
+            
+            # Next run stops paging at these reviews
+            if self.watermarks:
+                self.watermarks.advance(target_key, reviews, started)
+                self.watermarks.save()
             
             return insights
             
@@ -566,6 +620,22 @@ class CompetitiveIntelligenceScraper:
             logger.error(f"Failed to scrape product reviews for {target.name}: {e}")
             return []
     
+    async def _scrape_review_page(self, url: str, target: CompetitiveTarget,
+                                  navigate: bool = True) -> Tuple[List[EnhancedReview], List[str]]:
+        """Fetch one review page and parse it off the event loop; also returns the IDs skipped as seen."""
+        if navigate:
+            await self._navigate_with_maximum_stealth(url)
+            if self.config.get("cloudflare_bypass", True):
+                await self.cloudflare_bypass.wait_for_bypass()
+        
+        platform = "g2" if target.platform == "g2" else "capterra"
+        html_content = await self._extract_content_robustly(platform)
+        
+        engine = self.config.get("parser_engines", {}).get(target.platform)
+        plan_dir = self.config.get("selector_plan_dir")
+        seen_path = self.config.get("seen_reviews_path")
+        return await self.parse_executor.extract_review_page(platform, html_content, url, engine, plan_dir, seen_path)
+    
     async def _scrape_comparisons(self, target: CompetitiveTarget) -> List[CompetitiveInsight]:
         """Scrape head-to-head and multi-way comparisons."""
         insights = []
@@ -578,7 +648,7 @@ class CompetitiveIntelligenceScraper:
                     
                     # Handle Cloudflare
                     if self.config.get("cloudflare_bypass", True):
-                        await self.cloudflare_bypass.wait_for_bypass(self.page, target.platform)
+                        await self.cloudflare_bypass.wait_for_bypass()
                     
                     # Extract comparison data
                     comparison_data = await self._extract_comparison_data()
@@ -627,19 +697,17 @@ class CompetitiveIntelligenceScraper:
                     
                     # Handle Cloudflare
                     if self.config.get("cloudflare_bypass", True):
-                        await self.cloudflare_bypass.wait_for_bypass(self.page, target.platform)
+                        await self.cloudflare_bypass.wait_for_bypass()
                     
                     # Simulate competitive research behavior
                     if self.config.get("human_behavior", True):
                         await self._simulate_competitive_research_behavior()
                     
                     # Extract content
-                    html_content = await self._extract_content_robustly()
+                    html_content = await self._extract_content_robustly("g2_head_to_head")
                     
                     # Parse head-to-head comparison using specialized parser
-                    from ..parsers.head_to_head_comparison import G2HeadToHeadComparisonParser
-                    head_to_head_parser = G2HeadToHeadComparisonParser()
-                    comparison_data = await head_to_head_parser.parse_head_to_head_comparison(html_content, comparison_url)
+                    comparison_data = await self.parse_executor.parse_head_to_head_comparison(html_content, comparison_url)
                     
                     # Create comprehensive insight
                     insight = CompetitiveInsight(
@@ -648,7 +716,7 @@ class CompetitiveIntelligenceScraper:
                         extraction_date=datetime.now(),
                         data_type="head_to_head_comparison",
                         url=comparison_url,
-                        content=asdict(comparison_data),
+                        content=serialization.to_dict(comparison_data),
                         sentiment_analysis={
                             "score": 0.0,  # Head-to-head comparisons don't have sentiment
                             "label": "neutral",
@@ -702,19 +770,17 @@ class CompetitiveIntelligenceScraper:
                     
                     # Handle Cloudflare
                     if self.config.get("cloudflare_bypass", True):
-                        await self.cloudflare_bypass.wait_for_bypass(self.page, target.platform)
+                        await self.cloudflare_bypass.wait_for_bypass()
                     
                     # Simulate competitive research behavior
                     if self.config.get("human_behavior", True):
                         await self._simulate_competitive_research_behavior()
                     
                     # Extract content
-                    html_content = await self._extract_content_robustly()
+                    html_content = await self._extract_content_robustly("g2_four_way")
                     
                     # Parse four-way comparison using specialized parser
-                    from ..parsers.four_way_comparison import G2FourWayComparisonParser
-                    four_way_parser = G2FourWayComparisonParser()
-                    comparison_data = await four_way_parser.parse_four_way_comparison(html_content, comparison_url)
+                    comparison_data = await self.parse_executor.parse_four_way_comparison(html_content, comparison_url)
                     
                     # Create comprehensive insight
                     insight = CompetitiveInsight(
@@ -723,7 +789,7 @@ class CompetitiveIntelligenceScraper:
                         extraction_date=datetime.now(),
                         data_type="four_way_comparison",
                         url=comparison_url,
-                        content=asdict(comparison_data),
+                        content=serialization.to_dict(comparison_data),
                         sentiment_analysis={
                             "score": 0.0,  # Four-way comparisons don't have sentiment
                             "label": "neutral",
@@ -822,7 +888,7 @@ class CompetitiveIntelligenceScraper:
                 extraction_date=datetime.now(),
                 data_type=data_type,
                 url=url,
-                content=asdict(review),
+                content=serialization.to_dict(review),
                 sentiment_analysis={
                     "score": sentiment_score,
                     "label": sentiment_label,
@@ -843,7 +909,7 @@ class CompetitiveIntelligenceScraper:
                 extraction_date=datetime.now(),
                 data_type=data_type,
                 url=url,
-                content=asdict(review),
+                content=serialization.to_dict(review),
                 sentiment_analysis={},
                 competitive_mentions=[],
                 market_insights={},
@@ -854,21 +920,18 @@ class CompetitiveIntelligenceScraper:
     def _extract_competitive_mentions(self, content: str, target: CompetitiveTarget) -> List[str]:
         """Extract mentions of competitors from content."""
         mentions = []
-        content_lower = content.lower()
+        
+        # Primary and major competitors are found in a single pass
+        found = get_matcher([*target.primary_competitors, *MAJOR_COMPETITORS]).matched(content.lower())
         
         # Check for mentions of primary competitors
         for competitor in target.primary_competitors:
-            if competitor.lower() in content_lower:
+            if competitor.lower() in found:
                 mentions.append(competitor)
         
         # Check for mentions of other major competitors
-        major_competitors = [
-            "tableau", "power bi", "qlik", "looker", "snowflake", "databricks",
-            "thoughtspot", "sigma", "hex", "omni", "domo", "sisense"
-        ]
-        
-        for competitor in major_competitors:
-            if competitor.lower() in content_lower and competitor not in mentions:
+        for competitor in MAJOR_COMPETITORS:
+            if competitor in found and competitor not in mentions:
                 mentions.append(competitor)
         
         return mentions
@@ -1467,8 +1530,12 @@ class CompetitiveIntelligenceScraper:
         except Exception as e:
             logger.warning(f"Failed to simulate competitive analysis behavior: {e}")
     
-    async def _extract_content_robustly(self) -> str:
-        """Extract HTML content with robust error handling."""
+    async def _extract_content_robustly(self, parser: Optional[str] = None) -> str:
+        """Extract HTML content with robust error handling.
+        
+        The page is also written to the page store, tagged with the parser
+        that will read it, so it can be re-parsed offline later.
+        """
         try:
             # Wait for content to load
             await self.page.wait_for_load_state("networkidle", timeout=15000)
@@ -1479,6 +1546,9 @@ class CompetitiveIntelligenceScraper:
             if not content or len(content) < 1000:
                 raise Exception("Insufficient content extracted")
             
+            if self.page_store:
+                await self.page_store.save(self.page.url, content, parser)
+            
             logger.info(f"Successfully extracted {len(content)} characters of content")
             return content
             
@@ -1560,16 +1630,16 @@ class CompetitiveIntelligenceScraper:
                     }
                     for insight in self.competitive_insights
                 ],
+                "review_analytics": self._review_analytics(),
                 "scraping_statistics": self.scraping_stats,
                 "recommendations": await self._generate_strategic_recommendations()
             }
             
             # Save comprehensive report
-            report_file = f"competitive_intelligence_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(report_file, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            run_id = save_results("competitive_intelligence_report", report,
+                                  path=self.config.get("results_store_path", DEFAULT_RESULTS_STORE_PATH))
             
-            logger.info(f"Comprehensive report saved to {report_file}")
+            logger.info(f"Comprehensive report saved as run {run_id}")
             
             return report
             
@@ -1577,6 +1647,22 @@ class CompetitiveIntelligenceScraper:
             logger.error(f"Failed to generate comprehensive report: {e}")
             raise
     
+    def _review_analytics(self) -> Dict[str, Any]:
+        """Per-competitor and per-platform review aggregates over every scraped review."""
+        frame = ReviewFrame.concat(self.review_frames)
+        if not len(frame):
+            return {}
+        
+        aggregates = {"rating": "mean", "sentiment_score": "mean", "review_quality_score": "mean"}
+        return {
+            "total_reviews": len(frame),
+            "by_competitor": frame.group_by("target_company", **aggregates),
+            "by_platform": frame.group_by("source", **aggregates),
+            "sentiment_distribution": frame.sentiment_distribution(),
+            "competitor_mentions": frame.value_counts("competitor_mentions"),
+            "pain_points": frame.value_counts("pain_points")
+        }
+    
     async def _generate_strategic_recommendations(self) -> List[str]:
         """Generate strategic recommendations based on competitive intelligence."""
         try:
@@ -1625,6 +1711,12 @@ class CompetitiveIntelligenceScraper:
             if self.browser:
                 await self.browser.close()
             
+            # Stop parse workers
+            self.parse_executor.shutdown()
+            
+            # Close the review database
+            self.storage.close()
+            
             # Export final competitive intelligence data
             await self._export_competitive_intelligence()
             
@@ -1636,15 +1728,13 @@ class CompetitiveIntelligenceScraper:
     async def _export_competitive_intelligence(self):
         """Export competitive intelligence data."""
         try:
+            results_path = self.config.get("results_store_path", DEFAULT_RESULTS_STORE_PATH)
+            
             # Export insights
-            insights_file = f"competitive_insights_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(insights_file, 'w') as f:
-                json.dump([asdict(insight) for insight in self.competitive_insights], f, indent=2, default=str)
+            save_results("competitive_insights", self.competitive_insights, path=results_path)
             
             # Export market analysis
-            market_file = f"market_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(market_file, 'w') as f:
-                json.dump(self.market_analysis, f, indent=2, default=str)
+            save_results("market_analysis", self.market_analysis, path=results_path)
             
             logger.info("Competitive intelligence data exported successfully")
             
@@ -1657,6 +1747,7 @@ class CompetitiveIntelligenceScraper:
             "scraping_stats": self.scraping_stats,
             "session_summary": self.session_manager.get_session_summary(),
             "performance_summary": self.performance_monitor.get_metrics_summary() if self.performance_monitor else {},
+            "parse_executor": self.parse_executor.get_metrics(),
             "competitive_targets": len(self.competitive_targets),
             "competitive_insights": len(self.competitive_insights),
             "market_analysis": len(self.market_analysis),
@@ -6,7 +6,6 @@ import random
 from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
 from pathlib import Path
-import json
 import yaml
 
 from playwright.async_api import async_playwright, BrowserContext, Page, Browser
@@ -20,10 +19,16 @@ from .retry import AdvancedRetryManager, RetryConfig, CircuitBreakerConfig
 from ..targets.manager import TargetManager
 from ..parsers.g2 import G2Parser
 from ..parsers.capterra import CapterraParser
+from ..parsers.executor import REVIEW_PLATFORMS, ParseExecutor
 from ..analysis.sentiment import AdvancedSentimentAnalyzer
 from ..monitoring.performance import PerformanceMonitor
 from ..models.review import EnhancedReview, ReviewBatch
-from ..utils.storage import DataStorage
+from ..utils.storage import ReviewSink
+from ..utils.review_store import DEFAULT_REVIEW_STORE_PATH, ReviewStore
+from ..utils.review_ids import get_seen_reviews
+from ..utils.page_store import PageStore
+from ..utils import serialization
+from ..targets.watermarks import WatermarkStore, collect_new_reviews
 
 
 class ChimeraEnterpriseScraper:
@@ -37,7 +42,14 @@ class ChimeraEnterpriseScraper:
         self.session_manager = ScrapingSession()
         self.target_manager = TargetManager()
         self.sentiment_analyzer = AdvancedSentimentAnalyzer()
-        self.storage = DataStorage()
+        self.storage = ReviewStore(self.config.get("review_store_path", DEFAULT_REVIEW_STORE_PATH))
+        self.parse_executor = ParseExecutor.from_config(self.config)
+        self.page_store = PageStore(self.config["page_store_dir"]) if self.config.get("page_store_dir") else None
+        self.review_sink = self._create_review_sink()
+        # Incremental mode: per-target high-water marks; None re-reads every page
+        self.watermarks = WatermarkStore(self.config["watermark_path"]) if self.config.get("watermark_path") else None
+        # Reviews stored by earlier runs, which the parsers skip; None disables
+        self.seen_reviews = get_seen_reviews(self.config["seen_reviews_path"]) if self.config.get("seen_reviews_path") else None
         
         # Advanced components
         self.retry_manager = AdvancedRetryManager(
@@ -101,9 +113,33 @@ class ChimeraEnterpriseScraper:
             "max_reviews_per_target": 25,
             "human_behavior": True,
             "cloudflare_bypass": True,
-            "performance_monitoring": True
+            "performance_monitoring": True,
+            "parser_engines": {},  # platform -> DOM engine, e.g. {"g2": "selectolax"}
+            "selector_plan_dir": "output/selector_plans",
+            "seen_reviews_path": "output/seen_reviews.db",  # reviews stored by earlier runs are skipped; None disables
+            "parse_executor": {"mode": "process", "max_workers": 2},  # mode: process, thread or inline
+            "page_store_dir": "output/pages",  # raw HTML kept for offline replay; None disables
+            "review_store_path": "output/reviews.db",
+            "max_review_pages": 5,  # review pages read per target; incremental runs stop at known reviews
+            "watermark_path": "output/watermarks.json",  # None disables incremental mode
+            "review_sink": {"directory": "output", "rotate_mb": 64, "rotate_minutes": 60}  # None disables
         }
     
+    def _create_review_sink(self) -> Optional[ReviewSink]:
+        """Stream reviews to rotating JSONL files as targets complete."""
+        sink_config = self.config.get("review_sink")
+        if not sink_config:
+            return None
+        
+        directory = Path(sink_config.get("directory", "output"))
+        rotate_mb = sink_config.get("rotate_mb")
+        rotate_minutes = sink_config.get("rotate_minutes")
+        return ReviewSink(
+            str(directory / f"reviews_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"),
+            rotate_bytes=int(rotate_mb * 1024 * 1024) if rotate_mb else None,
+            rotate_seconds=rotate_minutes * 60 if rotate_minutes else None
+        )
+    
     async def initialize(self):
         """Initialize the scraper with browser and monitoring."""
         try:
@@ -147,6 +183,7 @@ class ChimeraEnterpriseScraper:
             
             # Create page
             self.page = await self.context.new_page()
+            self.cloudflare_bypass = CloudflareBypass(self.page)
             
             # Apply advanced stealth measures
             await self._apply_advanced_stealth_measures()
@@ -268,6 +305,7 @@ class ChimeraEnterpriseScraper:
                 try:
                     self.current_target = target
                     logger.info(f"Scraping target: {target.get('name', 'Unknown')}")
+                    started = datetime.now()
                     
                     # Scrape single target
                     reviews = await self.scrape_target(target)
@@ -287,9 +325,22 @@ class ChimeraEnterpriseScraper:
                         
                         review_batches.append(batch)
                         
+                        # Stream to disk as we go
+                        if self.review_sink:
+                            await self.review_sink.write_many(reviews)
+                        
                         # Store batch
                         await self.storage.save_reviews_batch(batch)
                         
+                        # Only stored reviews are skipped by later runs
+                        if self.seen_reviews is not None:
+                            await asyncio.to_thread(self.seen_reviews.add_many, [review.id for review in reviews])
+                        
+                        # Next run stops paging at these reviews
+                        if self.watermarks:
+                            self.watermarks.advance(self._target_key(target), reviews, started)
+                            self.watermarks.save()
+                        
                         logger.info(f"Successfully scraped {len(reviews)} reviews from {target.get('name', 'Unknown')}")
                     
                     # Update session
@@ -350,18 +401,21 @@ class ChimeraEnterpriseScraper:
             
             # Handle Cloudflare if needed
             if self.config.get("cloudflare_bypass", True):
-                await self.cloudflare_bypass.wait_for_bypass(self.page, target.get('platform', 'unknown'))
+                await self.cloudflare_bypass.wait_for_bypass()
             
             # Simulate human behavior
             if self.config.get("human_behavior", True):
                 await self._simulate_advanced_human_behavior()
             
-            # Extract content robustly
-            html_content = await self._extract_content_robustly()
-            
-            # Parse reviews based on platform
+            # Read review pages newest-first, stopping at reviews collected by earlier runs
             platform = target.get('platform', 'unknown').lower()
-            reviews = await self._parse_reviews_enhanced(html_content, url, platform)
+            reviews = await collect_new_reviews(
+                lambda page: self._scrape_review_page(page, platform, navigate=page != url),
+                url,
+                self._target_key(target),
+                self.watermarks,
+                self.config.get("max_review_pages", 1)
+            )
             
             # Post-scraping cleanup
             await self._post_scraping_cleanup()
@@ -385,6 +439,22 @@ class ChimeraEnterpriseScraper:
             
             raise
     
+    @staticmethod
+    def _target_key(target: Dict[str, Any]) -> str:
+        """Watermark key for a target."""
+        return f"{target.get('platform', 'unknown').lower()}:{target.get('id') or target.get('url')}"
+    
+    async def _scrape_review_page(self, url: str, platform: str,
+                                  navigate: bool = True) -> Tuple[List[EnhancedReview], List[str]]:
+        """Fetch and parse one review page of the current target; also returns the IDs skipped as seen."""
+        if navigate:
+            await self._navigate_with_stealth(url)
+            if self.config.get("cloudflare_bypass", True):
+                await self.cloudflare_bypass.wait_for_bypass()
+        
+        html_content = await self._extract_content_robustly(platform if platform in ("g2", "capterra") else "g2")
+        return await self._parse_reviews_enhanced(html_content, url, platform)
+    
     async def _prepare_for_scraping(self, target: Dict[str, Any]):
         """Prepare the scraper for a new target."""
         try:
@@ -480,8 +550,12 @@ class ChimeraEnterpriseScraper:
         except Exception as e:
             logger.warning(f"Failed to simulate human behavior: {e}")
     
-    async def _extract_content_robustly(self) -> str:
-        """Extract HTML content with robust error handling."""
+    async def _extract_content_robustly(self, parser: Optional[str] = None) -> str:
+        """Extract HTML content with robust error handling.
+        
+        The page is also written to the page store, tagged with the parser
+        that will read it, so it can be re-parsed offline later.
+        """
         try:
             # Wait for content to load
             await self.page.wait_for_load_state("networkidle", timeout=10000)
@@ -492,6 +566,9 @@ class ChimeraEnterpriseScraper:
             if not content or len(content) < 1000:
                 raise Exception("Insufficient content extracted")
             
+            if self.page_store:
+                await self.page_store.save(self.page.url, content, parser)
+            
             logger.info(f"Successfully extracted {len(content)} characters of content")
             return content
             
@@ -499,19 +576,19 @@ class ChimeraEnterpriseScraper:
             logger.error(f"Failed to extract content: {e}")
             raise
     
-    async def _parse_reviews_enhanced(self, html_content: str, url: str, platform: str) -> List[EnhancedReview]:
-        """Parse reviews using enhanced parsers."""
+    async def _parse_reviews_enhanced(self, html_content: str, url: str,
+                                      platform: str) -> Tuple[List[EnhancedReview], List[str]]:
+        """Parse reviews using enhanced parsers; also returns the IDs skipped as already processed."""
         try:
-            if platform == "g2":
-                parser = G2Parser()
-                reviews = await parser.extract_reviews(html_content, url)
-            elif platform == "capterra":
-                parser = CapterraParser()
-                reviews = await parser.extract_reviews(html_content, url)
-            else:
-                # Fallback to G2 parser
-                parser = G2Parser()
-                reviews = await parser.extract_reviews(html_content, url)
+            engine = self.config.get("parser_engines", {}).get(platform)
+            plan_dir = self.config.get("selector_plan_dir")
+            seen_path = self.config.get("seen_reviews_path")
+            
+            # Parse off the event loop; unknown platforms fall back to the G2 parser
+            parser_platform = platform if platform in REVIEW_PLATFORMS else "g2"
+            reviews, skipped_ids = await self.parse_executor.extract_review_page(
+                parser_platform, html_content, url, engine, plan_dir, seen_path
+            )
             
             # Enhance reviews with sentiment analysis
             enhanced_reviews = []
@@ -529,7 +606,7 @@ class ChimeraEnterpriseScraper:
                 enhanced_reviews.append(review)
             
             logger.info(f"Successfully parsed {len(enhanced_reviews)} enhanced reviews")
-            return enhanced_reviews
+            return enhanced_reviews, skipped_ids
             
         except Exception as e:
             logger.error(f"Failed to parse reviews: {e}")
@@ -627,6 +704,7 @@ class ChimeraEnterpriseScraper:
             
             # Create new page
             self.page = await self.context.new_page()
+            self.cloudflare_bypass = CloudflareBypass(self.page)
             
             # Apply stealth measures
             await self._apply_advanced_stealth_measures()
@@ -664,6 +742,17 @@ class ChimeraEnterpriseScraper:
             if self.browser:
                 await self.browser.close()
             
+            # Stop parse workers
+            self.parse_executor.shutdown()
+            
+            # Close the review database
+            self.storage.close()
+            
+            # Flush streamed reviews
+            if self.review_sink:
+                files = await self.review_sink.close()
+                logger.info(f"Streamed {self.review_sink.stats['written']} reviews to {len(files)} file(s)")
+            
             # Export final statistics
             await self._export_final_statistics()
             
@@ -684,13 +773,13 @@ class ChimeraEnterpriseScraper:
             session_summary = self.session_manager.get_session_summary()
             session_file = f"session_summary_{int(time.time())}.json"
             
-            with open(session_file, 'w') as f:
-                json.dump(session_summary, f, indent=2, default=str)
+            with open(session_file, 'w', encoding='utf-8') as f:
+                serialization.dump(session_summary, f, indent=2)
             
             # Export anti-detection events
             events_file = f"anti_detection_events_{int(time.time())}.json"
-            with open(events_file, 'w') as f:
-                json.dump(self.anti_detection_events, f, indent=2, default=str)
+            with open(events_file, 'w', encoding='utf-8') as f:
+                serialization.dump(self.anti_detection_events, f, indent=2)
             
             logger.info("Final statistics exported successfully")
             
@@ -706,6 +795,7 @@ class ChimeraEnterpriseScraper:
             "anti_detection_events": len(self.anti_detection_events),
             "fingerprint_rotations": self.fingerprint_rotations,
             "retry_statistics": self.retry_manager.get_statistics() if self.retry_manager else {},
+            "parse_executor": self.parse_executor.get_metrics(),
             "uptime_seconds": (datetime.now() - self.scraping_stats.get("start_time", datetime.now())).total_seconds() if self.scraping_stats.get("start_time") else 0
         }
     
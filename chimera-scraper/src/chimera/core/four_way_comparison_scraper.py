@@ -6,14 +6,13 @@ import random
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
-import json
-from dataclasses import asdict
 
 from playwright.async_api import Page
 from loguru import logger
 
 from .competitive_intelligence_scraper import CompetitiveIntelligenceScraper, CompetitiveTarget, CompetitiveInsight
 from ..parsers.four_way_comparison import G2FourWayComparisonParser, FourWayComparisonData
+from ..utils import serialization
 
 
 class FourWayComparisonScraper:
@@ -109,20 +108,17 @@ class FourWayComparisonScraper:
             
             # Handle Cloudflare if needed
             if self.competitive_scraper.config.get("cloudflare_bypass", True):
-                await self.competitive_scraper.cloudflare_bypass.wait_for_bypass(
-                    self.competitive_scraper.page, 
-                    url_data["platform"]
-                )
+                await self.competitive_scraper.cloudflare_bypass.wait_for_bypass()
             
             # Simulate competitive research behavior
             if self.competitive_scraper.config.get("human_behavior", True):
                 await self.competitive_scraper._simulate_competitive_research_behavior()
             
             # Extract content
-            html_content = await self.competitive_scraper._extract_content_robustly()
+            html_content = await self.competitive_scraper._extract_content_robustly("g2_four_way")
             
             # Parse the four-way comparison
-            comparison_data = await self.parser.parse_four_way_comparison(html_content, url)
+            comparison_data = await self.competitive_scraper.parse_executor.parse_four_way_comparison(html_content, url)
             
             # Create competitive insight
             insight = await self._create_four_way_insight(url_data, comparison_data)
@@ -153,7 +149,7 @@ class FourWayComparisonScraper:
                 extraction_date=datetime.now(),
                 data_type="four_way_comparison",
                 url=url_data["url"],
-                content=asdict(comparison_data),
+                content=serialization.to_dict(comparison_data),
                 sentiment_analysis={
                     "score": 0.0,  # Four-way comparisons don't have sentiment
                     "label": "neutral",
@@ -413,21 +409,21 @@ class FourWayComparisonScraper:
             
             # Export as JSON
             json_file = f"{export_dir}/four_way_comparisons_{timestamp}.json"
-            with open(json_file, 'w') as f:
-                json.dump([asdict(insight) for insight in insights], f, indent=2, default=str)
+            with open(json_file, 'w', encoding='utf-8') as f:
+                serialization.dump(insights, f, indent=2)
             export_files["json"] = json_file
             
             # Export summary report
             summary_file = f"{export_dir}/four_way_summary_{timestamp}.json"
             summary = self._create_summary_report(insights)
-            with open(summary_file, 'w') as f:
-                json.dump(summary, f, indent=2, default=str)
+            with open(summary_file, 'w', encoding='utf-8') as f:
+                serialization.dump(summary, f, indent=2)
             export_files["summary"] = summary_file
             
             # Export statistics
             stats_file = f"{export_dir}/four_way_stats_{timestamp}.json"
-            with open(stats_file, 'w') as f:
-                json.dump(self.scraping_stats, f, indent=2, default=str)
+            with open(stats_file, 'w', encoding='utf-8') as f:
+                serialization.dump(self.scraping_stats, f, indent=2)
             export_files["stats"] = stats_file
             
             logger.info(f"Four-way comparison data exported to {export_dir}")
@@ -1,5 +1,4 @@
 """Session management and statistics tracking for scraping operations."""
-import json
 import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
@@ -7,6 +6,8 @@ from dataclasses import dataclass, asdict
 from loguru import logger
 import asyncio
 
+from ..utils import serialization
+
 
 @dataclass
 class ScrapingMetrics:
@@ -281,7 +282,7 @@ class ScrapingSession:
             report['anti_detection_events'] = self.anti_detection_events
             
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, default=str)
+                serialization.dump(report, f, indent=2)
             
             logger.info(f"Session report exported to {output_path}")
             return output_path
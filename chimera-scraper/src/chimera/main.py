@@ -7,6 +7,7 @@ from dotenv import load_dotenv
 from chimera.core.scraper import AsyncScraper, ChimeraRequestException
 from chimera.providers.proxies import StaticProxyProvider
 from chimera.parsers.g2 import G2Parser
+from chimera.utils.page_store import PageStore
 from chimera.utils.storage import save_to_json, save_to_csv
 from chimera.utils.logging import configure_logging
 
@@ -21,12 +22,13 @@ USER_AGENTS = [
 ]
 
 async def scrape_g2_reviews(url: str) -> List[dict]:
-    """Scrape reviews from a G2 product page."""
+    """Scrape reviews from a G2 product page, keeping the raw page for offline replay."""
     proxy_provider = StaticProxyProvider()
     
     async with AsyncScraper(proxy_provider, USER_AGENTS) as scraper:
         try:
             html = await scraper.get(url)
+            await PageStore().save(url, html, "g2")
             reviews = G2Parser.extract_reviews(html, url)
             return reviews
         except ChimeraRequestException as e:
@@ -22,6 +22,7 @@ class Review(BaseModel):
     
     class Config:
         allow_population_by_field_name = True
+        populate_by_name = True  # pydantic v2 name for the setting above
 
 
 class EnhancedReview(Review):
@@ -54,6 +55,7 @@ class EnhancedReview(Review):
     
     class Config:
         allow_population_by_field_name = True
+        populate_by_name = True  # pydantic v2 name for the setting above
         json_encoders = {datetime: lambda v: v.isoformat()}
 
 
@@ -82,23 +84,28 @@ class ReviewBatch(BaseModel):
     
     class Config:
         allow_population_by_field_name = True
+        populate_by_name = True  # pydantic v2 name for the setting above
         json_encoders = {datetime: lambda v: v.isoformat()}
     
     def update_statistics(self):
-        """Update batch statistics based on current reviews."""
+        """Update batch statistics based on current reviews, in one pass."""
+        successful = 0
+        rating_sum, rating_count = 0.0, 0
+        sentiments = {sentiment: 0 for sentiment in ReviewSentiment}
+        for review in self.reviews:
+            if review.extraction_confidence and review.extraction_confidence > 0.5:
+                successful += 1
+            if review.rating and review.rating > 0:
+                rating_sum += review.rating
+                rating_count += 1
+            if review.sentiment_label:
+                sentiments[review.sentiment_label] += 1
+        
         self.total_reviews = len(self.reviews)
-        self.successful_extractions = len([r for r in self.reviews if r.extraction_confidence and r.extraction_confidence > 0.5])
-        self.failed_extractions = self.total_reviews - self.successful_extractions
+        self.successful_extractions = successful
+        self.failed_extractions = self.total_reviews - successful
         
-        if self.reviews:
-            ratings = [r.rating for r in self.reviews if r.rating and r.rating > 0]
-            if ratings:
-                self.average_rating = sum(ratings) / len(ratings)
-            
-            # Calculate sentiment distribution
-            sentiments = [r.sentiment_label for r in self.reviews if r.sentiment_label]
-            if sentiments:
-                self.sentiment_distribution = {
-                    sentiment.value: sentiments.count(sentiment) 
-                    for sentiment in ReviewSentiment
-                }
+        if rating_count:
+            self.average_rating = rating_sum / rating_count
+        if any(sentiments.values()):
+            self.sentiment_distribution = {sentiment.value: count for sentiment, count in sentiments.items()}
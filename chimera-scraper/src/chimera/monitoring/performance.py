@@ -9,9 +9,10 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from collections import deque, defaultdict
 from loguru import logger
-import json
 import os
 
+from ..utils import serialization
+
 
 @dataclass
 class PerformanceMetrics:
@@ -557,10 +558,7 @@ class PerformanceMonitor:
             cutoff_time = datetime.now() - timedelta(minutes=duration_minutes)
             
             with self._lock:
-                export_metrics = [
-                    asdict(m) for m in self.metrics_history 
-                    if m.timestamp >= cutoff_time
-                ]
+                export_metrics = [m for m in self.metrics_history if m.timestamp >= cutoff_time]
             
             export_data = {
                 "export_timestamp": datetime.now().isoformat(),
@@ -572,8 +570,8 @@ class PerformanceMonitor:
                 "recommendations": self.get_recommendations_summary()
             }
             
-            with open(filepath, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+            with open(filepath, 'w', encoding='utf-8') as f:
+                serialization.dump(export_data, f, indent=2)
             
             logger.info(f"Performance metrics exported to {filepath}")
             
@@ -1,22 +1,119 @@
 """Base parser infrastructure for HTML and data parsing."""
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Optional, Tuple
 from datetime import datetime
+from pathlib import Path
+import asyncio
+import functools
+from bisect import bisect_right
 import re
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
 
 from chimera.models.review import EnhancedReview, ReviewSentiment
+from chimera.analysis.dedup import NearDuplicateIndex
+from chimera.analysis.keywords import get_index, get_matcher
+from chimera.utils.review_ids import SeenReviews, get_seen_reviews
+from .engines import DOMEngine, get_engine
+from .selector_plan import SelectorPlanStore, get_plan_store
+from .streaming import ContainerStream, HTMLSource, DEFAULT_CHUNK_SIZE, iter_html_chunks
+
+
+def run_sync(coroutine):
+    """Run a parser coroutine to completion from synchronous code.
+    
+    ``asyncio.run`` refuses to start inside a running event loop, which is
+    where legacy synchronous calls made from async code end up; there the
+    coroutine runs on its own loop in a helper thread and the caller blocks
+    until it finishes.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coroutine).result()
+
+
+class sync_on_class:
+    """Async parser method that keeps a legacy synchronous class-level call.
+
+    Called on an instance it is the usual bound coroutine method; called on
+    the class (``G2Parser.extract_reviews(html, url)``) it runs the legacy
+    function registered with ``class_call``, like a ``property`` setter.
+    """
+    
+    def __init__(self, method, legacy=None):
+        self.method = method
+        self.legacy = legacy
+        functools.update_wrapper(self, method)
+    
+    def class_call(self, legacy) -> "sync_on_class":
+        """Register the function used when the method is called on the class."""
+        return type(self)(self.method, legacy)
+    
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self.legacy or self.method
+        return self.method.__get__(instance, owner)
 
 
 class BaseParser(ABC):
     """Abstract base class for all parsers with advanced features."""
     
-    def __init__(self):
+    # DOM engine name for this platform; None picks the fastest installed engine
+    dom_engine: Optional[str] = None
+    
+    # Key for this parser's selector plans
+    platform: str = "generic"
+    
+    # Keyword vocabularies for enrichment; each set is compiled once into a
+    # shared multi-pattern matcher
+    sentiment_vocabularies: Dict[str, List[str]] = {
+        'positive': [
+            'excellent', 'great', 'amazing', 'outstanding', 'fantastic', 'wonderful',
+            'love', 'perfect', 'best', 'awesome', 'brilliant', 'superb', 'terrific'
+        ],
+        'negative': [
+            'terrible', 'awful', 'horrible', 'worst', 'bad', 'poor', 'disappointing',
+            'hate', 'useless', 'broken', 'frustrating', 'annoying', 'difficult'
+        ]
+    }
+    indicator_vocabularies: Dict[str, List[str]] = {
+        'feature': [
+            'feature', 'functionality', 'capability', 'tool', 'option', 'setting',
+            'dashboard', 'report', 'analytics', 'integration', 'api', 'workflow'
+        ],
+        'pain': [
+            'problem', 'issue', 'bug', 'error', 'crash', 'slow', 'difficult',
+            'confusing', 'complicated', 'frustrating', 'annoying', 'broken'
+        ]
+    }
+    
+    # Review container selectors, tried best-first through the selector plan
+    review_selector_type: str = "review_selector"
+    primary_review_selectors: List[str] = []
+    fallback_review_selectors: List[str] = []
+    
+    # SimHash bit distance under which two reviews by the same author count as one
+    near_duplicate_distance: int = 6
+    
+    def __init__(self, engine: Optional[str] = None, selector_plan_dir: Optional[str] = None,
+                 seen_reviews_path: Optional[str] = None):
+        self.dom: DOMEngine = get_engine(engine or self.dom_engine)
+        self.selector_plans: SelectorPlanStore = get_plan_store(
+            self.platform, Path(selector_plan_dir) if selector_plan_dir else None
+        )
+        # Reviews processed by earlier runs; None processes every review
+        self.seen_reviews: Optional[SeenReviews] = get_seen_reviews(seen_reviews_path) if seen_reviews_path else None
+        # IDs dropped by _already_processed, for incremental paging
+        self.skipped_ids: List[str] = []
         self.selector_cache = {}
         self.extraction_stats = {
             'total_attempts': 0,
             'successful_extractions': 0,
             'failed_extractions': 0,
+            'skipped_seen': 0,
             'selector_success_rates': {},
             'extraction_times': []
         }
@@ -27,20 +124,122 @@ class BaseParser(ABC):
         """Extract reviews from HTML content."""
         pass
     
+    async def stream_reviews(self, source: HTMLSource, source_url: str,
+                             chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[EnhancedReview]:
+        """Yield reviews as their containers close while the page is read in chunks.
+        
+        ``source`` may be HTML text, a Path, a file object or a (async) chunk
+        iterable. Only selector-matched containers are streamed; the
+        whole-page pattern-matching fallback of ``extract_reviews`` needs the
+        full tree and is not available here.
+        """
+        plan = self.selector_plans.get(self.review_selector_type, self.review_selectors())
+        ordered = plan.ordered()
+        stream = ContainerStream(ordered)
+        seen = NearDuplicateIndex(self.near_duplicate_distance)
+        
+        if hasattr(source, '__aiter__'):
+            async for chunk in source:
+                async for review in self._reviews_from_containers(stream.feed(chunk), source_url, seen):
+                    yield review
+        else:
+            for chunk in iter_html_chunks(source, chunk_size):
+                async for review in self._reviews_from_containers(stream.feed(chunk), source_url, seen):
+                    yield review
+                # Let enrichment consumers run between chunks
+                await asyncio.sleep(0)
+        
+        async for review in self._reviews_from_containers(stream.close(), source_url, seen):
+            yield review
+        
+        # Same bookkeeping as SelectorPlan.select: misses up to the winner, then its hit
+        for selector in ordered:
+            plan.record(selector, selector == stream.best_selector)
+            if selector == stream.best_selector:
+                self.cache_selectors({self.review_selector_type: selector})
+                break
+        # Throttled: writes at most once per save_interval
+        self.selector_plans.save()
+        logger.info(f"Streamed {stream.containers_seen} review containers from {source_url}")
+        self.last_extraction_time = datetime.now()
+    
+    async def _reviews_from_containers(self, containers: List[Tuple[str, str]], source_url: str,
+                                       seen: NearDuplicateIndex) -> AsyncIterator[EnhancedReview]:
+        """Parse closed container fragments into validated, enriched, first-seen reviews."""
+        for selector, fragment in containers:
+            root = self.dom.parse(fragment)
+            element = self.dom.select_one(root, selector)
+            if element is None:
+                continue
+            
+            review = await self._parse_single_review_enhanced(element, source_url)
+            if review is None:
+                continue
+            if not self._is_valid_review(review):
+                self.extraction_stats['failed_extractions'] += 1
+                continue
+            if self._is_near_duplicate(review, seen):
+                continue
+            
+            self.extraction_stats['successful_extractions'] += 1
+            enhanced = await self._enhance_reviews_with_intelligence([review])
+            for enhanced_review in enhanced:
+                yield enhanced_review
+    
+    def review_selectors(self) -> List[str]:
+        """Candidate review container selectors in declared order."""
+        return self.primary_review_selectors + self.fallback_review_selectors
+    
+    @abstractmethod
+    async def _parse_single_review_enhanced(self, element: Any, source_url: str) -> Optional[EnhancedReview]:
+        """Parse one review container, or return None when it holds no usable review."""
+        pass
+    
+    async def _enhance_reviews_with_intelligence(self, reviews: List[EnhancedReview]) -> List[EnhancedReview]:
+        """Hook for platform-specific enrichment of parsed reviews."""
+        return reviews
+    
     def validate_extraction(self, reviews: List[EnhancedReview]) -> List[EnhancedReview]:
-        """Validate extracted reviews for quality."""
+        """Validate extracted reviews for quality and drop near-duplicates."""
         validated_reviews = []
+        seen = NearDuplicateIndex(self.near_duplicate_distance)
         
         for review in reviews:
-            if self._is_valid_review(review):
-                validated_reviews.append(review)
-            else:
+            if not self._is_valid_review(review):
                 self.extraction_stats['failed_extractions'] += 1
                 logger.debug(f"Review validation failed: {review.id}")
+            elif not self._is_near_duplicate(review, seen):
+                validated_reviews.append(review)
         
         self.extraction_stats['successful_extractions'] = len(validated_reviews)
         return validated_reviews
     
+    def _already_processed(self, review_id: str) -> bool:
+        """Whether an earlier run already parsed and stored this review.
+        
+        Platforms check this as soon as the ID is known, before any
+        enrichment work, and drop the review when it is true. IDs are only
+        recorded by the orchestrators once a batch is stored, so a run that
+        fails before saving leaves its reviews to be parsed again.
+        """
+        if self.seen_reviews is None or review_id not in self.seen_reviews:
+            return False
+        self.extraction_stats['skipped_seen'] += 1
+        self.skipped_ids.append(review_id)
+        return True
+    
+    def _is_near_duplicate(self, review: EnhancedReview, seen: NearDuplicateIndex) -> bool:
+        """Record the review in ``seen`` and report whether an earlier one matched it.
+        
+        The same review often appears more than once on a page, in nested
+        containers or in several matched selectors, with slightly different
+        surrounding text.
+        """
+        duplicate_of = seen.add(review.id, f"{review.title} {review.content}", review.author.strip().lower())
+        if duplicate_of is not None:
+            logger.debug(f"Dropped review {review.id} as a near-duplicate of {duplicate_of}")
+        return duplicate_of is not None
+    
     def _is_valid_review(self, review: EnhancedReview) -> bool:
         """Check if a review meets quality standards."""
         # Basic validation
@@ -74,6 +273,20 @@ class BaseParser(ABC):
         """Get cached selectors for a specific type."""
         return self.selector_cache.get(selector_type, [])
     
+    def select_with_plan(self, root: Any, selector_type: str, selectors: List[str]) -> Tuple[Optional[str], List[Any]]:
+        """Try selectors best-first by past success and return the first match."""
+        plan = self.selector_plans.get(selector_type, selectors)
+        selector, elements = plan.select(self.dom, root)
+        
+        for tried, data in plan.stats.items():
+            self.extraction_stats['selector_success_rates'][tried] = dict(data)
+        
+        if selector:
+            self.cache_selectors({selector_type: selector})
+        # Throttled: writes at most once per save_interval
+        self.selector_plans.save()
+        return selector, elements
+    
     def update_extraction_stats(self, selector: str, success: bool, extraction_time: float):
         """Update extraction statistics."""
         self.extraction_stats['total_attempts'] += 1
@@ -131,23 +344,10 @@ class BaseParser(ABC):
         if not text:
             return 0.0, ReviewSentiment.NEUTRAL
         
-        text_lower = text.lower()
-        
-        # Positive indicators
-        positive_words = [
-            'excellent', 'great', 'amazing', 'outstanding', 'fantastic', 'wonderful',
-            'love', 'perfect', 'best', 'awesome', 'brilliant', 'superb', 'terrific'
-        ]
-        
-        # Negative indicators
-        negative_words = [
-            'terrible', 'awful', 'horrible', 'worst', 'bad', 'poor', 'disappointing',
-            'hate', 'useless', 'broken', 'frustrating', 'annoying', 'difficult'
-        ]
-        
-        # Count positive and negative words
-        positive_count = sum(1 for word in positive_words if word in text_lower)
-        negative_count = sum(1 for word in negative_words if word in text_lower)
+        # Count positive and negative words in one pass
+        found = get_index(self.sentiment_vocabularies).matched(text.lower())
+        positive_count = len(found['positive'])
+        negative_count = len(found['negative'])
         
         # Calculate sentiment score (-1 to 1)
         total_words = len(text.split())
@@ -173,18 +373,23 @@ class BaseParser(ABC):
             return []
         
         text_lower = text.lower()
-        mentioned_competitors = []
         
-        for competitor in known_competitors:
-            competitor_lower = competitor.lower()
-            
-            # Check for exact matches and variations
-            if competitor_lower in text_lower:
-                mentioned_competitors.append(competitor)
-            elif competitor_lower.replace(' ', '') in text_lower.replace(' ', ''):
-                mentioned_competitors.append(competitor)
-            elif competitor_lower.replace('-', ' ') in text_lower:
-                mentioned_competitors.append(competitor)
+        # Exact and hyphen-as-space variants in one pass over the text
+        variants = get_matcher([v for c in known_competitors for v in (c.lower(), c.lower().replace('-', ' '))])
+        found = variants.matched(text_lower)
+        mentioned_competitors = [
+            c for c in known_competitors
+            if c.lower() in found or c.lower().replace('-', ' ') in found
+        ]
+        
+        # Space-insensitive variants, scanned once only if something is still missing
+        if len(mentioned_competitors) < len(known_competitors):
+            compact = get_matcher([c.lower().replace(' ', '') for c in known_competitors])
+            found_compact = compact.matched(text_lower.replace(' ', ''))
+            mentioned_competitors = [
+                c for c in known_competitors
+                if c in mentioned_competitors or c.lower().replace(' ', '') in found_compact
+            ]
         
         return mentioned_competitors
     
@@ -193,40 +398,40 @@ class BaseParser(ABC):
         if not text:
             return [], []
         
-        text_lower = text.lower()
-        
-        # Feature indicators
-        feature_indicators = [
-            'feature', 'functionality', 'capability', 'tool', 'option', 'setting',
-            'dashboard', 'report', 'analytics', 'integration', 'api', 'workflow'
-        ]
-        
-        # Pain point indicators
-        pain_indicators = [
-            'problem', 'issue', 'bug', 'error', 'crash', 'slow', 'difficult',
-            'confusing', 'complicated', 'frustrating', 'annoying', 'broken'
-        ]
+        index = get_index(self.indicator_vocabularies)
         
         features = []
         pain_points = []
         
-        # Extract sentences containing indicators
-        sentences = re.split(r'[.!?]+', text)
+        # Find every indicator in one scan of the whole text, then map each hit
+        # to the sentence containing it. Lower-casing leaves the delimiters in
+        # place, so sentence spans line up between the two texts.
+        text_lower = text.lower()
+        spans = [match.span() for match in re.finditer(r'[^.!?]+', text_lower)]
+        sentences = re.findall(r'[^.!?]+', text)
+        starts = [start for start, _ in spans]
+        
+        hit_sentences = {'feature': set(), 'pain': set()}
+        for start, end, keyword in index.find_all(text_lower):
+            position = bisect_right(starts, start) - 1
+            if position < 0 or end > spans[position][1]:
+                continue
+            for kind in ('feature', 'pain'):
+                if keyword in index.vocabularies[kind]:
+                    hit_sentences[kind].add(position)
         
-        for sentence in sentences:
-            sentence_lower = sentence.lower().strip()
-            if not sentence_lower:
+        for position, sentence in enumerate(sentences):
+            sentence = sentence.strip()
+            if len(sentence) <= 10:
                 continue
             
             # Check for features
-            if any(indicator in sentence_lower for indicator in feature_indicators):
-                if len(sentence.strip()) > 10:
-                    features.append(sentence.strip())
+            if position in hit_sentences['feature']:
+                features.append(sentence)
             
             # Check for pain points
-            if any(indicator in sentence_lower for indicator in pain_indicators):
-                if len(sentence.strip()) > 10:
-                    pain_points.append(sentence.strip())
+            if position in hit_sentences['pain']:
+                pain_points.append(sentence)
         
         return features, pain_points
     
@@ -306,6 +511,7 @@ class BaseParser(ABC):
         """Get information about the parser."""
         return {
             'parser_type': self.__class__.__name__,
+            'dom_engine': self.dom.name,
             'selector_cache_size': sum(len(selectors) for selectors in self.selector_cache.values()),
             'extraction_stats': self.get_extraction_stats(),
             'last_extraction': self.last_extraction_time.isoformat() if self.last_extraction_time else None
@@ -1,6 +1,5 @@
 """Enhanced Capterra parser with advanced Cloudflare handling and anti-detection capabilities."""
 
-from bs4 import BeautifulSoup
 from typing import List, Any, Optional
 import re
 from datetime import datetime
@@ -9,14 +8,55 @@ from loguru import logger
 import asyncio
 
 from chimera.models.review import Review, EnhancedReview
-from .base import BaseParser
+from chimera.utils.review_ids import stable_review_id
+from .base import BaseParser, run_sync, sync_on_class
+from .text_scan import PhraseScanner, find_phrase_containers
 
 
 class CapterraParser(BaseParser):
     """Enhanced Capterra parser with benchmark-level capabilities and Cloudflare bypass."""
     
-    def __init__(self):
-        super().__init__()
+    platform = "capterra"
+    
+    review_selector_type = "capterra_review_selector"
+    
+    # Primary selectors from benchmark
+    primary_review_selectors = [
+        '.review-item',
+        '.review',
+        '[data-testid="review"]',
+        '.review-container',
+        '.review-card'
+    ]
+    
+    # Fallback selectors from benchmark
+    fallback_review_selectors = [
+        '.review-text',
+        '.review-content',
+        '.review-body',
+        '.review-description',
+        '.review-summary'
+    ]
+    
+    # Review-like phrases for the pattern matching fallback
+    review_trigger_phrases = [
+        'pros and cons',
+        'what i like',
+        'what i dislike',
+        'overall experience',
+        'ease of use',
+        'customer support',
+        'value for money',
+        'recommend to others',
+        'would recommend',
+        'great tool',
+        'excellent software'
+    ]
+    _phrase_scanner = PhraseScanner(review_trigger_phrases)
+    
+    def __init__(self, engine: Optional[str] = None, selector_plan_dir: Optional[str] = None,
+                 seen_reviews_path: Optional[str] = None):
+        super().__init__(engine, selector_plan_dir, seen_reviews_path)
         self.known_competitors = [
             "tableau", "power bi", "qlik sense", "looker", "snowflake", 
             "databricks", "thoughtspot", "sigma", "hex", "omni", "domo",
@@ -26,6 +66,7 @@ class CapterraParser(BaseParser):
         self.last_extraction_time = datetime.now()
         self.cloudflare_detected = False
     
+    @sync_on_class
     async def extract_reviews(self, html: str, source_url: str) -> List[EnhancedReview]:
         """Extract reviews with enhanced features and Cloudflare detection."""
         start_time = time.time()
@@ -65,8 +106,9 @@ class CapterraParser(BaseParser):
     
     def _detect_cloudflare(self, html: str) -> bool:
         """Detect Cloudflare protection in HTML response."""
+        # Challenge-page markers only: fully rendered pages served through
+        # Cloudflare also mention it (e.g. <script data-source="cloudflare">)
         cloudflare_indicators = [
-            "cloudflare",
             "ray id:",
             "checking your browser",
             "please wait while we verify",
@@ -86,69 +128,23 @@ class CapterraParser(BaseParser):
     
     async def _extract_review_elements(self, html: str) -> List[Any]:
         """Extract review elements using multiple strategies."""
-        soup = BeautifulSoup(html, 'lxml')
-        
-        # Primary selectors from benchmark
-        primary_selectors = [
-            '.review-item',
-            '.review',
-            '[data-testid="review"]',
-            '.review-container',
-            '.review-card'
-        ]
+        root = self.dom.parse(html)
         
-        # Fallback selectors from benchmark
-        fallback_selectors = [
-            '.review-text',
-            '.review-content',
-            '.review-body',
-            '.review-description',
-            '.review-summary'
-        ]
-        
-        # Try primary selectors first
-        for selector in primary_selectors:
-            elements = soup.select(selector)
-            if elements:
-                self.cache_selectors({"capterra_review_selector": selector})
-                logger.info(f"Found {len(elements)} review elements with primary selector: {selector}")
-                return elements
-        
-        # Try fallback selectors
-        for selector in fallback_selectors:
-            elements = soup.select(selector)
-            if elements:
-                self.cache_selectors({"capterra_review_selector": selector})
-                logger.info(f"Found {len(elements)} review elements with fallback selector: {selector}")
-                return elements
+        # Try selectors best-first by past success rate
+        selector, elements = self.select_with_plan(root, self.review_selector_type, self.review_selectors())
+        if elements:
+            logger.info(f"Found {len(elements)} review elements with selector: {selector}")
+            return elements
         
         # Pattern matching fallback (from benchmark)
-        return self._extract_by_pattern_matching(soup)
+        return self._extract_by_pattern_matching(root)
     
-    def _extract_by_pattern_matching(self, soup: BeautifulSoup) -> List[Any]:
+    def _extract_by_pattern_matching(self, root: Any) -> List[Any]:
         """Extract reviews using pattern matching from benchmark."""
-        potential_reviews = []
-        
-        # Look for review-like patterns
-        all_elements = soup.find_all(['div', 'p', 'span', 'article'])
-        
-        for element in all_elements:
-            text = element.get_text().strip()
-            if text and len(text) > 30:
-                if any(phrase in text.lower() for phrase in [
-                    'pros and cons',
-                    'what i like',
-                    'what i dislike',
-                    'overall experience',
-                    'ease of use',
-                    'customer support',
-                    'value for money',
-                    'recommend to others',
-                    'would recommend',
-                    'great tool',
-                    'excellent software'
-                ]):
-                    potential_reviews.append(element)
+        # One scan of the text nodes; each phrase hit resolves to its containers
+        potential_reviews = find_phrase_containers(
+            self.dom, root, ['div', 'p', 'span', 'article'], self.review_trigger_phrases, scanner=self._phrase_scanner
+        )
         
         logger.info(f"Found {len(potential_reviews)} potential review elements using pattern matching")
         return potential_reviews[:30]  # Limit to avoid detection
@@ -165,6 +161,11 @@ class CapterraParser(BaseParser):
             if not text or len(text.strip()) < 20:
                 return None
             
+            # Skip enrichment for reviews an earlier run already processed
+            review_id = stable_review_id("Capterra", author, text)
+            if self._already_processed(review_id):
+                return None
+            
             # Enhanced features
             sentiment_score, sentiment_label = self.analyze_sentiment(text)
             competitor_mentions = self.extract_competitor_mentions(text, self.known_competitors)
@@ -172,12 +173,11 @@ class CapterraParser(BaseParser):
             pros, cons = self.extract_pros_and_cons(text)
             
             # Calculate quality metrics
-            review_quality_score = self.calculate_review_quality_score(text)
             extraction_confidence = self._calculate_extraction_confidence(element)
             
             # Create enhanced review
             review = EnhancedReview(
-                id=f"capterra_{hash(f'{author}_{date}_{text[:50]}')}",
+                id=review_id,
                 source="Capterra",
                 title=text[:100] + "..." if len(text) > 100 else text,
                 content=text,
@@ -192,12 +192,12 @@ class CapterraParser(BaseParser):
                 pain_points=pain_points,
                 pros=pros,
                 cons=cons,
-                review_quality_score=review_quality_score,
                 extraction_confidence=extraction_confidence,
                 word_count=len(text.split()),
                 extraction_method="enhanced_capterra_parser",
                 extraction_timestamp=datetime.now()
             )
+            review.review_quality_score = self.calculate_review_quality_score(review)
             
             return review
             
@@ -215,16 +215,16 @@ class CapterraParser(BaseParser):
         
         for selector in text_selectors:
             try:
-                text_elements = element.select(selector)
+                text_elements = self.dom.select(element, selector)
                 for text_element in text_elements:
-                    text = text_element.get_text().strip()
+                    text = self.dom.text(text_element).strip()
                     if text and len(text) > 20:
                         return text
             except:
                 continue
         
         # Fallback to element text
-        return element.get_text().strip()
+        return self.dom.text(element).strip()
     
     def _extract_rating(self, element: Any) -> float:
         """Extract rating from review element."""
@@ -237,9 +237,9 @@ class CapterraParser(BaseParser):
             
             for selector in rating_selectors:
                 try:
-                    rating_element = element.select_one(selector)
-                    if rating_element:
-                        rating_text = rating_element.get_text()
+                    rating_element = self.dom.select_one(element, selector)
+                    if rating_element is not None:
+                        rating_text = self.dom.text(rating_element)
                         rating_match = re.search(r"(\d+\.?\d?)", rating_text)
                         if rating_match:
                             rating = float(rating_match.group(1))
@@ -249,7 +249,7 @@ class CapterraParser(BaseParser):
                     continue
             
             # Look for rating in text content
-            text = element.get_text()
+            text = self.dom.text(element)
             rating_match = re.search(r"(\d+\.?\d?)\s*out\s*of\s*5", text)
             if rating_match:
                 rating = float(rating_match.group(1))
@@ -257,9 +257,9 @@ class CapterraParser(BaseParser):
                     return rating
             
             # Look for star ratings
-            star_elements = element.select('[class*="star"], .star, [class*="rating"]')
+            star_elements = self.dom.select(element, '[class*="star"], .star, [class*="rating"]')
             if star_elements:
-                star_count = len([s for s in star_elements if 'filled' in s.get('class', []) or 'active' in s.get('class', [])])
+                star_count = len([s for s in star_elements if 'filled' in self.dom.classes(s) or 'active' in self.dom.classes(s)])
                 if star_count > 0:
                     return float(star_count)
             
@@ -280,9 +280,9 @@ class CapterraParser(BaseParser):
             
             for selector in date_selectors:
                 try:
-                    date_element = element.select_one(selector)
-                    if date_element:
-                        date_str = date_element.get('datetime') or date_element.get_text().strip()
+                    date_element = self.dom.select_one(element, selector)
+                    if date_element is not None:
+                        date_str = self.dom.attribute(date_element, 'datetime') or self.dom.text(date_element).strip()
                         if date_str:
                             parsed_date = self._parse_date_string(date_str)
                             if parsed_date:
@@ -291,7 +291,7 @@ class CapterraParser(BaseParser):
                     continue
             
             # Look for date patterns in text
-            text = element.get_text()
+            text = self.dom.text(element)
             date_patterns = [
                 r'\d{1,2}/\d{1,2}/\d{4}',  # MM/DD/YYYY
                 r'\d{4}-\d{2}-\d{2}',      # YYYY-MM-DD
@@ -323,16 +323,16 @@ class CapterraParser(BaseParser):
             
             for selector in author_selectors:
                 try:
-                    author_element = element.select_one(selector)
-                    if author_element:
-                        author = author_element.get_text().strip()
+                    author_element = self.dom.select_one(element, selector)
+                    if author_element is not None:
+                        author = self.dom.text(author_element).strip()
                         if author and len(author) > 2 and author.lower() != 'anonymous':
                             return author
                 except:
                     continue
             
             # Look for author patterns in text
-            text = element.get_text()
+            text = self.dom.text(element)
             lines = text.split('\n')
             for line in lines:
                 line = line.strip()
@@ -374,7 +374,7 @@ class CapterraParser(BaseParser):
         confidence = 0.0
         
         # Check if we have text content
-        if element.get_text().strip():
+        if self.dom.text(element).strip():
             confidence += 0.3
         
         # Check if we have rating
@@ -392,11 +392,11 @@ class CapterraParser(BaseParser):
             confidence += 0.1
         
         # Check element structure
-        if element.name in ['div', 'p', 'span', 'article']:
+        if self.dom.tag_name(element) in ['div', 'p', 'span', 'article']:
             confidence += 0.1
         
         # Check for review-like content
-        text = element.get_text().lower()
+        text = self.dom.text(element).lower()
         if any(phrase in text for phrase in ['pros', 'cons', 'like', 'dislike', 'experience', 'recommend']):
             confidence += 0.1
         
@@ -424,7 +424,7 @@ class CapterraParser(BaseParser):
                 
                 # Calculate quality score if not present
                 if review.review_quality_score is None:
-                    review.review_quality_score = self.calculate_review_quality_score(review.content)
+                    review.review_quality_score = self.calculate_review_quality_score(review)
                 
                 # Add word count if not present
                 if review.word_count is None:
@@ -441,12 +441,12 @@ class CapterraParser(BaseParser):
         return self.cloudflare_detected
     
     # Backward compatibility methods
-    @staticmethod
+    @extract_reviews.class_call
     def extract_reviews(html: str, source_url: str) -> List[Review]:
         """Legacy method for backward compatibility."""
         parser = CapterraParser()
         # Convert EnhancedReview to Review for backward compatibility
-        enhanced_reviews = asyncio.run(parser.extract_reviews(html, source_url))
+        enhanced_reviews = run_sync(parser.extract_reviews(html, source_url))
         return [Review(
             review_id=review.id,
             source=review.source,
@@ -0,0 +1,230 @@
+"""Parse-once indexed document model shared by section extractors."""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple, Union
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+
+Matcher = Union[str, Pattern, bool, None]
+
+
+class IndexedDocument:
+    """HTML document parsed once and indexed for repeated section lookups.
+
+    A single pre-order walk records every tag by name, class token, full class
+    string, attribute name and attribute value, plus each node's document span.
+    Lookups pick the smallest matching index instead of re-walking the tree, and
+    ``within`` scopes a query to a node's subtree with a position range check.
+    Text is cached per node so repeated ``get_text`` calls are free.
+    """
+
+    def __init__(self, html: Union[str, bytes, BeautifulSoup], features: str = 'lxml'):
+        if isinstance(html, BeautifulSoup):
+            self.soup = html
+        else:
+            self.soup = BeautifulSoup(html, features)
+
+        self._spans: Dict[int, Tuple[int, int]] = {}
+        self._by_tag: Dict[str, List[Tag]] = defaultdict(list)
+        self._by_class: Dict[str, List[Tag]] = defaultdict(list)
+        self._by_class_string: Dict[str, List[Tag]] = defaultdict(list)
+        self._by_attr: Dict[str, List[Tag]] = defaultdict(list)
+        self._by_attr_value: Dict[str, Dict[str, List[Tag]]] = defaultdict(lambda: defaultdict(list))
+        self._string_positions: List[int] = []
+        self._strings: List[NavigableString] = []
+        self._text_cache: Dict[Tuple[int, str, bool], str] = {}
+        self._select_cache: Dict[Tuple[str, int], List[Tag]] = {}
+        self._page_text: Optional[str] = None
+
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """Walk the tree once, assigning pre-order positions and filling indexes."""
+        position = 0
+        root = self.soup
+        stack = [(root, iter(root.contents), position)]
+
+        while stack:
+            node, children, start = stack[-1]
+            child = next(children, None)
+
+            if child is None:
+                stack.pop()
+                self._spans[id(node)] = (start, position)
+                continue
+
+            position += 1
+            if isinstance(child, Tag):
+                self._register_tag(child)
+                stack.append((child, iter(child.contents), position))
+            elif isinstance(child, NavigableString):
+                self._string_positions.append(position)
+                self._strings.append(child)
+
+    def _register_tag(self, tag: Tag):
+        """Add a tag to the name, class and attribute indexes."""
+        self._by_tag[tag.name].append(tag)
+
+        for attr, value in tag.attrs.items():
+            if isinstance(value, list):
+                value = ' '.join(value)
+            self._by_attr[attr].append(tag)
+            self._by_attr_value[attr][value].append(tag)
+
+        for token in tag.get('class', []):
+            self._by_class[token].append(tag)
+        if 'class' in tag.attrs:
+            self._by_class_string[' '.join(tag['class'])].append(tag)
+
+    # Queries
+
+    def find_all(self, name: Union[str, List[str], None] = None, class_: Matcher = None,
+                 attrs: Optional[Dict[str, Matcher]] = None, string: Matcher = None,
+                 within: Optional[Tag] = None, limit: Optional[int] = None) -> List[Tag]:
+        """Find tags with BeautifulSoup ``find_all`` semantics using the indexes."""
+        attrs = dict(attrs or {})
+        if class_ is not None:
+            attrs['class'] = class_
+
+        candidate_lists = []
+        if name is not None:
+            names = [name] if isinstance(name, str) else list(name)
+            candidate_lists.append(self._merge(self._by_tag.get(n, []) for n in names))
+        for attr, matcher in attrs.items():
+            candidate_lists.append(self._attr_candidates(attr, matcher))
+
+        if candidate_lists:
+            candidates = min(candidate_lists, key=len)
+        else:
+            candidates = self._merge(self._by_tag.values())
+
+        low, high = self._bounds(within)
+        results = []
+        for node in candidates:
+            position = self._spans[id(node)][0]
+            if not low < position <= high:
+                continue
+            if name is not None and node.name not in names:
+                continue
+            if not all(self._attr_matches(node, attr, matcher) for attr, matcher in attrs.items()):
+                continue
+            if string is not None and not self._value_matches(node.string, string):
+                continue
+            results.append(node)
+            if limit and len(results) >= limit:
+                break
+
+        return results
+
+    def find(self, name: Union[str, List[str], None] = None, class_: Matcher = None,
+             attrs: Optional[Dict[str, Matcher]] = None, string: Matcher = None,
+             within: Optional[Tag] = None) -> Optional[Tag]:
+        """Return the first tag matching ``find_all`` criteria, or None."""
+        results = self.find_all(name, class_=class_, attrs=attrs, string=string, within=within, limit=1)
+        return results[0] if results else None
+
+    def find_previous(self, node: Tag, name: Union[str, List[str], None] = None,
+                      class_: Matcher = None, attrs: Optional[Dict[str, Matcher]] = None,
+                      string: Matcher = None) -> Optional[Tag]:
+        """Return the closest tag before ``node`` in document order, like ``Tag.find_previous``."""
+        position = self._spans[id(node)][0]
+        matches = self.find_all(name, class_=class_, attrs=attrs, string=string)
+        positions = [self._spans[id(match)][0] for match in matches]
+        index = bisect_left(positions, position)
+        return matches[index - 1] if index > 0 else None
+
+    def find_string(self, pattern: Matcher, within: Optional[Tag] = None) -> Optional[NavigableString]:
+        """Return the first text node matching ``pattern``, like ``find(string=...)``."""
+        low, high = self._bounds(within)
+        start = bisect_right(self._string_positions, low)
+        stop = bisect_right(self._string_positions, high)
+        for text_node in self._strings[start:stop]:
+            if self._value_matches(text_node, pattern):
+                return text_node
+        return None
+
+    def select(self, selector: str, within: Optional[Tag] = None) -> List[Tag]:
+        """Run a CSS selector once per scope and cache the result."""
+        key = (selector, id(within) if within is not None else 0)
+        if key not in self._select_cache:
+            scope = within if within is not None else self.soup
+            self._select_cache[key] = scope.select(selector)
+        return self._select_cache[key]
+
+    def text(self, node: Tag, separator: str = '', strip: bool = False) -> str:
+        """Return ``node.get_text(separator, strip)``, computed once per node."""
+        key = (id(node), separator, strip)
+        if key not in self._text_cache:
+            self._text_cache[key] = node.get_text(separator, strip=strip)
+        return self._text_cache[key]
+
+    @property
+    def page_text(self) -> str:
+        """Full document text, computed once."""
+        if self._page_text is None:
+            self._page_text = self.soup.get_text()
+        return self._page_text
+
+    def classes(self) -> List[str]:
+        """Distinct class tokens seen in the document."""
+        return list(self._by_class.keys())
+
+    def position(self, node: Tag) -> int:
+        """Pre-order position of a node in the document."""
+        return self._spans[id(node)][0]
+
+    # Internal helpers
+
+    def _bounds(self, within: Optional[Tag]) -> Tuple[int, int]:
+        """Exclusive-inclusive position range covering ``within``'s descendants."""
+        if within is None:
+            return self._spans[id(self.soup)]
+        return self._spans[id(within)]
+
+    def _attr_candidates(self, attr: str, matcher: Matcher) -> List[Tag]:
+        """Candidate tags for one attribute constraint, from the value index."""
+        if attr == 'class' and isinstance(matcher, str):
+            return self._merge([self._by_class.get(matcher, []), self._by_class_string.get(matcher, [])])
+        if matcher is True:
+            return self._by_attr.get(attr, [])
+
+        values = self._by_attr_value.get(attr, {})
+        if isinstance(matcher, str):
+            return values.get(matcher, [])
+        return self._merge(nodes for value, nodes in values.items() if self._value_matches(value, matcher))
+
+    def _attr_matches(self, node: Tag, attr: str, matcher: Matcher) -> bool:
+        """Check one attribute constraint with BeautifulSoup's matching rules."""
+        value = node.get(attr)
+        if value is None:
+            return matcher is None
+        if matcher is True:
+            return True
+        if isinstance(value, list):
+            if isinstance(matcher, str) and matcher in value:
+                return True
+            value = ' '.join(value)
+        return self._value_matches(value, matcher)
+
+    @staticmethod
+    def _value_matches(value: Any, matcher: Matcher) -> bool:
+        """Match a string value against an exact string or compiled regex."""
+        if value is None:
+            return False
+        if matcher is True:
+            return True
+        if isinstance(matcher, str):
+            return value == matcher
+        return matcher.search(value) is not None
+
+    def _merge(self, lists: Iterable[List[Tag]]) -> List[Tag]:
+        """Union several index lists, keeping document order."""
+        lists = [nodes for nodes in lists if nodes]
+        if not lists:
+            return []
+        if len(lists) == 1:
+            return lists[0]
+        unique = {id(node): node for nodes in lists for node in nodes}
+        return sorted(unique.values(), key=lambda node: self._spans[id(node)][0])
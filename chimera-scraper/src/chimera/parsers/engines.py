@@ -0,0 +1,352 @@
+"""Pluggable DOM engines for HTML parsers."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
+
+import soupsieve
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+from loguru import logger
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    LexborHTMLParser = None
+
+try:
+    import lxml.html
+    from lxml import etree
+    from lxml.cssselect import CSSSelector
+except ImportError:  # pragma: no cover - optional dependency
+    CSSSelector = None
+
+
+# Elements whose content BeautifulSoup's get_text() leaves out; the C-backed
+# engines drop them at parse time so text() matches across engines
+NON_TEXT_TAGS = ('script', 'style', 'template')
+
+
+class DOMEngine(ABC):
+    """Minimal DOM interface the review extractors are written against.
+
+    Nodes are whatever the backend returns; extractors only touch them through
+    the engine so the backend can be swapped per platform without changes to
+    the extraction logic.
+    """
+
+    name = "base"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Whether the backend library is installed."""
+        return True
+
+    @abstractmethod
+    def parse(self, html: str) -> Any:
+        """Parse HTML and return the document root node."""
+        pass
+
+    @abstractmethod
+    def select(self, node: Any, selector: str) -> List[Any]:
+        """Return all descendants of ``node`` matching a CSS selector."""
+        pass
+
+    def select_one(self, node: Any, selector: str) -> Optional[Any]:
+        """Return the first descendant matching a CSS selector, or None."""
+        matches = self.select(node, selector)
+        return matches[0] if matches else None
+
+    def compile(self, selector: str) -> Any:
+        """Pre-compile a CSS selector for repeated use with ``select_compiled``."""
+        return selector
+
+    def select_compiled(self, node: Any, compiled: Any) -> List[Any]:
+        """Run a selector returned by ``compile``."""
+        return self.select(node, compiled)
+
+    @abstractmethod
+    def text(self, node: Any, strip: bool = False) -> str:
+        """Return the concatenated text of a node's subtree."""
+        pass
+
+    @abstractmethod
+    def attribute(self, node: Any, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Return an attribute value; multi-valued attributes are space-joined."""
+        pass
+
+    @abstractmethod
+    def iterate(self, node: Any, tags: Optional[Iterable[str]] = None) -> Iterator[Any]:
+        """Yield descendant elements in document order, optionally filtered by tag."""
+        pass
+
+    @abstractmethod
+    def tag_name(self, node: Any) -> str:
+        """Return a node's lower-case tag name."""
+        pass
+
+    def classes(self, node: Any) -> List[str]:
+        """Return a node's class tokens."""
+        return (self.attribute(node, 'class') or '').split()
+
+    @abstractmethod
+    def text_spans(self, node: Any, tags: Optional[Iterable[str]] = None) -> Tuple[str, List[Tuple[Any, int, int]]]:
+        """Walk text nodes once and return the subtree text plus element spans.
+
+        Each span is ``(element, start, end)`` for a descendant element (filtered
+        by tag) such that ``text[start:end] == self.text(element)``. Spans come
+        in document order.
+        """
+        pass
+
+
+class BeautifulSoupEngine(DOMEngine):
+    """BeautifulSoup engine, kept as the compatibility fallback."""
+
+    name = "beautifulsoup"
+
+    def __init__(self, features: str = 'lxml'):
+        self.features = features
+
+    def parse(self, html: str) -> BeautifulSoup:
+        return BeautifulSoup(html, self.features)
+
+    def select(self, node: Tag, selector: str) -> List[Tag]:
+        return node.select(selector)
+
+    def select_one(self, node: Tag, selector: str) -> Optional[Tag]:
+        return node.select_one(selector)
+
+    def compile(self, selector: str) -> Any:
+        return soupsieve.compile(selector)
+
+    def select_compiled(self, node: Tag, compiled: Any) -> List[Tag]:
+        return compiled.select(node)
+
+    def text(self, node: Tag, strip: bool = False) -> str:
+        return node.get_text(strip=strip)
+
+    def attribute(self, node: Tag, name: str, default: Optional[str] = None) -> Optional[str]:
+        value = node.get(name)
+        if value is None:
+            return default
+        return ' '.join(value) if isinstance(value, list) else value
+
+    def iterate(self, node: Tag, tags: Optional[Iterable[str]] = None) -> Iterator[Tag]:
+        if tags is None:
+            return iter(node.find_all(True))
+        return iter(node.find_all(list(tags)))
+
+    def tag_name(self, node: Tag) -> str:
+        return node.name
+
+    def text_spans(self, node: Tag, tags: Optional[Iterable[str]] = None) -> Tuple[str, List[Tuple[Tag, int, int]]]:
+        wanted = set(tags) if tags is not None else None
+        pieces: List[str] = []
+        length = 0
+        spans: List[List[Any]] = []
+        stack = [(iter(node.contents), None)]
+
+        while stack:
+            children, span = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if span is not None:
+                    span[2] = length
+                continue
+            if isinstance(child, Tag):
+                child_span = None
+                if wanted is None or child.name in wanted:
+                    child_span = [child, length, length]
+                    spans.append(child_span)
+                stack.append((iter(child.contents), child_span))
+            elif type(child) in (NavigableString, CData):
+                pieces.append(child)
+                length += len(child)
+
+        return ''.join(pieces), [tuple(span) for span in spans]
+
+
+class SelectolaxEngine(DOMEngine):
+    """C-backed engine on selectolax's Lexbor parser."""
+
+    name = "selectolax"
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return LexborHTMLParser is not None
+
+    def parse(self, html: str) -> Any:
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(list(NON_TEXT_TAGS))
+        return tree.root
+
+    def select(self, node: Any, selector: str) -> List[Any]:
+        return node.css(selector)
+
+    def select_one(self, node: Any, selector: str) -> Optional[Any]:
+        return node.css_first(selector)
+
+    def text(self, node: Any, strip: bool = False) -> str:
+        return node.text(deep=True, strip=strip)
+
+    def attribute(self, node: Any, name: str, default: Optional[str] = None) -> Optional[str]:
+        value = node.attributes.get(name, default)
+        return default if value is None else value
+
+    def iterate(self, node: Any, tags: Optional[Iterable[str]] = None) -> Iterator[Any]:
+        wanted = set(tags) if tags is not None else None
+        descendants = node.traverse()
+        next(descendants, None)  # traverse() starts with the node itself
+        for element in descendants:
+            if wanted is None or element.tag in wanted:
+                yield element
+
+    def tag_name(self, node: Any) -> str:
+        return node.tag
+
+    def text_spans(self, node: Any, tags: Optional[Iterable[str]] = None) -> Tuple[str, List[Tuple[Any, int, int]]]:
+        wanted = set(tags) if tags is not None else None
+        pieces: List[str] = []
+        length = 0
+        spans: List[List[Any]] = []
+        stack = [(node.iter(include_text=True), None)]
+
+        while stack:
+            children, span = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if span is not None:
+                    span[2] = length
+                continue
+            tag = child.tag
+            if tag == '-text':
+                text = child.text_content
+                pieces.append(text)
+                length += len(text)
+            elif not tag.startswith('-'):
+                child_span = None
+                if wanted is None or tag in wanted:
+                    child_span = [child, length, length]
+                    spans.append(child_span)
+                stack.append((child.iter(include_text=True), child_span))
+
+        return ''.join(pieces), [tuple(span) for span in spans]
+
+
+class LxmlEngine(DOMEngine):
+    """C-backed engine on lxml.html with compiled cssselect selectors."""
+
+    name = "lxml"
+
+    def __init__(self):
+        self._compiled: Dict[str, Any] = {}
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return CSSSelector is not None
+
+    def parse(self, html: str) -> Any:
+        if not html or not html.strip():
+            html = '<html></html>'
+        root = lxml.html.document_fromstring(html)
+        for element in list(root.iter(*NON_TEXT_TAGS)):
+            element.drop_tree()
+        return root
+
+    def select(self, node: Any, selector: str) -> List[Any]:
+        compiled = self._compiled.get(selector)
+        if compiled is None:
+            compiled = self._compiled[selector] = CSSSelector(selector)
+        return self.select_compiled(node, compiled)
+
+    def compile(self, selector: str) -> Any:
+        return CSSSelector(selector)
+
+    def select_compiled(self, node: Any, compiled: Any) -> List[Any]:
+        return [element for element in compiled(node) if element is not node]
+
+    def text(self, node: Any, strip: bool = False) -> str:
+        if strip:
+            return ''.join(part.strip() for part in node.itertext())
+        return ''.join(node.itertext())
+
+    def attribute(self, node: Any, name: str, default: Optional[str] = None) -> Optional[str]:
+        return node.get(name, default)
+
+    def iterate(self, node: Any, tags: Optional[Iterable[str]] = None) -> Iterator[Any]:
+        wanted = set(tags) if tags is not None else None
+        for element in node.iterdescendants():
+            if isinstance(element.tag, str) and (wanted is None or element.tag in wanted):
+                yield element
+
+    def tag_name(self, node: Any) -> str:
+        return node.tag
+
+    def text_spans(self, node: Any, tags: Optional[Iterable[str]] = None) -> Tuple[str, List[Tuple[Any, int, int]]]:
+        wanted = set(tags) if tags is not None else None
+        pieces: List[str] = []
+        length = 0
+        spans: List[Tuple[Any, int, int]] = []
+        open_spans: List[Optional[int]] = []
+
+        for event, element in etree.iterwalk(node, events=('start', 'end', 'comment', 'pi')):
+            if not isinstance(element.tag, str):
+                # Comments and processing instructions only contribute their tail
+                if element.tail:
+                    pieces.append(element.tail)
+                    length += len(element.tail)
+                continue
+
+            if event == 'start':
+                if element is not node and (wanted is None or element.tag in wanted):
+                    open_spans.append(len(spans))
+                    spans.append((element, length, length))
+                else:
+                    open_spans.append(None)
+                if element.text:
+                    pieces.append(element.text)
+                    length += len(element.text)
+            else:
+                index = open_spans.pop()
+                if index is not None:
+                    spans[index] = (element, spans[index][1], length)
+                if element is not node and element.tail:
+                    pieces.append(element.tail)
+                    length += len(element.tail)
+
+        return ''.join(pieces), spans
+
+
+ENGINE_TYPES: Dict[str, Type[DOMEngine]] = {
+    SelectolaxEngine.name: SelectolaxEngine,
+    LxmlEngine.name: LxmlEngine,
+    BeautifulSoupEngine.name: BeautifulSoupEngine,
+}
+
+# Fastest first; BeautifulSoup is always installed
+ENGINE_PREFERENCE = [SelectolaxEngine.name, LxmlEngine.name, BeautifulSoupEngine.name]
+
+
+def available_engines() -> List[str]:
+    """Names of engines whose backend library is installed."""
+    return [name for name in ENGINE_PREFERENCE if ENGINE_TYPES[name].is_available()]
+
+
+def get_engine(name: Optional[str] = None) -> DOMEngine:
+    """Return the named engine, or the fastest installed one when no name is given.
+
+    A named engine whose library is missing falls back to BeautifulSoup.
+    """
+    if name is None:
+        return ENGINE_TYPES[available_engines()[0]]()
+
+    engine_type = ENGINE_TYPES.get(name.lower())
+    if engine_type is None:
+        raise ValueError(f"Unknown DOM engine '{name}'. Available: {', '.join(ENGINE_TYPES)}")
+
+    if not engine_type.is_available():
+        logger.warning(f"DOM engine '{name}' is not installed, falling back to BeautifulSoup")
+        return BeautifulSoupEngine()
+
+    return engine_type()
@@ -0,0 +1,245 @@
+"""Run page parsing off the event loop in a thread or process pool."""
+
+import asyncio
+import importlib
+import os
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from chimera.models.review import EnhancedReview
+from chimera.parsers.selector_plan import flush_plan_stores
+from chimera.utils.serialization import to_dict
+
+
+# Parser name -> (module, parser class, parse method, result dataclass or None for reviews)
+PARSERS: Dict[str, Tuple[str, str, str, Optional[str]]] = {
+    "g2": ("chimera.parsers.g2", "G2Parser", "extract_reviews", None),
+    "capterra": ("chimera.parsers.capterra", "CapterraParser", "extract_reviews", None),
+    "g2_head_to_head": (
+        "chimera.parsers.head_to_head_comparison", "G2HeadToHeadComparisonParser",
+        "parse_head_to_head_comparison", "HeadToHeadComparisonData"
+    ),
+    "g2_four_way": (
+        "chimera.parsers.four_way_comparison", "G2FourWayComparisonParser",
+        "parse_four_way_comparison", "FourWayComparisonData"
+    ),
+}
+
+# Platforms with a review parser in PARSERS
+REVIEW_PLATFORMS = ("g2", "capterra")
+
+EXECUTOR_MODES = ("process", "thread", "inline")
+
+# Completed parses kept for latency percentiles
+LATENCY_WINDOW = 500
+
+
+def parse_page(parser_name: str, html: str, url: str, parser_kwargs: Optional[Dict[str, Any]] = None) -> Any:
+    """Parse one page and return a picklable, serialized result.
+
+    Runs in a worker (it drives the parser's coroutine on its own event loop),
+    so a fresh parser is created per page exactly as the orchestrators do.
+    Reviews come back as a list of dicts, comparisons as the dataclass dict.
+    """
+    return serialize_result(asyncio.run(_run_parser(parser_name, html, url, parser_kwargs))[0])
+
+
+async def _run_parser(parser_name: str, html: str, url: str,
+                      parser_kwargs: Optional[Dict[str, Any]]) -> Tuple[Any, List[str]]:
+    """Create the parser, run its parse method and return the result with the review IDs it skipped as seen."""
+    module_name, class_name, method_name, _ = PARSERS[parser_name]
+    parser_type = getattr(importlib.import_module(module_name), class_name)
+    parser = parser_type(**(parser_kwargs or {}))
+    result = await getattr(parser, method_name)(html, url)
+    return result, list(getattr(parser, "skipped_ids", []))
+
+
+def serialize_result(result: Any) -> Any:
+    """Reviews become a list of dicts, comparisons their dataclass dict.
+
+    The dicts are shallow (see ``serialization.to_dict``); pickling to the
+    parent copies them anyway.
+    """
+    if isinstance(result, list):
+        return [to_dict(review) for review in result]
+    return to_dict(result)
+
+
+def deserialize_result(parser_name: str, payload: Any) -> Any:
+    """Rebuild the parser's native result from ``parse_page`` output."""
+    module_name, _, _, result_name = PARSERS[parser_name]
+    if result_name is None:
+        return [EnhancedReview(**review) for review in payload]
+    result_type = getattr(importlib.import_module(module_name), result_name)
+    return result_type(**payload)
+
+
+def _timed_parse_page(parser_name: str, html: str, url: str,
+                      parser_kwargs: Optional[Dict[str, Any]]) -> Tuple[Any, List[str], float]:
+    """``parse_page`` plus the skipped review IDs and the worker-side parse time in seconds."""
+    started = time.perf_counter()
+    result, skipped_ids = asyncio.run(_run_parser(parser_name, html, url, parser_kwargs))
+    return serialize_result(result), skipped_ids, time.perf_counter() - started
+
+
+class ParseExecutor:
+    """Async facade over a pool that parses raw HTML away from the event loop.
+
+    ``mode`` is ``"process"`` (parsing runs in parallel and never holds the
+    loop's GIL), ``"thread"`` (no pickling cost, the loop stays responsive
+    between bytecodes) or ``"inline"`` (parse on the loop, for debugging).
+    At most ``max_workers`` pages are handed to the pool at once; the rest
+    wait in an asyncio queue so queue depth and wait time are observable.
+    """
+
+    def __init__(self, mode: str = "process", max_workers: Optional[int] = None):
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown parse executor mode '{mode}'. Available: {', '.join(EXECUTOR_MODES)}")
+
+        self.mode = mode
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self._pool: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+        self.queued = 0
+        self.running = 0
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "max_queue_depth": 0
+        }
+        self._wait_times: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._parse_times: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self._total_times: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ParseExecutor":
+        """Build an executor from a scraper's ``parse_executor`` config section."""
+        settings = config.get("parse_executor", {}) or {}
+        return cls(settings.get("mode", "process"), settings.get("max_workers"))
+
+    def _get_pool(self) -> Optional[Executor]:
+        if self.mode == "inline":
+            return None
+        if self._pool is None:
+            if self.mode == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="chimera-parse")
+        return self._pool
+
+    async def parse(self, parser_name: str, html: str, url: str, **parser_kwargs) -> Any:
+        """Parse a page with a named parser and return its native result."""
+        return (await self._parse(parser_name, html, url, parser_kwargs))[0]
+
+    async def _parse(self, parser_name: str, html: str, url: str,
+                     parser_kwargs: Dict[str, Any]) -> Tuple[Any, List[str]]:
+        if parser_name not in PARSERS:
+            raise ValueError(f"Unknown parser '{parser_name}'. Available: {', '.join(PARSERS)}")
+
+        loop = asyncio.get_running_loop()
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_workers)
+
+        submitted = loop.time()
+        self.stats["submitted"] += 1
+        self.queued += 1
+        self.stats["max_queue_depth"] = max(self.stats["max_queue_depth"], self.queued)
+
+        try:
+            async with self._slots:
+                self.queued -= 1
+                self.running += 1
+                started = loop.time()
+                try:
+                    pool = self._get_pool()
+                    if pool is None:
+                        result, skipped_ids = await _run_parser(parser_name, html, url, parser_kwargs)
+                        parse_time = loop.time() - started
+                    else:
+                        payload, skipped_ids, parse_time = await loop.run_in_executor(
+                            pool, _timed_parse_page, parser_name, html, url, parser_kwargs
+                        )
+                        result = deserialize_result(parser_name, payload)
+                finally:
+                    self.running -= 1
+        except BaseException:
+            self.stats["failed"] += 1
+            raise
+
+        finished = loop.time()
+        self.stats["completed"] += 1
+        self._wait_times.append(started - submitted)
+        self._parse_times.append(parse_time)
+        self._total_times.append(finished - submitted)
+
+        return result, skipped_ids
+
+    async def extract_reviews(self, platform: str, html: str, url: str,
+                              engine: Optional[str] = None, selector_plan_dir: Optional[str] = None,
+                              seen_reviews_path: Optional[str] = None) -> List[EnhancedReview]:
+        """Off-loop equivalent of ``G2Parser``/``CapterraParser.extract_reviews``."""
+        return (await self.extract_review_page(platform, html, url, engine, selector_plan_dir, seen_reviews_path))[0]
+
+    async def extract_review_page(self, platform: str, html: str, url: str,
+                                  engine: Optional[str] = None, selector_plan_dir: Optional[str] = None,
+                                  seen_reviews_path: Optional[str] = None) -> Tuple[List[EnhancedReview], List[str]]:
+        """``extract_reviews`` plus the IDs of reviews on the page skipped as already processed.
+
+        Incremental paging needs those IDs: a page whose reviews were all
+        stored by earlier runs comes back empty, but still marks where the
+        new reviews end.
+        """
+        if platform not in REVIEW_PLATFORMS:
+            raise ValueError(f"No review parser for platform '{platform}'. Available: {', '.join(REVIEW_PLATFORMS)}")
+        return await self._parse(platform, html, url, dict(engine=engine, selector_plan_dir=selector_plan_dir,
+                                                           seen_reviews_path=seen_reviews_path))
+
+    async def parse_head_to_head_comparison(self, html: str, url: str):
+        """Off-loop equivalent of ``G2HeadToHeadComparisonParser.parse_head_to_head_comparison``."""
+        return await self.parse("g2_head_to_head", html, url)
+
+    async def parse_four_way_comparison(self, html: str, url: str):
+        """Off-loop equivalent of ``G2FourWayComparisonParser.parse_four_way_comparison``."""
+        return await self.parse("g2_four_way", html, url)
+
+    @staticmethod
+    def _latency_summary(samples: Deque[float]) -> Dict[str, float]:
+        if not samples:
+            return {"avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        ordered = sorted(samples)
+        return {
+            "avg_ms": sum(ordered) / len(ordered) * 1000,
+            "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+            "max_ms": ordered[-1] * 1000
+        }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Queue depth, throughput counters and latency percentiles."""
+        return {
+            "mode": self.mode,
+            "max_workers": self.max_workers,
+            "queue_depth": self.queued,
+            "in_flight": self.running,
+            **self.stats,
+            "queue_wait": self._latency_summary(self._wait_times),
+            "parse_time": self._latency_summary(self._parse_times),
+            "total_latency": self._latency_summary(self._total_times)
+        }
+
+    def shutdown(self, wait: bool = True):
+        """Release pool workers; the executor restarts lazily if used again.
+
+        Process workers flush their selector plan counts as they exit; plans
+        used by thread or inline parsing live here and are flushed now.
+        """
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+            logger.info(f"Parse executor shut down: {self.stats['completed']} pages parsed, {self.stats['failed']} failed")
+        flush_plan_stores()
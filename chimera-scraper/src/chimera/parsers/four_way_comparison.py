@@ -4,11 +4,14 @@ import re
 import json
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from bs4 import BeautifulSoup
 from loguru import logger
 
+from chimera.models.review import EnhancedReview
+from chimera.utils.serialization import to_dict
 from .base import BaseParser
+from .engines import BeautifulSoupEngine
 
 
 @dataclass
@@ -52,6 +55,9 @@ class ProductComparison:
 class G2FourWayComparisonParser(BaseParser):
     """Specialized parser for G2 four-way comparison pages."""
     
+    # Section extractors navigate BeautifulSoup trees
+    dom_engine = BeautifulSoupEngine.name
+    
     def __init__(self):
         super().__init__()
         self.comparison_selectors = {
@@ -95,10 +101,18 @@ class G2FourWayComparisonParser(BaseParser):
             "Data Governance"
         ]
     
+    async def extract_reviews(self, html: str, source_url: str) -> List[EnhancedReview]:
+        """Comparison pages have no individual review containers."""
+        return []
+    
+    async def _parse_single_review_enhanced(self, element: Any, source_url: str) -> Optional[EnhancedReview]:
+        """Comparison pages have no individual review containers."""
+        return None
+    
     async def parse_four_way_comparison(self, html: str, url: str) -> FourWayComparisonData:
         """Parse a G2 four-way comparison page comprehensively."""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.dom.parse(html)
             
             # Extract basic comparison info
             comparison_id = self._extract_comparison_id(url)
@@ -122,7 +136,7 @@ class G2FourWayComparisonParser(BaseParser):
                 comparison_id=comparison_id,
                 extraction_date=datetime.now(),
                 url=url,
-                products=[asdict(product) for product in products],
+                products=[to_dict(product) for product in products],
                 at_a_glance=at_a_glance,
                 pricing=pricing,
                 ratings=ratings,
@@ -448,7 +462,11 @@ class G2FourWayComparisonParser(BaseParser):
             if product.lower() in text.lower():
                 found_products.append(product)
         
-        return found_products
+        # "Power BI" also matches inside "Microsoft Power BI"; keep the longer name only
+        return [
+            product for product in found_products
+            if not any(product != other and product.lower() in other.lower() for other in found_products)
+        ]
     
     async def _extract_at_a_glance(self, soup: BeautifulSoup, products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract 'At a Glance' section data."""
@@ -4,11 +4,15 @@ import re
 import json
 from typing import Dict, List, Any, Optional, Tuple, Union
 from datetime import datetime
-from dataclasses import dataclass, asdict
-from bs4 import BeautifulSoup
+from dataclasses import dataclass
 from loguru import logger
 
+from chimera.models.review import EnhancedReview
+from chimera.utils.patterns import register_pattern
+from chimera.utils.serialization import to_dict
 from .base import BaseParser
+from .engines import BeautifulSoupEngine
+from .document import IndexedDocument
 
 
 @dataclass
@@ -79,6 +83,9 @@ class SummaryPoint:
 class G2HeadToHeadComparisonParser(BaseParser):
     """Specialized parser for G2 head-to-head comparison pages with AI summary focus."""
     
+    # Section extractors navigate BeautifulSoup trees
+    dom_engine = BeautifulSoupEngine.name
+    
     def __init__(self):
         super().__init__()
         self.comparison_selectors = {
@@ -126,38 +133,51 @@ class G2HeadToHeadComparisonParser(BaseParser):
         ]
         
         # AI summary patterns for extraction
-        self.summary_patterns = {
+        summary_sources = {
             "score_comparison": r"scoring\s+(\d+\.?\d*)\s+compared\s+to\s+[^']*?(\d+\.?\d*)",
             "feature_mention": r"(?:excel|excels|superior|stronger|better|trails|behind)\s+(?:in|at)\s+([^,]+)",
             "sentiment_indicators": r"(?:excellent|fantastic|superior|better|trails|behind|lower|stronger|weaker)",
             "product_names": r"(?:Microsoft Power BI|Power BI|Domo|Tableau|Qlik|Snowflake|Databricks)"
         }
+        self.summary_patterns = {
+            name: register_pattern(f"g2.head_to_head.{name}", source)
+            for name, source in summary_sources.items()
+        }
+    
+    async def extract_reviews(self, html: str, source_url: str) -> List[EnhancedReview]:
+        """Comparison pages have no individual review containers."""
+        return []
+    
+    async def _parse_single_review_enhanced(self, element: Any, source_url: str) -> Optional[EnhancedReview]:
+        """Comparison pages have no individual review containers."""
+        return None
     
     async def parse_head_to_head_comparison(self, html: str, url: str) -> HeadToHeadComparisonData:
         """Parse a G2 head-to-head comparison page comprehensively."""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            # Parse once; every section extractor queries the shared indexes
+            doc = IndexedDocument(self.dom.parse(html))
             
             # Extract basic comparison info
             comparison_id = self._extract_comparison_id(url)
             
             # Extract products information
-            products = await self._extract_products(soup)
+            products = await self._extract_products(doc)
             if len(products) != 2:
                 raise ValueError(f"Expected 2 products, found {len(products)}")
             
             product_a, product_b = products[0], products[1]
             
             # Extract AI-generated summary (highest priority)
-            ai_summary = await self._extract_ai_generated_summary(soup)
+            ai_summary = await self._extract_ai_generated_summary(doc)
             
             # Extract comparison sections
-            at_a_glance = await self._extract_at_a_glance(soup, products)
-            pricing = await self._extract_pricing(soup, products)
-            ratings = await self._extract_ratings(soup, products)
-            features = await self._extract_features(soup, products)
-            reviews = await self._extract_reviews(soup, products)
-            alternatives = await self._extract_alternatives(soup, products)
+            at_a_glance = await self._extract_at_a_glance(doc, products)
+            pricing = await self._extract_pricing(doc, products)
+            ratings = await self._extract_ratings(doc, products)
+            features = await self._extract_features(doc, products)
+            reviews = await self._extract_reviews(doc, products)
+            alternatives = await self._extract_alternatives(doc, products)
             
             # Calculate data quality metrics
             data_quality_score = self._calculate_data_quality_score(
@@ -172,9 +192,9 @@ class G2HeadToHeadComparisonParser(BaseParser):
                 comparison_id=comparison_id,
                 extraction_date=datetime.now(),
                 url=url,
-                product_a=asdict(product_a),
-                product_b=asdict(product_b),
-                ai_generated_summary=asdict(ai_summary),
+                product_a=to_dict(product_a),
+                product_b=to_dict(product_b),
+                ai_generated_summary=to_dict(ai_summary),
                 at_a_glance=at_a_glance,
                 pricing=pricing,
                 ratings=ratings,
@@ -182,7 +202,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
                 reviews=reviews,
                 alternatives=alternatives,
                 data_quality_score=data_quality_score,
-                extraction_confidence=self._calculate_extraction_confidence(soup),
+                extraction_confidence=self._calculate_extraction_confidence(doc),
                 summary_quality_score=summary_quality_score
             )
             
@@ -206,17 +226,17 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract comparison ID: {e}")
             return f"head_to_head_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
     
-    async def _extract_products(self, soup: BeautifulSoup) -> List[ProductComparison]:
+    async def _extract_products(self, doc: IndexedDocument) -> List[ProductComparison]:
         """Extract product information from comparison headers."""
         products = []
         
         try:
             # Find product headers using multiple selector strategies
-            product_headers = soup.select(self.comparison_selectors["product_headers"])
+            product_headers = doc.select(self.comparison_selectors["product_headers"])
             
             if not product_headers:
                 # Fallback: look for product names in comparison structure
-                product_headers = soup.find_all('div', class_=re.compile(r'comparison.*header'))
+                product_headers = doc.find_all('div', class_=re.compile(r'comparison.*header'))
             
             for header in product_headers:
                 try:
@@ -229,7 +249,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             
             # If we still don't have products, try alternative extraction
             if not products:
-                products = await self._extract_products_alternative(soup)
+                products = await self._extract_products_alternative(doc)
             
             logger.info(f"Extracted {len(products)} products from head-to-head comparison")
             return products
@@ -455,32 +475,37 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract entry level pricing: {e}")
             return "Not specified"
     
-    async def _extract_ai_generated_summary(self, soup: BeautifulSoup) -> AIGeneratedSummary:
+    def _find_summary_section(self, doc: IndexedDocument):
+        """Locate the AI summary container by aria-label, then by class."""
+        summary_section = doc.find('div', attrs={'aria-label': 'Comparison Summary'})
+        if not summary_section:
+            summary_section = doc.find('div', class_='compare-container-v2_summary')
+        return summary_section
+    
+    async def _extract_ai_generated_summary(self, doc: IndexedDocument) -> AIGeneratedSummary:
         """Extract AI-generated summary - the most valuable data."""
         try:
             # Look for summary section
-            summary_section = soup.find('div', attrs={'aria-label': 'Comparison Summary'})
-            if not summary_section:
-                summary_section = soup.find('div', class_='compare-container-v2_summary')
+            summary_section = self._find_summary_section(doc)
             
             if not summary_section:
                 # Try alternative selectors
-                summary_section = soup.find('div', class_=re.compile(r'summary'))
+                summary_section = doc.find('div', class_=re.compile(r'summary'))
             
             if summary_section:
                 # Extract summary title
-                title_element = summary_section.find('div', class_=re.compile(r'mb-1/4'))
+                title_element = doc.find('div', class_=re.compile(r'mb-1/4'), within=summary_section)
                 if not title_element:
-                    title_element = summary_section.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+                    title_element = doc.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'], within=summary_section)
                 
-                title = title_element.get_text(strip=True) if title_element else "AI Generated Summary"
+                title = doc.text(title_element, strip=True) if title_element else "AI Generated Summary"
                 
                 # Extract subtitle
-                subtitle_element = summary_section.find(string=re.compile(r'AI-generated\. Powered by real user reviews'))
+                subtitle_element = doc.find_string(re.compile(r'AI-generated\. Powered by real user reviews'), within=summary_section)
                 subtitle = subtitle_element.strip() if subtitle_element else ""
                 
                 # Extract summary points
-                summary_points = await self._extract_summary_points(summary_section)
+                summary_points = await self._extract_summary_points(doc, summary_section)
                 
                 # Generate structured insights
                 structured_insights = self._analyze_summary_insights(summary_points)
@@ -489,7 +514,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
                     summary_title=title,
                     summary_subtitle=subtitle,
                     summary_points=summary_points,
-                    extraction_confidence=self._calculate_summary_extraction_confidence(summary_section),
+                    extraction_confidence=self._calculate_summary_extraction_confidence(doc, summary_section),
                     structured_insights=structured_insights
                 )
                 
@@ -516,17 +541,17 @@ class G2HeadToHeadComparisonParser(BaseParser):
                 structured_insights={}
             )
     
-    async def _extract_summary_points(self, summary_section) -> List[Dict[str, Any]]:
+    async def _extract_summary_points(self, doc: IndexedDocument, summary_section) -> List[Dict[str, Any]]:
         """Extract individual summary points with structured data."""
         summary_points = []
         
         try:
             # Look for list items containing summary points
-            list_items = summary_section.find_all('li')
+            list_items = doc.find_all('li', within=summary_section)
             
             for item in list_items:
                 try:
-                    point_text = item.get_text(strip=True)
+                    point_text = doc.text(item, strip=True)
                     if point_text and len(point_text) > 50:  # Reasonable summary point length
                         
                         # Parse the summary point
@@ -539,7 +564,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             
             # If no list items found, try alternative extraction
             if not summary_points:
-                summary_points = self._extract_summary_points_alternative(summary_section)
+                summary_points = self._extract_summary_points_alternative(doc, summary_section)
             
             return summary_points
             
@@ -551,7 +576,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
         """Parse individual summary point to extract structured data."""
         try:
             # Extract scores if present
-            score_match = re.search(self.summary_patterns["score_comparison"], point_text)
+            score_match = self.summary_patterns["score_comparison"].search(point_text)
             product_a_score = None
             product_b_score = None
             
@@ -581,7 +606,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
                 confidence=confidence
             )
             
-            return asdict(summary_point)
+            return to_dict(summary_point)
             
         except Exception as e:
             logger.warning(f"Failed to parse summary point: {e}")
@@ -669,16 +694,16 @@ class G2HeadToHeadComparisonParser(BaseParser):
         
         return min(confidence, 100.0)
     
-    def _extract_summary_points_alternative(self, summary_section) -> List[Dict[str, Any]]:
+    def _extract_summary_points_alternative(self, doc: IndexedDocument, summary_section) -> List[Dict[str, Any]]:
         """Alternative method to extract summary points if primary method fails."""
         summary_points = []
         
         try:
             # Look for paragraphs or divs that might contain summary content
-            text_elements = summary_section.find_all(['p', 'div'], string=re.compile(r'.{50,}'))
+            text_elements = doc.find_all(['p', 'div'], string=re.compile(r'.{50,}'), within=summary_section)
             
             for element in text_elements:
-                text = element.get_text(strip=True)
+                text = doc.text(element, strip=True)
                 if text and len(text) > 50:
                     summary_point = self._parse_summary_point(text)
                     summary_points.append(summary_point)
@@ -733,19 +758,19 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to analyze summary insights: {e}")
             return {}
     
-    def _calculate_summary_extraction_confidence(self, summary_section) -> float:
+    def _calculate_summary_extraction_confidence(self, doc: IndexedDocument, summary_section) -> float:
         """Calculate confidence in summary extraction."""
         try:
             confidence = 0.0
             
             # Check for key structural elements
-            if summary_section.find('div', attrs={'aria-label': 'Comparison Summary'}):
+            if doc.find('div', attrs={'aria-label': 'Comparison Summary'}, within=summary_section):
                 confidence += 40
-            if summary_section.find('div', class_=re.compile(r'summary')):
+            if doc.find('div', class_=re.compile(r'summary'), within=summary_section):
                 confidence += 30
-            if summary_section.find('li'):
+            if doc.find('li', within=summary_section):
                 confidence += 20
-            if summary_section.find(string=re.compile(r'AI-generated')):
+            if doc.find_string(re.compile(r'AI-generated'), within=summary_section):
                 confidence += 10
             
             return min(confidence, 100.0)
@@ -754,15 +779,15 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to calculate summary extraction confidence: {e}")
             return 0.0
     
-    async def _extract_products_alternative(self, soup: BeautifulSoup) -> List[ProductComparison]:
+    async def _extract_products_alternative(self, doc: IndexedDocument) -> List[ProductComparison]:
         """Alternative method to extract products if primary method fails."""
         products = []
         
         try:
             # Look for product names in the page title or URL
-            title = soup.find('title')
+            title = doc.find('title')
             if title:
-                title_text = title.get_text()
+                title_text = doc.text(title)
                 # Extract product names from title
                 product_names = self._extract_product_names_from_text(title_text)
                 
@@ -800,9 +825,13 @@ class G2HeadToHeadComparisonParser(BaseParser):
             if product.lower() in text.lower():
                 found_products.append(product)
         
-        return found_products
+        # "Power BI" also matches inside "Microsoft Power BI"; keep the longer name only
+        return [
+            product for product in found_products
+            if not any(product != other and product.lower() in other.lower() for other in found_products)
+        ]
     
-    async def _extract_at_a_glance(self, soup: BeautifulSoup, products: List[ProductComparison]) -> Dict[str, Any]:
+    async def _extract_at_a_glance(self, doc: IndexedDocument, products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract 'At a Glance' section data."""
         try:
             at_a_glance = {
@@ -834,7 +863,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract at a glance data: {e}")
             return {}
     
-    async def _extract_pricing(self, soup: BeautifulSoup, products: List[ProductComparison]) -> Dict[str, Any]:
+    async def _extract_pricing(self, doc: IndexedDocument, products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract comprehensive pricing information."""
         try:
             pricing_data = {
@@ -845,9 +874,9 @@ class G2HeadToHeadComparisonParser(BaseParser):
             }
             
             # Look for pricing section
-            pricing_section = soup.find('div', string=re.compile(r'pricing', re.I))
+            pricing_section = doc.find('div', string=re.compile(r'pricing', re.I))
             if not pricing_section:
-                pricing_section = soup.find('div', id='pricing')
+                pricing_section = doc.find('div', attrs={'id': 'pricing'})
             
             if pricing_section:
                 # Extract pricing for each product
@@ -885,7 +914,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract product pricing: {e}")
             return {}
     
-    async def _extract_ratings(self, soup: BeautifulSoup, products: List[ProductComparison]) -> Dict[str, Any]:
+    async def _extract_ratings(self, doc: IndexedDocument, products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract comprehensive ratings by criteria."""
         try:
             ratings_data = {
@@ -896,16 +925,16 @@ class G2HeadToHeadComparisonParser(BaseParser):
             }
             
             # Look for ratings section
-            ratings_section = soup.find('div', attrs={'aria-label': re.compile(r'Ratings', re.I)})
+            ratings_section = doc.find('div', attrs={'aria-label': re.compile(r'Ratings', re.I)})
             if not ratings_section:
-                ratings_section = soup.find('div', string=re.compile(r'Ratings', re.I))
+                ratings_section = doc.find('div', string=re.compile(r'Ratings', re.I))
             
             if ratings_section:
                 # Extract ratings for each criterion
                 for criterion_key, criterion_names in self.rating_criteria.items():
                     try:
                         criterion_data = await self._extract_criterion_ratings(
-                            ratings_section, criterion_names, products
+                            doc, ratings_section, criterion_names, products
                         )
                         
                         if criterion_data:
@@ -916,11 +945,11 @@ class G2HeadToHeadComparisonParser(BaseParser):
                         continue
             
             # Extract rating breakdowns from visual elements
-            rating_breakdowns = await self._extract_rating_breakdowns(soup, products)
+            rating_breakdowns = await self._extract_rating_breakdowns(doc, products)
             ratings_data["rating_breakdowns"] = rating_breakdowns
             
             # Extract rating insights from AI summary
-            rating_insights = await self._extract_rating_insights_from_ai_summary(soup, products)
+            rating_insights = await self._extract_rating_insights_from_ai_summary(doc, products)
             ratings_data["rating_insights"] = rating_insights
             
             return ratings_data
@@ -929,7 +958,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract ratings data: {e}")
             return {}
     
-    async def _extract_criterion_ratings(self, ratings_section, criterion_names: List[str], products: List[ProductComparison]) -> Dict[str, Any]:
+    async def _extract_criterion_ratings(self, doc: IndexedDocument, ratings_section, criterion_names: List[str], products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract ratings for a specific criterion."""
         try:
             criterion_data = {
@@ -940,9 +969,10 @@ class G2HeadToHeadComparisonParser(BaseParser):
             
             # Look for rating elements with aria-label containing the criterion
             for criterion_name in criterion_names:
-                rating_elements = ratings_section.find_all(
+                rating_elements = doc.find_all(
                     'div', 
-                    attrs={'aria-label': re.compile(f'.*{re.escape(criterion_name)}.*', re.I)}
+                    attrs={'aria-label': re.compile(f'.*{re.escape(criterion_name)}.*', re.I)},
+                    within=ratings_section
                 )
                 
                 if rating_elements:
@@ -981,7 +1011,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract criterion ratings: {e}")
             return {}
     
-    async def _extract_rating_breakdowns(self, soup: BeautifulSoup, products: List[ProductComparison]) -> Dict[str, Any]:
+    async def _extract_rating_breakdowns(self, doc: IndexedDocument, products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract rating breakdowns from visual elements."""
         try:
             rating_breakdowns = {
@@ -995,7 +1025,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
                 product_name = product.name
                 
                 # Look for star rating elements
-                star_rating_elements = soup.find_all(
+                star_rating_elements = doc.find_all(
                     'div', 
                     attrs={'aria-label': re.compile(f'{re.escape(product_name)}.*star rating', re.I)}
                 )
@@ -1019,7 +1049,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract rating breakdowns: {e}")
             return {}
     
-    async def _extract_rating_insights_from_ai_summary(self, soup: BeautifulSoup, products: List[ProductComparison]) -> Dict[str, Any]:
+    async def _extract_rating_insights_from_ai_summary(self, doc: IndexedDocument, products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract rating insights from AI-generated summary."""
         try:
             rating_insights = {
@@ -1029,22 +1059,20 @@ class G2HeadToHeadComparisonParser(BaseParser):
             }
             
             # Look for AI summary section
-            summary_section = soup.find('div', attrs={'aria-label': 'Comparison Summary'})
-            if not summary_section:
-                summary_section = soup.find('div', class_='compare-container-v2_summary')
+            summary_section = self._find_summary_section(doc)
             
             if summary_section:
                 # Extract rating-related insights from summary points
-                summary_points = summary_section.find_all('li')
+                summary_points = doc.find_all('li', within=summary_section)
                 
                 for point in summary_points:
                     try:
-                        point_text = point.get_text(strip=True)
+                        point_text = doc.text(point, strip=True)
                         
                         # Check if this point mentions ratings or scoring
                         if any(word in point_text.lower() for word in ["scoring", "score", "rating", "out of"]):
                             # Extract rating comparison
-                            rating_match = re.search(r'scoring\s+(\d+\.?\d*)\s+compared\s+to\s+[^\']*?(\d+\.?\d*)', point_text)
+                            rating_match = self.summary_patterns["score_comparison"].search(point_text)
                             
                             if rating_match:
                                 score_a = float(rating_match.group(1))
@@ -1090,7 +1118,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract rating insights from AI summary: {e}")
             return {}
     
-    async def _extract_features(self, soup: BeautifulSoup, products: List[ProductComparison]) -> Dict[str, Any]:
+    async def _extract_features(self, doc: IndexedDocument, products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract comprehensive feature comparison data."""
         try:
             features_data = {
@@ -1101,16 +1129,16 @@ class G2HeadToHeadComparisonParser(BaseParser):
             }
             
             # Look for features section
-            features_section = soup.find('div', attrs={'aria-label': re.compile(r'Features', re.I)})
+            features_section = doc.find('div', attrs={'aria-label': re.compile(r'Features', re.I)})
             if not features_section:
-                features_section = soup.find('div', string=re.compile(r'Features', re.I))
+                features_section = doc.find('div', string=re.compile(r'Features', re.I))
             
             if features_section:
                 # Extract feature categories and ratings
                 for feature_category in self.feature_categories:
                     try:
                         category_data = await self._extract_feature_category_data(
-                            features_section, feature_category, products
+                            doc, features_section, feature_category, products
                         )
                         
                         if category_data:
@@ -1121,8 +1149,8 @@ class G2HeadToHeadComparisonParser(BaseParser):
                         continue
             
             # Extract feature comparisons from AI summary if available
-            if soup.find(string=re.compile(r'AI Generated Summary', re.I)):
-                ai_summary_features = await self._extract_features_from_ai_summary(soup, products)
+            if doc.find_string(re.compile(r'AI Generated Summary', re.I)):
+                ai_summary_features = await self._extract_features_from_ai_summary(doc, products)
                 features_data["ai_summary_features"] = ai_summary_features
             
             return features_data
@@ -1131,7 +1159,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract features data: {e}")
             return {}
     
-    async def _extract_feature_category_data(self, features_section, feature_category: str, products: List[ProductComparison]) -> Dict[str, Any]:
+    async def _extract_feature_category_data(self, doc: IndexedDocument, features_section, feature_category: str, products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract data for a specific feature category."""
         try:
             category_data = {
@@ -1141,9 +1169,10 @@ class G2HeadToHeadComparisonParser(BaseParser):
             }
             
             # Look for elements with aria-label containing the feature category
-            category_elements = features_section.find_all(
+            category_elements = doc.find_all(
                 'div', 
-                attrs={'aria-label': re.compile(f'.*{re.escape(feature_category)}.*', re.I)}
+                attrs={'aria-label': re.compile(f'.*{re.escape(feature_category)}.*', re.I)},
+                within=features_section
             )
             
             if category_elements:
@@ -1178,7 +1207,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract {feature_category} category data: {e}")
             return {}
     
-    async def _extract_features_from_ai_summary(self, soup: BeautifulSoup, products: List[ProductComparison]) -> Dict[str, Any]:
+    async def _extract_features_from_ai_summary(self, doc: IndexedDocument, products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract feature insights from AI-generated summary."""
         try:
             ai_summary_features = {
@@ -1188,17 +1217,15 @@ class G2HeadToHeadComparisonParser(BaseParser):
             }
             
             # Look for AI summary section
-            summary_section = soup.find('div', attrs={'aria-label': 'Comparison Summary'})
-            if not summary_section:
-                summary_section = soup.find('div', class_='compare-container-v2_summary')
+            summary_section = self._find_summary_section(doc)
             
             if summary_section:
                 # Extract feature-related insights from summary points
-                summary_points = summary_section.find_all('li')
+                summary_points = doc.find_all('li', within=summary_section)
                 
                 for point in summary_points:
                     try:
-                        point_text = point.get_text(strip=True)
+                        point_text = doc.text(point, strip=True)
                         
                         # Check if this point mentions any of our feature categories
                         for feature_category in self.feature_categories:
@@ -1244,7 +1271,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract features from AI summary: {e}")
             return {}
     
-    async def _extract_reviews(self, soup: BeautifulSoup, products: List[ProductComparison]) -> Dict[str, Any]:
+    async def _extract_reviews(self, doc: IndexedDocument, products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract comprehensive review data and insights."""
         try:
             reviews_data = {
@@ -1256,19 +1283,19 @@ class G2HeadToHeadComparisonParser(BaseParser):
             }
             
             # Extract reviewers company size data
-            company_size_data = await self._extract_reviewers_company_size(soup, products)
+            company_size_data = await self._extract_reviewers_company_size(doc, products)
             reviews_data["reviewers_company_size"] = company_size_data
             
             # Extract reviewers industry data
-            industry_data = await self._extract_reviewers_industry(soup, products)
+            industry_data = await self._extract_reviewers_industry(doc, products)
             reviews_data["reviewers_industry"] = industry_data
             
             # Extract most helpful reviews
-            helpful_reviews = await self._extract_most_helpful_reviews(soup, products)
+            helpful_reviews = await self._extract_most_helpful_reviews(doc, products)
             reviews_data["most_helpful_reviews"] = helpful_reviews
             
             # Extract review statistics
-            review_stats = await self._extract_review_statistics(soup, products)
+            review_stats = await self._extract_review_statistics(doc, products)
             reviews_data["review_statistics"] = review_stats
             
             return reviews_data
@@ -1277,7 +1304,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract reviews data: {e}")
             return {}
     
-    async def _extract_reviewers_company_size(self, soup: BeautifulSoup, products: List[ProductComparison]) -> Dict[str, Any]:
+    async def _extract_reviewers_company_size(self, doc: IndexedDocument, products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract reviewers company size breakdown."""
         try:
             company_size_data = {
@@ -1288,9 +1315,9 @@ class G2HeadToHeadComparisonParser(BaseParser):
             }
             
             # Look for company size section
-            company_size_section = soup.find('div', attrs={'aria-label': re.compile(r'Reviewers Company Size', re.I)})
+            company_size_section = doc.find('div', attrs={'aria-label': re.compile(r'Reviewers Company Size', re.I)})
             if not company_size_section:
-                company_size_section = soup.find('div', string=re.compile(r'Reviewers.*Company Size', re.I))
+                company_size_section = doc.find('div', string=re.compile(r'Reviewers.*Company Size', re.I))
             
             if company_size_section:
                 # Extract data for each company size category
@@ -1300,9 +1327,10 @@ class G2HeadToHeadComparisonParser(BaseParser):
                 for i, (category, label) in enumerate(zip(categories, category_labels)):
                     try:
                         # Look for elements with aria-label containing the category
-                        category_elements = company_size_section.find_all(
+                        category_elements = doc.find_all(
                             'div', 
-                            attrs={'aria-label': re.compile(f'.*{label}.*', re.I)}
+                            attrs={'aria-label': re.compile(f'.*{label}.*', re.I)},
+                            within=company_size_section
                         )
                         
                         for element in category_elements:
@@ -1333,7 +1361,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract reviewers company size: {e}")
             return {}
     
-    async def _extract_reviewers_industry(self, soup: BeautifulSoup, products: List[ProductComparison]) -> Dict[str, Any]:
+    async def _extract_reviewers_industry(self, doc: IndexedDocument, products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract reviewers industry breakdown."""
         try:
             industry_data = {
@@ -1342,9 +1370,9 @@ class G2HeadToHeadComparisonParser(BaseParser):
             }
             
             # Look for industry section
-            industry_section = soup.find('div', attrs={'aria-label': re.compile(r'Reviewers.*Industry', re.I)})
+            industry_section = doc.find('div', attrs={'aria-label': re.compile(r'Reviewers.*Industry', re.I)})
             if not industry_section:
-                industry_section = soup.find('div', string=re.compile(r'Reviewers.*Industry', re.I))
+                industry_section = doc.find('div', string=re.compile(r'Reviewers.*Industry', re.I))
             
             if industry_section:
                 # Common industries from screenshots
@@ -1356,9 +1384,10 @@ class G2HeadToHeadComparisonParser(BaseParser):
                 for industry in common_industries:
                     try:
                         # Look for elements with aria-label containing the industry
-                        industry_elements = industry_section.find_all(
+                        industry_elements = doc.find_all(
                             'div', 
-                            attrs={'aria-label': re.compile(f'.*{re.escape(industry)}.*', re.I)}
+                            attrs={'aria-label': re.compile(f'.*{re.escape(industry)}.*', re.I)},
+                            within=industry_section
                         )
                         
                         for element in industry_elements:
@@ -1391,7 +1420,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract reviewers industry: {e}")
             return {}
     
-    async def _extract_most_helpful_reviews(self, soup: BeautifulSoup, products: List[ProductComparison]) -> Dict[str, Any]:
+    async def _extract_most_helpful_reviews(self, doc: IndexedDocument, products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract most helpful reviews for each product."""
         try:
             helpful_reviews_data = {
@@ -1400,9 +1429,9 @@ class G2HeadToHeadComparisonParser(BaseParser):
             }
             
             # Look for most helpful reviews section
-            reviews_section = soup.find('div', attrs={'aria-label': re.compile(r'Most Helpful Reviews', re.I)})
+            reviews_section = doc.find('div', attrs={'aria-label': re.compile(r'Most Helpful Reviews', re.I)})
             if not reviews_section:
-                reviews_section = soup.find('div', string=re.compile(r'Most Helpful Reviews', re.I))
+                reviews_section = doc.find('div', string=re.compile(r'Most Helpful Reviews', re.I))
             
             if reviews_section:
                 # Extract reviews for each product
@@ -1412,16 +1441,16 @@ class G2HeadToHeadComparisonParser(BaseParser):
                     
                     try:
                         # Look for review elements
-                        review_elements = reviews_section.find_all(['p', 'div'], class_=re.compile(r'review|comment'))
+                        review_elements = doc.find_all(['p', 'div'], class_=re.compile(r'review|comment'), within=reviews_section)
                         
                         for review_element in review_elements:
                             try:
-                                review_text = review_element.get_text(strip=True)
+                                review_text = doc.text(review_element, strip=True)
                                 
                                 # Check if this review belongs to the current product
                                 if len(review_text) > 50 and any(word in review_text.lower() for word in product_name.lower().split()):
                                     # Extract reviewer information if available
-                                    reviewer_info = self._extract_reviewer_info(review_element)
+                                    reviewer_info = self._extract_reviewer_info(doc, review_element)
                                     
                                     review_data = {
                                         "text": review_text,
@@ -1450,7 +1479,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract most helpful reviews: {e}")
             return {}
     
-    def _extract_reviewer_info(self, review_element) -> Dict[str, Any]:
+    def _extract_reviewer_info(self, doc: IndexedDocument, review_element) -> Dict[str, Any]:
         """Extract reviewer information from review element."""
         try:
             reviewer_info = {
@@ -1461,19 +1490,19 @@ class G2HeadToHeadComparisonParser(BaseParser):
             }
             
             # Look for reviewer name
-            name_element = review_element.find_previous(['span', 'div'], class_=re.compile(r'name|user'))
+            name_element = doc.find_previous(review_element, ['span', 'div'], class_=re.compile(r'name|user'))
             if name_element:
-                reviewer_info["name"] = name_element.get_text(strip=True)
+                reviewer_info["name"] = doc.text(name_element, strip=True)
             
             # Look for verification status
-            verification_element = review_element.find_previous(['span', 'div'], string=re.compile(r'Verified User', re.I))
+            verification_element = doc.find_previous(review_element, ['span', 'div'], string=re.compile(r'Verified User', re.I))
             if verification_element:
                 reviewer_info["verification_status"] = "Verified"
             
             # Look for industry information
-            industry_element = review_element.find_previous(['span', 'div'], string=re.compile(r'in .*', re.I))
+            industry_element = doc.find_previous(review_element, ['span', 'div'], string=re.compile(r'in .*', re.I))
             if industry_element:
-                industry_text = industry_element.get_text(strip=True)
+                industry_text = doc.text(industry_element, strip=True)
                 if 'in ' in industry_text:
                     reviewer_info["industry"] = industry_text.split('in ')[-1]
             
@@ -1483,7 +1512,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract reviewer info: {e}")
             return {"name": "Unknown", "verification_status": "Unknown", "industry": "Unknown", "company_size": "Unknown"}
     
-    async def _extract_review_statistics(self, soup: BeautifulSoup, products: List[ProductComparison]) -> Dict[str, Any]:
+    async def _extract_review_statistics(self, doc: IndexedDocument, products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract review statistics and metrics."""
         try:
             review_stats = {
@@ -1498,7 +1527,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
                 product_name = product.name
                 
                 # Look for review count elements
-                review_count_elements = soup.find_all(
+                review_count_elements = doc.find_all(
                     'a', 
                     attrs={'aria-label': re.compile(f'{re.escape(product_name)}.*reviews?', re.I)}
                 )
@@ -1517,7 +1546,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
                         break
                 
                 # Extract average rating if available
-                rating_elements = soup.find_all(
+                rating_elements = doc.find_all(
                     'div', 
                     attrs={'aria-label': re.compile(f'{re.escape(product_name)}.*star rating', re.I)}
                 )
@@ -1541,7 +1570,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to extract review statistics: {e}")
             return {}
     
-    async def _extract_alternatives(self, soup: BeautifulSoup, products: List[ProductComparison]) -> Dict[str, Any]:
+    async def _extract_alternatives(self, doc: IndexedDocument, products: List[ProductComparison]) -> Dict[str, Any]:
         """Extract comprehensive alternatives data."""
         try:
             alternatives_data = {
@@ -1552,9 +1581,9 @@ class G2HeadToHeadComparisonParser(BaseParser):
             }
             
             # Look for alternatives section
-            alternatives_section = soup.find('div', attrs={'aria-label': re.compile(r'Alternatives', re.I)})
+            alternatives_section = doc.find('div', attrs={'aria-label': re.compile(r'Alternatives', re.I)})
             if not alternatives_section:
-                alternatives_section = soup.find('div', string=re.compile(r'Alternatives', re.I))
+                alternatives_section = doc.find('div', string=re.compile(r'Alternatives', re.I))
             
             if alternatives_section:
                 # Extract alternative products for each main product
@@ -1564,14 +1593,14 @@ class G2HeadToHeadComparisonParser(BaseParser):
                     
                     try:
                         # Look for alternative product links
-                        alternative_links = alternatives_section.find_all('a', href=re.compile(r'/products/'))
+                        alternative_links = doc.find_all('a', attrs={'href': re.compile(r'/products/')}, within=alternatives_section)
                         
                         for link in alternative_links:
                             try:
                                 href = link.get('href', '')
                                 if '/products/' in href:
                                     # Extract product name from link text or href
-                                    alt_product_name = link.get_text(strip=True)
+                                    alt_product_name = doc.text(link, strip=True)
                                     if not alt_product_name:
                                         alt_product_name = href.split('/products/')[-1].replace('-', ' ').title()
                                     
@@ -1597,19 +1626,20 @@ class G2HeadToHeadComparisonParser(BaseParser):
                         continue
             
             # Extract competitor mentions from AI summary and other content
+            page_text = doc.page_text.lower()
+            competitor_products = [
+                "Tableau", "Qlik", "Snowflake", "Databricks", "Amazon Redshift", 
+                "Google BigQuery", "Looker", "Sisense", "ThoughtSpot", "Power BI"
+            ]
+            mentioned_competitors = [competitor for competitor in competitor_products if competitor.lower() in page_text]
+            
             for product in products:
                 product_name = product.name
                 alternatives_data["competitor_mentions"][product_name] = []
                 
                 # Look for competitor mentions in the page content
-                page_text = soup.get_text()
-                competitor_products = [
-                    "Tableau", "Qlik", "Snowflake", "Databricks", "Amazon Redshift", 
-                    "Google BigQuery", "Looker", "Sisense", "ThoughtSpot", "Power BI"
-                ]
-                
-                for competitor in competitor_products:
-                    if competitor.lower() in page_text.lower() and competitor.lower() != product_name.lower():
+                for competitor in mentioned_competitors:
+                    if competitor.lower() != product_name.lower():
                         alternatives_data["competitor_mentions"][product_name].append({
                             "competitor": competitor,
                             "mention_context": "page_content",
@@ -1664,19 +1694,19 @@ class G2HeadToHeadComparisonParser(BaseParser):
             logger.warning(f"Failed to calculate data quality score: {e}")
             return 0.0
     
-    def _calculate_extraction_confidence(self, soup: BeautifulSoup) -> float:
+    def _calculate_extraction_confidence(self, doc: IndexedDocument) -> float:
         """Calculate confidence in the extraction process."""
         try:
             confidence = 0.0
             
             # Check for key structural elements
-            if soup.find('div', attrs={'data-eventscope': 'Comparison Table'}):
+            if doc.find('div', attrs={'data-eventscope': 'Comparison Table'}):
                 confidence += 30
-            if soup.find('div', id='comparison-table'):
+            if doc.find('div', attrs={'id': 'comparison-table'}):
                 confidence += 20
-            if soup.find('div', class_=re.compile(r'comparison.*container')):
+            if doc.find('div', class_=re.compile(r'comparison.*container')):
                 confidence += 25
-            if soup.find('div', attrs={'aria-label': re.compile(r'out of \d+')}):
+            if doc.find('div', attrs={'aria-label': re.compile(r'out of \d+')}):
                 confidence += 25
             
             return min(confidence, 100.0)
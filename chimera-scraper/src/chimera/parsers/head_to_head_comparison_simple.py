@@ -5,11 +5,15 @@ import re
 import json
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from bs4 import BeautifulSoup
 from loguru import logger
 
+from chimera.models.review import EnhancedReview
+from chimera.utils.patterns import register_pattern
+from chimera.utils.serialization import to_dict
 from .base import BaseParser
+from .engines import BeautifulSoupEngine
 
 
 @dataclass
@@ -80,6 +84,9 @@ class SummaryPoint:
 class G2HeadToHeadComparisonParser(BaseParser):
     """Python 3.8 compatible parser for G2 head-to-head comparison pages."""
     
+    # Section extractors navigate BeautifulSoup trees
+    dom_engine = BeautifulSoupEngine.name
+    
     def __init__(self):
         super().__init__()
         self.comparison_selectors = {
@@ -127,17 +134,29 @@ class G2HeadToHeadComparisonParser(BaseParser):
         ]
         
         # AI summary patterns
-        self.summary_patterns = {
-            "score_comparison": r"scoring\s+(\d+\.?\d*)\s+compared\s+to\s+[^\']*?(\d+\.?\d*)",
+        summary_sources = {
+            "score_comparison": r"scoring\s+(\d+\.?\d*)\s+compared\s+to\s+[^']*?(\d+\.?\d*)",
             "feature_mention": r"(?:excel|excels|superior|stronger|better|trails|behind)\s+(?:in|at)\s+([^,]+)",
             "sentiment_indicators": r"(?:excellent|fantastic|superior|better|trails|behind|lower|stronger|weaker)",
             "product_names": r"(?:Microsoft Power BI|Power BI|Domo|Tableau|Qlik|Snowflake|Databricks)"
         }
+        self.summary_patterns = {
+            name: register_pattern(f"g2.head_to_head.{name}", source)
+            for name, source in summary_sources.items()
+        }
+    
+    async def extract_reviews(self, html: str, source_url: str) -> List[EnhancedReview]:
+        """Comparison pages have no individual review containers."""
+        return []
+    
+    async def _parse_single_review_enhanced(self, element: Any, source_url: str) -> Optional[EnhancedReview]:
+        """Comparison pages have no individual review containers."""
+        return None
     
     async def parse_head_to_head_comparison(self, html: str, url: str) -> HeadToHeadComparisonData:
         """Parse a G2 head-to-head comparison page comprehensively."""
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = self.dom.parse(html)
             
             # Extract basic comparison info
             comparison_id = self._extract_comparison_id(url)
@@ -173,9 +192,9 @@ class G2HeadToHeadComparisonParser(BaseParser):
                 comparison_id=comparison_id,
                 extraction_date=datetime.now(),
                 url=url,
-                product_a=asdict(product_a),
-                product_b=asdict(product_b),
-                ai_generated_summary=asdict(ai_summary),
+                product_a=to_dict(product_a),
+                product_b=to_dict(product_b),
+                ai_generated_summary=to_dict(ai_summary),
                 at_a_glance=at_a_glance,
                 pricing=pricing,
                 ratings=ratings,
@@ -495,7 +514,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
         """Parse individual summary point to extract structured data."""
         try:
             # Extract scores if present
-            score_match = re.search(self.summary_patterns["score_comparison"], point_text)
+            score_match = self.summary_patterns["score_comparison"].search(point_text)
             product_a_score = None
             product_b_score = None
             
@@ -525,7 +544,7 @@ class G2HeadToHeadComparisonParser(BaseParser):
                 confidence=confidence
             )
             
-            return asdict(summary_point)
+            return to_dict(summary_point)
             
         except Exception as e:
             logger.warning(f"Failed to parse summary point: {e}")
@@ -724,7 +743,11 @@ class G2HeadToHeadComparisonParser(BaseParser):
             if product.lower() in text.lower():
                 found_products.append(product)
         
-        return found_products
+        # "Power BI" also matches inside "Microsoft Power BI"; keep the longer name only
+        return [
+            product for product in found_products
+            if not any(product != other and product.lower() in other.lower() for other in found_products)
+        ]
     
     # Placeholder methods for additional data extraction
     async def _extract_at_a_glance(self, soup: BeautifulSoup, products: List[ProductComparison]) -> Dict:
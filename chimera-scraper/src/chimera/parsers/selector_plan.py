@@ -0,0 +1,227 @@
+"""Success-rate-ordered selector plans with on-disk persistence."""
+
+import json
+import os
+import threading
+import time
+from multiprocessing import util
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from chimera.utils.file_lock import file_lock
+from .engines import DOMEngine
+
+
+# Minimum seconds between writes of one store; pending counts are flushed at exit
+SAVE_INTERVAL = 30.0
+
+
+class SelectorPlan:
+    """Candidate selectors for one lookup, tried best-first.
+
+    Selectors are ordered by their smoothed hit rate, with the declared order
+    as the tie-break, so a page layout that always matches a fallback selector
+    stops paying for the primary misses ahead of it. Compiled selector objects
+    are kept per engine.
+    """
+
+    def __init__(self, name: str, selectors: List[str], stats: Optional[Dict[str, Dict[str, int]]] = None):
+        self.name = name
+        self.selectors = list(selectors)
+        self.stats: Dict[str, Dict[str, int]] = {
+            selector: dict((stats or {}).get(selector, {'success': 0, 'total': 0}))
+            for selector in self.selectors
+        }
+        self._order: Optional[List[str]] = None
+        self._compiled: Dict[str, Dict[str, Any]] = {}
+
+    def hit_rate(self, selector: str) -> float:
+        """Laplace-smoothed hit rate so untried selectors sit at 0.5."""
+        data = self.stats[selector]
+        return (data['success'] + 1) / (data['total'] + 2)
+
+    def ordered(self) -> List[str]:
+        """Selectors in the order they should be tried."""
+        if self._order is None:
+            self._order = sorted(
+                self.selectors,
+                key=lambda selector: (-self.hit_rate(selector), self.selectors.index(selector))
+            )
+        return self._order
+
+    def compiled(self, engine: DOMEngine) -> List[Tuple[str, Any]]:
+        """(selector, compiled selector) pairs for an engine, in try order."""
+        cache = self._compiled.setdefault(engine.name, {})
+        pairs = []
+        for selector in self.ordered():
+            if selector not in cache:
+                cache[selector] = engine.compile(selector)
+            pairs.append((selector, cache[selector]))
+        return pairs
+
+    def record(self, selector: str, success: bool):
+        """Record one attempt and invalidate the try order."""
+        data = self.stats.setdefault(selector, {'success': 0, 'total': 0})
+        data['total'] += 1
+        if success:
+            data['success'] += 1
+        self._order = None
+
+    def select(self, engine: DOMEngine, root: Any) -> Tuple[Optional[str], List[Any]]:
+        """Return the first selector with matches and its elements."""
+        for selector, compiled in self.compiled(engine):
+            elements = engine.select_compiled(root, compiled)
+            self.record(selector, bool(elements))
+            if elements:
+                return selector, elements
+        return None, []
+
+    def merge_stats(self, stats: Dict[str, Dict[str, int]]):
+        """Replace this plan's counts with merged totals for its selectors."""
+        for selector in self.selectors:
+            if selector in stats:
+                self.stats[selector] = dict(stats[selector])
+        self._order = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable statistics for this plan."""
+        return {'selectors': self.selectors, 'stats': self.stats}
+
+
+class SelectorPlanStore:
+    """Selector plans for one platform, persisted as a JSON file.
+
+    Several parse workers (threads or processes) may share the file. Each
+    save re-reads the file, adds the counts recorded since this store's
+    previous save and replaces it through a temp file, all while holding an
+    ``flock`` on a sidecar ``.lock`` file, so concurrent saves add up rather
+    than overwrite each other. Saves are throttled to one per
+    ``save_interval``; ``flush_plan_stores`` writes what is left.
+    """
+
+    def __init__(self, platform: str, directory: Optional[Path] = None, save_interval: float = SAVE_INTERVAL):
+        self.platform = platform
+        self.path = Path(directory) / f"{platform}.json" if directory else None
+        self.save_interval = save_interval
+        self.plans: Dict[str, SelectorPlan] = {}
+        self._saved_stats = self._load()
+        # Per plan, the counts already included in the file
+        self._flushed: Dict[str, Dict[str, Dict[str, int]]] = {}
+        self._last_save: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read stored statistics, ignoring missing or unreadable files."""
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load selector plans from {self.path}: {e}")
+            return {}
+
+    def get(self, name: str, selectors: List[str]) -> SelectorPlan:
+        """Return the plan for a lookup, seeded from stored statistics."""
+        plan = self.plans.get(name)
+        if plan is None or plan.selectors != list(selectors):
+            stored = plan.stats if plan else self._saved_stats.get(name, {}).get('stats', {})
+            plan = self.plans[name] = SelectorPlan(name, selectors, stored)
+            self._flushed.setdefault(name, {selector: dict(value) for selector, value in plan.stats.items()})
+        return plan
+
+    def _pending(self) -> Dict[str, Dict[str, Dict[str, int]]]:
+        """Counts recorded since the last save, per plan and selector."""
+        pending = {}
+        for name, plan in self.plans.items():
+            flushed = self._flushed.get(name, {})
+            for selector, data in plan.stats.items():
+                base = flushed.get(selector, {'success': 0, 'total': 0})
+                if data['total'] != base['total']:
+                    pending.setdefault(name, {})[selector] = {
+                        'success': data['success'] - base['success'],
+                        'total': data['total'] - base['total']
+                    }
+        return pending
+
+    def save(self, force: bool = False):
+        """Add the counts recorded since the last save to the file on disk.
+
+        Without ``force`` this is a no-op until ``save_interval`` seconds have
+        passed since the previous write, so it is cheap to call per page.
+        """
+        if self.path is None:
+            return
+        now = time.monotonic()
+        if not force and self._last_save is not None and now - self._last_save < self.save_interval:
+            return
+        with self._lock:
+            pending = self._pending()
+            self._last_save = now
+            if not pending:
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with file_lock(self.path.with_name(f"{self.path.name}.lock")):
+                    self._write_merged(pending)
+            except Exception as e:
+                logger.warning(f"Failed to save selector plans to {self.path}: {e}")
+
+    def _write_merged(self, pending: Dict[str, Dict[str, Dict[str, int]]]):
+        """Add pending counts to the file's current contents; the caller holds the file lock."""
+        # Re-read so counts other workers saved meanwhile are kept
+        data = self._load()
+        for name, counts in pending.items():
+            plan = self.plans[name]
+            stored = data.get(name, {}).get('stats', {})
+            stats = {selector: dict(value) for selector, value in stored.items()}
+            for selector, delta in counts.items():
+                merged = stats.setdefault(selector, {'success': 0, 'total': 0})
+                merged['success'] += delta['success']
+                merged['total'] += delta['total']
+            data[name] = {'selectors': plan.selectors, 'stats': stats}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        tmp_path.replace(self.path)
+        self._saved_stats = data
+        for name in pending:
+            plan = self.plans[name]
+            plan.merge_stats(data[name]['stats'])
+            self._flushed[name] = {selector: dict(value) for selector, value in plan.stats.items()}
+
+    def flush(self):
+        """Write any counts not saved yet."""
+        self.save(force=True)
+
+
+_PLAN_STORES: Dict[Tuple[str, Optional[str]], SelectorPlanStore] = {}
+# Process that registered the exit flush; forked workers register their own
+_FLUSH_REGISTERED_PID: Optional[int] = None
+
+
+def flush_plan_stores():
+    """Write the pending counts of every plan store in this process."""
+    for store in list(_PLAN_STORES.values()):
+        store.flush()
+
+
+def get_plan_store(platform: str, directory: Optional[Path] = None) -> SelectorPlanStore:
+    """Return the process-wide plan store for a platform and directory.
+
+    Parsers are created per scrape, so sharing the store keeps the learned
+    order and compiled selectors alive between instances. Pending counts are
+    flushed when the process exits, including parse pool workers when the
+    executor shuts down.
+    """
+    global _FLUSH_REGISTERED_PID
+    if _FLUSH_REGISTERED_PID != os.getpid():
+        # multiprocessing runs these at normal exit, in workers as well as the main process
+        util.Finalize(None, flush_plan_stores, exitpriority=10)
+        _FLUSH_REGISTERED_PID = os.getpid()
+    key = (platform, str(directory) if directory else None)
+    if key not in _PLAN_STORES:
+        _PLAN_STORES[key] = SelectorPlanStore(platform, directory)
+    return _PLAN_STORES[key]
@@ -0,0 +1,151 @@
+"""Incremental HTML reading that hands out review containers as they close."""
+
+from pathlib import Path
+from typing import Any, AsyncIterable, IO, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import lxml.html
+    from lxml import etree
+    from cssselect import HTMLTranslator
+except ImportError:  # pragma: no cover - optional dependency
+    etree = None
+
+
+HTMLSource = Union[str, bytes, Path, IO, Iterable[Union[str, bytes]], AsyncIterable[Union[str, bytes]]]
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+if etree is not None:
+    class _SelfMatchTranslator(HTMLTranslator):
+        """CSS to XPath tested on the element itself.
+
+        Combinators become conditions on the element's ancestors and earlier
+        siblings instead of steps down from a context node, so a selector such
+        as ``.reviews .review`` can be checked when an element starts.
+        """
+
+        def xpath_descendant_combinator(self, left, right):
+            return right.add_condition(f"ancestor::{left}")
+
+        def xpath_child_combinator(self, left, right):
+            return right.add_condition(f"parent::{left}")
+
+        def xpath_direct_adjacent_combinator(self, left, right):
+            return right.add_condition(f"preceding-sibling::*[1]/self::{left}")
+
+        def xpath_indirect_adjacent_combinator(self, left, right):
+            return right.add_condition(f"preceding-sibling::{left}")
+
+
+class ContainerStream:
+    """Event-driven container extraction over an lxml pull parser.
+
+    Chunks are fed as they arrive. Selectors are given best-first and, as in
+    ``SelectorPlan.select``, the page's containers are those of the
+    best-ranked selector that matches anywhere in it. Every starting element
+    is tested against the selectors ranked above the best match so far (and
+    against that one while no container is open); combinators are checked
+    against the element's ancestors and the earlier siblings still in the
+    tree. When a container closes it is serialized and its subtree dropped.
+
+    Containers of the top-ranked selector are returned as they close. Those
+    of a lower-ranked selector are held until the document ends, because a
+    better selector may still match further down, and are dropped as soon
+    as one does. Closed elements outside any container are dropped as well,
+    so memory stays at the held containers plus the open ancestor chain.
+    """
+
+    def __init__(self, selectors: List[str]):
+        if etree is None:
+            raise ImportError("Streaming extraction requires lxml and cssselect")
+
+        translator = _SelfMatchTranslator()
+        self.matchers = [
+            (selector, etree.XPath(translator.css_to_xpath(selector, prefix='self::')))
+            for selector in selectors
+        ]
+        self.best_selector: Optional[str] = None
+        self.containers_seen = 0
+        self._best_rank = len(self.matchers)
+        self._held: List[Tuple[str, str]] = []
+        self._parser = etree.HTMLPullParser(events=('start', 'end'))
+        self._open: Optional[Any] = None
+
+    def feed(self, chunk: Union[str, bytes]) -> List[Tuple[str, str]]:
+        """Feed a chunk and return (selector, container HTML) for containers that are final."""
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self) -> List[Tuple[str, str]]:
+        """Flush the parser and return the remaining and held containers."""
+        self._parser.close()
+        closed = self._drain()
+        if self._held:
+            closed.extend(self._held)
+            self.containers_seen += len(self._held)
+            self._held = []
+        return closed
+
+    def _drain(self) -> List[Tuple[str, str]]:
+        closed = []
+        for event, element in self._parser.read_events():
+            if not isinstance(element.tag, str):
+                continue
+
+            if event == 'start':
+                rank = self._match(element)
+                if rank is not None:
+                    if rank < self._best_rank:
+                        # A better selector matched: what the old one found no longer counts
+                        self._best_rank = rank
+                        self.best_selector = self.matchers[rank][0]
+                        self._held = []
+                    self._open = element
+                continue
+
+            if self._open is not None:
+                if element is not self._open:
+                    continue
+                container = (self.best_selector, lxml.html.tostring(element, encoding='unicode', with_tail=False))
+                self._open = None
+                if self._best_rank == 0:
+                    closed.append(container)
+                    self.containers_seen += 1
+                else:
+                    self._held.append(container)
+
+            self._discard(element)
+        return closed
+
+    def _match(self, element: Any) -> Optional[int]:
+        """Rank of the best selector that could open a container at this element."""
+        # The current best only opens a container outside an open one; better ones always may
+        limit = self._best_rank if self._open is not None else min(self._best_rank + 1, len(self.matchers))
+        for rank in range(limit):
+            if self.matchers[rank][1](element):
+                return rank
+        return None
+
+    @staticmethod
+    def _discard(element: Any):
+        """Drop a finished subtree and any earlier siblings already processed."""
+        element.clear(keep_tail=True)
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
+
+
+def iter_html_chunks(source: HTMLSource, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Union[str, bytes]]:
+    """Yield HTML in chunks from a string, bytes, path, file object or chunk iterable."""
+    if isinstance(source, (str, bytes)):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+    elif isinstance(source, Path):
+        with open(source, 'r', encoding='utf-8') as f:
+            yield from iter(lambda: f.read(chunk_size), '')
+    elif hasattr(source, 'read'):
+        yield from iter(lambda: source.read(chunk_size), source.read(0))
+    else:
+        yield from source
@@ -0,0 +1,76 @@
+"""Single-pass phrase scanning over a page's text nodes."""
+
+import re
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Any, Iterable, List, Optional, Tuple
+
+from chimera.analysis.keywords import get_matcher
+from .engines import DOMEngine
+
+
+_LEADING_WHITESPACE = re.compile(r'\s*')
+
+
+class PhraseScanner:
+    """Case-insensitive matcher for a fixed set of trigger phrases.
+
+    The page text is lower-cased once and searched in one pass by the shared
+    keyword matcher. When lower-casing shifts offsets (a few non-ASCII
+    characters expand), the hits are mapped back onto the original text.
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        self.matcher = get_matcher(sorted({phrase.lower() for phrase in phrases if phrase}))
+
+    def occurrences(self, text: str) -> List[Tuple[int, int]]:
+        """Return (start, end) of every phrase occurrence, sorted by start."""
+        lowered = text.lower()
+        found = sorted((start, end) for start, end, _ in self.matcher.find_all(lowered))
+        if found and len(lowered) != len(text):
+            # Offset in the lowered text at which each original character starts
+            offsets = list(accumulate((len(char.lower()) for char in text), initial=0))
+            found = [(bisect_right(offsets, start) - 1, bisect_left(offsets, end)) for start, end in found]
+        return found
+
+
+def find_phrase_containers(engine: DOMEngine, root: Any, tags: Iterable[str], phrases: Iterable[str],
+                           min_length: int = 30, scanner: Optional[PhraseScanner] = None) -> List[Any]:
+    """Elements whose stripped text is longer than ``min_length`` and contains a phrase.
+
+    Equivalent to checking ``phrase in engine.text(element).strip().lower()``
+    for every element with one of ``tags``, but the page text is built once
+    from its text nodes and each element's text is a span of it. An element
+    matches when some phrase occurrence lies inside its span, so nested
+    containers never re-concatenate their descendants' text. Results are in
+    document order.
+    """
+    scanner = scanner or PhraseScanner(phrases)
+    text, spans = engine.text_spans(root, tags)
+    occurrences = scanner.occurrences(text)
+    if not occurrences:
+        return []
+
+    starts = [start for start, _ in occurrences]
+    # Smallest occurrence end at or after each index, for O(log n) containment checks
+    min_ends = [end for _, end in occurrences]
+    for index in range(len(min_ends) - 2, -1, -1):
+        min_ends[index] = min(min_ends[index], min_ends[index + 1])
+
+    reversed_text = text[::-1]
+    text_length = len(text)
+    matches = []
+
+    for element, start, end in spans:
+        index = bisect_left(starts, start)
+        if index == len(starts) or min_ends[index] > end:
+            continue
+
+        leading = _LEADING_WHITESPACE.match(text, start, end).end() - start
+        if leading == end - start:
+            continue
+        trailing = _LEADING_WHITESPACE.match(reversed_text, text_length - end, text_length - start).end() - (text_length - end)
+        if end - start - leading - trailing > min_length:
+            matches.append(element)
+
+    return matches
@@ -6,6 +6,8 @@ from datetime import datetime
 from loguru import logger
 from pathlib import Path
 
+from ..utils import serialization
+
 
 class TargetManager:
     """Manages scraping targets with metadata and priority handling."""
@@ -266,7 +268,7 @@ class TargetManager:
         # Save to file
         try:
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, default=str)
+                serialization.dump(summary, f, indent=2)
             
             logger.info(f"Targets summary exported to {output_path}")
             return output_path
@@ -0,0 +1,140 @@
+"""Per-target high-water marks for incremental review scraping."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from loguru import logger
+
+from chimera.models.review import EnhancedReview
+
+
+DEFAULT_WATERMARK_PATH = "output/watermarks.json"
+
+# Newest review IDs remembered per target, so reviews sharing the newest
+# date (or pages without dates) are still recognized
+KNOWN_IDS_PER_TARGET = 50
+
+
+def page_url(url: str, page: int) -> str:
+    """URL of a numbered review page; G2 and Capterra both page with ``?page=N``."""
+    if page <= 1:
+        return url
+    parts = urlsplit(url)
+    query = [(key, value) for key, value in parse_qsl(parts.query) if key != "page"]
+    query.append(("page", str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class WatermarkStore:
+    """Newest review date and IDs collected per target, persisted as JSON.
+
+    Review pages list the newest reviews first, so once a page reaches a
+    review older than the mark, or one of the newest IDs, every later page
+    holds only reviews a previous run already collected.
+    """
+
+    def __init__(self, path: Optional[str] = DEFAULT_WATERMARK_PATH):
+        self.path = Path(path) if path else None
+        self.marks: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read stored marks, ignoring missing or unreadable files."""
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Failed to load watermarks from {self.path}: {e}")
+            return {}
+
+    def get(self, target_key: str) -> Optional[Dict[str, Any]]:
+        """The stored mark for a target, or None before its first run."""
+        return self.marks.get(target_key)
+
+    def split_new(self, target_key: str, reviews: List[EnhancedReview]) -> Tuple[List[EnhancedReview], bool]:
+        """Return the reviews newer than the mark and whether the mark was reached."""
+        mark = self.marks.get(target_key)
+        if not mark:
+            return list(reviews), False
+
+        newest = datetime.fromisoformat(mark["newest_date"]) if mark.get("newest_date") else None
+        known_ids = set(mark.get("known_ids", []))
+        new_reviews = []
+        reached = False
+        for review in reviews:
+            if review.id in known_ids or (newest is not None and review.date < newest):
+                reached = True
+            else:
+                new_reviews.append(review)
+        return new_reviews, reached
+
+    def advance(self, target_key: str, reviews: List[EnhancedReview], started: datetime):
+        """Move a target's mark up to the newest of ``reviews``.
+
+        ``started`` is when the scrape began. Parsers date undated reviews
+        with the parse time, so only dates before it move the date mark;
+        undated reviews are still remembered by ID.
+        """
+        if not reviews:
+            return
+        mark = self.marks.get(target_key, {})
+        dates = [review.date for review in reviews if review.date < started]
+        if mark.get("newest_date"):
+            dates.append(datetime.fromisoformat(mark["newest_date"]))
+        newest = max(dates) if dates else None
+
+        ordered = sorted(reviews, key=lambda review: review.date, reverse=True)
+        known_ids = list(dict.fromkeys([review.id for review in ordered] + mark.get("known_ids", [])))
+        self.marks[target_key] = {
+            "newest_date": newest.isoformat() if newest else None,
+            "known_ids": known_ids[:KNOWN_IDS_PER_TARGET],
+            "updated": datetime.now().isoformat()
+        }
+
+    def save(self):
+        """Write marks to disk."""
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.marks, f, indent=2)
+            tmp_path.replace(self.path)
+        except Exception as e:
+            logger.warning(f"Failed to save watermarks to {self.path}: {e}")
+
+
+async def collect_new_reviews(fetch_page: Callable[[str], Awaitable[Tuple[List[EnhancedReview], List[str]]]],
+                              url: str, target_key: str, watermarks: Optional[WatermarkStore],
+                              max_pages: int = 1) -> List[EnhancedReview]:
+    """Walk a target's review pages newest-first until known reviews appear.
+
+    ``fetch_page`` navigates to, extracts and parses one page URL, returning
+    the parsed reviews and the IDs of reviews the parser skipped because an
+    earlier run already stored them (empty without the seen-set). Paging
+    stops at ``max_pages``, at a page with no new reviews, or at the first
+    page that reaches the target's high-water mark. Skipped reviews count
+    toward the mark: they were collected by an earlier run, so a page
+    holding one has reached it even though the parser returned none of
+    them. Without ``watermarks`` every page up to ``max_pages`` is read.
+    """
+    collected: List[EnhancedReview] = []
+    for page in range(1, max_pages + 1):
+        reviews, skipped_ids = await fetch_page(page_url(url, page))
+        if watermarks is None:
+            collected.extend(reviews)
+            if not reviews:
+                break
+            continue
+
+        new_reviews, reached = watermarks.split_new(target_key, reviews)
+        collected.extend(new_reviews)
+        if reached or skipped_ids or not new_reviews:
+            logger.info(f"{target_key}: reached known reviews on page {page}, stopping")
+            break
+    return collected
@@ -0,0 +1,165 @@
+"""Columnar Parquet export of reviews, partitioned by platform, competitor and review day."""
+
+import enum
+import re
+import typing
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from loguru import logger
+
+from chimera.models.review import EnhancedReview, ReviewBatch
+from chimera.utils import serialization
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    ds = None
+
+
+# Low-cardinality string columns stored dictionary-encoded
+DICTIONARY_COLUMNS = ("source", "sentiment_label", "extraction_method")
+
+# "day" rather than "date", which is already the review timestamp column
+PARTITION_COLUMNS = ("platform", "competitor", "day")
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("pyarrow is required for Parquet export: pip install pyarrow")
+
+
+def _arrow_type(name: str, annotation: Any) -> "pa.DataType":
+    """Map a model field annotation to its Arrow type."""
+    if typing.get_origin(annotation) is typing.Union:
+        annotation = next(arg for arg in typing.get_args(annotation) if arg is not type(None))
+
+    if name in DICTIONARY_COLUMNS:
+        return pa.dictionary(pa.int32(), pa.string())
+    if typing.get_origin(annotation) in (list, List):
+        return pa.list_(_arrow_type("", typing.get_args(annotation)[0]))
+    if annotation is datetime:
+        return pa.timestamp("us")
+    if annotation is float:
+        return pa.float64()
+    if annotation is int:
+        return pa.int32()
+    # str, enums, and dicts (stored as JSON text)
+    return pa.string()
+
+
+def review_schema() -> "pa.Schema":
+    """Arrow schema with one column per ``EnhancedReview`` field, by alias.
+
+    Partition columns are not part of it; they live in the directory names.
+    """
+    _require_pyarrow()
+    return pa.schema([
+        pa.field(field.alias or name, _arrow_type(name, field.annotation), nullable=not field.is_required())
+        for name, field in EnhancedReview.model_fields.items()
+    ])
+
+
+def _column_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, dict):
+        return serialization.dumps(value)
+    return value
+
+
+def reviews_to_table(reviews: Sequence[EnhancedReview]) -> "pa.Table":
+    """Build an Arrow table straight from model attributes, one column at a time."""
+    schema = review_schema()
+    names = list(EnhancedReview.model_fields)
+    columns = []
+    for name, field in zip(names, schema):
+        values = [_column_value(getattr(review, name, None)) for review in reviews]
+        if pa.types.is_dictionary(field.type):
+            columns.append(pa.array(values, pa.string()).dictionary_encode())
+        else:
+            columns.append(pa.array(values, field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _slug(value: str) -> str:
+    """Directory-safe partition value."""
+    return re.sub(r'[^a-z0-9]+', '-', (value or '').lower()).strip('-') or 'unknown'
+
+
+def write_reviews_parquet(reviews: Sequence[EnhancedReview], root_dir: str, competitor: Optional[str] = None,
+                          platform: Optional[str] = None) -> List[str]:
+    """Append reviews to a hive-partitioned Parquet dataset and return the new files.
+
+    Files land in ``platform=<p>/competitor=<c>/day=<YYYY-MM-DD>/``, the day
+    being the review's own date. ``platform`` defaults to each review's source.
+    Every call writes new uniquely named files, so exports accumulate.
+    """
+    _require_pyarrow()
+    if not reviews:
+        return []
+
+    table = reviews_to_table(reviews)
+    partitions = {
+        "platform": [_slug(platform or review.source) for review in reviews],
+        "competitor": [_slug(competitor or "unknown")] * len(reviews),
+        "day": [review.date.date().isoformat() for review in reviews],
+    }
+    for name in PARTITION_COLUMNS:
+        table = table.append_column(name, pa.array(partitions[name], pa.string()))
+
+    written: List[str] = []
+    ds.write_dataset(
+        table,
+        root_dir,
+        format="parquet",
+        partitioning=list(PARTITION_COLUMNS),
+        partitioning_flavor="hive",
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        file_visitor=lambda written_file: written.append(written_file.path)
+    )
+
+    logger.info(f"Wrote {len(reviews)} reviews to {len(written)} Parquet file(s) under {root_dir}")
+    return written
+
+
+def write_batches_parquet(batches: Iterable[ReviewBatch], root_dir: str) -> List[str]:
+    """Export review batches, partitioned by their platform and target company."""
+    written: List[str] = []
+    for batch in batches:
+        written.extend(write_reviews_parquet(batch.reviews, root_dir, batch.target_company, batch.source_platform))
+    return written
+
+
+def read_reviews_parquet(root_dir: str, columns: Optional[List[str]] = None,
+                         filters: Optional[Dict[str, Any]] = None) -> "pa.Table":
+    """Load reviews, reading only the requested columns and matching partitions.
+
+    ``filters`` maps column names to a value or a list of values, e.g.
+    ``{"platform": "g2", "day": ["2024-01-01", "2024-01-02"]}``. Partition
+    filters prune whole directories before any file is opened.
+    """
+    _require_pyarrow()
+    if not Path(root_dir).exists():
+        return review_schema().empty_table()
+
+    partition_fields = [pa.field(name, pa.string()) for name in PARTITION_COLUMNS]
+    dataset = ds.dataset(
+        root_dir,
+        # The fixed schema keeps every file consistent, whichever one is discovered first
+        schema=pa.schema(list(review_schema()) + partition_fields),
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema(partition_fields), flavor="hive")
+    )
+
+    expression = None
+    for name, value in (filters or {}).items():
+        condition = ds.field(name).isin(list(value)) if isinstance(value, (list, tuple, set)) else ds.field(name) == value
+        expression = condition if expression is None else expression & condition
+
+    return dataset.to_table(columns=columns, filter=expression)
@@ -0,0 +1,30 @@
+"""Advisory file locks shared between processes."""
+
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Union
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+
+@contextmanager
+def file_lock(path: Union[str, Path], shared: bool = False) -> Iterator[None]:
+    """Hold an ``flock`` on a sidecar lock file for the duration of the block.
+
+    Writers take the lock exclusively; ``shared=True`` lets readers overlap
+    with each other but not with a writer. The lock file is created on
+    first use and never removed. Without ``fcntl`` the block runs unlocked.
+    """
+    if fcntl is None:
+        yield
+        return
+
+    with open(path, 'a') as handle:
+        fcntl.flock(handle, fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
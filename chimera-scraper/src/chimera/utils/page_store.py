@@ -0,0 +1,139 @@
+"""Content-addressed store for fetched HTML, so pages can be re-parsed offline."""
+
+import asyncio
+import gzip
+import hashlib
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from loguru import logger
+
+from chimera.utils import serialization
+
+
+DEFAULT_PAGE_STORE_DIR = "output/pages"
+
+
+@dataclass
+class PageRecord:
+    """One fetch of a URL; the body lives in the blob named by ``sha256``."""
+    url: str
+    fetched_at: str
+    sha256: str
+    size: int
+    parser: Optional[str] = None
+
+
+class PageStore:
+    """Gzip-compressed page bodies keyed by SHA-256, plus a fetch log.
+
+    Bodies are written once to ``objects/<sha[:2]>/<sha>.html.gz``, so a page
+    fetched again with identical content costs only a line in ``index.jsonl``.
+    Each index line records the URL, fetch time, body hash and the parser the
+    page was fetched for, which is what replay uses to re-run parsing.
+    """
+
+    def __init__(self, directory: str = DEFAULT_PAGE_STORE_DIR, compresslevel: int = 6):
+        self.directory = Path(directory)
+        self.objects_dir = self.directory / "objects"
+        self.index_path = self.directory / "index.jsonl"
+        self.compresslevel = compresslevel
+        self._lock = threading.Lock()
+
+    def _blob_path(self, sha256: str) -> Path:
+        return self.objects_dir / sha256[:2] / f"{sha256}.html.gz"
+
+    def put(self, url: str, html: str, parser: Optional[str] = None,
+            fetched_at: Optional[datetime] = None) -> PageRecord:
+        """Store a fetched page and return its index record."""
+        body = html.encode("utf-8")
+        sha256 = hashlib.sha256(body).hexdigest()
+        record = PageRecord(
+            url=url,
+            fetched_at=(fetched_at or datetime.now(timezone.utc)).isoformat(),
+            sha256=sha256,
+            size=len(body),
+            parser=parser
+        )
+
+        blob_path = self._blob_path(sha256)
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename so a crash never leaves a truncated blob behind
+            temp_path = blob_path.with_name(f"{blob_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temp_path, "wb") as f:
+                f.write(gzip.compress(body, compresslevel=self.compresslevel))
+            os.replace(temp_path, blob_path)
+
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(serialization.dumps(record) + "\n")
+
+        return record
+
+    async def save(self, url: str, html: str, parser: Optional[str] = None) -> Optional[PageRecord]:
+        """Store a page without blocking the event loop; failures are logged, never raised."""
+        try:
+            return await asyncio.to_thread(self.put, url, html, parser)
+        except Exception as e:
+            logger.warning(f"Failed to store page {url}: {e}")
+            return None
+
+    def read(self, sha256: str) -> str:
+        """Return the HTML body stored under a hash."""
+        with open(self._blob_path(sha256), "rb") as f:
+            return gzip.decompress(f.read()).decode("utf-8")
+
+    def records(self, urls: Optional[Iterable[str]] = None, parser: Optional[str] = None,
+                latest_only: bool = True) -> List[PageRecord]:
+        """Index records in fetch order, optionally filtered by URL and parser.
+
+        With ``latest_only`` each URL contributes only its most recent fetch.
+        """
+        if not self.index_path.exists():
+            return []
+
+        wanted = set(urls) if urls else None
+        found: List[PageRecord] = []
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = serialization.loads(line, PageRecord)
+                except (ValueError, TypeError) as e:
+                    logger.warning(f"Skipping malformed page index line: {e}")
+                    continue
+                if wanted is not None and record.url not in wanted:
+                    continue
+                if parser is not None and record.parser != parser:
+                    continue
+                found.append(record)
+
+        if latest_only:
+            latest = {}
+            for record in found:
+                previous = latest.get(record.url)
+                if previous is None or record.fetched_at >= previous.fetched_at:
+                    latest[record.url] = record
+            found = sorted(latest.values(), key=lambda record: record.fetched_at)
+
+        return found
+
+    def latest(self, url: str) -> Optional[PageRecord]:
+        """Most recent fetch of a URL, or None if it was never stored."""
+        records = self.records(urls=[url])
+        return records[-1] if records else None
+
+    def iter_pages(self, records: Iterable[PageRecord]) -> Iterator[Tuple[PageRecord, str]]:
+        """Yield ``(record, html)`` pairs, decompressing one body at a time."""
+        for record in records:
+            try:
+                yield record, self.read(record.sha256)
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f"Stored body for {record.url} is unreadable: {e}")
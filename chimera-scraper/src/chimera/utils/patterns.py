@@ -0,0 +1,332 @@
+"""Registry of compiled regular expressions with linear-time checks, run budgets and timing."""
+
+import re
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional
+
+from loguru import logger
+
+
+# Longest stretch an unbounded wildcard may cover once a risky pattern is bounded
+DEFAULT_MAX_SPAN = 16 * 1024
+
+# Risky patterns scan at most this many characters of one input...
+DEFAULT_MAX_INPUT = 1024 * 1024
+
+# ...in windows of this size, checking the time budget between windows
+DEFAULT_WINDOW = 16 * 1024
+
+DEFAULT_TIME_BUDGET = 0.25
+
+# Constructs that let the backtracking engine go superlinear: unbounded
+# wildcards (``.*``, ``.+?``, ``.{3,}``), open-ended counts and quantified groups
+_RISKY_CONSTRUCTS = re.compile(r"\.[*+]|\{\d*,\}|\)[*+]")
+
+_SPECIAL_CHARS = set(".^$*+?{}[]()|\\")
+
+# Atomic groups, (?>...), arrived in Python 3.11
+_ATOMIC_GROUPS = sys.version_info >= (3, 11)
+
+
+@dataclass
+class PatternStats:
+    """Timing of one registered pattern in this process."""
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    chars_scanned: int = 0
+    budget_exceeded: int = 0
+    partial_scans: int = 0
+
+
+@dataclass
+class PatternScan:
+    """Matches from one run, and whether they are all ``re`` would have found.
+
+    ``complete`` is False when the scan stopped early (time budget or
+    ``max_input``) or a match may have been cut short by a bound, so the
+    matches can differ from an unbounded ``re`` run. A lazy wildcard whose
+    terminator lies beyond ``max_span`` simply finds nothing; that is the
+    bound working, and is not flagged.
+    """
+    matches: List["re.Match[str]"]
+    groups: int
+    scanned: int
+    complete: bool = True
+
+    def findall(self) -> List[Any]:
+        """The matches in ``re.findall`` shape: whole matches, the group, or group tuples."""
+        if self.groups == 0:
+            return [match.group() for match in self.matches]
+        if self.groups == 1:
+            return [match.groups("")[0] for match in self.matches]
+        return [match.groups("") for match in self.matches]
+
+
+def is_linear_safe(source: str) -> bool:
+    """Whether a pattern has none of the constructs that can make matching superlinear.
+
+    Delimited runs such as ``[^>]*`` or ``[^"]+`` stop at their delimiter
+    and count as safe; a dot, open count or group under an unbounded
+    quantifier does not. Conservative: a pattern flagged unsafe may still be
+    fine, it is only run under budgets.
+    """
+    return _RISKY_CONSTRUCTS.search(_strip_escapes_and_classes(source)) is None
+
+
+def _strip_escapes_and_classes(source: str) -> str:
+    return re.sub(r"\\.|\[(?:\\.|[^\]])*\]", "_", source)
+
+
+def _skip_class(source: str, i: int) -> int:
+    """Index just past the character class opening at ``i``."""
+    # A leading ']' (or '^]') is a member, not the end of the class
+    i += 1 + (source[i + 1:i + 2] == "^")
+    i += source[i:i + 1] == "]"
+    while i < len(source) and source[i] != "]":
+        i += 2 if source[i] == "\\" else 1
+    return i + 1
+
+
+def _literal_run(source: str, i: int) -> int:
+    """Index just past the plain literal characters starting at ``i``."""
+    while i < len(source):
+        if source[i] == "\\" and i + 1 < len(source) and not source[i + 1].isalnum():
+            i += 2
+        elif source[i] not in _SPECIAL_CHARS:
+            i += 1
+        else:
+            break
+    return i
+
+
+def _is_lazy_wildcard(source: str, i: int) -> bool:
+    return source[i:i + 1] == "." and source[i + 1:i + 3] in ("*?", "+?")
+
+
+def bound_wildcards(source: str, max_span: int) -> str:
+    """Rewrite unbounded dot repeats and open counts to stop after ``max_span`` characters.
+
+    ``.*?`` becomes ``.{0,N}?``, ``.+`` becomes ``.{1,N}`` and ``{n,}``
+    becomes ``{n,N}``; escapes and character classes are left alone.
+
+    On Python 3.11+, a top-level lazy wildcard that runs up to a literal
+    followed by another lazy wildcard (or the end), as in ``.*?Pros.*?Cons``,
+    is also made atomic: only the first occurrence of the literal is tried.
+    The next wildcard can reach anything a later occurrence could, so matches
+    stay the same up to the span bound, without backtracking over every
+    later occurrence.
+    """
+    atomic = _ATOMIC_GROUPS and not _has_top_level_alternation(source)
+    out = []
+    depth = 0
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            out.append(source[i:i + 2])
+            i += 2
+        elif char == "[":
+            end = _skip_class(source, i)
+            out.append(source[i:end])
+            i = end
+        elif char == "." and source[i + 1:i + 2] in ("*", "+"):
+            wildcard = ".{%d,%d}" % (0 if source[i + 1] == "*" else 1, max_span)
+            if _is_lazy_wildcard(source, i):
+                run_end = _literal_run(source, i + 3)
+                if atomic and depth == 0 and run_end > i + 3 and (
+                        run_end == len(source) or _is_lazy_wildcard(source, run_end)):
+                    out.append(f"(?>{wildcard}?{source[i + 3:run_end]})")
+                    i = run_end
+                    continue
+                wildcard += "?"
+            out.append(wildcard)
+            i += 2 + wildcard.endswith("?")
+        elif char == "{" and re.match(r"\{(\d*),\}", source[i:]):
+            open_count = re.match(r"\{(\d*),\}", source[i:])
+            low = int(open_count.group(1) or 0)
+            out.append("{%d,%d}" % (low, max(low, max_span)))
+            i += open_count.end()
+        else:
+            depth += (char == "(") - (char == ")")
+            out.append(char)
+            i += 1
+    return "".join(out)
+
+
+def _has_top_level_alternation(source: str) -> bool:
+    depth = 0
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "[":
+            i = _skip_class(source, i)
+            continue
+        if char == "|" and depth == 0:
+            return True
+        depth += (char == "(") - (char == ")")
+        i += 1
+    return False
+
+
+class BudgetedPattern:
+    """A pattern compiled once, timed on every call.
+
+    Linear-safe patterns run as they are. Others are compiled with their
+    wildcards bounded to ``max_span`` characters, scan at most ``max_input``
+    characters, and stop with the matches found so far once ``time_budget``
+    seconds have passed; the budget is checked between ``window``-sized
+    slices, so one call cannot run long past it.
+
+    ``search``, ``finditer`` and ``findall`` return what ``re`` does; use
+    ``scan`` to also learn whether a risky pattern's run was cut short.
+    """
+
+    def __init__(self, name: str, source: str, flags: int = 0, safe: Optional[bool] = None,
+                 max_span: int = DEFAULT_MAX_SPAN, max_input: int = DEFAULT_MAX_INPUT,
+                 window: int = DEFAULT_WINDOW, time_budget: float = DEFAULT_TIME_BUDGET):
+        self.name = name
+        self.source = source
+        self.flags = flags
+        self.safe = is_linear_safe(source) if safe is None else safe
+        self.max_span = max_span
+        self.max_input = max_input
+        self.window = window
+        self.time_budget = time_budget
+        self.regex = re.compile(source if self.safe else bound_wildcards(source, max_span), flags)
+        # Furthest a match can run past its start: one span per bounded wildcard,
+        # plus one for the delimited runs around them
+        self.reach = max_span * (len(_RISKY_CONSTRUCTS.findall(_strip_escapes_and_classes(source))) + 1)
+        # '$' would also match at an artificial window end; escapes and classes such as [^$] don't anchor
+        self._anchored_end = "$" in _strip_escapes_and_classes(source) or "\\Z" in re.findall(r"\\.", source)
+        self.stats = PatternStats()
+
+    def __repr__(self) -> str:
+        return f"BudgetedPattern({self.name!r}, {self.source!r}, safe={self.safe})"
+
+    def search(self, text: str) -> Optional["re.Match[str]"]:
+        matches = self.scan(text, first_only=True).matches
+        return matches[0] if matches else None
+
+    def finditer(self, text: str) -> Iterator["re.Match[str]"]:
+        return iter(self.scan(text).matches)
+
+    def findall(self, text: str) -> List[Any]:
+        """Same shape as ``re.findall``: whole matches, the group, or group tuples."""
+        return self.scan(text).findall()
+
+    def scan(self, text: str, first_only: bool = False) -> PatternScan:
+        """Run the pattern over ``text`` and report whether the run was complete."""
+        started = time.perf_counter()
+        if self.safe:
+            if first_only:
+                match = self.regex.search(text)
+                matches = [match] if match else []
+            else:
+                matches = list(self.regex.finditer(text))
+            result = PatternScan(matches, self.regex.groups, len(text))
+            exceeded = False
+        else:
+            result, exceeded = self._run_windowed(text, first_only, started)
+        self._record(time.perf_counter() - started, result, len(text), exceeded)
+        return result
+
+    def _run_windowed(self, text: str, first_only: bool, started: float):
+        length = len(text)
+        limit = min(length, self.max_input)
+        result = PatternScan([], self.regex.groups, limit, complete=limit == length)
+        skipped = False
+        pos = 0
+        while pos < limit:
+            window_end = min(pos + self.window, limit)
+            # Matches starting in this window end within reach of it
+            endpos = min(window_end + self.reach, length)
+            resume = window_end
+            for match in self.regex.finditer(text, pos, endpos):
+                if match.start() >= window_end:
+                    break
+                # A match running into endpos or as long as a span may have been cut at a bound
+                cut = match.end() == endpos < length or match.end() - match.start() >= self.max_span
+                if cut:
+                    result.complete = False
+                    if self._anchored_end and match.end() == endpos:
+                        skipped = True
+                        continue
+                result.matches.append(match)
+                resume = max(window_end, match.end())
+                if first_only:
+                    # Unless one was dropped before it, this is the match re.search finds
+                    result.scanned = match.end()
+                    result.complete = not (cut or skipped)
+                    return result, False
+            pos = resume
+            if pos < limit and time.perf_counter() - started > self.time_budget:
+                result.scanned = pos
+                result.complete = False
+                return result, True
+        return result, False
+
+    def _record(self, elapsed: float, result: PatternScan, length: int, exceeded: bool):
+        stats = self.stats
+        stats.calls += 1
+        stats.total_seconds += elapsed
+        stats.max_seconds = max(stats.max_seconds, elapsed)
+        stats.chars_scanned += result.scanned
+        if exceeded:
+            stats.budget_exceeded += 1
+            logger.warning(f"Pattern {self.name} stopped after {result.scanned:,} characters ({elapsed:.2f}s): over budget")
+        elif not result.complete:
+            logger.warning(f"Pattern {self.name} returned partial results: scanned {result.scanned:,} "
+                           f"of {length:,} characters, or a match reached a bound")
+        if not result.complete:
+            stats.partial_scans += 1
+
+
+class PatternRegistry:
+    """Named patterns shared by the parsers and extractors of one process."""
+
+    def __init__(self):
+        self._patterns: Dict[str, BudgetedPattern] = {}
+
+    def register(self, name: str, source: str, flags: int = 0, **options) -> BudgetedPattern:
+        """Compile ``source`` under ``name``, or return the pattern already registered for it.
+
+        ``options`` are BudgetedPattern's ``safe`` override and budgets.
+        """
+        pattern = self._patterns.get(name)
+        if pattern is None or pattern.source != source or pattern.flags != flags:
+            pattern = self._patterns[name] = BudgetedPattern(name, source, flags, **options)
+        return pattern
+
+    def get(self, name: str) -> BudgetedPattern:
+        return self._patterns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._patterns
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-pattern timing, slowest total first."""
+        ordered = sorted(self._patterns.values(), key=lambda pattern: pattern.stats.total_seconds, reverse=True)
+        return {pattern.name: {"safe": pattern.safe, **asdict(pattern.stats)} for pattern in ordered}
+
+    def reset_stats(self):
+        for pattern in self._patterns.values():
+            pattern.stats = PatternStats()
+
+
+_REGISTRY = PatternRegistry()
+
+
+def get_pattern_registry() -> PatternRegistry:
+    """Return the process-wide pattern registry."""
+    return _REGISTRY
+
+
+def register_pattern(name: str, source: str, flags: int = 0, **options) -> BudgetedPattern:
+    """Register a pattern in the process-wide registry."""
+    return _REGISTRY.register(name, source, flags, **options)
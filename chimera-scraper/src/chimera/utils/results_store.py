@@ -0,0 +1,362 @@
+"""Append-only segmented store for run results, indexed in SQLite."""
+
+import re
+import sqlite3
+import threading
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from loguru import logger
+
+from chimera.utils import serialization
+from chimera.utils.file_lock import file_lock
+
+
+DEFAULT_RESULTS_STORE_PATH = "output/results"
+
+SEGMENT_PATTERN = re.compile(r"^segment-(\d{6})\.jsonl$")
+
+# Legacy result files end with a ``_YYYYMMDD_HHMMSS`` timestamp
+LEGACY_TIMESTAMP = re.compile(r"^(?P<kind>.*?)_?(?P<stamp>\d{8}_\d{6})")
+
+
+@dataclass
+class RunRecord:
+    """Index entry for one stored run."""
+    run_id: str
+    kind: str
+    timestamp: datetime
+    status: str
+    segment: int
+    offset: int
+    length: int
+
+
+class ResultsStore:
+    """Run results appended as JSON lines to numbered segment files.
+
+    Each run (a test report, a scrape's insights, a harness session) is one
+    line in the current segment; a new segment starts once it passes
+    ``segment_bytes``. The SQLite index maps run ID, kind, timestamp and
+    status to the line's position, so history queries read the index and
+    seek straight to the matching runs instead of globbing and parsing a
+    directory of files.
+
+    Lines are self-describing, so a lost index is rebuilt from the
+    segments. Rewriting a run ID or deleting a run only updates the index;
+    ``compact`` rewrites the segments without the dead lines and runs every
+    ``compact_every`` appends.
+
+    Several processes may share a store (the test harnesses all write to one
+    directory). Appends, segment rotation, compaction and index rebuilds hold
+    an exclusive ``flock`` on ``store.lock``, and the current segment is read
+    from disk under that lock rather than cached, so a compaction in one
+    process never strands another's writes. Reads take the lock shared.
+    Compaction only ever writes to new segment numbers, so segment handles
+    opened before it keep returning the right lines.
+    """
+
+    def __init__(self, path: str = DEFAULT_RESULTS_STORE_PATH, segment_bytes: int = 16 * 1024 * 1024,
+                 compact_every: Optional[int] = 500):
+        self.directory = Path(path)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.compact_every = compact_every
+        self._appends = 0
+        self._lock = threading.RLock()
+        self._lock_path = self.directory / "store.lock"
+
+        self._connection = sqlite3.connect(str(self.directory / "index.db"), timeout=30, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS runs (
+                    run_id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    timestamp TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    segment INTEGER NOT NULL,
+                    offset INTEGER NOT NULL,
+                    length INTEGER NOT NULL
+                )
+            """)
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_runs_kind_time ON runs (kind, timestamp)")
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_runs_time ON runs (timestamp)")
+
+        if self._segments() and not self._connection.execute("SELECT 1 FROM runs LIMIT 1").fetchone():
+            self.rebuild_index()
+
+    @contextmanager
+    def _locked(self, shared: bool = False):
+        """Hold the thread lock and the cross-process store lock."""
+        with self._lock, file_lock(self._lock_path, shared=shared):
+            yield
+
+    def _segment_path(self, segment: int) -> Path:
+        return self.directory / f"segment-{segment:06d}.jsonl"
+
+    def _segments(self) -> List[int]:
+        return sorted(
+            int(match.group(1)) for match in
+            (SEGMENT_PATTERN.match(path.name) for path in self.directory.iterdir()) if match
+        )
+
+    def _write_lines(self, segment: int, lines: List[bytes]) -> List[int]:
+        """Append lines to a segment and return their offsets."""
+        offsets = []
+        with open(self._segment_path(segment), 'ab') as f:
+            for line in lines:
+                offsets.append(f.tell())
+                f.write(line)
+        return offsets
+
+    def append(self, kind: str, data: Any, status: str = "ok", run_id: Optional[str] = None,
+               timestamp: Optional[datetime] = None) -> str:
+        """Store one run's results and return its run ID.
+
+        Appending an existing ``run_id`` replaces that run.
+        """
+        timestamp = timestamp or datetime.now()
+        run_id = run_id or f"{kind}_{timestamp.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        line = serialization.dumpb({
+            "run_id": run_id,
+            "kind": kind,
+            "timestamp": timestamp.isoformat(),
+            "status": status,
+            "data": data
+        }) + b"\n"
+
+        with self._locked():
+            # Another process may have rotated or compacted since our last append
+            segments = self._segments()
+            segment = segments[-1] if segments else 1
+            path = self._segment_path(segment)
+            if path.exists() and path.stat().st_size + len(line) > self.segment_bytes:
+                segment += 1
+            offset = self._write_lines(segment, [line])[0]
+            with self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (run_id, kind, timestamp.isoformat(), status, segment, offset, len(line))
+                )
+            self._appends += 1
+            if self.compact_every and self._appends % self.compact_every == 0:
+                self._compact()
+
+        logger.debug(f"Stored {kind} run {run_id} in segment {segment}")
+        return run_id
+
+    def records(self, kind: Optional[str] = None, since: Optional[datetime] = None,
+                until: Optional[datetime] = None, status: Optional[str] = None,
+                limit: Optional[int] = None, newest_first: bool = False) -> List[RunRecord]:
+        """Index entries matching the filters, ordered by timestamp."""
+        clauses, params = [], []
+        for clause, value in (("kind = ?", kind), ("status = ?", status),
+                              ("timestamp >= ?", since.isoformat() if since else None),
+                              ("timestamp < ?", until.isoformat() if until else None)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+
+        sql = "SELECT * FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += f" ORDER BY timestamp {'DESC' if newest_first else 'ASC'}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(sql, params).fetchall()
+        return [
+            RunRecord(run_id, kind, datetime.fromisoformat(timestamp), status, segment, offset, length)
+            for run_id, kind, timestamp, status, segment, offset, length in rows
+        ]
+
+    def read(self, record: RunRecord) -> Dict[str, Any]:
+        """The stored run (``run_id``, ``kind``, ``timestamp``, ``status``, ``data``) for an index entry.
+
+        Entries are positions, so one fetched before a compaction may point
+        at a removed segment; ``get`` and ``iter_results`` look up and read
+        under one lock instead.
+        """
+        with self._locked(shared=True):
+            return self._read_line(record.segment, record.offset, record.length)
+
+    def _read_line(self, segment: int, offset: int, length: int) -> Dict[str, Any]:
+        with open(self._segment_path(segment), 'rb') as f:
+            f.seek(offset)
+            return serialization.loads(f.read(length))
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """A run by ID, or None."""
+        with self._locked(shared=True):
+            row = self._connection.execute(
+                "SELECT segment, offset, length FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+            return self._read_line(*row) if row else None
+
+    def iter_results(self, **filters) -> Iterator[Dict[str, Any]]:
+        """Stored runs matching ``records`` filters, in timestamp order.
+
+        Segments are opened once each, so a scan over weeks of runs costs
+        one index query plus a seek per run. The query and the opens happen
+        under the store lock, so the scan sees one consistent snapshot even
+        if another process compacts while it is being consumed.
+        """
+        handles: Dict[int, Any] = {}
+        try:
+            with self._locked(shared=True):
+                records = self.records(**filters)
+                for segment in {record.segment for record in records}:
+                    handles[segment] = open(self._segment_path(segment), 'rb')
+            for record in records:
+                f = handles[record.segment]
+                f.seek(record.offset)
+                yield serialization.loads(f.read(record.length))
+        finally:
+            for f in handles.values():
+                f.close()
+
+    def kinds(self) -> Dict[str, int]:
+        """Run count per kind."""
+        with self._lock:
+            return dict(self._connection.execute("SELECT kind, COUNT(*) FROM runs GROUP BY kind ORDER BY kind"))
+
+    def delete(self, run_id: str) -> bool:
+        """Drop a run from the index; its line is removed at the next compaction."""
+        with self._lock, self._connection:
+            return self._connection.execute("DELETE FROM runs WHERE run_id = ?", (run_id,)).rowcount > 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def compact(self) -> int:
+        """Rewrite live runs into fresh segments, dropping replaced and deleted lines.
+
+        Returns the number of bytes reclaimed.
+        """
+        with self._locked():
+            return self._compact()
+
+    def _compact(self) -> int:
+        old_segments = self._segments()
+        if not old_segments:
+            return 0
+        before = sum(self._segment_path(segment).stat().st_size for segment in old_segments)
+
+        rows = self._connection.execute(
+            "SELECT run_id, segment, offset, length FROM runs ORDER BY segment, offset"
+        ).fetchall()
+        segment = old_segments[-1] + 1
+        written, moves, pending = 0, [], []
+
+        def flush():
+            offsets = self._write_lines(segment, [line for _, line in pending])
+            moves.extend((segment, offset, run_id) for (run_id, _), offset in zip(pending, offsets))
+
+        handles: Dict[int, Any] = {}
+        try:
+            for run_id, old_segment, offset, length in rows:
+                f = handles.get(old_segment)
+                if f is None:
+                    f = handles[old_segment] = open(self._segment_path(old_segment), 'rb')
+                f.seek(offset)
+                line = f.read(length)
+                if pending and written + len(line) > self.segment_bytes:
+                    flush()
+                    segment, written, pending = segment + 1, 0, []
+                pending.append((run_id, line))
+                written += len(line)
+            if pending:
+                flush()
+            else:
+                # Keep the numbering moving forward even when nothing is live
+                self._segment_path(segment).touch()
+        finally:
+            for f in handles.values():
+                f.close()
+
+        with self._connection:
+            self._connection.executemany("UPDATE runs SET segment = ?, offset = ? WHERE run_id = ?", moves)
+        for old_segment in old_segments:
+            self._segment_path(old_segment).unlink()
+
+        after = sum(self._segment_path(segment).stat().st_size for segment in self._segments())
+        logger.info(f"Compacted results store {self.directory}: {len(rows)} runs, {before - after} bytes reclaimed")
+        return before - after
+
+    def rebuild_index(self):
+        """Recreate the index from the segment files; the last line for a run ID wins."""
+        with self._locked():
+            rows = []
+            for segment in self._segments():
+                with open(self._segment_path(segment), 'rb') as f:
+                    offset = 0
+                    for line in f:
+                        try:
+                            run = serialization.loads(line)
+                            rows.append((run["run_id"], run["kind"], run["timestamp"], run["status"],
+                                         segment, offset, len(line)))
+                        except (ValueError, KeyError):
+                            logger.warning(f"Skipping unreadable line at {segment}:{offset}")
+                        offset += len(line)
+            with self._connection:
+                self._connection.execute("DELETE FROM runs")
+                self._connection.executemany("INSERT OR REPLACE INTO runs VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            logger.info(f"Rebuilt results index for {self.directory} with {len(rows)} runs")
+
+    def import_files(self, paths: Iterable[str], kind: Optional[str] = None) -> int:
+        """Load legacy ``<kind>_YYYYMMDD_HHMMSS.json`` result files, keyed by file name.
+
+        The kind and timestamp come from the file name unless ``kind`` is
+        given; files already imported are skipped. Returns the number
+        imported.
+        """
+        imported = 0
+        for path in map(Path, paths):
+            match = LEGACY_TIMESTAMP.match(path.stem)
+            if self.get(path.stem) is not None:
+                continue
+            try:
+                data = serialization.loads(path.read_bytes())
+            except Exception as e:
+                logger.warning(f"Skipping unreadable result file {path}: {e}")
+                continue
+            timestamp = (datetime.strptime(match.group("stamp"), "%Y%m%d_%H%M%S") if match
+                         else datetime.fromtimestamp(path.stat().st_mtime))
+            file_kind = kind or (match.group("kind") if match and match.group("kind") else path.stem)
+            self.append(file_kind, data, status="imported", run_id=path.stem, timestamp=timestamp)
+            imported += 1
+        return imported
+
+    def close(self):
+        """Close the index connection."""
+        with self._lock:
+            self._connection.close()
+
+
+_RESULTS_STORES: Dict[str, ResultsStore] = {}
+
+
+def get_results_store(path: str = DEFAULT_RESULTS_STORE_PATH) -> ResultsStore:
+    """Return the process-wide results store for a path."""
+    if path not in _RESULTS_STORES:
+        _RESULTS_STORES[path] = ResultsStore(path)
+    return _RESULTS_STORES[path]
+
+
+def save_results(kind: str, data: Any, status: str = "ok", path: str = DEFAULT_RESULTS_STORE_PATH,
+                 run_id: Optional[str] = None) -> str:
+    """Append one run's results to the store at ``path`` and return its run ID.
+
+    The single write path for scrapers and test harnesses, in place of a
+    timestamped JSON file per run.
+    """
+    return get_results_store(path).append(kind, data, status=status, run_id=run_id)
@@ -0,0 +1,138 @@
+"""Stable review IDs and a persistent record of reviews already processed."""
+
+import hashlib
+import math
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from loguru import logger
+
+from chimera.analysis.dedup import normalize_text
+
+
+DEFAULT_SEEN_REVIEWS_PATH = "output/seen_reviews.db"
+
+
+def stable_review_id(source: str, author: Optional[str], text: str) -> str:
+    """Deterministic ID for a review, identical across runs and processes.
+
+    Derived from the platform, the normalized author and the normalized
+    review text (case, punctuation and markup do not matter). The review
+    date is left out on purpose: parsers fall back to the fetch time when a
+    page shows no date, which would give an undated review a new ID on every
+    run.
+    """
+    key = "\x1f".join((
+        source.lower(),
+        " ".join(normalize_text(author or "")),
+        " ".join(normalize_text(text)),
+    ))
+    return f"{source.lower()}_{hashlib.blake2b(key.encode('utf-8'), digest_size=10).hexdigest()}"
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings.
+
+    ``k`` bit positions per item come from one 128-bit BLAKE2b digest by
+    double hashing. Membership can be a false positive, never a false
+    negative.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "big"), int.from_bytes(digest[8:], "big") | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class SeenReviews:
+    """Persistent set of IDs of reviews already stored, which parsers skip.
+
+    The exact index is a SQLite table (WAL, so parse workers in several
+    processes can share it). An in-memory Bloom filter built from it at open
+    rules out new reviews without touching disk; only Bloom hits are
+    confirmed against the table. IDs another process adds later are missing
+    from this process's filter, so at worst such a review is enriched twice.
+    """
+
+    def __init__(self, path: str = DEFAULT_SEEN_REVIEWS_PATH, capacity: int = 1_000_000):
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS seen (review_id TEXT PRIMARY KEY, first_seen TEXT NOT NULL) WITHOUT ROWID"
+        )
+
+        count = self._connection.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+        self._bloom = BloomFilter(max(capacity, count * 2))
+        for (review_id,) in self._connection.execute("SELECT review_id FROM seen"):
+            self._bloom.add(review_id)
+        logger.debug(f"Loaded {count} seen review IDs from {path}")
+
+    def __contains__(self, review_id: str) -> bool:
+        if review_id not in self._bloom:
+            return False
+        with self._lock:
+            return self._connection.execute(
+                "SELECT 1 FROM seen WHERE review_id = ?", (review_id,)
+            ).fetchone() is not None
+
+    def add_many(self, review_ids: Iterable[str]) -> int:
+        """Record IDs in one transaction and return how many were new."""
+        seen = datetime.now().isoformat()
+        rows = [(review_id, seen) for review_id in dict.fromkeys(review_ids)]
+        if not rows:
+            return 0
+        with self._lock, self._connection:
+            before = self._connection.total_changes
+            self._connection.executemany("INSERT OR IGNORE INTO seen VALUES (?, ?)", rows)
+            added = self._connection.total_changes - before
+        for review_id, _ in rows:
+            self._bloom.add(review_id)
+        return added
+
+    def add(self, review_id: str) -> bool:
+        """Record one ID; True when it was not seen before."""
+        return self.add_many([review_id]) == 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+
+_SEEN_REVIEWS: Dict[str, SeenReviews] = {}
+
+
+def get_seen_reviews(path: str) -> SeenReviews:
+    """Return the process-wide seen-set for a path.
+
+    Parsers are created per page, so sharing the set keeps the Bloom filter
+    from being rebuilt for every page.
+    """
+    if path not in _SEEN_REVIEWS:
+        _SEEN_REVIEWS[path] = SeenReviews(path)
+    return _SEEN_REVIEWS[path]
@@ -0,0 +1,264 @@
+"""SQLite-backed review history with upserts and indexed queries."""
+
+import asyncio
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from loguru import logger
+
+from chimera.models.review import EnhancedReview, ReviewBatch
+from chimera.utils import serialization
+
+
+DEFAULT_REVIEW_STORE_PATH = "output/reviews.db"
+
+# Model fields stored as JSON text
+JSON_FIELDS = ("competitor_mentions", "feature_mentions", "pain_points", "pros", "cons", "raw_data")
+
+REVIEW_COLUMNS = (
+    "review_id", "source", "target_company", "batch_id", "title", "content", "rating", "author",
+    "author_role", "date", "url", "sentiment_score", "sentiment_label", "competitor_mentions",
+    "feature_mentions", "pain_points", "pros", "cons", "review_quality_score", "extraction_confidence",
+    "word_count", "use_case", "industry", "extraction_method", "selector_used", "extraction_timestamp",
+    "raw_data", "first_seen", "last_seen"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reviews (
+    review_id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    target_company TEXT,
+    batch_id TEXT,
+    title TEXT,
+    content TEXT,
+    rating REAL,
+    author TEXT,
+    author_role TEXT,
+    date TEXT,
+    url TEXT,
+    sentiment_score REAL,
+    sentiment_label TEXT,
+    competitor_mentions TEXT,
+    feature_mentions TEXT,
+    pain_points TEXT,
+    pros TEXT,
+    cons TEXT,
+    review_quality_score REAL,
+    extraction_confidence REAL,
+    word_count INTEGER,
+    use_case TEXT,
+    industry TEXT,
+    extraction_method TEXT,
+    selector_used TEXT,
+    extraction_timestamp TEXT,
+    raw_data TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reviews_source_company_date ON reviews (source, target_company, date);
+CREATE INDEX IF NOT EXISTS idx_reviews_rating ON reviews (rating);
+
+CREATE TABLE IF NOT EXISTS batches (
+    batch_id TEXT PRIMARY KEY,
+    source_platform TEXT,
+    target_company TEXT,
+    extraction_date TEXT,
+    total_reviews INTEGER,
+    successful_extractions INTEGER,
+    failed_extractions INTEGER,
+    average_rating REAL,
+    sentiment_distribution TEXT,
+    extraction_metadata TEXT
+);
+"""
+
+# Sentiment, mentions and quality scores; only present when the scraper computed them
+ENRICHMENT_COLUMNS = (
+    "sentiment_score", "sentiment_label", "competitor_mentions", "feature_mentions", "pain_points",
+    "review_quality_score", "use_case", "industry"
+)
+_KEPT_WHEN_MISSING = ("target_company", "batch_id") + ENRICHMENT_COLUMNS
+
+# first_seen is kept from the original insert; everything else follows the latest scrape.
+# Enrichment a later scrape did not produce is not erased.
+_UPSERT = f"""
+INSERT INTO reviews ({', '.join(REVIEW_COLUMNS)})
+VALUES ({', '.join('?' for _ in REVIEW_COLUMNS)})
+ON CONFLICT(review_id) DO UPDATE SET
+{', '.join(
+    f'{column} = COALESCE(excluded.{column}, {column})' if column in _KEPT_WHEN_MISSING else f'{column} = excluded.{column}'
+    for column in REVIEW_COLUMNS if column not in ('review_id', 'first_seen')
+)}
+"""
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+class ReviewStore:
+    """Review history in a local SQLite database running in WAL mode.
+
+    Reviews are upserted by ``review_id``, so re-scraping a target updates
+    rows instead of piling up duplicates, and every write is one transaction
+    however many reviews it carries. ``(source, target_company, date)`` and
+    ``rating`` are indexed for the query helpers below. WAL lets readers (for
+    example an analysis notebook) query while a scrape is writing.
+
+    One connection is shared behind a lock; the async methods run the
+    blocking work in a thread so the event loop keeps moving.
+    """
+
+    def __init__(self, path: str = DEFAULT_REVIEW_STORE_PATH):
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "ReviewStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    @staticmethod
+    def _row_values(review: EnhancedReview, target_company: Optional[str], batch_id: Optional[str],
+                    seen: str) -> tuple:
+        values = {
+            "review_id": review.id,
+            "source": review.source,
+            "target_company": target_company,
+            "batch_id": batch_id,
+            "date": _timestamp(review.date),
+            "sentiment_label": review.sentiment_label.value if getattr(review, "sentiment_label", None) else None,
+            "extraction_timestamp": _timestamp(getattr(review, "extraction_timestamp", None)),
+            "first_seen": seen,
+            "last_seen": seen,
+        }
+        for column in REVIEW_COLUMNS:
+            if column not in values:
+                value = getattr(review, column, None)
+                # An empty mention list means "not enriched" and is stored as NULL, like a missing score
+                if column in ENRICHMENT_COLUMNS and value == []:
+                    value = None
+                values[column] = serialization.dumps(value) if column in JSON_FIELDS and value is not None else value
+        return tuple(values[column] for column in REVIEW_COLUMNS)
+
+    def upsert_reviews(self, reviews: Iterable[EnhancedReview], target_company: Optional[str] = None,
+                       batch_id: Optional[str] = None) -> int:
+        """Insert or update reviews in a single transaction and return how many were written."""
+        seen = datetime.now().isoformat()
+        rows = [self._row_values(review, target_company, batch_id, seen) for review in reviews]
+        if not rows:
+            return 0
+        with self._lock, self._connection:
+            self._connection.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def save_batch(self, batch: ReviewBatch) -> int:
+        """Store a batch's reviews and its statistics together, atomically."""
+        seen = datetime.now().isoformat()
+        rows = [self._row_values(review, batch.target_company, batch.batch_id, seen) for review in batch.reviews]
+        with self._lock, self._connection:
+            self._connection.executemany(_UPSERT, rows)
+            self._connection.execute(
+                "INSERT OR REPLACE INTO batches VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (batch.batch_id, batch.source_platform, batch.target_company, _timestamp(batch.extraction_date),
+                 batch.total_reviews, batch.successful_extractions, batch.failed_extractions, batch.average_rating,
+                 serialization.dumps(batch.sentiment_distribution) if batch.sentiment_distribution is not None else None,
+                 serialization.dumps(batch.extraction_metadata) if batch.extraction_metadata is not None else None)
+            )
+        logger.info(f"Stored batch {batch.batch_id}: {len(rows)} reviews for {batch.target_company}")
+        return len(rows)
+
+    async def save_reviews_batch(self, batch: ReviewBatch) -> int:
+        """Async ``save_batch`` for the orchestrators."""
+        return await asyncio.to_thread(self.save_batch, batch)
+
+    @staticmethod
+    def _where(source: Optional[str] = None, target_company: Optional[str] = None,
+               since: Optional[datetime] = None, until: Optional[datetime] = None,
+               min_rating: Optional[float] = None, max_rating: Optional[float] = None,
+               sentiment: Optional[str] = None) -> tuple:
+        clauses, params = [], []
+        for clause, value in (
+            ("source = ?", source),
+            ("target_company = ?", target_company),
+            ("date >= ?", _timestamp(since)),
+            ("date < ?", _timestamp(until)),
+            ("rating >= ?", min_rating),
+            ("rating <= ?", max_rating),
+            ("sentiment_label = ?", sentiment),
+        ):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def query(self, source: Optional[str] = None, target_company: Optional[str] = None,
+              since: Optional[datetime] = None, until: Optional[datetime] = None,
+              min_rating: Optional[float] = None, max_rating: Optional[float] = None,
+              sentiment: Optional[str] = None, limit: Optional[int] = None) -> List[EnhancedReview]:
+        """Reviews matching every given filter, newest first.
+
+        ``since`` is inclusive and ``until`` exclusive; ``sentiment`` is a
+        ``ReviewSentiment`` value such as ``"negative"``.
+        """
+        where, params = self._where(source, target_company, since, until, min_rating, max_rating, sentiment)
+        sql = f"SELECT * FROM reviews{where} ORDER BY date DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [self._to_review(row) for row in self._execute(sql, params)]
+
+    def count(self, **filters) -> int:
+        """Number of reviews matching the same filters as ``query``."""
+        where, params = self._where(**filters)
+        return self._execute(f"SELECT COUNT(*) FROM reviews{where}", params)[0][0]
+
+    def rating_summary(self, group_by: str = "target_company", **filters) -> List[Dict[str, Any]]:
+        """Review count, average rating and sentiment split per company or source."""
+        if group_by not in ("target_company", "source"):
+            raise ValueError("group_by must be 'target_company' or 'source'")
+        where, params = self._where(**filters)
+        rows = self._execute(
+            f"""SELECT {group_by} AS name, COUNT(*) AS reviews, AVG(rating) AS average_rating,
+                       AVG(sentiment_score) AS average_sentiment,
+                       SUM(sentiment_label = 'positive') AS positive,
+                       SUM(sentiment_label = 'negative') AS negative,
+                       SUM(sentiment_label = 'neutral') AS neutral,
+                       MIN(date) AS first_review, MAX(date) AS last_review
+                FROM reviews{where} GROUP BY {group_by} ORDER BY reviews DESC""",
+            params
+        )
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def _to_review(row: sqlite3.Row) -> EnhancedReview:
+        data = dict(row)
+        for column in ("target_company", "batch_id", "first_seen", "last_seen"):
+            data.pop(column)
+        for column in JSON_FIELDS:
+            if data[column] is not None:
+                data[column] = serialization.loads(data[column])
+        for column in JSON_FIELDS[:-1]:
+            if data[column] is None:
+                data[column] = []
+        return EnhancedReview(**data)
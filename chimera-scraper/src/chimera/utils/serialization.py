@@ -0,0 +1,159 @@
+"""JSON encoding and decoding of dataclasses and review models through cached per-type plans."""
+
+import dataclasses
+import enum
+import json
+import typing
+from datetime import date, datetime, time
+from pathlib import Path
+from typing import Any, Callable, Dict, IO, Optional, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+T = TypeVar("T")
+
+# type -> function returning a JSON-ready value for one instance (shallow)
+_ENCODE_PLANS: Dict[type, Callable[[Any], Any]] = {}
+
+# annotation -> function rebuilding a typed value from decoded JSON
+_DECODE_PLANS: Dict[Any, Callable[[Any], Any]] = {}
+
+
+def _field_plan(names) -> Callable[[Any], Dict[str, Any]]:
+    names = tuple(names)
+    return lambda obj: {key: getattr(obj, name) for name, key in names}
+
+
+def _encode_plan(cls: type) -> Callable[[Any], Any]:
+    """Build the encoder for a type once; later instances reuse it."""
+    if dataclasses.is_dataclass(cls):
+        return _field_plan((field.name, field.name) for field in dataclasses.fields(cls))
+    if issubclass(cls, BaseModel):
+        # Field aliases, as the JSON and CSV exports write them (``review_id``)
+        return _field_plan((name, field.alias or name) for name, field in cls.model_fields.items())
+    if issubclass(cls, (datetime, date, time)):
+        return cls.isoformat
+    if issubclass(cls, enum.Enum):
+        return lambda value: value.value
+    if issubclass(cls, (set, frozenset)):
+        return list
+    if hasattr(cls, "item") and hasattr(cls, "dtype"):
+        # NumPy scalars
+        return lambda value: value.item()
+    return str
+
+
+def encode_default(obj: Any) -> Any:
+    """``default`` hook for ``json`` and ``orjson``: one level of a non-JSON value.
+
+    Nested values go back through the C encoder, which calls this again only
+    for what it cannot write itself, so nothing is deep-copied.
+    """
+    plan = _ENCODE_PLANS.get(type(obj))
+    if plan is None:
+        plan = _ENCODE_PLANS[type(obj)] = _encode_plan(type(obj))
+    return plan(obj)
+
+
+def to_dict(obj: Any) -> Dict[str, Any]:
+    """Shallow field dict of a dataclass or model.
+
+    Replaces ``dataclasses.asdict`` where its recursive deep copy is not
+    needed; nested values are shared, not copied.
+    """
+    return encode_default(obj)
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """Serialize to a JSON string; ``indent`` may be None or 2 with orjson.
+
+    The stdlib fallback escapes non-ASCII characters like ``json.dumps``;
+    orjson writes them as-is, so files receiving the text are opened as UTF-8.
+    """
+    return _encode(obj, indent, ensure_ascii=True).decode("utf-8")
+
+
+def dumpb(obj: Any, indent: Optional[int] = None) -> bytes:
+    """Serialize to UTF-8 JSON bytes."""
+    return _encode(obj, indent, ensure_ascii=False)
+
+
+def _encode(obj: Any, indent: Optional[int], ensure_ascii: bool) -> bytes:
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=encode_default, option=option)
+        except TypeError:
+            # Integers beyond 64 bits and other values only the stdlib writes
+            pass
+    return json.dumps(obj, default=encode_default, indent=indent, ensure_ascii=ensure_ascii).encode("utf-8")
+
+
+def dump(obj: Any, fp: IO[str], indent: Optional[int] = None):
+    """Serialize to an open text file."""
+    fp.write(dumps(obj, indent))
+
+
+def _decode_plan(annotation: Any) -> Callable[[Any], Any]:
+    """Build the decoder for a type annotation once."""
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+
+    if origin is Union:
+        options = [arg for arg in args if arg is not type(None)]
+        if len(options) == 1:
+            inner = decoder_for(options[0])
+            return lambda value: None if value is None else inner(value)
+        return lambda value: value
+    if origin in (list, tuple, set, frozenset) and args:
+        inner = decoder_for(args[0])
+        return lambda value: origin(inner(item) for item in value)
+    if origin is dict and len(args) == 2:
+        inner = decoder_for(args[1])
+        return lambda value: {key: inner(item) for key, item in value.items()}
+    if not isinstance(annotation, type):
+        return lambda value: value
+
+    if dataclasses.is_dataclass(annotation):
+        hints = typing.get_type_hints(annotation)
+        fields = [(field.name, decoder_for(hints.get(field.name, Any)))
+                  for field in dataclasses.fields(annotation) if field.init]
+        return lambda value: annotation(**{name: decode(value[name]) for name, decode in fields if name in value})
+    if issubclass(annotation, BaseModel):
+        return annotation.model_validate
+    if issubclass(annotation, datetime):
+        return lambda value: annotation.fromisoformat(value) if isinstance(value, str) else value
+    if issubclass(annotation, date):
+        return lambda value: annotation.fromisoformat(value) if isinstance(value, str) else value
+    if issubclass(annotation, enum.Enum):
+        return annotation
+    if annotation is Path:
+        return Path
+    return lambda value: value
+
+
+def decoder_for(annotation: Any) -> Callable[[Any], Any]:
+    """Cached decoder turning decoded JSON into an instance of ``annotation``."""
+    plan = _DECODE_PLANS.get(annotation)
+    if plan is None:
+        plan = _DECODE_PLANS[annotation] = _decode_plan(annotation)
+    return plan
+
+
+def loads(data: Union[str, bytes], cls: Optional[Type[T]] = None) -> Any:
+    """Parse JSON, rebuilding ``cls`` (dataclass, model, ``List[...]``...) when given."""
+    value = orjson.loads(data) if orjson is not None else json.loads(data)
+    return value if cls is None else decoder_for(cls)(value)
+
+
+def from_jsonable(value: Any, cls: Type[T]) -> T:
+    """Rebuild ``cls`` from already decoded JSON data."""
+    return decoder_for(cls)(value)
@@ -1,25 +1,185 @@
-import json
+import asyncio
 import csv
 import aiofiles
-from typing import List
+from typing import Any, Iterable, List, Optional
 from datetime import datetime
 from pathlib import Path
 
+from loguru import logger
+
 from chimera.models.review import Review
+from chimera.utils import serialization
+
+# Queue marker that tells the sink's writer task to drain and stop
+_CLOSE = object()
+
+
+def _review_to_json(review: Any) -> str:
+    """One review as a compact JSON object."""
+    return serialization.dumps(review)
+
+
+class ReviewSink:
+    """Streams reviews to disk from a background writer task.
+    
+    Producers ``await write()`` into a bounded queue, so a slow disk applies
+    backpressure instead of growing memory. The writer serializes each review
+    to one compact JSON line and flushes every ``flush_every`` reviews or
+    ``flush_interval`` seconds, whichever comes first. When ``rotate_bytes`` or
+    ``rotate_seconds`` is reached the next file is ``<stem>.<n><suffix>``.
+    
+    With ``array=True`` every file is a JSON array (one review per line inside
+    the brackets) rather than JSON Lines.
+    """
+    
+    def __init__(self, path: str, max_queue: int = 1000, flush_every: int = 100,
+                 flush_interval: float = 1.0, rotate_bytes: Optional[int] = None,
+                 rotate_seconds: Optional[float] = None, array: bool = False):
+        self.path = Path(path)
+        self.max_queue = max_queue
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self.rotate_bytes = rotate_bytes
+        self.rotate_seconds = rotate_seconds
+        self.array = array
+        
+        self.files: List[str] = []
+        self.stats = {"written": 0, "flushes": 0, "bytes": 0}
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._error: Optional[BaseException] = None
+    
+    async def __aenter__(self) -> "ReviewSink":
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def start(self):
+        """Start the writer task; called implicitly by the first write."""
+        if self._task is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._queue = asyncio.Queue(maxsize=self.max_queue)
+            self._task = asyncio.create_task(self._run())
+    
+    async def write(self, review: Any):
+        """Queue one review (a model or a dict), waiting while the queue is full."""
+        if self._error is not None:
+            raise self._error
+        await self.start()
+        await self._queue.put(review)
+    
+    async def write_many(self, reviews: Iterable[Any]):
+        """Queue several reviews in order."""
+        for review in reviews:
+            await self.write(review)
+    
+    async def close(self) -> List[str]:
+        """Flush everything queued, close the current file and return all file paths."""
+        if self._task is not None:
+            await self._queue.put(_CLOSE)
+            await self._task
+            self._task = None
+        if self._error is not None:
+            raise self._error
+        return self.files
+    
+    def _file_path(self, index: int) -> Path:
+        if index == 0:
+            return self.path
+        return self.path.with_name(f"{self.path.stem}.{index}{self.path.suffix}")
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        f = None
+        file_bytes = 0
+        opened_at = 0.0
+        buffer: List[str] = []
+        buffered_bytes = 0
+        
+        async def flush():
+            nonlocal file_bytes, buffered_bytes
+            if not buffer:
+                return
+            await f.write(''.join(buffer))
+            await f.flush()
+            file_bytes += buffered_bytes
+            self.stats["bytes"] += buffered_bytes
+            self.stats["flushes"] += 1
+            buffer.clear()
+            buffered_bytes = 0
+        
+        async def close_file():
+            await flush()
+            if self.array:
+                await f.write("\n]\n")
+            await f.close()
+        
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=self.flush_interval)
+                except asyncio.TimeoutError:
+                    if f is not None:
+                        await flush()
+                    continue
+                
+                if item is _CLOSE:
+                    break
+                
+                if f is not None and (
+                    (self.rotate_bytes and file_bytes + buffered_bytes >= self.rotate_bytes)
+                    or (self.rotate_seconds and loop.time() - opened_at >= self.rotate_seconds)
+                ):
+                    await close_file()
+                    f = None
+                
+                line = _review_to_json(item)
+                if f is None:
+                    file_path = self._file_path(len(self.files))
+                    f = await aiofiles.open(file_path, 'w', encoding='utf-8')
+                    self.files.append(str(file_path))
+                    file_bytes = 0
+                    opened_at = loop.time()
+                    line = "[\n" + line if self.array else line + "\n"
+                else:
+                    line = ",\n" + line if self.array else line + "\n"
+                
+                buffer.append(line)
+                buffered_bytes += len(line)
+                self.stats["written"] += 1
+                
+                if len(buffer) >= self.flush_every:
+                    await flush()
+            
+            if f is not None:
+                await close_file()
+            elif self.array:
+                # Nothing was written; still leave a valid empty document
+                async with aiofiles.open(self.path, 'w', encoding='utf-8') as empty:
+                    await empty.write("[]\n")
+                self.files.append(str(self.path))
+        
+        except Exception as e:
+            logger.error(f"Review sink writing {self.path} failed: {e}")
+            self._error = e
+            if f is not None:
+                await f.close()
+            # Keep draining so producers blocked on a full queue are released
+            while await self._queue.get() is not _CLOSE:
+                pass
+
 
 async def save_to_json(reviews: List[Review], filename: str = None):
     """Save reviews to JSON file."""
     if not filename:
         filename = f"reviews_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     
-    # Create directory if it doesn't exist
-    Path("output").mkdir(exist_ok=True)
-    
     filepath = f"output/{filename}"
-    data = [review.dict(by_alias=True) for review in reviews]
     
-    async with aiofiles.open(filepath, 'w', encoding='utf-8') as f:
-        await f.write(json.dumps(data, indent=2, default=str))
+    async with ReviewSink(filepath, array=True) as sink:
+        await sink.write_many(reviews)
         
     return filepath
 
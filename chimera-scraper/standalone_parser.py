@@ -95,12 +95,14 @@ class StandaloneHeadToHeadParser:
             "Predictive Analytics"
         ]
         
-        self.summary_patterns = {
+        # Compiled once; this parser stays free of chimera imports
+        summary_sources = {
             "score_comparison": r"scoring\s+(\d+\.?\d*)\s+compared\s+to\s+[^\']*?(\d+\.?\d*)",
             "feature_mention": r"(?:excel|excels|superior|stronger|better|trails|behind)\s+(?:in|at)\s+([^,]+)",
             "sentiment_indicators": r"(?:excellent|fantastic|superior|better|trails|behind|lower|stronger|weaker)",
             "product_names": r"(?:Microsoft Power BI|Power BI|Domo|Tableau|Qlik|Snowflake|Databricks)"
         }
+        self.summary_patterns = {name: re.compile(source) for name, source in summary_sources.items()}
     
     def parse_head_to_head_comparison(self, html: str, url: str) -> HeadToHeadComparisonData:
         """Parse a G2 head-to-head comparison page comprehensively."""
@@ -299,7 +301,7 @@ class StandaloneHeadToHeadParser:
         try:
             # Extract scores if present
             import re
-            score_match = re.search(self.summary_patterns["score_comparison"], point_text)
+            score_match = self.summary_patterns["score_comparison"].search(point_text)
             product_a_score = None
             product_b_score = None
             
@@ -0,0 +1,42 @@
+"""Tests for the Parquet review export."""
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from chimera.models.review import EnhancedReview, ReviewBatch, ReviewSentiment
+from chimera.utils.columnar import read_reviews_parquet, review_schema, write_batches_parquet
+
+
+def _review(i, day):
+    return EnhancedReview(
+        review_id=f"r{i}", source="G2", title=f"Review {i}", content="Solid reporting", rating=4.0,
+        author="Analyst", date=datetime(2024, 1, day), url="https://g2.com/r",
+        sentiment_label=ReviewSentiment.POSITIVE, pros=["fast", "cheap"], raw_data={"selector": ".review"}
+    )
+
+
+def test_schema_covers_every_review_field():
+    """Each EnhancedReview field becomes a column, named by its alias."""
+    schema = review_schema()
+    assert len(schema) == len(EnhancedReview.model_fields)
+    assert "review_id" in schema.names
+    assert str(schema.field("pros").type) == "list<item: string>"
+    assert str(schema.field("source").type).startswith("dictionary")
+
+
+def test_partitioned_round_trip(tmp_path):
+    """Batches land in platform/competitor/day partitions and filters prune them."""
+    batches = [
+        ReviewBatch(batch_id="a", source_platform="G2", target_company="Looker", reviews=[_review(1, 1), _review(2, 2)]),
+        ReviewBatch(batch_id="b", source_platform="Capterra", target_company="Power BI", reviews=[_review(3, 1)]),
+    ]
+    write_batches_parquet(batches, str(tmp_path))
+
+    assert (tmp_path / "platform=capterra" / "competitor=power-bi" / "day=2024-01-01").is_dir()
+
+    table = read_reviews_parquet(str(tmp_path), columns=["review_id", "pros", "sentiment_label"],
+                                 filters={"competitor": "looker", "day": ["2024-01-02"]})
+    assert table.to_pylist() == [{"review_id": "r2", "pros": ["fast", "cheap"], "sentiment_label": "positive"}]
+    assert read_reviews_parquet(str(tmp_path)).num_rows == 3
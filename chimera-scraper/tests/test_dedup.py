@@ -0,0 +1,37 @@
+"""Tests for near-duplicate review detection."""
+from chimera.analysis.dedup import NearDuplicateIndex, deduplicate, simhash
+
+
+TEXT = ("The dashboard features and reporting tool are great for our analytics work, and support "
+        "was quick to respond when we hit a problem with the connector.")
+
+
+def test_markup_and_case_do_not_change_the_fingerprint():
+    """Normalization strips tags, punctuation and case before hashing."""
+    assert simhash(TEXT) == simhash(f"<p>{TEXT.upper()}</p>\n")
+    assert simhash("<div></div>") is None
+
+
+def test_index_matches_near_duplicates_within_scope():
+    """Lightly edited copies match; other reviews and other authors do not."""
+    index = NearDuplicateIndex()
+    assert index.add("r1", TEXT, "jane d.") is None
+    assert index.add("r2", TEXT + " Would recommend.", "jane d.") == "r1"
+    assert index.add("r3", TEXT, "john s.") is None
+    assert index.add("r4", "Pricing is far too high for small teams and the editor is slow to load.", "jane d.") is None
+    assert len(index) == 3
+
+
+def test_deduplicate_keeps_first_occurrence():
+    """Only the first of each near-duplicate group survives, in order."""
+    reviews = [
+        {"author": "a", "text": TEXT},
+        {"author": "b", "text": "Setup took weeks and the documentation is thin."},
+        {"author": "a", "text": f"<span>{TEXT}</span>"},
+    ]
+    unique = deduplicate(reviews, lambda r: r["text"], lambda r: r["author"])
+    assert unique == reviews[:2]
+
+    shared = NearDuplicateIndex()
+    deduplicate(reviews[:1], lambda r: r["text"], index=shared)
+    assert deduplicate(reviews, lambda r: r["text"], index=shared) == reviews[1:2]
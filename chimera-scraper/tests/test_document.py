@@ -0,0 +1,77 @@
+"""Tests for the indexed document model."""
+import re
+import pytest
+from bs4 import BeautifulSoup
+from chimera.parsers.document import IndexedDocument
+
+
+SAMPLE_HTML = """
+<html>
+<head><title>Compare Domo and Power BI</title></head>
+<body>
+    <div aria-label="Comparison Summary" class="compare-container-v2_summary wide">
+        <div class="mb-1/4">AI Generated Summary</div>
+        <span>AI-generated. Powered by real user reviews.</span>
+        <ul>
+            <li>Domo excels in Data Visualization, scoring 8.7 compared to Power BI's 9.2.</li>
+            <li>Power BI trails in Ease of Setup.</li>
+        </ul>
+    </div>
+    <div aria-label="Domo star rating is 4.3 out of 5" class="rating">4.3</div>
+    <div id="pricing">Pricing</div>
+    <span class="user-name">Jane D.</span>
+    <p class="review-text">Great dashboards and reports.</p>
+    <a href="/products/tableau/reviews">Tableau</a>
+</body>
+</html>
+"""
+
+
+@pytest.fixture
+def documents():
+    """Build the indexed document and a plain soup over the same markup."""
+    return IndexedDocument(SAMPLE_HTML), BeautifulSoup(SAMPLE_HTML, 'lxml')
+
+
+def test_find_all_matches_beautifulsoup(documents):
+    """Indexed lookups return the same nodes, in order, as BeautifulSoup."""
+    doc, soup = documents
+
+    queries = [
+        dict(name='div', attrs={'aria-label': re.compile(r'star rating', re.I)}),
+        dict(name='div', class_='compare-container-v2_summary'),
+        dict(name='div', class_=re.compile(r'summary')),
+        dict(name=['p', 'span'], class_=re.compile(r'review|name')),
+        dict(name='div', attrs={'id': 'pricing'}),
+        dict(name='div', string=re.compile(r'pricing', re.I)),
+        dict(name='a', attrs={'href': re.compile(r'/products/')}),
+    ]
+
+    for query in queries:
+        expected = [str(node) for node in soup.find_all(**query)]
+        assert [str(node) for node in doc.find_all(**query)] == expected
+
+
+def test_within_scopes_to_descendants(documents):
+    """Scoped queries only see the section's subtree."""
+    doc, soup = documents
+    section = doc.find('div', attrs={'aria-label': 'Comparison Summary'})
+
+    items = doc.find_all('li', within=section)
+    assert [doc.text(item, strip=True) for item in items] == [
+        item.get_text(strip=True) for item in soup.find('div', attrs={'aria-label': 'Comparison Summary'}).find_all('li')
+    ]
+    assert doc.find('div', attrs={'aria-label': 'Comparison Summary'}, within=section) is None
+    assert doc.find_string(re.compile(r'AI-generated'), within=section) is not None
+    assert doc.find_string(re.compile(r'Tableau'), within=section) is None
+
+
+def test_find_previous_and_text_cache(documents):
+    """find_previous walks backwards in document order and text is cached."""
+    doc, _ = documents
+    review = doc.find('p', class_='review-text')
+
+    name_element = doc.find_previous(review, ['span', 'div'], class_=re.compile(r'name|user'))
+    assert doc.text(name_element, strip=True) == "Jane D."
+    assert doc.text(review) is doc.text(review)
+    assert 'Tableau' in doc.page_text
@@ -0,0 +1,62 @@
+"""Tests for the off-event-loop parse executor."""
+import pytest
+from chimera.parsers.capterra import CapterraParser
+from chimera.parsers.executor import ParseExecutor
+from chimera.utils.review_ids import get_seen_reviews
+
+
+REVIEW = """<div class="review-item"><div class="rating">4.{i}</div><span class="reviewer-name">Jane Doe{i}</span>
+<time datetime="2024-01-1{i}">Jan</time><p>The dashboard features and reporting tool are great for our analytics work, review {i}.</p></div>"""
+HTML = "<html><body><nav>menu</nav>" + "".join(REVIEW.format(i=i) for i in range(5)) + "</body></html>"
+URL = "https://capterra.com/test"
+
+
+def _fields(reviews):
+    return [review.model_dump(exclude={"extraction_timestamp"}) for review in reviews]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["inline", "thread", "process"])
+async def test_executor_matches_direct_parsing(mode):
+    """Reviews parsed in a worker come back identical to parsing on the loop."""
+    expected = await CapterraParser().extract_reviews(HTML, URL)
+    executor = ParseExecutor(mode, max_workers=1)
+    try:
+        results = [await executor.extract_reviews("capterra", HTML, URL) for _ in range(2)]
+    finally:
+        executor.shutdown()
+
+    assert len(expected) == 5
+    assert all(_fields(reviews) == _fields(expected) for reviews in results)
+
+    metrics = executor.get_metrics()
+    assert metrics["completed"] == 2 and metrics["failed"] == 0
+    assert metrics["queue_depth"] == 0 and metrics["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_executor_rejects_unknown_parser():
+    """Unknown parser names fail before anything is queued."""
+    executor = ParseExecutor("inline")
+    with pytest.raises(ValueError):
+        await executor.parse("unknown", HTML, URL)
+    with pytest.raises(ValueError):
+        await executor.extract_reviews("trustradius", HTML, URL)
+    assert executor.get_metrics()["submitted"] == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["inline", "process"])
+async def test_review_page_reports_reviews_skipped_as_seen(mode, tmp_path):
+    """IDs the worker's parser skipped come back with the page's new reviews."""
+    path = str(tmp_path / "seen.db")
+    expected = await CapterraParser().extract_reviews(HTML, URL)
+    get_seen_reviews(path).add_many(review.id for review in expected[:2])
+    executor = ParseExecutor(mode, max_workers=1)
+    try:
+        reviews, skipped_ids = await executor.extract_review_page("capterra", HTML, URL, seen_reviews_path=path)
+    finally:
+        executor.shutdown()
+
+    assert [review.id for review in reviews] == [review.id for review in expected[2:]]
+    assert sorted(skipped_ids) == sorted(review.id for review in expected[:2])
@@ -0,0 +1,64 @@
+"""Tests for the columnar ReviewFrame."""
+from datetime import datetime
+
+import numpy as np
+from chimera.analysis.frame import ReviewFrame
+from chimera.models.review import EnhancedReview, ReviewBatch
+
+
+def _review(i):
+    return EnhancedReview(
+        review_id=f"r{i}", source="G2" if i % 2 else "Capterra", title=f"Review {i}",
+        content="Solid reporting " * (i + 1), rating=float(i % 5 + 1), author=f"Analyst {i}",
+        author_role="Data Engineer" if i % 3 else None, date=datetime(2024, 1, i + 1), url="https://g2.com/looker",
+        raw_data={"html": f"<div>{i}</div>"} if i % 2 else None,
+        sentiment_score=0.1 * i if i % 4 else None, sentiment_label="positive" if i % 2 else "negative",
+        competitor_mentions=["Tableau"] if i % 2 else [], pros=["Fast", "Cheap"][:i % 3],
+        word_count=3 * (i + 1), extraction_confidence=0.9 if i % 2 else 0.3,
+        extraction_timestamp=datetime(2024, 2, 1, 12, 30, 0, 5)
+    )
+
+
+REVIEWS = [_review(i) for i in range(8)]
+
+
+def test_round_trip_is_lossless():
+    frame = ReviewFrame.from_reviews(REVIEWS, "Looker")
+    assert len(frame) == 8
+    assert frame.to_reviews() == REVIEWS
+    assert frame.review(3) == REVIEWS[3]
+
+
+def test_group_by_aggregates_skip_missing_values():
+    frame = ReviewFrame.from_reviews(REVIEWS)
+    groups = frame.group_by("source", rating="mean", sentiment_score="max", word_count="sum")
+
+    g2 = [review for review in REVIEWS if review.source == "G2"]
+    assert groups["G2"]["count"] == len(g2)
+    assert groups["G2"]["rating_mean"] == np.mean([review.rating for review in g2])
+    assert groups["Capterra"]["sentiment_score_max"] == max(
+        review.sentiment_score for review in REVIEWS if review.source == "Capterra" and review.sentiment_score is not None
+    )
+    assert groups["G2"]["word_count_sum"] == sum(review.word_count for review in g2)
+
+
+def test_concat_filter_and_counts():
+    """Frames from several targets combine, with categories merged."""
+    frame = ReviewFrame.concat([ReviewFrame.from_reviews(REVIEWS, "Looker"), ReviewFrame.from_reviews(REVIEWS[:2], "Tableau")])
+    assert frame.to_reviews() == REVIEWS + REVIEWS[:2]
+    assert {company: group["count"] for company, group in frame.group_by("target_company").items()} == {
+        "Looker": 8, "Tableau": 2
+    }
+    assert frame.value_counts("competitor_mentions") == {"Tableau": 5}
+
+    low = frame.filter(frame.numeric("rating") < 3)
+    assert low.to_reviews() == [review for review in REVIEWS + REVIEWS[:2] if review.rating < 3]
+
+
+def test_batch_statistics():
+    batch = ReviewBatch(batch_id="b1", source_platform="g2", target_company="Looker", reviews=REVIEWS)
+    batch.update_statistics()
+    assert batch.total_reviews == 8
+    assert batch.successful_extractions == 4 and batch.failed_extractions == 4
+    assert batch.average_rating == sum(review.rating for review in REVIEWS) / 8
+    assert batch.sentiment_distribution == {"positive": 4, "negative": 4, "neutral": 0}
@@ -0,0 +1,45 @@
+"""Tests for multi-pattern keyword matching."""
+import pytest
+from chimera.analysis import keywords
+from chimera.analysis.keywords import KeywordIndex, KeywordMatcher
+from chimera.parsers.capterra import CapterraParser
+
+
+KEYWORDS = ['he', 'she', 'his', 'hers', 'power bi', 'bi']
+TEXT = "ushers said power bi beats his tableau setup"
+
+
+@pytest.fixture(params=['c', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'c' and keywords.ahocorasick is None:
+        pytest.skip("pyahocorasick not installed")
+    if request.param == 'python':
+        monkeypatch.setattr(keywords, 'ahocorasick', None)
+    return request.param
+
+
+def test_find_all_matches_substring_search(backend):
+    """Every occurrence is reported, overlapping ones included."""
+    matcher = KeywordMatcher(KEYWORDS)
+    expected = sorted(
+        (start, start + len(keyword), keyword)
+        for keyword in KEYWORDS
+        for start in range(len(TEXT))
+        if TEXT.startswith(keyword, start)
+    )
+    assert sorted(matcher.find_all(TEXT)) == expected
+    assert matcher.matched(TEXT) == {keyword for keyword in KEYWORDS if keyword in TEXT}
+
+
+def test_index_splits_hits_per_vocabulary(backend):
+    """A shared scan reports hits under every vocabulary that owns them."""
+    index = KeywordIndex({'pronouns': ['he', 'his'], 'products': ['Power BI', 'Looker', 'his']})
+    assert index.matched(TEXT) == {'pronouns': {'he', 'his'}, 'products': {'power bi', 'his'}}
+
+
+def test_features_and_pain_points_map_hits_to_sentences(backend):
+    """One scan over the text files each indicator under the sentence holding it."""
+    text = "The Dashboard works well! Setup was slow and confusing. Short bug. Nothing else to say here?"
+    features, pain_points = CapterraParser().extract_features_and_pain_points(text)
+    assert features == ["The Dashboard works well"]
+    assert pain_points == ["Setup was slow and confusing"]
@@ -0,0 +1,49 @@
+"""Tests for the raw page store and offline replay."""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from chimera.cli import replay_stored_pages
+from chimera.utils.page_store import PageStore
+
+
+REVIEW = """<div class="review-item"><div class="rating">4.{i}</div><span class="reviewer-name">Jane Doe{i}</span>
+<time datetime="2024-01-1{i}">Jan</time><p>The dashboard features and reporting tool are great for our analytics work, review {i}.</p></div>"""
+HTML = "<html><body>" + "".join(REVIEW.format(i=i) for i in range(3)) + "</body></html>"
+URL = "https://www.capterra.com/p/1/test/reviews/"
+
+
+def test_identical_bodies_share_one_blob(tmp_path):
+    """Refetching unchanged content adds an index line but no new blob."""
+    store = PageStore(str(tmp_path))
+    first = store.put(URL, HTML, "capterra")
+    second = store.put(URL, HTML, "capterra")
+    store.put(URL + "?page=2", HTML + "<!-- 2 -->", "capterra")
+
+    assert first.sha256 == second.sha256
+    assert len(list((tmp_path / "objects").rglob("*.html.gz"))) == 2
+    assert store.read(first.sha256) == HTML
+    assert len(store.records(latest_only=False)) == 3
+
+
+def test_records_keep_latest_fetch_per_url(tmp_path):
+    """Replay sees only the newest fetch of each URL unless asked for all."""
+    store = PageStore(str(tmp_path))
+    fetched = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    store.put(URL, "<html>old</html>", fetched_at=fetched)
+    newest = store.put(URL, "<html>new</html>", fetched_at=fetched + timedelta(days=1))
+
+    assert store.latest(URL) == newest
+    assert store.records(urls=[URL]) == [newest]
+    assert store.records(urls=["https://example.com"]) == []
+
+
+@pytest.mark.asyncio
+async def test_replay_parses_stored_pages(tmp_path):
+    """Stored pages are re-parsed with the parser they were fetched for."""
+    store = PageStore(str(tmp_path))
+    store.put(URL, HTML, "capterra")
+
+    reviews, comparisons = await replay_stored_pages(store, store.records(), max_workers=1)
+
+    assert len(reviews) == 3 and comparisons == []
+    assert all(review.source == "Capterra" for review in reviews)
@@ -0,0 +1,101 @@
+"""Tests for the budgeted regex registry."""
+import re
+import sys
+
+import pytest
+from chimera.utils.patterns import BudgetedPattern, PatternRegistry, bound_wildcards, is_linear_safe
+
+
+PROS_CONS = r"<div[^>]*>.*?Pros.*?Cons.*?</div>"
+REVIEW = '<div class="review"><h3>Solid BI</h3><p>Pros</p><p>Fast dashboards</p><p>Cons</p><p>Pricey</p></div>'
+
+
+def test_linear_safe_classification():
+    assert is_linear_safe(r'<div[^>]*class="[^"]*review[^"]*"[^>]*>')
+    assert is_linear_safe(r"(\d+\.?\d*)\s+out\s+of\s+5")
+    assert is_linear_safe(r"\.\*|[.*+]")
+    assert not is_linear_safe(PROS_CONS)
+    assert not is_linear_safe(r'([^"]{50,}?)')
+    assert not is_linear_safe(r"(?:ab)+c")
+
+
+def test_bound_wildcards_keeps_escapes_and_classes():
+    assert bound_wildcards(r"a.+b\.*[.*]", 10) == r"a.{1,10}b\.*[.*]"
+    assert bound_wildcards(r"([^<]{20,}?)(?=<|$)", 10) == r"([^<]{20,20}?)(?=<|$)"
+    assert bound_wildcards(r"a.*?b|c.*?d", 10) == r"a.{0,10}?b|c.{0,10}?d"
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="atomic groups need Python 3.11")
+def test_lazy_segments_become_atomic():
+    assert bound_wildcards(PROS_CONS, 10) == r"<div[^>]*>(?>.{0,10}?Pros)(?>.{0,10}?Cons)(?>.{0,10}?</div>)"
+    assert bound_wildcards(r"(a.*?b).*?c", 10) == r"(a.{0,10}?b)(?>.{0,10}?c)"
+
+
+@pytest.mark.parametrize("source, flags", [
+    (PROS_CONS, re.DOTALL | re.I),
+    (r"Pros</p>\s*(.*?)(?=Cons|$)", re.DOTALL),
+    (r"<p>(.*?)</p>", 0),
+    (r"<(h3)>(.+?)</\1>", 0),
+])
+def test_matches_re_on_normal_input(source, flags):
+    text = (REVIEW + "\n") * 50
+    pattern = BudgetedPattern("test", source, flags, window=256)
+    assert pattern.findall(text) == re.findall(source, text, flags)
+    assert pattern.search(text).span() == re.search(source, text, flags).span()
+    assert pattern.search("no match") is None
+
+
+def test_budget_stops_pathological_input():
+    text = '<div class="a">Pros and more ' * 5000
+    pattern = BudgetedPattern("test", r"<div[^>]*>.*?Pros.*?Cons.*?</div>", re.DOTALL, max_span=4096,
+                              window=1024, time_budget=0.05)
+    assert pattern.findall(text) == []
+    assert pattern.stats.budget_exceeded == 1
+    assert pattern.stats.chars_scanned < len(text)
+    assert pattern.stats.max_seconds < 2
+
+
+def test_max_input_caps_scan():
+    pattern = BudgetedPattern("test", r"a.*?b", max_input=100, window=50)
+    assert pattern.findall("ab" * 100) == ["ab"] * 50
+    assert pattern.stats.chars_scanned == 100
+
+    scan = pattern.scan("ab" * 100)
+    assert not scan.complete and scan.scanned == 100
+    assert pattern.scan("ab" * 50).complete
+    assert pattern.scan("ab" * 100, first_only=True).complete
+    assert pattern.stats.partial_scans == 2
+
+
+def test_scan_flags_matches_cut_at_a_bound():
+    pattern = BudgetedPattern("test", r"<p>(.*)", max_span=64, window=32)
+    scan = pattern.scan("<p>" + "x" * 200)
+    assert scan.findall() == ["x" * 64] and not scan.complete
+    assert pattern.scan("<p>short").findall() == ["short"]
+    assert pattern.scan("<p>short").complete
+
+
+def test_dollar_in_class_does_not_anchor():
+    assert not BudgetedPattern("test", r"a[^$]*.*?b")._anchored_end
+    assert not BudgetedPattern("test", r"\$.*?\d")._anchored_end
+    assert BudgetedPattern("test", r"(.*?)(?=x|$)")._anchored_end
+    assert BudgetedPattern("test", r"a.*?\Z")._anchored_end
+
+
+def test_registry_compiles_once_and_records_stats():
+    registry = PatternRegistry()
+    first = registry.register("fast", r"\d+")
+    assert registry.register("fast", r"\d+") is first
+    assert registry.register("fast", r"\d+", re.I) is not first
+    slow = registry.register("slow", r"a.*?b")
+    assert "slow" in registry and registry.get("slow") is slow
+
+    slow.findall("a" * 2000 + "b")
+    registry.get("fast").search("abc 123")
+    stats = registry.stats()
+    assert list(stats)[0] == "slow"
+    assert stats["slow"]["safe"] is False and stats["fast"]["safe"] is True
+    assert stats["fast"]["calls"] == 1
+
+    registry.reset_stats()
+    assert registry.stats()["slow"]["calls"] == 0
@@ -0,0 +1,91 @@
+"""Tests for the segmented results store."""
+import json
+import multiprocessing
+from datetime import datetime, timedelta
+
+from chimera.utils.results_store import ResultsStore
+
+
+START = datetime(2024, 1, 1)
+
+
+def _fill(store, count, kind="comprehensive_test_report"):
+    return [
+        store.append(kind, {"day": day, "padding": "x" * 40}, timestamp=START + timedelta(days=day))
+        for day in range(count)
+    ]
+
+
+def test_append_rolls_segments_and_queries_by_time(tmp_path):
+    store = ResultsStore(str(tmp_path), segment_bytes=400, compact_every=None)
+    _fill(store, 10)
+    store.append("market_analysis", {"day": 3}, status="failed", timestamp=START + timedelta(days=3))
+
+    assert len(list(tmp_path.glob("segment-*.jsonl"))) > 1
+    week = store.iter_results(kind="comprehensive_test_report", since=START + timedelta(days=2),
+                              until=START + timedelta(days=9))
+    assert [run["data"]["day"] for run in week] == [2, 3, 4, 5, 6, 7, 8]
+    assert [record.kind for record in store.records(status="failed")] == ["market_analysis"]
+    assert store.kinds() == {"comprehensive_test_report": 10, "market_analysis": 1}
+
+
+def test_compaction_drops_replaced_and_deleted_runs(tmp_path):
+    """Only live runs survive compaction, and the index follows them."""
+    store = ResultsStore(str(tmp_path), segment_bytes=400, compact_every=None)
+    run_ids = _fill(store, 6)
+    store.append("comprehensive_test_report", {"day": "rerun"}, run_id=run_ids[0])
+    store.delete(run_ids[1])
+
+    assert store.compact() > 0
+    assert len(store) == 5
+    assert store.get(run_ids[0])["data"]["day"] == "rerun"
+    assert store.get(run_ids[1]) is None
+    lines = sum(len(path.read_text().splitlines()) for path in tmp_path.glob("segment-*.jsonl"))
+    assert lines == 5
+
+
+def test_index_is_rebuilt_from_segments(tmp_path):
+    store = ResultsStore(str(tmp_path), compact_every=None)
+    run_ids = _fill(store, 3)
+    store.close()
+    (tmp_path / "index.db").unlink()
+
+    reopened = ResultsStore(str(tmp_path))
+    assert [record.run_id for record in reopened.records()] == run_ids
+
+
+def test_import_legacy_result_files(tmp_path):
+    legacy = tmp_path / "legacy"
+    legacy.mkdir()
+    path = legacy / "breakthrough_iframe_bypass_results_20250830_010930.json"
+    path.write_text(json.dumps({"successful_requests": 2}))
+
+    store = ResultsStore(str(tmp_path / "results"))
+    assert store.import_files([str(path)]) == 1
+    assert store.import_files([str(path)]) == 0
+    [record] = store.records(kind="breakthrough_iframe_bypass_results")
+    assert record.timestamp == datetime(2025, 8, 30, 1, 9, 30)
+    assert store.read(record)["data"] == {"successful_requests": 2}
+
+
+def _append_from_worker(path, worker):
+    store = ResultsStore(path, segment_bytes=400, compact_every=3)
+    for day in range(20):
+        store.append("harness_session", {"worker": worker, "day": day})
+
+
+def test_processes_sharing_a_store_keep_every_run(tmp_path):
+    """Automatic compaction in one process does not lose another's appends."""
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_append_from_worker, args=(str(tmp_path), worker)) for worker in range(3)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+        assert process.exitcode == 0
+
+    store = ResultsStore(str(tmp_path), compact_every=None)
+    runs = list(store.iter_results(kind="harness_session"))
+    assert sorted((run["data"]["worker"], run["data"]["day"]) for run in runs) == [
+        (worker, day) for worker in range(3) for day in range(20)
+    ]
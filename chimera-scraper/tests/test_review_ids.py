@@ -0,0 +1,72 @@
+"""Tests for stable review IDs and the persistent seen-set."""
+import pytest
+from chimera.parsers.capterra import CapterraParser
+from chimera.utils.review_ids import BloomFilter, SeenReviews, get_seen_reviews, stable_review_id
+
+
+REVIEW = """<div class="review-item"><div class="rating">4.{i}</div><span class="reviewer-name">Jane Doe{i}</span>
+<time datetime="2024-01-1{i}">Jan</time><p>The dashboard features and reporting tool are great for our analytics work, review {i}.</p></div>"""
+URL = "https://capterra.com/test"
+
+
+def _html(count):
+    return "<html><body>" + "".join(REVIEW.format(i=i) for i in range(count)) + "</body></html>"
+
+
+def test_stable_review_id_ignores_formatting():
+    """IDs depend on normalized content only, so reruns reproduce them."""
+    review_id = stable_review_id("G2", "Jane Doe", "Great dashboards, slow exports.")
+    assert review_id == stable_review_id("G2", " jane doe", "great dashboards slow exports")
+    assert review_id.startswith("g2_")
+    assert review_id != stable_review_id("Capterra", "Jane Doe", "Great dashboards, slow exports.")
+    assert review_id != stable_review_id("G2", "John Roe", "Great dashboards, slow exports.")
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000)
+    items = [f"review-{i}" for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+    assert all(item in bloom for item in items)
+    assert sum(f"other-{i}" in bloom for i in range(1000)) < 50
+
+
+def test_seen_reviews_persist(tmp_path):
+    """IDs recorded by one instance are seen by the next."""
+    path = str(tmp_path / "seen.db")
+    seen = SeenReviews(path)
+    assert seen.add_many(["a", "b", "a"]) == 2
+    assert seen.add("b") is False
+    seen.close()
+
+    reopened = SeenReviews(path)
+    assert "a" in reopened and "c" not in reopened
+    assert len(reopened) == 2
+
+
+@pytest.mark.asyncio
+async def test_parser_skips_reviews_seen_by_earlier_runs(tmp_path):
+    """A refresh only returns, and only enriches, the reviews that are new."""
+    path = str(tmp_path / "seen.db")
+    first = await CapterraParser(seen_reviews_path=path).extract_reviews(_html(3), URL)
+    # The orchestrator records reviews once they are stored
+    get_seen_reviews(path).add_many(review.id for review in first)
+    parser = CapterraParser(seen_reviews_path=path)
+    second = await parser.extract_reviews(_html(5), URL)
+
+    assert len(first) == 3
+    assert [review.author for review in second] == ["Jane Doe3", "Jane Doe4"]
+    assert parser.extraction_stats["skipped_seen"] == 3
+    assert sorted(parser.skipped_ids) == sorted(review.id for review in first)
+    assert {review.id for review in first}.isdisjoint(review.id for review in second)
+
+
+@pytest.mark.asyncio
+async def test_parsing_alone_does_not_mark_reviews_seen(tmp_path):
+    """Reviews that were parsed but never stored come back on the next run."""
+    path = str(tmp_path / "seen.db")
+    first = await CapterraParser(seen_reviews_path=path).extract_reviews(_html(3), URL)
+    again = await CapterraParser(seen_reviews_path=path).extract_reviews(_html(3), URL)
+
+    assert len(get_seen_reviews(path)) == 0
+    assert [review.id for review in again] == [review.id for review in first]
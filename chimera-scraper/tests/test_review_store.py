@@ -0,0 +1,70 @@
+"""Tests for the SQLite review store."""
+from datetime import datetime
+
+from chimera.models.review import EnhancedReview, ReviewBatch, ReviewSentiment
+from chimera.utils.review_store import ReviewStore
+
+
+def _review(i, day, rating=4.0, sentiment=ReviewSentiment.POSITIVE):
+    return EnhancedReview(
+        review_id=f"r{i}", source="G2", title=f"Review {i}", content="Solid reporting", rating=rating,
+        author="Analyst", date=datetime(2024, 1, day), url="https://g2.com/r",
+        sentiment_label=sentiment, pros=["fast"], raw_data={"selector": ".review"}
+    )
+
+
+def test_upsert_updates_instead_of_duplicating(tmp_path):
+    """Re-saving a review by ID replaces its fields but keeps one row."""
+    with ReviewStore(str(tmp_path / "reviews.db")) as store:
+        store.save_batch(ReviewBatch(batch_id="a", source_platform="G2", target_company="Looker",
+                                     reviews=[_review(1, 1), _review(2, 2)]))
+        store.upsert_reviews([_review(1, 1, rating=2.0, sentiment=ReviewSentiment.NEGATIVE)])
+
+        assert store.count() == 2
+        updated = store.query(sentiment="negative")
+        assert [review.id for review in updated] == ["r1"]
+        assert updated[0].rating == 2.0
+        assert updated[0].pros == ["fast"]
+        assert store.count(target_company="Looker") == 2
+
+
+def test_rescrape_without_enrichment_keeps_it(tmp_path):
+    """A later scrape that computed no sentiment or mentions leaves the stored ones alone."""
+    with ReviewStore(str(tmp_path / "reviews.db")) as store:
+        enriched = _review(1, 1)
+        enriched.sentiment_score = 0.8
+        enriched.competitor_mentions = ["tableau"]
+        enriched.review_quality_score = 0.9
+        store.upsert_reviews([enriched], target_company="Looker")
+        store.upsert_reviews([_review(1, 1, rating=3.0, sentiment=None)])
+
+        stored = store.query()[0]
+        assert stored.rating == 3.0
+        assert stored.sentiment_label == ReviewSentiment.POSITIVE
+        assert stored.sentiment_score == 0.8
+        assert stored.competitor_mentions == ["tableau"]
+        assert stored.review_quality_score == 0.9
+
+
+def test_query_filters_and_summary(tmp_path):
+    """Filters combine, results come newest first and summaries group by company."""
+    with ReviewStore(str(tmp_path / "reviews.db")) as store:
+        store.save_batch(ReviewBatch(batch_id="a", source_platform="G2", target_company="Looker",
+                                     reviews=[_review(1, 1), _review(2, 5, rating=2.0)]))
+        store.save_batch(ReviewBatch(batch_id="b", source_platform="G2", target_company="Tableau",
+                                     reviews=[_review(3, 3, rating=5.0)]))
+
+        assert [review.id for review in store.query()] == ["r2", "r3", "r1"]
+        assert [review.id for review in store.query(since=datetime(2024, 1, 2), min_rating=3.0)] == ["r3"]
+        assert [review.id for review in store.query(limit=1)] == ["r2"]
+
+        summary = {row["name"]: row for row in store.rating_summary()}
+        assert summary["Looker"]["reviews"] == 2
+        assert summary["Looker"]["average_rating"] == 3.0
+        assert summary["Tableau"]["positive"] == 1
+
+
+def test_wal_mode(tmp_path):
+    """The database runs in write-ahead-log mode."""
+    with ReviewStore(str(tmp_path / "reviews.db")) as store:
+        assert store._execute("PRAGMA journal_mode")[0][0] == "wal"
@@ -0,0 +1,78 @@
+"""Tests for success-rate-ordered selector plans."""
+import multiprocessing
+
+from chimera.parsers.engines import get_engine
+from chimera.parsers.selector_plan import SelectorPlanStore
+
+
+HTML = '<html><body><div class="review-text">Solid reporting</div><div class="review-text">Fast</div></body></html>'
+SELECTORS = ['.review-item', '.review', '.review-text']
+
+
+def test_plan_promotes_winning_selector_and_persists(tmp_path):
+    """The selector that keeps matching moves to the front and survives a reload."""
+    engine = get_engine()
+    root = engine.parse(HTML)
+    store = SelectorPlanStore("capterra", tmp_path)
+    plan = store.get("review_selector", SELECTORS)
+
+    assert plan.ordered() == SELECTORS
+    selector, elements = plan.select(engine, root)
+    assert selector == '.review-text'
+    assert len(elements) == 2
+    assert plan.ordered()[0] == '.review-text'
+
+    store.save()
+    reloaded = SelectorPlanStore("capterra", tmp_path).get("review_selector", SELECTORS)
+    assert reloaded.ordered()[0] == '.review-text'
+    assert reloaded.stats['.review-item'] == {'success': 0, 'total': 1}
+
+
+def test_saves_merge_counts_from_other_workers(tmp_path):
+    """Stores sharing a file add their counts to it instead of overwriting each other's."""
+    engine = get_engine()
+    root = engine.parse(HTML)
+    first = SelectorPlanStore("capterra", tmp_path)
+    second = SelectorPlanStore("capterra", tmp_path)
+    for store, pages in ((first, 2), (second, 3)):
+        plan = store.get("review_selector", SELECTORS)
+        for _ in range(pages):
+            plan.select(engine, root)
+
+    first.save()
+    second.save()
+    second.get("review_selector", SELECTORS).select(engine, root)
+    second.save()  # throttled
+    assert SelectorPlanStore("capterra", tmp_path).get("review_selector", SELECTORS).stats['.review-text'] == {
+        'success': 5, 'total': 5
+    }
+
+    second.flush()
+    first.flush()  # nothing pending
+    reloaded = SelectorPlanStore("capterra", tmp_path).get("review_selector", SELECTORS)
+    assert reloaded.stats['.review-text'] == {'success': 6, 'total': 6}
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def _record_and_flush(directory, rounds):
+    engine = get_engine()
+    root = engine.parse(HTML)
+    store = SelectorPlanStore("capterra", directory)
+    plan = store.get("review_selector", SELECTORS)
+    for _ in range(rounds):
+        plan.select(engine, root)
+        store.flush()
+
+
+def test_concurrent_process_saves_add_up(tmp_path):
+    """Worker processes flushing at the same time do not drop each other's counts."""
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_record_and_flush, args=(tmp_path, 20)) for _ in range(4)]
+    for process in workers:
+        process.start()
+    for process in workers:
+        process.join()
+        assert process.exitcode == 0
+
+    reloaded = SelectorPlanStore("capterra", tmp_path).get("review_selector", SELECTORS)
+    assert reloaded.stats['.review-text'] == {'success': 80, 'total': 80}
@@ -0,0 +1,33 @@
+"""Tests for batch sentiment analysis."""
+import pytest
+from chimera.analysis import sentiment
+from chimera.analysis.sentiment import AdvancedSentimentAnalyzer
+
+
+TEXTS = [
+    "Tableau is not great, but the dashboards are really intuitive!",
+    "Very slow. NEVER buying again; support was terrible and 3 reports broke",
+    "It is okay I guess",
+    "",
+    "extremely   good... absolutely   awful looker setup, somewhat reliable",
+]
+
+
+def _without_timestamp(result):
+    score, label, details = result
+    details = dict(details)
+    details.pop("analysis_timestamp", None)
+    return score, label, details
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(sentiment.np is None, reason="numpy not installed")
+async def test_batch_matches_per_text_analysis():
+    """The vectorized batch path gives the same results as one text at a time."""
+    analyzer = AdvancedSentimentAnalyzer()
+    context = {"industry": "crm"}
+
+    batch = await analyzer.analyze_batch_sentiment(TEXTS, context)
+    single = [await analyzer.analyze_sentiment_advanced(text, context) for text in TEXTS]
+
+    assert [_without_timestamp(result) for result in batch] == [_without_timestamp(result) for result in single]
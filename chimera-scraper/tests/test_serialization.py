@@ -0,0 +1,95 @@
+"""Round-trip tests for the JSON serialization layer."""
+import json
+from dataclasses import asdict
+from datetime import datetime
+from typing import List
+
+import pytest
+from chimera.models.review import EnhancedReview, ReviewSentiment
+from chimera.parsers.four_way_comparison import FourWayComparisonData
+from chimera.parsers.head_to_head_comparison import AIGeneratedSummary, HeadToHeadComparisonData, ProductComparison
+from chimera.utils import serialization
+from chimera.utils.page_store import PageRecord
+
+
+PRODUCT = ProductComparison(
+    name="Looker", g2_product_id="123", vendor_id="9", star_rating=4.4, review_count=1200,
+    market_segments={"Mid-Market": 0.45}, entry_level_pricing="$5", pricing_details={"tiers": ["Standard"]},
+    ratings_by_criteria={"Ease of Use": 8.1}, feature_scores={"Dashboards": 8.7}
+)
+SUMMARY = AIGeneratedSummary(
+    summary_title="Looker vs Tableau", summary_subtitle="Users say", extraction_confidence=0.9,
+    summary_points=[{"text": "Looker models data centrally", "product_a_score": 8.5, "product_b_score": None}],
+    structured_insights={"winner": "Looker"}
+)
+COMPARISON = HeadToHeadComparisonData(
+    comparison_id="looker-vs-tableau", extraction_date=datetime(2024, 3, 1, 9, 30, 15, 250), url="https://g2.com/compare",
+    product_a=serialization.to_dict(PRODUCT), product_b=serialization.to_dict(PRODUCT),
+    ai_generated_summary=serialization.to_dict(SUMMARY), at_a_glance={}, pricing={"a": "$5"}, ratings={},
+    features={"Dashboards": [8.7, 8.2]}, reviews={}, alternatives={}, data_quality_score=0.8,
+    extraction_confidence=0.9, summary_quality_score=0.7
+)
+REVIEW = EnhancedReview(
+    review_id="g2_1", source="G2", title="Great modeling", content="LookML keeps metrics consistent — très bien",
+    rating=4.5, author="Analyst", date=datetime(2024, 1, 5), url="https://g2.com/looker",
+    sentiment_score=0.6, sentiment_label=ReviewSentiment.POSITIVE, competitor_mentions=["Tableau"],
+    raw_data={"html": "<div>review</div>"}, extraction_timestamp=datetime(2024, 1, 6, 12, 0, 0, 1)
+)
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run each test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "json":
+        monkeypatch.setattr(serialization, "orjson", None)
+    elif serialization.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_to_dict_matches_asdict_without_copying():
+    data = serialization.to_dict(PRODUCT)
+    assert data == asdict(PRODUCT)
+    assert data["market_segments"] is PRODUCT.market_segments
+
+
+def test_dataclass_round_trip(backend):
+    assert serialization.loads(serialization.dumps(COMPARISON), HeadToHeadComparisonData) == COMPARISON
+    four_way = FourWayComparisonData(**{
+        **{name: getattr(COMPARISON, name) for name in ("comparison_id", "extraction_date", "url", "at_a_glance",
+                                                        "pricing", "ratings", "data_quality_score",
+                                                        "extraction_confidence")},
+        "products": [serialization.to_dict(PRODUCT)] * 4, "features_by_category": {}, "total_products": 4,
+        "comparison_categories": ["pricing"]
+    })
+    assert serialization.loads(serialization.dumpb(four_way), FourWayComparisonData) == four_way
+
+
+def test_review_round_trip_uses_aliases(backend):
+    text = serialization.dumps([REVIEW], indent=2)
+    data = json.loads(text)
+    assert data[0]["review_id"] == "g2_1"
+    assert data[0]["sentiment_label"] == "positive"
+    assert data[0]["date"] == "2024-01-05T00:00:00"
+    assert serialization.loads(text, List[EnhancedReview]) == [REVIEW]
+
+
+def test_matches_stdlib_output(backend):
+    """Output parses to what ``json.dumps(..., default=str)`` of ``asdict`` gave, with ISO dates."""
+    expected = json.loads(json.dumps(asdict(COMPARISON), default=lambda value: value.isoformat()))
+    assert json.loads(serialization.dumps(COMPARISON)) == expected
+
+
+def test_optional_and_nested_fields(backend):
+    record = PageRecord(url="https://g2.com/a", fetched_at="2024-01-01T00:00:00+00:00", sha256="ab", size=3)
+    assert serialization.loads(serialization.dumps(record), PageRecord) == record
+    assert json.loads(serialization.dumps({"tags": {"b"}, 1: None})) == {"tags": ["b"], "1": None}
+
+
+def test_text_fallback_escapes_non_ascii(monkeypatch):
+    """Without orjson, text output stays ASCII so any file encoding can hold it; bytes stay UTF-8."""
+    monkeypatch.setattr(serialization, "orjson", None)
+    review = {"content": "Très bien — 很好"}
+    assert serialization.dumps(review).isascii()
+    assert serialization.dumpb(review) == json.dumps(review, ensure_ascii=False).encode("utf-8")
+    assert serialization.loads(serialization.dumps(review)) == review
@@ -5,7 +5,8 @@ import os
 from pathlib import Path
 from datetime import datetime
 from chimera.models.review import Review
-from chimera.utils.storage import save_to_json, save_to_csv
+import json
+from chimera.utils.storage import ReviewSink, save_to_json, save_to_csv
 
 
 @pytest.fixture
@@ -117,3 +118,33 @@ async def test_save_empty_reviews():
             
         finally:
             os.chdir(original_cwd)
+
+
+@pytest.mark.asyncio
+async def test_save_to_json_is_valid_json(sample_reviews):
+    """The streamed JSON output is still one parseable array."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        original_cwd = os.getcwd()
+        os.chdir(temp_dir)
+        
+        try:
+            filepath = await save_to_json(sample_reviews, "test_reviews.json")
+            with open(filepath, 'r') as f:
+                data = json.load(f)
+            assert [review["review_id"] for review in data] == ["test_1", "test_2"]
+            
+        finally:
+            os.chdir(original_cwd)
+
+
+@pytest.mark.asyncio
+async def test_review_sink_rotates_jsonl(sample_reviews, tmp_path):
+    """Each review is one JSON line and files rotate once they reach the size limit."""
+    async with ReviewSink(str(tmp_path / "reviews.jsonl"), flush_every=1, rotate_bytes=1) as sink:
+        for _ in range(3):
+            await sink.write_many(sample_reviews)
+    
+    assert len(sink.files) == 6
+    assert sink.files[1].endswith("reviews.1.jsonl")
+    lines = [line for path in sink.files for line in Path(path).read_text().splitlines()]
+    assert [json.loads(line)["review_id"] for line in lines] == ["test_1", "test_2"] * 3
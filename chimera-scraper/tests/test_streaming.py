@@ -0,0 +1,62 @@
+"""Tests for streaming review extraction."""
+import pytest
+from chimera.parsers.capterra import CapterraParser
+from chimera.parsers.streaming import ContainerStream
+
+
+REVIEW = """<div class="review-item"><div class="rating">4.{i}</div><span class="reviewer-name">Jane Doe{i}</span>
+<time datetime="2024-01-1{i}">Jan</time><p>The dashboard features and reporting tool are great for our analytics work, review {i}.</p></div>"""
+HTML = "<html><body><nav>menu</nav>" + "".join(REVIEW.format(i=i) for i in range(5)) + "</body></html>"
+
+
+def test_container_stream_yields_closed_containers_across_chunks():
+    """Containers split across chunk boundaries come out whole and in order."""
+    stream = ContainerStream(['.review-item', '.review-text'])
+    containers = []
+    for start in range(0, len(HTML), 37):
+        containers.extend(stream.feed(HTML[start:start + 37]))
+    containers.extend(stream.close())
+
+    assert [selector for selector, _ in containers] == ['.review-item'] * 5
+    assert all(fragment.startswith('<div class="review-item">') for _, fragment in containers)
+    assert 'Jane Doe3' in containers[3][1]
+
+
+def test_container_stream_prefers_best_ranked_selector_and_checks_ancestors():
+    """A lower-ranked selector matching earlier is dropped once a better one matches."""
+    page = ('<html><body><div class="review">Featured</div>'
+            '<section class="reviews"><p class="text">One</p><p class="text">Two</p></section>'
+            '<p class="text">Outside</p></body></html>')
+    stream = ContainerStream(['.reviews .text', '.review'])
+    containers = stream.feed(page[:60]) + stream.feed(page[60:]) + stream.close()
+
+    assert [fragment for _, fragment in containers] == ['<p class="text">One</p>', '<p class="text">Two</p>']
+    assert stream.best_selector == '.reviews .text'
+
+
+@pytest.mark.asyncio
+async def test_stream_reviews_matches_batch_parsing():
+    """Streamed reviews carry the same fields as the whole-page path."""
+    parser = CapterraParser()
+    elements = await parser._extract_review_elements(HTML)
+    batch = [await parser._parse_single_review_enhanced(element, "https://capterra.com/test") for element in elements]
+
+    streamed = [review async for review in CapterraParser().stream_reviews(HTML, "https://capterra.com/test", chunk_size=50)]
+
+    assert len(streamed) == 5
+    assert [(r.content, r.author, r.rating) for r in streamed] == [(r.content, r.author, r.rating) for r in batch]
+    assert streamed[0].review_quality_score is not None
+
+
+@pytest.mark.asyncio
+async def test_stream_reviews_matches_extract_reviews_when_two_selectors_match():
+    """A lower-priority container earlier in the page does not change what is streamed."""
+    featured = ('<div class="review"><div class="rating">2.0</div><span class="reviewer-name">Featured Author</span>'
+                '<p>A featured review block that the page shows above the review list, long enough to count.</p></div>')
+    page = HTML.replace("<nav>menu</nav>", "<nav>menu</nav>" + featured)
+
+    expected = await CapterraParser().extract_reviews(page, "https://capterra.com/test")
+    streamed = [review async for review in CapterraParser().stream_reviews(page, "https://capterra.com/test", chunk_size=50)]
+
+    assert len(expected) == 5
+    assert [(r.content, r.author) for r in streamed] == [(r.content, r.author) for r in expected]
@@ -0,0 +1,43 @@
+"""Tests for single-pass phrase scanning."""
+import pytest
+from chimera.parsers.engines import available_engines, get_engine
+from chimera.parsers.text_scan import PhraseScanner, find_phrase_containers
+
+
+HTML = """
+<html><body>
+    <div class="page">
+        <div class="review"><p>Would <b>recommend</b> to anyone who needs dashboards.</p><!-- note --></div>
+        <span>Ease of use</span>
+        <div><span>Short text</span><p>   The customer support team was quick to respond every time.   </p></div>
+        <script>var hint = "would recommend this great tool to everyone out there";</script>
+    </div>
+</body></html>
+"""
+PHRASES = ['would recommend', 'ease of use', 'customer support']
+
+
+@pytest.mark.parametrize("engine_name", available_engines())
+def test_matches_per_element_text_check(engine_name):
+    """One scan finds the same elements as checking every element's own text."""
+    engine = get_engine(engine_name)
+    root = engine.parse(HTML)
+    tags = ['div', 'p', 'span']
+
+    expected = []
+    for element in engine.iterate(root, tags):
+        text = engine.text(element).strip()
+        if len(text) > 30 and any(phrase in text.lower() for phrase in PHRASES):
+            expected.append(element)
+
+    found = find_phrase_containers(engine, root, tags, PHRASES)
+    assert len(found) == len(expected) == 5
+    assert all(a is b or a == b for a, b in zip(found, expected))
+
+
+def test_occurrences_map_back_through_expanding_lowercase():
+    """Offsets stay on the original text when lower-casing lengthens it."""
+    text = "İstanbul office: would recommend, WOULD RECOMMEND"
+    occurrences = PhraseScanner(['would recommend', 'istanbul']).occurrences(text)
+    assert [text[start:end].lower() for start, end in occurrences] == ['would recommend'] * 2
+    assert PhraseScanner(['office']).occurrences(text) == [(9, 15)]
@@ -0,0 +1,80 @@
+"""Tests for incremental scraping with per-target high-water marks."""
+from datetime import datetime
+
+import pytest
+from chimera.models.review import EnhancedReview
+from chimera.targets.watermarks import WatermarkStore, collect_new_reviews, page_url
+
+
+URL = "https://www.g2.com/products/looker/reviews?sort=newest"
+STARTED = datetime(2024, 2, 1)
+
+
+def _review(i, day):
+    return EnhancedReview(
+        review_id=f"r{i}", source="G2", title=f"Review {i}", content="Solid reporting", rating=4.0,
+        author="Analyst", date=datetime(2024, 1, day), url=URL
+    )
+
+
+def _pages(*pages, skipped=()):
+    """Fake fetcher over numbered pages, recording which were requested.
+
+    ``skipped`` holds, per page, the IDs the parser dropped as already seen.
+    """
+    fetched = []
+
+    async def fetch(url):
+        fetched.append(url)
+        index = len(fetched) - 1
+        return (pages[index] if index < len(pages) else []), (list(skipped[index]) if index < len(skipped) else [])
+
+    return fetch, fetched
+
+
+def test_page_url_sets_page_parameter():
+    assert page_url(URL, 1) == URL
+    assert page_url(URL, 3) == "https://www.g2.com/products/looker/reviews?sort=newest&page=3"
+    assert page_url(page_url(URL, 3), 4).count("page=") == 1
+
+
+@pytest.mark.asyncio
+async def test_second_run_stops_at_known_reviews(tmp_path):
+    """After a run, the next one stops on the first page holding known reviews."""
+    path = str(tmp_path / "watermarks.json")
+    marks = WatermarkStore(path)
+    fetch, fetched = _pages([_review(3, 10), _review(2, 9)], [_review(1, 5)])
+    first = await collect_new_reviews(fetch, URL, "g2:looker", marks, max_pages=5)
+    assert [review.id for review in first] == ["r3", "r2", "r1"]
+    assert len(fetched) == 3
+    marks.advance("g2:looker", first, STARTED)
+    marks.save()
+
+    reopened = WatermarkStore(path)
+    fetch, fetched = _pages([_review(5, 12), _review(4, 11), _review(3, 10)], [_review(2, 9)])
+    second = await collect_new_reviews(fetch, URL, "g2:looker", reopened, max_pages=5)
+    assert [review.id for review in second] == ["r5", "r4"]
+    assert len(fetched) == 1
+
+
+@pytest.mark.asyncio
+async def test_reviews_skipped_as_seen_stop_paging(tmp_path):
+    """A page whose known reviews the parser dropped still ends the walk there."""
+    marks = WatermarkStore(None)
+    marks.advance("g2:looker", [_review(3, 10)], STARTED)
+
+    fetch, fetched = _pages([_review(5, 12), _review(4, 11)], [_review(2, 9)], skipped=[["r3"]])
+    reviews = await collect_new_reviews(fetch, URL, "g2:looker", marks, max_pages=5)
+    assert [review.id for review in reviews] == ["r5", "r4"]
+    assert len(fetched) == 1
+
+
+def test_undated_reviews_do_not_move_the_date_mark(tmp_path):
+    """Reviews dated with the parse time are remembered by ID only."""
+    marks = WatermarkStore(None)
+    undated = _review(9, 1).model_copy(update={"date": datetime(2024, 3, 1)})
+    marks.advance("g2:looker", [_review(1, 5), undated], STARTED)
+
+    assert marks.get("g2:looker")["newest_date"] == "2024-01-05T00:00:00"
+    new, reached = marks.split_new("g2:looker", [undated, _review(7, 6)])
+    assert [review.id for review in new] == ["r7"] and reached
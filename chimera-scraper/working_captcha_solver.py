@@ -23,6 +23,8 @@ from dataclasses import dataclass
 
 from playwright.async_api import async_playwright, Page, Frame, ElementHandle
 
+from chimera_results import save_results
+
 @dataclass
 class MathematicalConstants:
     """Exact constants discovered in puzzle.md"""
@@ -1066,14 +1068,7 @@ class WorkingCaptchaSolver:
         📊 Export comprehensive results with working mathematical metrics
         """
         try:
-            # Create output directory if it doesn't exist
-            output_dir = Path("output")
-            output_dir.mkdir(exist_ok=True)
-            
             # Export comprehensive results
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"output/working_captcha_solver_results_{timestamp}.json"
-            
             results_data = {
                 "test_summary": {
                     "total_tests": len(self.test_results),
@@ -1095,11 +1090,10 @@ class WorkingCaptchaSolver:
                 "export_timestamp": datetime.now().isoformat()
             }
             
-            with open(filename, 'w') as f:
-                json.dump(results_data, f, indent=2)
+            run_id = save_results("working_captcha_solver_results", results_data, path="output/results")
             
-            self.logger.info(f"📊 Results exported to: {filename}")
-            return filename
+            self.logger.info(f"📊 Results exported as run: {run_id}")
+            return run_id
             
         except Exception as e:
             self.logger.error(f"❌ Results export failed: {e}")
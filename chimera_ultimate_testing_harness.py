@@ -38,6 +38,12 @@ from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 import sys
 import importlib.util
 
+# Results store writer shared with the chimera-scraper scripts
+spec = importlib.util.spec_from_file_location("chimera_results", Path(__file__).parent / "chimera-scraper" / "chimera_results.py")
+chimera_results = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(chimera_results)
+save_results = chimera_results.save_results
+
 # Load the chimera-ultimate module for testing and validation
 spec = importlib.util.spec_from_file_location("chimera_ultimate", "chimera-ultimate.py")
 chimera_ultimate = importlib.util.module_from_spec(spec)
@@ -130,8 +136,8 @@ class ChimeraUltimateTestingHarness:
     def __init__(self):
         self.scraper = None
         self.current_session = None
+        # Results store shared with the other harnesses
         self.test_results_dir = Path("test_results")
-        self.test_results_dir.mkdir(exist_ok=True)
         
         # Strategic analysis integration from COMPREHENSIVE_SCRAPER_STRATEGIC_ANALYSIS.md
         self.strategic_analysis = {
@@ -1546,8 +1552,6 @@ async def _apply_exact_javascript_architecture(self) -> bool:
         if not self.current_session:
             return
         
-        session_file = self.test_results_dir / f"{self.current_session.session_id}.json"
-        
         # Convert session to dictionary
         session_data = {
             "session_id": self.current_session.session_id,
@@ -1558,11 +1562,10 @@ async def _apply_exact_javascript_architecture(self) -> bool:
             "improvements": self.current_session.improvements
         }
         
-        # Save to file
-        with open(session_file, 'w') as f:
-            json.dump(session_data, f, indent=2)
+        save_results("testing_session", session_data, status="ok" if self.current_session.results else "empty",
+                     path=str(self.test_results_dir), run_id=self.current_session.session_id)
         
-        logger.info(f"💾 Session results saved to: {session_file}")
+        logger.info(f"💾 Session results saved as run: {self.current_session.session_id}")
     
     async def rapid_improvement_drive(self) -> Dict[str, Any]:
         """
@@ -22,6 +22,12 @@ from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 import sys
 import importlib.util
 
+# Results store writer shared with the chimera-scraper scripts
+spec = importlib.util.spec_from_file_location("chimera_results", Path(__file__).parent / "chimera-scraper" / "chimera_results.py")
+chimera_results = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(chimera_results)
+save_results = chimera_results.save_results
+
 # Load the chimera-ultimate module
 spec = importlib.util.spec_from_file_location("chimera_ultimate", "chimera-ultimate.py")
 chimera_ultimate = importlib.util.module_from_spec(spec)
@@ -54,8 +60,8 @@ class ComprehensiveTestingFramework:
     def __init__(self):
         self.scraper = None
         self.test_results = []
-        self.test_results_dir = Path("comprehensive_test_results")
-        self.test_results_dir.mkdir(exist_ok=True)
+        # Results store shared with the other harnesses
+        self.test_results_dir = Path("test_results")
         
         # Test URLs from strategic analysis (Phase 4 priority)
         self.test_urls = [
@@ -556,13 +562,9 @@ class ComprehensiveTestingFramework:
     
     async def _save_test_report(self, test_report):
         """Save comprehensive test report"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        report_file = self.test_results_dir / f"comprehensive_test_report_{timestamp}.json"
-        
-        with open(report_file, 'w') as f:
-            json.dump(test_report, f, indent=2)
+        run_id = save_results("comprehensive_test_report", test_report, path=str(self.test_results_dir))
         
-        logger.info(f"💾 Comprehensive test report saved to: {report_file}")
+        logger.info(f"💾 Comprehensive test report saved as run: {run_id}")
     
     def _display_comprehensive_results(self, test_report):
         """Display comprehensive test results"""